@@ -0,0 +1,103 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Benchmark dopasowywania wpisów do listy nauczycieli wraz ze sprawdzeniem zgodności z difflib.get_close_matches.
+# Uruchomienie: python benchmarks/dopasowanie.py [liczba nauczycieli] [liczba wpisów]
+
+# Standardowe biblioteki
+import difflib
+from pathlib import Path
+import random
+import re
+import sys
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.core.matching import (
+	IndeksDopasowań,
+	dopasujWpisyDoListy
+)
+from src.core.normalization import normalizujTekst
+
+def zmień(tekst: str, losowanie: random.Random) -> str:
+	"""
+	Wprowadza do tekstu literówkę: zamianę, usunięcie lub wstawienie znaku.
+
+	Args:
+		tekst (str): Tekst wejściowy.
+		losowanie (random.Random): Generator liczb losowych.
+
+	Returns:
+		str: Tekst z literówką.
+	"""
+
+	pozycja = losowanie.randrange(len(tekst))
+	znak = losowanie.choice("abcdełńóśźż")
+
+	return losowanie.choice((
+		tekst[:pozycja] + znak + tekst[pozycja + 1:],
+		tekst[:pozycja] + tekst[pozycja + 1:],
+		tekst[:pozycja] + znak + tekst[pozycja:]
+	))
+
+
+def zmierz(funkcja, powtórzenia: int=5) -> float:
+	"""
+	Zwraca najkrótszy czas wykonania funkcji w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+		powtórzenia (int, optional): Liczba powtórzeń. Domyślnie 5.
+
+	Returns:
+		float: Najkrótszy czas w milisekundach.
+	"""
+
+	czasy = []
+
+	for _ in range(powtórzenia):
+		początek = time.perf_counter()
+		funkcja()
+		czasy.append(time.perf_counter() - początek)
+
+	return min(czasy) * 1000
+
+
+losowanie = random.Random(2026)
+liczbaNauczycieli = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+liczbaWpisów = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+imiona = ["Anna", "Jan", "Ewa", "Piotr", "Zofia", "Łukasz", "Małgorzata", "Grzegorz", "Żaneta", "Stanisław"]
+nazwiska = ["Kowalski", "Nowak", "Wiśniewska", "Wójcik", "Kamińska", "Lewandowski", "Zieliński", "Szymańska", "Woźniak", "Dąbrowski", "Kozłowska", "Jankowski"]
+nauczyciele = sorted({f"{losowanie.choice(imiona)[0]}. {losowanie.choice(nazwiska)}{losowanie.randrange(100)}" for _ in range(liczbaNauczycieli * 2)})[:liczbaNauczycieli]
+wpisy = [zmień(losowanie.choice(nauczyciele), losowanie) for _ in range(liczbaWpisów)]
+
+# Zgodność z difflib.get_close_matches dla każdego wpisu
+indeks = IndeksDopasowań(nauczyciele)
+normy = [re.sub(r"\s+", "", normalizujTekst(nauczyciel)) for nauczyciel in nauczyciele]
+
+for wpis in wpisy:
+	norma = re.sub(r"\s+", "", normalizujTekst(wpis))
+	oczekiwane = difflib.get_close_matches(norma, normy, n=1, cutoff=0.6)
+	assert indeks.najbliższy(norma, 0.6) == (oczekiwane[0] if oczekiwane else None), wpis
+
+print(f"Nauczyciele: {liczbaNauczycieli}, wpisy: {liczbaWpisów}, wyniki zgodne z difflib: tak")
+
+czasDifflib = zmierz(lambda: [difflib.get_close_matches(re.sub(r"\s+", "", normalizujTekst(wpis)), normy, n=1, cutoff=0.6) for wpis in wpisy])
+
+print(f"difflib.get_close_matches:     {czasDifflib:8.1f} ms")
+print(f"indeks budowany przy wpisie:   {zmierz(lambda: dopasujWpisyDoListy(wpisy, nauczyciele)):8.1f} ms")
+print(f"trwały indeks szkoły:          {zmierz(lambda: indeks.dopasuj(wpisy)):8.1f} ms")
+print(f"budowa indeksu:                {zmierz(lambda: IndeksDopasowań(nauczyciele)):8.1f} ms")
@@ -0,0 +1,112 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Benchmark dopasowywania wpisów do listy nauczycieli wraz ze sprawdzeniem zgodności z difflib.get_close_matches.
+
+# Benchmark kolumnowego magazynu faktów zastępstw: dopisywanie, zapis i odczyt kolumn oraz agregacje roczne.
+# Uruchomienie: python benchmarks/fakty.py [liczba faktów]
+
+# Standardowe biblioteki
+from collections import Counter
+from datetime import (
+	date,
+	timedelta
+)
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.core import facts
+from src.core.facts import FaktyZastępstw
+
+def zmierz(funkcja, powtórzenia: int=5) -> float:
+	"""
+	Zwraca najkrótszy czas wykonania funkcji w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+		powtórzenia (int, optional): Liczba powtórzeń. Domyślnie 5.
+
+	Returns:
+		float: Najkrótszy czas w milisekundach.
+	"""
+
+	czasy = []
+
+	for _ in range(powtórzenia):
+		początek = time.perf_counter()
+		funkcja()
+		czasy.append(time.perf_counter() - początek)
+
+	return min(czasy) * 1000
+
+
+losowanie = random.Random(2026)
+liczbaFaktów = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+szkoły = [f"{numer:02d}" for numer in range(1, 11)]
+klasy = [f"{rocznik}{litera}" for rocznik in range(1, 6) for litera in "abcdefgh"]
+nauczyciele = [f"Nauczyciel {numer}" for numer in range(150)]
+początekRoku = date(2025, 9, 1)
+zdarzenia = [
+	{
+		"h": f"{losowanie.getrandbits(64):016x}",
+		"s": losowanie.choice(szkoły[:3] * 5 + szkoły),
+		"d": (początekRoku + timedelta(days=losowanie.randrange(300))).isoformat(),
+		"n": losowanie.choice(nauczyciele),
+		"k": [losowanie.choice(klasy)] if losowanie.random() < 0.9 else [],
+		"l": losowanie.randrange(1, 10),
+		"o": losowanie.random() < 0.15
+	}
+	for _ in range(liczbaFaktów)
+]
+
+# Zgodność agregacji z naiwnym zliczaniem rekordów
+magazyn = FaktyZastępstw()
+magazyn.dopisz(zdarzenia)
+od, do = date(2025, 9, 1), date(2026, 6, 26)
+oczekiwane = Counter(
+	date.fromisoformat(zdarzenie["d"]).weekday() for zdarzenie in zdarzenia
+	if zdarzenie["s"] == "01" and od <= date.fromisoformat(zdarzenie["d"]) <= do
+)
+assert magazyn.zlicz("dzieńTygodnia", szkoła="01", od=od, do=do) == dict(sorted(oczekiwane.items()))
+oczekiwane = Counter(zdarzenie["k"][0] for zdarzenie in zdarzenia if zdarzenie["s"] == "01" and zdarzenie["k"] and zdarzenie["o"])
+assert magazyn.zlicz("klasa", szkoła="01", tylkoOdwołane=True) == {klasa: oczekiwane[klasa] for klasa in sorted(oczekiwane, key=magazyn.indeksy["klasa"].get)}
+
+if facts.numpy is not None:
+	wynikNumPy = {wymiar: magazyn.zlicz(wymiar, szkoła="01", od=od, do=do) for wymiar in facts.wymiaryFaktów}
+	facts.numpy, numpy = None, facts.numpy
+	assert wynikNumPy == {wymiar: magazyn.zlicz(wymiar, szkoła="01", od=od, do=do) for wymiar in facts.wymiaryFaktów}
+	facts.numpy = numpy
+
+faktySzkoły = sum(1 for zdarzenie in zdarzenia if zdarzenie["s"] == "01")
+print(f"Fakty: {liczbaFaktów} (szkoła 01: {faktySzkoły}), NumPy: {'tak' if facts.numpy is not None else 'nie'}, wyniki zgodne: tak")
+print(f"dopisanie wszystkich faktów:   {zmierz(lambda: FaktyZastępstw().dopisz(zdarzenia), 3):8.1f} ms")
+
+with tempfile.TemporaryDirectory() as folder:
+	trwały = FaktyZastępstw(Path(folder))
+	print(f"dopisanie z zapisem na dysk:   {zmierz(lambda: trwały.dopisz(zdarzenia), 1):8.1f} ms")
+	print(f"wczytanie kolumn z dysku:      {zmierz(lambda: FaktyZastępstw(Path(folder)).wczytaj(), 3):8.1f} ms")
+
+for wymiar in ("dzieńTygodnia", "lekcja", "klasa"):
+	etykieta = f"podział {wymiar} (szkoła, rok):"
+	print(f"{etykieta:31}{zmierz(lambda: magazyn.zlicz(wymiar, szkoła='01', od=od, do=do)):8.1f} ms")
+
+if facts.numpy is not None:
+	facts.numpy = None
+	print(f"podział klasa bez NumPy:       {zmierz(lambda: magazyn.zlicz('klasa', szkoła='01', od=od, do=do)):8.1f} ms")
@@ -0,0 +1,98 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Benchmark czasu wczytywania i zapisywania pliku konfiguracyjnego z 10 000 serwerów.
+# Uruchomienie: python benchmarks/kodek.py [liczba serwerów]
+
+# Standardowe biblioteki
+import json
+from pathlib import Path
+import sys
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.handlers import codec
+
+def przykładowaKonfiguracja(liczbaSerwerów: int) -> dict:
+	"""
+	Tworzy przykładową konfigurację z dwiema szkołami i podaną liczbą serwerów.
+
+	Args:
+		liczbaSerwerów (int): Liczba serwerów w konfiguracji.
+
+	Returns:
+		dict: Słownik konfiguracji.
+	"""
+
+	return {
+		"wersja": "2.3.3.0-stable",
+		"token": "",
+		"serwery": {
+			str(10**17 + numer): {
+				"identyfikator-kanalu": str(10**18 + numer),
+				"szkoła": "01" if numer % 2 else "02",
+				"wybrane-klasy": [f"{numer % 5 + 1}{litera}" for litera in "ABC"],
+				"wybrani-nauczyciele": ["A. Kowalski", "Ż. Źdźbło"] if numer % 3 == 0 else [],
+				"wysyłaj-numerki": bool(numer % 2)
+			}
+			for numer in range(liczbaSerwerów)
+		},
+		"szkoły": {
+			identyfikator: {
+				"nazwa": f"Szkoła {identyfikator}",
+				"url": f"https://kacpergorka.com/zastepstwa/{identyfikator}",
+				"kodowanie": "iso-8859-2",
+				"lista-klas": {str(rok): [f"{rok}{litera}" for litera in "ABCDEFGH"] for rok in range(1, 6)},
+				"lista-nauczycieli": [f"N. Nauczyciel {numer}" for numer in range(150)]
+			}
+			for identyfikator in ("01", "02")
+		}
+	}
+
+
+def zmierz(
+	funkcja,
+	powtórzenia: int=5
+) -> float:
+	"""
+	Zwraca najkrótszy czas wykonania funkcji w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+		powtórzenia (int, optional): Liczba powtórzeń. Domyślnie 5.
+
+	Returns:
+		float: Najkrótszy czas w milisekundach.
+	"""
+
+	czasy = []
+
+	for _ in range(powtórzenia):
+		początek = time.perf_counter()
+		funkcja()
+		czasy.append(time.perf_counter() - początek)
+
+	return min(czasy) * 1000
+
+
+liczbaSerwerów = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+konfiguracja = przykładowaKonfiguracja(liczbaSerwerów)
+czytelny = json.dumps(konfiguracja, ensure_ascii=False, indent=4).encode("utf-8")
+zwarty = codec.zakoduj(konfiguracja, czytelnie=False)
+
+print(f"Kodek: {codec.nazwaKodeka}, serwery: {liczbaSerwerów}")
+print(f"json (indent=4)  zapis: {zmierz(lambda: json.dumps(konfiguracja, ensure_ascii=False, indent=4)):8.1f} ms, odczyt: {zmierz(lambda: json.loads(czytelny)):8.1f} ms, rozmiar: {len(czytelny) / 1024:8.0f} KiB")
+print(f"kodek czytelny   zapis: {zmierz(lambda: codec.zakoduj(konfiguracja)):8.1f} ms, odczyt: {zmierz(lambda: codec.odkoduj(czytelny)):8.1f} ms")
+print(f"kodek zwarty     zapis: {zmierz(lambda: codec.zakoduj(konfiguracja, czytelnie=False)):8.1f} ms, odczyt: {zmierz(lambda: codec.odkoduj(zwarty)):8.1f} ms, rozmiar: {len(zwarty) / 1024:8.0f} KiB")
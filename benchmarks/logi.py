@@ -0,0 +1,143 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+
+# Benchmark przestojów pętli zdarzeń podczas serii logów z pełnymi śladami błędów:
+# bezpośredni zapis do pliku (RotatingFileHandler) kontra kolejka logów z wątkiem zapisującym (QueueListener).
+# Uruchomienie: python benchmarks/logi.py [liczba serii] [wpisów w serii]
+
+# Standardowe biblioteki
+import asyncio
+import logging
+from logging.handlers import (
+	QueueListener,
+	RotatingFileHandler
+)
+from pathlib import Path
+import queue
+import statistics
+import sys
+import tempfile
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.classes.logs import KolejkaLogów
+from src.classes.timezone import Timezone
+
+liczbaSerii = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+wpisówWSerii = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+okres = 0.005
+
+def zagnieżdżonyBłąd(głębokość: int) -> None:
+	"""
+	Zgłasza wyjątek z kilkupoziomowym śladem, podobnym do błędów pobierania stron szkół.
+
+	Args:
+		głębokość (int): Liczba zagnieżdżonych wywołań.
+	"""
+
+	if głębokość:
+		zagnieżdżonyBłąd(głębokość - 1)
+	else:
+		raise ConnectionError("Nie udało się połączyć ze stroną szkoły.")
+
+
+async def zmierzPrzestoje(logger: logging.Logger) -> tuple[float, float, float]:
+	"""
+	Mierzy opóźnienia zegara pętli zdarzeń podczas kolejnych serii logów.
+
+	Args:
+		logger (logging.Logger): Logger, do którego wysyłane są serie wpisów.
+
+	Returns:
+		tuple[float, float, float]: Mediana i maksimum opóźnienia zegara oraz łączny czas blokady pętli przez logowanie, w milisekundach.
+	"""
+
+	opóźnienia = []
+	blokada = 0.0
+	zakończono = False
+
+	async def zegar() -> None:
+		oczekiwany = time.perf_counter() + okres
+
+		while not zakończono:
+			await asyncio.sleep(okres)
+			teraz = time.perf_counter()
+			opóźnienia.append(max(0.0, teraz - oczekiwany))
+			oczekiwany = teraz + okres
+
+	zadanie = asyncio.create_task(zegar())
+
+	for seria in range(liczbaSerii):
+		początek = time.perf_counter()
+
+		for numer in range(wpisówWSerii):
+			try:
+				zagnieżdżonyBłąd(8)
+			except Exception as e:
+				logger.exception(f"Wystąpił błąd podczas pobierania danych szkoły {numer} (seria {seria}). Więcej informacji: {e}")
+
+		blokada += time.perf_counter() - początek
+		await asyncio.sleep(okres * 4)
+
+	zakończono = True
+	await zadanie
+
+	return statistics.median(opóźnienia) * 1000, max(opóźnienia) * 1000, blokada * 1000
+
+
+def przygotujLogger(nazwa: str, folder: Path, kolejka: bool) -> tuple[logging.Logger, QueueListener | None]:
+	"""
+	Tworzy logger zapisujący do pliku w folderze tymczasowym, bezpośrednio lub przez kolejkę logów.
+
+	Args:
+		nazwa (str): Nazwa loggera.
+		folder (Path): Folder pliku logów.
+		kolejka (bool): Czy zapisywać przez kolejkę logów.
+
+	Returns:
+		tuple[logging.Logger, QueueListener | None]: Logger oraz uruchomiony wątek zapisujący (tylko dla kolejki).
+	"""
+
+	obsługa = RotatingFileHandler(folder / f"{nazwa}.log", encoding="utf-8", maxBytes=32 * 1024 * 1024, backupCount=1)
+	obsługa.setFormatter(Timezone("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+	logger = logging.getLogger(nazwa)
+	logger.setLevel(logging.INFO)
+	logger.propagate = False
+	słuchacz = None
+
+	if kolejka:
+		kolejkaLogów = KolejkaLogów(queue.SimpleQueue())
+		słuchacz = QueueListener(kolejkaLogów.queue, obsługa, respect_handler_level=True)
+		słuchacz.start()
+		logger.addHandler(kolejkaLogów)
+	else:
+		logger.addHandler(obsługa)
+
+	return logger, słuchacz
+
+
+with tempfile.TemporaryDirectory() as folder:
+	print(f"Serie: {liczbaSerii}, wpisów w serii: {wpisówWSerii}, okres zegara: {okres * 1000:.0f} ms")
+
+	for nazwa, kolejka in (("bezposrednio", False), ("kolejka", True)):
+		logger, słuchacz = przygotujLogger(nazwa, Path(folder), kolejka)
+		mediana, maksimum, blokada = asyncio.run(zmierzPrzestoje(logger))
+
+		if słuchacz:
+			słuchacz.stop()
+
+		print(f"{nazwa:<14} mediana: {mediana:6.2f} ms, maksimum: {maksimum:6.2f} ms, blokada pętli: {blokada:8.1f} ms")
@@ -0,0 +1,105 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Benchmark porównujący magazyn plików `JSON` z magazynem SQLite.
+# Uruchomienie: python benchmarks/magazyn.py [liczba serwerów]
+
+# Standardowe biblioteki
+import asyncio
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+os.chdir(tempfile.mkdtemp(prefix="zastepstwa-magazyn-"))
+
+# Wewnętrzne importy
+from src.handlers import data
+from src.handlers.configuration import (
+	konfiguracja,
+	opublikujMigawkę
+)
+
+def przykładoweDane(numer: int) -> dict:
+	"""
+	Tworzy przykładowe dane serwera o rozmiarze zbliżonym do rzeczywistych plików danych.
+
+	Args:
+		numer (int): Numer serwera, z którego wyprowadzane są wartości.
+
+	Returns:
+		dict: Dane serwera w formacie pliku danych.
+	"""
+
+	return {
+		"suma-kontrolna-informacji-dodatkowych": f"{numer:064x}",
+		"suma-kontrolna-wpisow-zastepstw": f"{numer * 7:064x}",
+		"licznik-zastepstw": numer % 500,
+		"statystyki-nauczycieli": {f"N. Nauczyciel {indeks}": indeks + numer % 5 for indeks in range(40)},
+		"ostatni-raport": ""
+	}
+
+
+async def zmierz(
+	nazwa: str,
+	liczbaSerwerów: int
+) -> None:
+	"""
+	Mierzy czas jednego cyklu zapisu i odczytu wszystkich serwerów dla wybranego magazynu danych.
+
+	Args:
+		nazwa (str): Nazwa magazynu danych (`json` lub `sqlite`).
+		liczbaSerwerów (int): Liczba symulowanych serwerów.
+	"""
+
+	konfiguracja["magazyn-danych"] = nazwa
+	opublikujMigawkę()
+	data.folderDanych = Path(nazwa)
+	data.folderDanych.mkdir(exist_ok=True)
+	identyfikatory = [str(10**17 + numer) for numer in range(liczbaSerwerów)]
+
+	początek = time.perf_counter()
+	await asyncio.gather(*(data.zarządzajPlikiemDanych(identyfikator, przykładoweDane(numer)) for numer, identyfikator in enumerate(identyfikatory)))
+	zapis = time.perf_counter() - początek
+
+	początek = time.perf_counter()
+	await asyncio.gather(*(data.zarządzajPlikiemDanych(identyfikator) for identyfikator in identyfikatory))
+	odczyt = time.perf_counter() - początek
+
+	print(f"{nazwa:>6}: zapis {zapis * 1000:9.1f} ms, odczyt {odczyt * 1000:9.1f} ms ({liczbaSerwerów} serwerów)")
+
+	magazyn = data.pobierzMagazynSQLite()
+
+	if magazyn:
+		początek = time.perf_counter()
+		await magazyn.zapiszWiele({identyfikator: przykładoweDane(numer + 1) for numer, identyfikator in enumerate(identyfikatory)})
+		zapisWsadowy = time.perf_counter() - początek
+
+		początek = time.perf_counter()
+		await magazyn.odczytajWszystkie()
+		odczytWsadowy = time.perf_counter() - początek
+
+		print(f"{nazwa:>6}: zapis wsadowy {zapisWsadowy * 1000:9.1f} ms, odczyt wszystkich {odczytWsadowy * 1000:9.1f} ms")
+
+	await data.zamknijMagazynDanych()
+
+
+async def main() -> None:
+	liczbaSerwerów = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+	await zmierz("json", liczbaSerwerów)
+	await zmierz("sqlite", liczbaSerwerów)
+
+asyncio.run(main())
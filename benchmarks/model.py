@@ -0,0 +1,104 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Benchmark pamięci i czasu budowania typowanego modelu konfiguracji dla 10 000 serwerów.
+# Uruchomienie: python benchmarks/model.py [liczba serwerów]
+
+# Standardowe biblioteki
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.classes.snapshot import zbudujMigawkę
+
+def przykładoweSerwery(liczbaSerwerów: int) -> bytes:
+	"""
+	Tworzy zawartość pliku `servers.json` z podaną liczbą serwerów.
+
+	Args:
+		liczbaSerwerów (int): Liczba serwerów w konfiguracji.
+
+	Returns:
+		bytes: Zakodowana sekcja `serwery`.
+	"""
+
+	return json.dumps({
+		str(10**17 + numer): {
+			"identyfikator-kanalu": str(10**18 + numer),
+			"szkoła": "01" if numer % 2 else "02",
+			"wybrane-klasy": [f"{numer % 5 + 1}{litera}" for litera in "ABC"],
+			"wybrani-nauczyciele": ["A. Kowalski", "Ż. Źdźbło"] if numer % 3 == 0 else [],
+			"wysyłaj-numerki": bool(numer % 2)
+		}
+		for numer in range(liczbaSerwerów)
+	}).encode("utf-8")
+
+
+def zmierzPamięć(funkcja) -> tuple[object, float, float]:
+	"""
+	Wykonuje funkcję i zwraca jej wynik, zajętą przez niego pamięć w MiB oraz czas wykonania w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+
+	Returns:
+		tuple[object, float, float]: Wynik funkcji, pamięć w MiB i czas w milisekundach.
+	"""
+
+	tracemalloc.start()
+	początek = time.perf_counter()
+	wynik = funkcja()
+	czas = (time.perf_counter() - początek) * 1000
+	pamięć = tracemalloc.get_traced_memory()[0] / 2**20
+	tracemalloc.stop()
+
+	return wynik, pamięć, czas
+
+
+liczbaSerwerów = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+plik = przykładoweSerwery(liczbaSerwerów)
+szkoły = {
+	identyfikator: {
+		"nazwa": f"Szkoła {identyfikator}",
+		"url": f"https://kacpergorka.com/zastepstwa/{identyfikator}",
+		"lista-klas": {str(rok): [f"{rok}{litera}" for litera in "ABCDEFGH"] for rok in range(1, 6)},
+		"lista-nauczycieli": [f"N. Nauczyciel {numer}" for numer in range(150)]
+	}
+	for identyfikator in ("01", "02")
+}
+
+serwery, pamięćSłowników, czasSłowników = zmierzPamięć(lambda: json.loads(plik))
+migawka, pamięćModelu, czasModelu = zmierzPamięć(lambda: zbudujMigawkę({"szkoły": szkoły, "serwery": json.loads(plik)}))
+
+print(f"Serwery: {liczbaSerwerów}")
+print(f"słowniki JSON  pamięć: {pamięćSłowników:7.1f} MiB, czas: {czasSłowników:8.1f} ms")
+print(f"model + indeks pamięć: {pamięćModelu:7.1f} MiB, czas: {czasModelu:8.1f} ms (z dekodowaniem)")
+
+powtórzenia = 100000
+początek = time.perf_counter()
+for _ in range(powtórzenia):
+	[klasa for grupy in szkoły["01"]["lista-klas"].values() for klasa in grupy]
+spłaszczanie = (time.perf_counter() - początek) / powtórzenia * 1e6
+
+początek = time.perf_counter()
+for _ in range(powtórzenia):
+	migawka.pobierzKlasy("01")
+indeks = (time.perf_counter() - początek) / powtórzenia * 1e6
+
+print(f"lista klas     spłaszczanie: {spłaszczanie:6.2f} µs, gotowy indeks: {indeks:6.2f} µs")
@@ -0,0 +1,120 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Benchmark dopasowywania wpisów do listy nauczycieli wraz ze sprawdzeniem zgodności z difflib.get_close_matches.
+
+# Benchmark normalizacji tekstu wraz ze sprawdzeniem zgodności z pierwotną implementacją opartą na unicodedata.
+# Uruchomienie: python benchmarks/normalizacja.py [liczba losowych tekstów]
+
+# Standardowe biblioteki
+from pathlib import Path
+import random
+import re
+import sys
+import time
+import unicodedata
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.core.normalization import (
+	normalizujTekst,
+	normalizujTekstBezPamięci
+)
+
+def pierwotnaNormalizacja(tekst: str) -> str:
+	"""
+	Pierwotna implementacja normalizacji, służąca jako wzorzec poprawności.
+
+	Args:
+		tekst (str): Tekst wejściowy do normalizacji.
+
+	Returns:
+		str: Oczyszczony i znormalizowany tekst.
+	"""
+
+	if not tekst or not isinstance(tekst, str):
+		return ""
+
+	tekst = tekst.strip()
+	tekst = unicodedata.normalize("NFKD", tekst)
+	tekst = "".join(znak for znak in tekst if not unicodedata.combining(znak))
+	tekst = tekst.replace(".", " ")
+	tekst = re.sub(r"\s+", " ", tekst)
+
+	return tekst.lower()
+
+
+def zmierz(funkcja, powtórzenia: int=5) -> float:
+	"""
+	Zwraca najkrótszy czas wykonania funkcji w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+		powtórzenia (int, optional): Liczba powtórzeń. Domyślnie 5.
+
+	Returns:
+		float: Najkrótszy czas w milisekundach.
+	"""
+
+	czasy = []
+
+	for _ in range(powtórzenia):
+		początek = time.perf_counter()
+		funkcja()
+		czasy.append(time.perf_counter() - początek)
+
+	return min(czasy) * 1000
+
+
+losowanie = random.Random(2026)
+liczbaTekstów = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+# Korpus: każdy pojedynczy znak BMP, losowe teksty z trudnych zakresów oraz typowe wiersze zastępstw
+alfabet = (
+	"abcXYZ019 .-/()\t\n"
+	"ąćęłńóśźżĄĆĘŁŃÓŚŹŻ"
+	"àáâãäåçèéñöøüÿßÆÐÞ ²½ª"
+	"̧̨́̈ͅ"
+	"ǅǈǲſıİĳŉ"
+	"  　․‥ﬁﬃＡＢ１"
+	"αβΆΐабвйё"
+)
+korpus = [chr(kod) for kod in range(0x10000) if not 0xD800 <= kod < 0xE000]
+korpus += [chr(kod) * 3 + " ." + chr(kod) for kod in range(0x80, 0x3100)]
+korpus += ["".join(losowanie.choice(alfabet) for _ in range(losowanie.randrange(1, 24))) for _ in range(liczbaTekstów)]
+wiersze = [
+	f"{lekcja} | {klasa} - {przedmiot} | {nauczyciel} | {uwagi}"
+	for lekcja in range(1, 9)
+	for klasa in ("1a", "2 b", "3TI", "4 LO", "1A(gr.1)")
+	for przedmiot, nauczyciel in (("j. polski", "mgr Łukasz Wiśniewski"), ("matematyka", "A. Żółtowska"), ("informatyka", "J. Kowalski"))
+	for uwagi in ("", "Uczniowie zwolnieni do domu.", "Sala 12  (zmiana)")
+]
+korpus += wiersze
+
+for tekst in korpus:
+	oczekiwane = pierwotnaNormalizacja(tekst)
+	assert normalizujTekstBezPamięci(tekst) == oczekiwane, repr(tekst)
+	assert normalizujTekst(tekst) == oczekiwane, repr(tekst)
+
+print(f"Teksty w korpusie: {len(korpus)}, wyniki zgodne z pierwotną implementacją: tak")
+
+# Obciążenie zbliżone do filtrowania: te same nazwy klas i nauczycieli normalizowane w każdym wierszu
+nazwy = ["1a", "2 b", "3TI", "4 LO", "mgr Łukasz Wiśniewski", "A. Żółtowska", "J. Kowalski", "Dąbrowski"] * 25
+obciążenie = (wiersze + nazwy) * 10
+
+print(f"Wywołania w obciążeniu: {len(obciążenie)}")
+print(f"pierwotna implementacja:       {zmierz(lambda: [pierwotnaNormalizacja(tekst) for tekst in obciążenie]):8.1f} ms")
+print(f"tablica translacji:            {zmierz(lambda: [normalizujTekstBezPamięci(tekst) for tekst in obciążenie]):8.1f} ms")
+print(f"tablica translacji i LRU:      {zmierz(lambda: [normalizujTekst(tekst) for tekst in obciążenie]):8.1f} ms")
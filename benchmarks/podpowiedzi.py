@@ -0,0 +1,91 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+
+# Benchmark podpowiedzi (autocomplete) polecenia /skonfiguruj: indeks prefiksów kontra liniowe przeszukiwanie listy.
+# Uruchomienie: python benchmarks/podpowiedzi.py [liczba nauczycieli]
+
+# Standardowe biblioteki
+from pathlib import Path
+import random
+import sys
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(katalogRepozytorium))
+
+# Wewnętrzne importy
+from src.core.matching import IndeksPrefiksów
+from src.core.normalization import normalizujTekst
+
+def zmierz(funkcja, powtórzenia: int=5) -> float:
+	"""
+	Zwraca najkrótszy czas wykonania funkcji w milisekundach.
+
+	Args:
+		funkcja (Callable): Mierzona funkcja.
+		powtórzenia (int, optional): Liczba powtórzeń. Domyślnie 5.
+
+	Returns:
+		float: Najkrótszy czas w milisekundach.
+	"""
+
+	czasy = []
+
+	for _ in range(powtórzenia):
+		początek = time.perf_counter()
+		funkcja()
+		czasy.append(time.perf_counter() - początek)
+
+	return min(czasy) * 1000
+
+
+def przeszukajLiniowo(elementy: list[str], tekst: str) -> list[str]:
+	"""
+	Wyszukuje elementy zawierające wpisany tekst, normalizując każdy element przy każdym zapytaniu (poprzednia implementacja).
+
+	Args:
+		elementy (list[str]): Przeszukiwane elementy.
+		tekst (str): Tekst wpisany przez użytkownika.
+
+	Returns:
+		list[str]: Maksymalnie 25 pasujących elementów.
+	"""
+
+	fraza = normalizujTekst(tekst)
+	return [element for element in elementy if not fraza or fraza in normalizujTekst(element)][:25]
+
+
+losowanie = random.Random(2026)
+liczbaNauczycieli = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+imiona = ["Anna", "Jan", "Ewa", "Piotr", "Zofia", "Łukasz", "Małgorzata", "Grzegorz", "Żaneta", "Stanisław"]
+nazwiska = ["Kowalski", "Nowak", "Wiśniewska", "Wójcik", "Kamińska", "Lewandowski", "Zieliński", "Szymańska", "Woźniak", "Dąbrowski", "Kozłowska", "Jankowski"]
+nauczyciele = sorted({f"{losowanie.choice(imiona)} {losowanie.choice(nazwiska)}{losowanie.randrange(1000)}" for _ in range(liczbaNauczycieli * 2)})[:liczbaNauczycieli]
+
+# Kolejne znaki wpisywane przez użytkownika, tak jak wysyła je Discord
+zapytania = [nauczyciel.split()[1][:długość] for nauczyciel in losowanie.sample(nauczyciele, 50) for długość in range(1, 8)]
+indeks = IndeksPrefiksów(nauczyciele)
+
+for zapytanie in zapytania:
+	fraza = normalizujTekst(zapytanie)
+	oczekiwane = [nauczyciel for nauczyciel in nauczyciele if normalizujTekst(nauczyciel).replace(" ", "").startswith(fraza) or any(słowo.startswith(fraza) for słowo in normalizujTekst(nauczyciel).split())]
+	assert sorted(indeks.szukaj(zapytanie, limit=len(nauczyciele))) == sorted(oczekiwane), zapytanie
+
+print(f"Nauczyciele: {len(nauczyciele)}, zapytania: {len(zapytania)}, wyniki poprawne: tak")
+
+czasLiniowy = zmierz(lambda: [przeszukajLiniowo(nauczyciele, zapytanie) for zapytanie in zapytania])
+czasIndeksu = zmierz(lambda: [indeks.szukaj(zapytanie) for zapytanie in zapytania])
+
+print(f"przeszukiwanie liniowe:        {czasLiniowy / len(zapytania):8.3f} ms na zapytanie")
+print(f"indeks prefiksów:              {czasIndeksu / len(zapytania):8.3f} ms na zapytanie")
+print(f"budowa indeksu:                {zmierz(lambda: IndeksPrefiksów(nauczyciele)):8.1f} ms")
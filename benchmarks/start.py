@@ -0,0 +1,96 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Benchmark czasu uruchamiania bota od startu procesu do gotowości do połączenia z Discordem, z podziałem na fazy.
+# Fazy `setup_hook`, `on_ready` i `pierwszy-cykl` wymagają połączenia z Discordem, dlatego ich czasy zapisuje w logach sam bot.
+# Uruchomienie: python benchmarks/start.py [liczba serwerów] [powtórzenia]
+
+# Standardowe biblioteki
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+katalogRepozytorium = Path(__file__).resolve().parent.parent
+
+# Skrypt wykonywany w osobnym procesie, odtwarzający kolejność uruchamiania z main.py bez łączenia z Discordem
+skrypt = """
+import json, time
+początek = time.perf_counter()
+from src.handlers.bootstrap import czasyFaz, oznaczFazę, początekUruchamiania, przygotujAplikację
+przygotujAplikację()
+import discord
+from src.classes.zastepstwa import bot
+oznaczFazę("importy")
+przesunięcie = początekUruchamiania - początek
+print(json.dumps({"import-bootstrap": przesunięcie, **{nazwa: czas + przesunięcie for nazwa, czas in czasyFaz.items()}}))
+"""
+
+def uruchom(katalog: Path) -> tuple[float, dict[str, float]]:
+	"""
+	Uruchamia skrypt startowy w nowym procesie i zwraca całkowity czas procesu oraz czasy faz.
+
+	Args:
+		katalog (Path): Katalog roboczy procesu z plikami konfiguracyjnymi.
+
+	Returns:
+		tuple[float, dict[str, float]]: Czas całego procesu w sekundach i czasy zakończenia faz w sekundach od pierwszej instrukcji skryptu.
+	"""
+
+	początek = time.perf_counter()
+	wynik = subprocess.run(
+		[sys.executable, "-c", skrypt],
+		cwd=katalog,
+		env={**os.environ, "PYTHONPATH": str(katalogRepozytorium)},
+		capture_output=True,
+		text=True,
+		check=True
+	)
+
+	return time.perf_counter() - początek, json.loads(wynik.stdout.strip().splitlines()[-1])
+
+
+liczbaSerwerów = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+powtórzenia = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+with tempfile.TemporaryDirectory() as folder:
+	katalog = Path(folder)
+	czasZimny, _ = uruchom(katalog)
+
+	(katalog / "servers.json").write_text(json.dumps({
+		str(10**17 + numer): {
+			"identyfikator-kanalu": str(10**18 + numer),
+			"szkoła": "01" if numer % 2 else "02",
+			"wybrane-klasy": [f"{numer % 5 + 1}A"],
+			"wybrani-nauczyciele": [],
+			"wysyłaj-numerki": False
+		}
+		for numer in range(liczbaSerwerów)
+	}), encoding="utf-8")
+
+	wyniki = [uruchom(katalog) for _ in range(powtórzenia)]
+
+print(f"Serwery: {liczbaSerwerów}, powtórzenia: {powtórzenia}")
+print(f"pierwsze uruchomienie (tworzenie config.json): {czasZimny * 1000:8.1f} ms")
+print(f"cały proces (mediana):                         {statistics.median(czas for czas, _ in wyniki) * 1000:8.1f} ms")
+
+poprzedni = 0.0
+
+for nazwa in wyniki[0][1]:
+	czas = statistics.median(fazy[nazwa] for _, fazy in wyniki)
+	print(f"  {nazwa:<16} {czas * 1000:8.1f} ms (+{(czas - poprzedni) * 1000:7.1f} ms)")
+	poprzedni = czas
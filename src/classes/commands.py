@@ -19,12 +19,11 @@ import discord
 
 # Wewnętrzne importy
 from src.classes.constants import Constants
-from src.handlers.configuration import konfiguracja
+from src.core.matching import IndeksDopasowań
+from src.handlers.configuration import pobierzMigawkę
 from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
-	dopasujWpisyDoListy,
 	pobierzListęKlas,
-	pobierzSłownikSerwera,
 	usuńDuplikaty,
 	wyczyśćFiltry,
 	zapiszKluczeSerwera
@@ -47,13 +46,14 @@ class WidokPodsumowania():
 			discord.Embed: Embed z podsumowaniem aktualnej konfiguracji bota dla serwera Discord.
 		"""
 
-		konfiguracjaSerwera = pobierzSłownikSerwera(identyfikatorSerwera)
-		identyfikatorSzkoły = konfiguracjaSerwera.get("szkoła", "")
-		nazwaSzkoły = konfiguracja.get("szkoły", {}).get(identyfikatorSzkoły, {}).get("nazwa", identyfikatorSzkoły)
+		migawka = pobierzMigawkę()
+		konfiguracjaSerwera = migawka.pobierzSerwer(identyfikatorSerwera)
+		szkoła = migawka.pobierzSzkołę(konfiguracjaSerwera.szkoła)
+		nazwaSzkoły = szkoła.nazwa if szkoła else konfiguracjaSerwera.szkoła
 
-		kanał = f"<#{konfiguracjaSerwera.get('identyfikator-kanalu', '')}>" if konfiguracjaSerwera.get("identyfikator-kanalu", "") else "Brak"
-		klasy = ", ".join(re.sub(r"(\d)\s+([A-Za-z])", r"\1\2", klasa) for klasa in konfiguracjaSerwera.get("wybrane-klasy", [])) or "Brak"
-		nauczyciele = ", ".join(f"{nauczyciel}" for nauczyciel in konfiguracjaSerwera.get("wybrani-nauczyciele", [])) or "Brak"
+		kanał = f"<#{konfiguracjaSerwera.identyfikatorKanału}>" if konfiguracjaSerwera.identyfikatorKanału else "Brak"
+		klasy = ", ".join(re.sub(r"(\d)\s+([A-Za-z])", r"\1\2", klasa) for klasa in konfiguracjaSerwera.wybraneKlasy) or "Brak"
+		nauczyciele = ", ".join(f"{nauczyciel}" for nauczyciel in konfiguracjaSerwera.wybraniNauczyciele) or "Brak"
 
 		embed = discord.Embed(
 			title="**Zapisano wprowadzone dane!**",
@@ -283,7 +283,14 @@ class ModalWybierania(discord.ui.Modal):
 			identyfikatorSerwera = str(interaction.guild.id)
 			suroweDane = self.pole.value
 			wpisy = [element.strip() for element in re.split(r",|;", suroweDane) if element.strip()]
-			idealneDopasowania, sugestie, nieZnaleziono = dopasujWpisyDoListy(wpisy, self.lista, cutoff=0.6)
+			szkoła = pobierzMigawkę().pobierzSzkołę(self.szkoła)
+
+			if szkoła:
+				indeks = szkoła.indeksKlas if self.typDanych == "klasy" else szkoła.indeksNauczycieli
+			else:
+				indeks = IndeksDopasowań(self.lista)
+
+			idealneDopasowania, sugestie, nieZnaleziono = indeks.dopasuj(wpisy, cutoff=0.6)
 
 			if nieZnaleziono:
 				embed = discord.Embed(
@@ -420,7 +427,8 @@ class PrzyciskNauczyciel(discord.ui.Button):
 		self,
 		interaction: discord.Interaction
 	) -> None:
-		listaNauczycieli = konfiguracja.get("szkoły", {}).get(self.szkoła, {}).get("lista-nauczycieli", [])
+		szkoła = pobierzMigawkę().pobierzSzkołę(self.szkoła)
+		listaNauczycieli = list(szkoła.nauczyciele) if szkoła else []
 		if not listaNauczycieli:
 			embed = discord.Embed(
 				title="**Opcja niedostępna!**",
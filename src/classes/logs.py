@@ -0,0 +1,235 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import contextlib
+from datetime import datetime
+import json
+import logging
+from logging.handlers import QueueHandler
+import threading
+import time
+from typing import (
+	Any,
+	Callable,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.classes.timezone import Timezone
+
+# Atrybuty, które posiada każdy wpis logów; pozostałe pochodzą z argumentu `extra` i trafiają do logów JSON
+atrybutyWpisu = frozenset(vars(logging.makeLogRecord({})).keys()) | {"message", "asctime"}
+
+class KolejkaLogów(QueueHandler):
+	"""
+	Obsługa logów przekazująca wpisy do kolejki, z której zapisuje je wątek `QueueListener`.
+
+	W przeciwieństwie do `QueueHandler` wpis nie jest formatowany w wątku wywołującym (pętli zdarzeń): scalana jest
+	jedynie treść z argumentami, a formatowanie czasu i śladu błędu (`exc_info`) odbywa się dopiero w wątku zapisującym.
+	Kolejka działa w obrębie jednego procesu, więc wpis nie musi nadawać się do serializacji. Wpisy bez argumentów
+	(np. `LeniwaWiadomość`) nie są zamieniane na tekst, dzięki czemu ich treść budowana jest dopiero w wątku zapisującym.
+	"""
+
+	def prepare(self, record):
+		if record.args:
+			record.msg = record.getMessage()
+			record.args = None
+
+		return record
+
+
+class LeniwaWiadomość():
+	"""
+	Treść wpisu logów budowana dopiero podczas formatowania, czyli w wątku zapisującym logi, a nie w pętli zdarzeń.
+	Argumenty muszą zostać wcześniej odczytane z obiektów, które mogą się zmienić (np. interakcji Discorda).
+
+	Attributes:
+		funkcja (Callable[..., str]): Funkcja budująca treść wpisu.
+		argumenty (tuple[Any, ...]): Argumenty przekazywane do funkcji.
+	"""
+
+	__slots__ = ("funkcja", "argumenty")
+
+	def __init__(
+		self,
+		funkcja: Callable[..., str],
+		*argumenty: Any
+	) -> None:
+		self.funkcja = funkcja
+		self.argumenty = argumenty
+
+	def __str__(self) -> str:
+		return self.funkcja(*self.argumenty)
+
+
+class FormatJSON(Timezone):
+	"""
+	Formatter zapisujący każdy wpis jako jedną linię JSON ze stałym zestawem pól (`time`, `level`, `logger`, `event`,
+	`guild`, `school`, `duration_ms`, `message`) oraz wszystkimi dodatkowymi polami przekazanymi w argumencie `extra`.
+	"""
+
+	stałePola = ("event", "guild", "school", "duration_ms")
+
+	def format(self, record):
+		wpis = {
+			"time": datetime.fromtimestamp(record.created, self.strefaCzasowa).isoformat(timespec="milliseconds"),
+			"level": record.levelname,
+			"logger": record.name
+		}
+
+		for pole in self.stałePola:
+			wpis[pole] = getattr(record, pole, None)
+
+		wpis["message"] = record.getMessage()
+
+		for pole, wartość in vars(record).items():
+			if pole not in atrybutyWpisu and pole not in wpis:
+				wpis[pole] = wartość
+
+		if record.exc_info:
+			if not record.exc_text:
+				record.exc_text = self.formatException(record.exc_info)
+
+		if record.exc_text:
+			wpis["exception"] = record.exc_text
+
+		return json.dumps(wpis, ensure_ascii=False, default=str)
+
+
+class FiltrPowtórzeń(logging.Filter):
+	"""
+	Filtr zwijający powtarzające się wpisy (np. te same ostrzeżenia dla tego samego serwera w każdym cyklu) w okresowe podsumowania.
+
+	Pierwszy wpis o danym kluczu jest przepuszczany, a kolejne w ciągu okna czasowego są jedynie zliczane. Po upływie okna,
+	jeśli coś pominięto, do celu trafia jeden wpis podsumowujący z liczbą pominiętych powtórzeń (pole `suppressed`).
+	Kluczem jest zdarzenie (`event`) wraz z pozostałymi polami `extra` (np. serwerem, szkołą), a dla wpisów bez zdarzenia - logger, poziom i treść.
+
+	Attributes:
+		okno (float): Długość okna w sekundach; wartość 0 wyłącza zwijanie.
+		poziom (int): Minimalny poziom wpisów, które mogą zostać zwinięte.
+		cel (Optional[Callable[[logging.LogRecord], Any]]): Funkcja przyjmująca wpisy podsumowujące (np. `KolejkaLogów.enqueue`).
+		wpisy (dict[tuple, list]): Dla każdego klucza: początek okna, liczba pominiętych powtórzeń i pola pierwszego wpisu.
+		następnePodsumowanie (float): Czas (monotoniczny), po którym wygasłe okna zostaną podsumowane.
+		blokada (threading.Lock): Blokada stanu filtra, wywoływanego z pętli zdarzeń i wątków roboczych.
+	"""
+
+	def __init__(
+		self,
+		okno: float=300,
+		poziom: int=logging.WARNING,
+		cel: Optional[Callable[[logging.LogRecord], Any]]=None
+	) -> None:
+		super().__init__()
+		self.okno = okno
+		self.poziom = poziom
+		self.cel = cel
+		self.wpisy = {}
+		self.następnePodsumowanie = 0.0
+		self.blokada = threading.Lock()
+
+	@staticmethod
+	def klucz(record: logging.LogRecord) -> Optional[tuple]:
+		"""
+		Wyznacza klucz, według którego wpisy uznawane są za powtórzenia.
+
+		Args:
+			record (logging.LogRecord): Wpis logów.
+
+		Returns:
+			Optional[tuple]: Klucz lub None, jeśli wpisu nie da się porównać bez budowania jego treści.
+		"""
+
+		if getattr(record, "event", None):
+			return tuple(sorted((pole, wartość) for pole, wartość in vars(record).items() if pole not in atrybutyWpisu and pole != "duration_ms"))
+
+		if isinstance(record.msg, str):
+			return (record.name, record.levelno, record.msg, record.args)
+
+		return None
+
+	def filter(self, record):
+		if self.okno <= 0 or record.levelno < self.poziom:
+			return True
+
+		try:
+			klucz = self.klucz(record)
+			hash(klucz)
+		except TypeError:
+			return True
+
+		if klucz is None:
+			return True
+
+		teraz = time.monotonic()
+
+		if teraz >= self.następnePodsumowanie:
+			self.podsumuj(teraz)
+
+		with self.blokada:
+			wpis = self.wpisy.get(klucz)
+
+			if wpis is None or teraz - wpis[0] >= self.okno:
+				if wpis is not None and wpis[1]:
+					self.wyślijPodsumowanie(wpis)
+
+				# Zapamiętywane są tylko pola potrzebne do podsumowania, bez śladu błędu i jego ramek
+				self.wpisy[klucz] = [teraz, 0, {
+					**{pole: wartość for pole, wartość in vars(record).items() if pole not in atrybutyWpisu},
+					"name": record.name,
+					"levelno": record.levelno,
+					"levelname": record.levelname,
+					"msg": record.msg,
+					"args": record.args
+				}]
+				return True
+
+			wpis[1] += 1
+
+		return False
+
+	def podsumuj(self, teraz: Optional[float]=None) -> None:
+		"""
+		Wysyła podsumowania wygasłych okien i usuwa je z pamięci filtra.
+
+		Args:
+			teraz (Optional[float]): Aktualny czas monotoniczny. Domyślnie (np. przy zamykaniu logów) podsumowywane są wszystkie okna.
+		"""
+
+		with self.blokada:
+			for klucz, wpis in list(self.wpisy.items()):
+				if teraz is None or teraz - wpis[0] >= self.okno:
+					if wpis[1]:
+						self.wyślijPodsumowanie(wpis)
+
+					del self.wpisy[klucz]
+
+			self.następnePodsumowanie = (teraz or time.monotonic()) + min(self.okno, 60)
+
+	def wyślijPodsumowanie(self, wpis: list) -> None:
+		"""
+		Tworzy wpis podsumowujący pominięte powtórzenia i przekazuje go do celu.
+
+		Args:
+			wpis (list): Stan okna: początek okna, liczba pominiętych powtórzeń i pola pierwszego wpisu.
+		"""
+
+		if self.cel is None:
+			return
+
+		_, pominięte, pierwszy = wpis
+		podsumowanie = logging.makeLogRecord({**pierwszy, "suppressed": pominięte})
+		podsumowanie.msg = f"Pominięto {pominięte} powtórzeń wpisu w ciągu {self.okno:g} s: {podsumowanie.getMessage()}"
+		podsumowanie.args = None
+
+		with contextlib.suppress(Exception):
+			self.cel(podsumowanie)
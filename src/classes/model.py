@@ -0,0 +1,369 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import codecs
+from dataclasses import (
+	dataclass,
+	field
+)
+import functools
+import re
+import sys
+from types import MappingProxyType
+from typing import (
+	Any,
+	Mapping,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.core.matching import (
+	IndeksDopasowań,
+	IndeksPrefiksów
+)
+from src.core.normalization import (
+	normalizujTekst,
+	zwróćNazwyKluczy
+)
+
+# Wspólny, pusty zestaw kluczy wykluczeń dla serwerów bez wybranych nauczycieli
+pusteKluczeWykluczeń = frozenset()
+
+class BłądKonfiguracji(ValueError):
+	"""
+	Błąd zgłaszany podczas budowania modelu konfiguracji z niepoprawnego wpisu pliku konfiguracyjnego.
+	"""
+
+
+def listaTekstów(
+	wartość: Any,
+	opis: str
+) -> tuple[str, ...]:
+	"""
+	Sprawdza, czy wartość jest listą tekstów, i zwraca ją jako krotkę internowanych ciągów znaków.
+
+	Args:
+		wartość (Any): Wartość do sprawdzenia.
+		opis (str): Opis pola używany w komunikacie błędu.
+
+	Returns:
+		tuple[str, ...]: Krotka tekstów. Identyczne teksty współdzielone są pomiędzy wszystkimi serwerami.
+
+	Raises:
+		BłądKonfiguracji: Jeśli wartość nie jest listą tekstów.
+	"""
+
+	if wartość is None:
+		return ()
+
+	if not isinstance(wartość, (list, tuple)) or not all(isinstance(element, str) for element in wartość):
+		raise BłądKonfiguracji(f"{opis} musi być listą tekstów, otrzymano: {wartość!r}.")
+
+	return tuple(sys.intern(element) for element in wartość)
+
+
+@functools.lru_cache(maxsize=8192)
+def zwróćKluczeWykluczeń(wybraniNauczyciele: tuple[str, ...]) -> frozenset[str]:
+	"""
+	Łączy klucze dopasowań wybranych nauczycieli w jeden zestaw, współdzielony przez serwery o tych samych filtrach.
+
+	Args:
+		wybraniNauczyciele (tuple[str, ...]): Krotka wybranych nauczycieli serwera.
+
+	Returns:
+		frozenset[str]: Zestaw kluczy wykluczeń. Wynik jest niezmienny, ponieważ pochodzi z pamięci podręcznej.
+	"""
+
+	if not wybraniNauczyciele:
+		return pusteKluczeWykluczeń
+
+	if len(wybraniNauczyciele) == 1:
+		return zwróćNazwyKluczy(wybraniNauczyciele[0])
+
+	return frozenset().union(*map(zwróćNazwyKluczy, wybraniNauczyciele))
+
+
+def kluczDnia(dzień: Any) -> str:
+	"""
+	Ujednolica zapis dnia do formatu DD.MM, dzięki czemu np. „1.9” i „01.09” wskazują ten sam dzień.
+
+	Args:
+		dzień (Any): Dzień z pliku konfiguracyjnego lub wyznaczony z daty.
+
+	Returns:
+		str: Dzień w formacie DD.MM lub tekst bez zmian, jeśli nie jest datą.
+	"""
+
+	tekst = str(dzień).strip()
+	dopasowanie = re.fullmatch(r"(\d{1,2})\.(\d{1,2})\.?", tekst)
+
+	if not dopasowanie:
+		return tekst
+
+	return f"{dopasowanie.group(1).zfill(2)}.{dopasowanie.group(2).zfill(2)}"
+
+
+def numerek(wartość: Any) -> int | str:
+	"""
+	Zamienia szczęśliwy numerek z pliku konfiguracyjnego na liczbę, a jeśli nie jest to możliwe, pozostawia go jako tekst.
+
+	Args:
+		wartość (Any): Numerek z pliku konfiguracyjnego.
+
+	Returns:
+		int | str: Numerek jako liczba lub tekst.
+	"""
+
+	if isinstance(wartość, int):
+		return int(wartość)
+
+	tekst = str(wartość).strip()
+
+	try:
+		return int(tekst)
+	except ValueError:
+		return sys.intern(tekst)
+
+
+@dataclass(frozen=True, slots=True)
+class Szkoła():
+	"""
+	Zweryfikowane dane szkoły z wyliczonymi podczas wczytywania konfiguracji indeksami.
+
+	Attributes:
+		identyfikator (str): ID szkoły.
+		nazwa (str): Nazwa szkoły.
+		url (str): Adres strony z zastępstwami.
+		kodowanie (str): Kodowanie strony z zastępstwami.
+		klasyWedługRoczników (Mapping[str, tuple[str, ...]]): Klasy pogrupowane według roczników.
+		klasy (tuple[str, ...]): Spłaszczona lista wszystkich klas szkoły.
+		nauczyciele (tuple[str, ...]): Lista nauczycieli szkoły.
+		znormalizowaniNauczyciele (tuple[str, ...]): Lista nauczycieli po normalizacji tekstu.
+		maNumerki (bool): Czy szkoła udostępnia szczęśliwe numerki.
+		szczęśliweNumerki (Mapping[str, tuple[int | str, ...]]): Przetworzone szczęśliwe numerki według dnia w formacie DD.MM.
+		indeksKlas (IndeksDopasowań): Indeks dopasowań wpisów użytkownika do listy klas.
+		indeksNauczycieli (IndeksDopasowań): Indeks dopasowań wpisów użytkownika do listy nauczycieli.
+		prefiksyKlas (IndeksPrefiksów): Indeks prefiksów klas dla podpowiedzi polecenia `/skonfiguruj`.
+		prefiksyNauczycieli (IndeksPrefiksów): Indeks prefiksów nauczycieli dla podpowiedzi polecenia `/skonfiguruj`.
+	"""
+
+	identyfikator: str
+	nazwa: str
+	url: str
+	kodowanie: str
+	klasyWedługRoczników: Mapping[str, tuple[str, ...]]
+	klasy: tuple[str, ...]
+	nauczyciele: tuple[str, ...]
+	znormalizowaniNauczyciele: tuple[str, ...]
+	maNumerki: bool
+	szczęśliweNumerki: Mapping[str, tuple[int | str, ...]]
+	indeksKlas: IndeksDopasowań = field(repr=False, compare=False)
+	indeksNauczycieli: IndeksDopasowań = field(repr=False, compare=False)
+	prefiksyKlas: IndeksPrefiksów = field(repr=False, compare=False)
+	prefiksyNauczycieli: IndeksPrefiksów = field(repr=False, compare=False)
+
+	@classmethod
+	def zDanych(
+		cls,
+		identyfikator: str,
+		dane: Any
+	) -> "Szkoła":
+		"""
+		Buduje model szkoły z wpisu pliku konfiguracyjnego, sprawdzając typy wszystkich pól.
+
+		Args:
+			identyfikator (str): ID szkoły.
+			dane (Any): Wpis szkoły z sekcji `szkoły`.
+
+		Returns:
+			Szkoła: Zweryfikowany model szkoły.
+
+		Raises:
+			BłądKonfiguracji: Jeśli wpis szkoły jest niepoprawny.
+		"""
+
+		opis = f"Szkoła o ID {identyfikator}"
+
+		if not isinstance(dane, Mapping):
+			raise BłądKonfiguracji(f"{opis} musi być słownikiem, otrzymano: {dane!r}.")
+
+		for klucz in ("nazwa", "url", "kodowanie"):
+			if not isinstance(dane.get(klucz, ""), str):
+				raise BłądKonfiguracji(f"{opis}: pole „{klucz}” musi być tekstem.")
+
+		kodowanie = dane.get("kodowanie", "iso-8859-2") or "iso-8859-2"
+
+		try:
+			codecs.lookup(kodowanie)
+		except LookupError:
+			raise BłądKonfiguracji(f"{opis}: nieznane kodowanie „{kodowanie}”.") from None
+
+		suroweKlasy = dane.get("lista-klas", {})
+
+		if isinstance(suroweKlasy, Mapping):
+			klasyWedługRoczników = {
+				sys.intern(str(rocznik)): listaTekstów(klasy, f"{opis}: rocznik „{rocznik}” w polu „lista-klas”")
+				for rocznik, klasy in suroweKlasy.items()
+			}
+		elif isinstance(suroweKlasy, (list, tuple)):
+			klasyWedługRoczników = {"": listaTekstów(suroweKlasy, f"{opis}: pole „lista-klas”")}
+		else:
+			raise BłądKonfiguracji(f"{opis}: pole „lista-klas” musi być słownikiem roczników lub listą klas.")
+
+		nauczyciele = listaTekstów(dane.get("lista-nauczycieli", []), f"{opis}: pole „lista-nauczycieli”")
+		maNumerki = dane.get("ma-numerki", "NIE")
+
+		if isinstance(maNumerki, str) and maNumerki.upper() in ("TAK", "NIE"):
+			maNumerki = maNumerki.upper() == "TAK"
+		elif not isinstance(maNumerki, bool):
+			raise BłądKonfiguracji(f"{opis}: pole „ma-numerki” musi mieć wartość „TAK” lub „NIE”.")
+
+		suroweNumerki = dane.get("szczęśliwe-numerki", {}) or {}
+
+		if not isinstance(suroweNumerki, Mapping) or not all(isinstance(numerki, (list, tuple)) for numerki in suroweNumerki.values()):
+			raise BłądKonfiguracji(f"{opis}: pole „szczęśliwe-numerki” musi być słownikiem list numerków według dnia.")
+
+		klasy = tuple(klasa for klasy in klasyWedługRoczników.values() for klasa in klasy)
+
+		return cls(
+			identyfikator=sys.intern(identyfikator),
+			nazwa=dane.get("nazwa", "") or identyfikator,
+			url=dane.get("url", ""),
+			kodowanie=kodowanie,
+			klasyWedługRoczników=MappingProxyType(klasyWedługRoczników),
+			klasy=klasy,
+			nauczyciele=nauczyciele,
+			znormalizowaniNauczyciele=tuple(normalizujTekst(nauczyciel) for nauczyciel in nauczyciele),
+			maNumerki=maNumerki,
+			szczęśliweNumerki=MappingProxyType({kluczDnia(dzień): tuple(map(numerek, numerki)) for dzień, numerki in suroweNumerki.items()}),
+			indeksKlas=IndeksDopasowań(klasy),
+			indeksNauczycieli=IndeksDopasowań(nauczyciele),
+			prefiksyKlas=IndeksPrefiksów(klasy),
+			prefiksyNauczycieli=IndeksPrefiksów(nauczyciele)
+		)
+
+	def numerkiNaDzień(self, dzień: str) -> tuple[int | str, ...]:
+		"""
+		Zwraca szczęśliwe numerki szkoły dla podanego dnia.
+
+		Args:
+			dzień (str): Dzień w formacie DD.MM (dopuszczalny jest również zapis bez zer wiodących, np. 1.9).
+
+		Returns:
+			tuple[int | str, ...]: Szczęśliwe numerki lub pusta krotka, jeśli dla tego dnia ich nie ma.
+		"""
+
+		return self.szczęśliweNumerki.get(kluczDnia(dzień), ())
+
+
+@dataclass(frozen=True, slots=True)
+class KonfiguracjaSerwera():
+	"""
+	Zweryfikowana konfiguracja serwera Discord. Teksty klas i nauczycieli są internowane, więc tysiące serwerów
+	wybierających te same filtry współdzieli jedną kopię każdego z nich.
+
+	Attributes:
+		identyfikator (int): ID serwera Discord.
+		identyfikatorKanału (Optional[int]): ID kanału tekstowego lub None, jeśli kanał nie został wybrany.
+		szkoła (str): ID szkoły przypisanej do serwera.
+		wybraneKlasy (tuple[str, ...]): Klasy wybrane do filtrowania zastępstw.
+		wybraniNauczyciele (tuple[str, ...]): Nauczyciele wybrani do filtrowania zastępstw.
+		wysyłajNumerki (bool): Czy na serwer wysyłane są szczęśliwe numerki.
+		kluczeWykluczeń (frozenset[str]): Klucze dopasowań wybranych nauczycieli, pomijanych w statystykach serwera.
+	"""
+
+	identyfikator: int
+	identyfikatorKanału: Optional[int] = None
+	szkoła: str = ""
+	wybraneKlasy: tuple[str, ...] = ()
+	wybraniNauczyciele: tuple[str, ...] = ()
+	wysyłajNumerki: bool = False
+	kluczeWykluczeń: frozenset[str] = field(default=pusteKluczeWykluczeń, repr=False, compare=False)
+
+	@classmethod
+	def zDanych(
+		cls,
+		identyfikator: str | int,
+		dane: Any
+	) -> "KonfiguracjaSerwera":
+		"""
+		Buduje model konfiguracji serwera z wpisu sekcji `serwery`, uzupełniając brakujące pola wartościami domyślnymi.
+
+		Args:
+			identyfikator (str | int): ID serwera Discord.
+			dane (Any): Wpis serwera z sekcji `serwery`.
+
+		Returns:
+			KonfiguracjaSerwera: Zweryfikowany model konfiguracji serwera.
+
+		Raises:
+			BłądKonfiguracji: Jeśli wpis serwera jest niepoprawny.
+		"""
+
+		opis = f"Serwer o ID {identyfikator}"
+
+		try:
+			identyfikator = int(identyfikator)
+		except (TypeError, ValueError):
+			raise BłądKonfiguracji(f"{opis}: ID serwera musi być liczbą.") from None
+
+		if not isinstance(dane, Mapping):
+			raise BłądKonfiguracji(f"{opis} musi być słownikiem, otrzymano: {dane!r}.")
+
+		identyfikatorKanału = dane.get("identyfikator-kanalu", "")
+
+		if identyfikatorKanału in ("", None):
+			identyfikatorKanału = None
+		elif isinstance(identyfikatorKanału, int) or (isinstance(identyfikatorKanału, str) and identyfikatorKanału.strip().isdigit()):
+			identyfikatorKanału = int(identyfikatorKanału)
+		else:
+			raise BłądKonfiguracji(f"{opis}: pole „identyfikator-kanalu” musi być ID kanału, otrzymano: {identyfikatorKanału!r}.")
+
+		szkoła = dane.get("szkoła", "")
+
+		if not isinstance(szkoła, str):
+			raise BłądKonfiguracji(f"{opis}: pole „szkoła” musi być tekstem.")
+
+		wysyłajNumerki = dane.get("wysyłaj-numerki", False)
+
+		if not isinstance(wysyłajNumerki, bool):
+			raise BłądKonfiguracji(f"{opis}: pole „wysyłaj-numerki” musi mieć wartość logiczną.")
+
+		wybraniNauczyciele = listaTekstów(dane.get("wybrani-nauczyciele", []), f"{opis}: pole „wybrani-nauczyciele”")
+
+		return cls(
+			identyfikator=identyfikator,
+			identyfikatorKanału=identyfikatorKanału,
+			szkoła=sys.intern(szkoła),
+			wybraneKlasy=listaTekstów(dane.get("wybrane-klasy", []), f"{opis}: pole „wybrane-klasy”"),
+			wybraniNauczyciele=wybraniNauczyciele,
+			wysyłajNumerki=wysyłajNumerki,
+			kluczeWykluczeń=zwróćKluczeWykluczeń(wybraniNauczyciele)
+		)
+
+	def doDanych(self) -> dict[str, Any]:
+		"""
+		Odtwarza wpis sekcji `serwery` z modelu, w postaci zapisywanej w pliku `servers.json`.
+
+		Returns:
+			dict[str, Any]: Wpis serwera.
+		"""
+
+		return {
+			"identyfikator-kanalu": str(self.identyfikatorKanału) if self.identyfikatorKanału is not None else "",
+			"szkoła": self.szkoła,
+			"wybrane-klasy": list(self.wybraneKlasy),
+			"wybrani-nauczyciele": list(self.wybraniNauczyciele),
+			"wysyłaj-numerki": self.wysyłajNumerki
+		}
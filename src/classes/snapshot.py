@@ -0,0 +1,390 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+from collections import defaultdict
+from dataclasses import (
+	dataclass,
+	field
+)
+from types import MappingProxyType
+from typing import (
+	Any,
+	Iterable,
+	Mapping,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.classes.model import (
+	BłądKonfiguracji,
+	KonfiguracjaSerwera,
+	Szkoła
+)
+from src.core.matching import IndeksPrefiksów
+from src.handlers.logging import logiKonsoli
+
+def zamroź(wartość: Any) -> Any:
+	"""
+	Tworzy niemodyfikowalną kopię wartości: słowniki zamieniane są na `MappingProxyType`, a listy na krotki.
+
+	Args:
+		wartość (Any): Wartość do zamrożenia.
+
+	Returns:
+		Any: Niemodyfikowalna kopia wartości.
+	"""
+
+	if isinstance(wartość, dict):
+		return MappingProxyType({klucz: zamroź(element) for klucz, element in wartość.items()})
+
+	if isinstance(wartość, (list, tuple)):
+		return tuple(zamroź(element) for element in wartość)
+
+	return wartość
+
+
+def odmroź(wartość: Any) -> Any:
+	"""
+	Tworzy modyfikowalną kopię wartości zamrożonej przez `zamroź`, nadającą się do zapisania w formacie `JSON`.
+
+	Args:
+		wartość (Any): Wartość do odmrożenia.
+
+	Returns:
+		Any: Modyfikowalna kopia wartości.
+	"""
+
+	if isinstance(wartość, Mapping):
+		return {klucz: odmroź(element) for klucz, element in wartość.items()}
+
+	if isinstance(wartość, (list, tuple)):
+		return [odmroź(element) for element in wartość]
+
+	return wartość
+
+
+@dataclass(frozen=True, slots=True)
+class MigawkaKonfiguracji():
+	"""
+	Niemodyfikowalna, wersjonowana migawka konfiguracji odczytywana bez blokady.
+
+	Zapisujący podmieniają całą migawkę po każdej zmianie, a czytelnicy pobierają aktualną referencję
+	i korzystają z niej przez cały czas operacji (read-copy-update).
+
+	Attributes:
+		wersja (int): Numer kolejnej opublikowanej migawki.
+		ustawienia (Mapping[str, Any]): Klucze główne konfiguracji poza sekcjami `szkoły` i `serwery`.
+		szkoły (Mapping[str, Szkoła]): Modele szkół według ich ID.
+		serwery (Mapping[str, KonfiguracjaSerwera]): Modele konfiguracji serwerów według ich ID.
+		subskrybenciSzkół (Mapping[str, tuple[int, ...]]): ID serwerów przypisanych do szkoły.
+		wpisySzkół (Mapping[str, Any]): Zamrożone wpisy sekcji `szkoły` w postaci z pliku konfiguracyjnego, zapisywane przez `ZapisywaczKonfiguracji`.
+		niepoprawneSerwery (Mapping[str, Any]): Zamrożone wpisy serwerów pominiętych jako niepoprawne, zachowywane przy zapisie sekcji `serwery`.
+		indeksSzkół (IndeksPrefiksów): Indeks prefiksów nazw i ID szkół dla podpowiedzi polecenia `/skonfiguruj`.
+	"""
+
+	wersja: int
+	ustawienia: Mapping[str, Any]
+	szkoły: Mapping[str, Szkoła]
+	serwery: Mapping[str, KonfiguracjaSerwera]
+	subskrybenciSzkół: Mapping[str, tuple[int, ...]]
+	wpisySzkół: Mapping[str, Any] = field(repr=False, compare=False)
+	niepoprawneSerwery: Mapping[str, Any] = field(repr=False, compare=False)
+	indeksSzkół: IndeksPrefiksów = field(repr=False, compare=False)
+
+	def pobierzSerwer(self, identyfikatorSerwera: str | int) -> KonfiguracjaSerwera:
+		"""
+		Zwraca konfigurację serwera lub domyślną konfigurację, jeśli serwer nie został skonfigurowany.
+
+		Args:
+			identyfikatorSerwera (str | int): ID serwera Discord.
+
+		Returns:
+			KonfiguracjaSerwera: Model konfiguracji serwera.
+		"""
+
+		konfiguracjaSerwera = self.serwery.get(str(identyfikatorSerwera))
+
+		if konfiguracjaSerwera is None:
+			return KonfiguracjaSerwera(identyfikator=int(identyfikatorSerwera))
+
+		return konfiguracjaSerwera
+
+	def pobierzSzkołę(self, identyfikatorSzkoły: str) -> Optional[Szkoła]:
+		"""
+		Zwraca model szkoły lub None, jeśli szkoła nie istnieje w konfiguracji.
+
+		Args:
+			identyfikatorSzkoły (str): ID szkoły.
+
+		Returns:
+			Optional[Szkoła]: Model szkoły.
+		"""
+
+		return self.szkoły.get(identyfikatorSzkoły)
+
+	def pobierzKlasy(self, identyfikatorSzkoły: str) -> tuple[str, ...]:
+		"""
+		Zwraca spłaszczoną listę klas szkoły lub pustą krotkę, jeśli szkoła nie istnieje.
+
+		Args:
+			identyfikatorSzkoły (str): ID szkoły.
+
+		Returns:
+			tuple[str, ...]: Klasy szkoły.
+		"""
+
+		szkoła = self.szkoły.get(identyfikatorSzkoły)
+		return szkoła.klasy if szkoła else ()
+
+	def wpisySerwerów(self) -> dict[str, Any]:
+		"""
+		Odtwarza sekcję `serwery` z modeli konfiguracji serwerów oraz zachowanych, niepoprawnych wpisów.
+		Wywoływana przez `ZapisywaczKonfiguracji` w wątku zapisu, więc migawka nie przechowuje drugiej kopii wpisów.
+
+		Returns:
+			dict[str, Any]: Sekcja `serwery` w postaci zapisywanej w pliku `servers.json`.
+		"""
+
+		return {
+			**{identyfikatorSerwera: konfiguracjaSerwera.doDanych() for identyfikatorSerwera, konfiguracjaSerwera in self.serwery.items()},
+			**odmroź(self.niepoprawneSerwery)
+		}
+
+
+def zbudujSerwer(
+	identyfikatorSerwera: str,
+	daneSerwera: Any
+) -> Optional[KonfiguracjaSerwera]:
+	"""
+	Buduje model konfiguracji serwera na potrzeby migawki. Niepoprawny wpis jest pomijany i zapisywany w logach,
+	dzięki czemu błąd w konfiguracji jednego serwera nie blokuje uruchomienia bota dla pozostałych.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		daneSerwera (Any): Wpis serwera z sekcji `serwery`.
+
+	Returns:
+		Optional[KonfiguracjaSerwera]: Model konfiguracji serwera lub None, jeśli wpis jest niepoprawny.
+	"""
+
+	try:
+		return KonfiguracjaSerwera.zDanych(identyfikatorSerwera, daneSerwera)
+	except BłądKonfiguracji as e:
+		logiKonsoli.warning(
+			f"Pominięto niepoprawny wpis serwera o ID {identyfikatorSerwera} w pliku konfiguracyjnym. Więcej informacji: {e}"
+		)
+		return None
+
+
+def zbudujMigawkę(
+	konfiguracja: dict[str, Any],
+	poprzednia: Optional[MigawkaKonfiguracji]=None,
+	serwery: Optional[Iterable[str]]=None
+) -> MigawkaKonfiguracji:
+	"""
+	Buduje nową migawkę konfiguracji, weryfikując wszystkie wpisy szkół i serwerów. Niepoprawne wpisy serwerów są pomijane
+	(zobacz `zbudujSerwer`). Jeśli podano poprzednią migawkę i listę zmienionych serwerów, pozostałe dane (szkoły, ustawienia
+	i niezmienione serwery) są współdzielone z poprzednią migawką.
+
+	Args:
+		konfiguracja (dict[str, Any]): Aktualny, modyfikowalny słownik konfiguracji.
+		poprzednia (Optional[MigawkaKonfiguracji]): Poprzednio opublikowana migawka.
+		serwery (Optional[Iterable[str]]): ID serwerów, których konfiguracja uległa zmianie. Domyślnie przebudowywana jest cała migawka.
+
+	Returns:
+		MigawkaKonfiguracji: Nowa migawka konfiguracji.
+
+	Raises:
+		BłądKonfiguracji: Jeśli którykolwiek wpis szkoły albo sekcja `szkoły` lub `serwery` jest niepoprawna.
+	"""
+
+	aktualneSerwery = konfiguracja.get("serwery", {}) or {}
+	aktualneSzkoły = konfiguracja.get("szkoły", {}) or {}
+
+	if not isinstance(aktualneSerwery, dict):
+		raise BłądKonfiguracji("Sekcja „serwery” musi być słownikiem.")
+
+	if not isinstance(aktualneSzkoły, dict):
+		raise BłądKonfiguracji("Sekcja „szkoły” musi być słownikiem.")
+
+	if poprzednia is not None and serwery is not None:
+		noweSerwery = dict(poprzednia.serwery)
+		niepoprawneSerwery = dict(poprzednia.niepoprawneSerwery)
+		zmienioneSzkoły = set()
+
+		for identyfikatorSerwera in serwery:
+			identyfikatorSerwera = str(identyfikatorSerwera)
+			zmienioneSzkoły.add(poprzednia.pobierzSerwer(identyfikatorSerwera).szkoła)
+			niepoprawneSerwery.pop(identyfikatorSerwera, None)
+
+			konfiguracjaSerwera = zbudujSerwer(identyfikatorSerwera, aktualneSerwery[identyfikatorSerwera]) if identyfikatorSerwera in aktualneSerwery else None
+
+			if konfiguracjaSerwera is not None:
+				noweSerwery[identyfikatorSerwera] = konfiguracjaSerwera
+				zmienioneSzkoły.add(konfiguracjaSerwera.szkoła)
+			else:
+				noweSerwery.pop(identyfikatorSerwera, None)
+
+				if identyfikatorSerwera in aktualneSerwery:
+					niepoprawneSerwery[identyfikatorSerwera] = zamroź(aktualneSerwery[identyfikatorSerwera])
+
+		subskrybenci = dict(poprzednia.subskrybenciSzkół)
+
+		for szkoła in zmienioneSzkoły - {""}:
+			subskrybenci[szkoła] = przypiszSubskrybentów(noweSerwery, szkoła)
+
+		return MigawkaKonfiguracji(
+			wersja=poprzednia.wersja + 1,
+			ustawienia=poprzednia.ustawienia,
+			szkoły=poprzednia.szkoły,
+			serwery=MappingProxyType(noweSerwery),
+			subskrybenciSzkół=MappingProxyType(subskrybenci),
+			wpisySzkół=poprzednia.wpisySzkół,
+			niepoprawneSerwery=MappingProxyType(niepoprawneSerwery),
+			indeksSzkół=poprzednia.indeksSzkół
+		)
+
+	szkoły = {str(identyfikator): Szkoła.zDanych(str(identyfikator), dane) for identyfikator, dane in aktualneSzkoły.items()}
+	noweSerwery = {
+		str(identyfikator): konfiguracjaSerwera for identyfikator, dane in aktualneSerwery.items()
+		if (konfiguracjaSerwera := zbudujSerwer(str(identyfikator), dane)) is not None
+	}
+	subskrybenci = defaultdict(list)
+
+	for konfiguracjaSerwera in noweSerwery.values():
+		if konfiguracjaSerwera.szkoła:
+			subskrybenci[konfiguracjaSerwera.szkoła].append(konfiguracjaSerwera.identyfikator)
+
+	return MigawkaKonfiguracji(
+		wersja=(poprzednia.wersja + 1) if poprzednia else 1,
+		ustawienia=zamroź({klucz: wartość for klucz, wartość in konfiguracja.items() if klucz not in ("szkoły", "serwery")}),
+		szkoły=MappingProxyType(szkoły),
+		serwery=MappingProxyType(noweSerwery),
+		subskrybenciSzkół=MappingProxyType({szkoła: tuple(subskrybenci.get(szkoła, ())) for szkoła in szkoły}),
+		wpisySzkół=zamroź(aktualneSzkoły),
+		niepoprawneSerwery=zamroź({identyfikator: dane for identyfikator, dane in aktualneSerwery.items() if str(identyfikator) not in noweSerwery}),
+		indeksSzkół=zbudujIndeksSzkół(szkoły)
+	)
+
+
+def zbudujIndeksSzkół(szkoły: Mapping[str, Szkoła]) -> IndeksPrefiksów:
+	"""
+	Buduje indeks prefiksów szkół przeszukujący jednocześnie ich nazwy i ID.
+
+	Args:
+		szkoły (Mapping[str, Szkoła]): Modele szkół według ich ID.
+
+	Returns:
+		IndeksPrefiksów: Indeks zwracający ID szkół.
+	"""
+
+	return IndeksPrefiksów(szkoły, (f"{szkoła.nazwa} {identyfikator}" for identyfikator, szkoła in szkoły.items()))
+
+
+def przypiszSubskrybentów(
+	serwery: Mapping[str, KonfiguracjaSerwera],
+	szkoła: str
+) -> tuple[int, ...]:
+	"""
+	Wyznacza ID serwerów przypisanych do podanej szkoły.
+
+	Args:
+		serwery (Mapping[str, KonfiguracjaSerwera]): Modele konfiguracji serwerów według ich ID.
+		szkoła (str): ID szkoły.
+
+	Returns:
+		tuple[int, ...]: ID serwerów przypisanych do szkoły.
+	"""
+
+	return tuple(konfiguracjaSerwera.identyfikator for konfiguracjaSerwera in serwery.values() if konfiguracjaSerwera.szkoła == szkoła)
+
+
+def podmieńSzkoły(
+	poprzednia: MigawkaKonfiguracji,
+	szkoły: Mapping[str, Szkoła],
+	wpisySzkół: Mapping[str, Any]
+) -> MigawkaKonfiguracji:
+	"""
+	Buduje nową migawkę z podmienioną sekcją szkół. Serwery i ustawienia są współdzielone z poprzednią migawką,
+	a listy subskrybentów wyznaczane są ponownie wyłącznie dla nowo dodanych szkół.
+
+	Args:
+		poprzednia (MigawkaKonfiguracji): Poprzednio opublikowana migawka.
+		szkoły (Mapping[str, Szkoła]): Kompletny zestaw modeli szkół w kolejności z pliku konfiguracyjnego.
+		wpisySzkół (Mapping[str, Any]): Wpisy sekcji `szkoły`, z których zbudowano modele.
+
+	Returns:
+		MigawkaKonfiguracji: Nowa migawka konfiguracji.
+	"""
+
+	return MigawkaKonfiguracji(
+		wersja=poprzednia.wersja + 1,
+		ustawienia=poprzednia.ustawienia,
+		szkoły=MappingProxyType(dict(szkoły)),
+		serwery=poprzednia.serwery,
+		subskrybenciSzkół=MappingProxyType({
+			szkoła: poprzednia.subskrybenciSzkół[szkoła] if szkoła in poprzednia.subskrybenciSzkół else przypiszSubskrybentów(poprzednia.serwery, szkoła)
+			for szkoła in szkoły
+		}),
+		wpisySzkół=zamroź(wpisySzkół),
+		niepoprawneSerwery=poprzednia.niepoprawneSerwery,
+		indeksSzkół=zbudujIndeksSzkół(szkoły)
+	)
+
+
+def podmieńSerwer(
+	poprzednia: MigawkaKonfiguracji,
+	identyfikatorSerwera: str,
+	konfiguracjaSerwera: Optional[KonfiguracjaSerwera]
+) -> MigawkaKonfiguracji:
+	"""
+	Buduje nową migawkę z podmienionym, już zweryfikowanym modelem jednego serwera. Szkoły i ustawienia są współdzielone
+	z poprzednią migawką, a listy subskrybentów wyznaczane są ponownie wyłącznie dla poprzedniej i nowej szkoły serwera.
+
+	Args:
+		poprzednia (MigawkaKonfiguracji): Poprzednio opublikowana migawka.
+		identyfikatorSerwera (str): ID serwera Discord.
+		konfiguracjaSerwera (Optional[KonfiguracjaSerwera]): Nowy model konfiguracji serwera lub None, jeśli serwer został usunięty.
+
+	Returns:
+		MigawkaKonfiguracji: Nowa migawka konfiguracji.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	noweSerwery = dict(poprzednia.serwery)
+	niepoprawneSerwery = dict(poprzednia.niepoprawneSerwery)
+	niepoprawneSerwery.pop(identyfikatorSerwera, None)
+	zmienioneSzkoły = {poprzednia.pobierzSerwer(identyfikatorSerwera).szkoła}
+
+	if konfiguracjaSerwera is None:
+		noweSerwery.pop(identyfikatorSerwera, None)
+	else:
+		noweSerwery[identyfikatorSerwera] = konfiguracjaSerwera
+		zmienioneSzkoły.add(konfiguracjaSerwera.szkoła)
+
+	subskrybenci = dict(poprzednia.subskrybenciSzkół)
+
+	for szkoła in zmienioneSzkoły - {""}:
+		subskrybenci[szkoła] = przypiszSubskrybentów(noweSerwery, szkoła)
+
+	return MigawkaKonfiguracji(
+		wersja=poprzednia.wersja + 1,
+		ustawienia=poprzednia.ustawienia,
+		szkoły=poprzednia.szkoły,
+		serwery=MappingProxyType(noweSerwery),
+		subskrybenciSzkół=MappingProxyType(subskrybenci),
+		wpisySzkół=poprzednia.wpisySzkół,
+		niepoprawneSerwery=MappingProxyType(niepoprawneSerwery),
+		indeksSzkół=poprzednia.indeksSzkół
+	)
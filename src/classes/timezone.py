@@ -18,10 +18,29 @@ from zoneinfo import ZoneInfo
 class Timezone(logging.Formatter):
 	"""
 	Formatter logów wykorzystujący strefę czasową Europe/Warsaw.
+
+	Strefa czasowa tworzona jest raz dla całej klasy, a sformatowany czas zapamiętywany jest dla bieżącej sekundy,
+	ponieważ seria logów (np. pełne ślady błędów) zapisywana jest zwykle w obrębie jednej sekundy.
 	"""
 
+	strefaCzasowa = ZoneInfo("Europe/Warsaw")
+
+	def __init__(self, *args, **kwargs) -> None:
+		super().__init__(*args, **kwargs)
+		self.ostatniCzas = (None, None, "")
+
 	def formatTime(self, record, datefmt=None):
-		daneCzasu = datetime.fromtimestamp(record.created, ZoneInfo("Europe/Warsaw"))
-		if datefmt:
-			return daneCzasu.strftime(datefmt)
-		return daneCzasu.strftime("%d-%m-%Y %H:%M:%S")
\ No newline at end of file
+		sekunda = int(record.created)
+		ostatniaSekunda, ostatniFormat, tekst = self.ostatniCzas
+
+		if sekunda == ostatniaSekunda and datefmt == ostatniFormat:
+			return tekst
+
+		daneCzasu = datetime.fromtimestamp(record.created, self.strefaCzasowa)
+		tekst = daneCzasu.strftime(datefmt or "%d-%m-%Y %H:%M:%S")
+
+		# Formaty z ułamkami sekund nie mogą być zapamiętywane dla całej sekundy
+		if "%f" not in (datefmt or ""):
+			self.ostatniCzas = (sekunda, datefmt, tekst)
+
+		return tekst
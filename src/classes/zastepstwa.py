@@ -26,16 +26,77 @@ from src.commands import (
 	informacje,
 	skonfiguruj,
 	statystyki,
-	numerki
+	numerki,
+	profiluj
 )
 from src.events import (
 	join,
 	remove
 )
-from src.handlers.configuration import konfiguracja
+from src.handlers.bootstrap import oznaczFazę
+from src.handlers.configuration import (
+	konfiguracja,
+	zapisywaczKonfiguracji
+)
+from src.handlers.data import (
+	pamięćDanych,
+	zamknijMagazynDanych
+)
+from src.handlers.history import dziennikZastępstw
 from src.handlers.logging import logiKonsoli
+from src.handlers.metrics import uruchomSerwerMetryk
+from src.handlers.profiling import (
+	profilerNaŻądanie,
+	zarejestrujSygnałProfilowania
+)
+from src.tasks.numerki import wysyłajNumerkiCodziennie
+from src.tasks.persistence import zapisujDaneOkresowo
+from src.tasks.reload import obserwujKonfiguracje
 from src.tasks.statistics import sprawdźKoniecRoku
+from src.tasks.supervisor import nadzorujZadanie
 from src.tasks.updates import sprawdźAktualizacje
+from src.tasks.watchdog import monitorujPętlę
+
+class DrzewoPoleceń(discord.app_commands.CommandTree):
+	"""
+	Drzewo poleceń bota rozpoczynające sesję profilowania dla wywołań poleceń, gdy włączono profilowanie na żądanie.
+	"""
+
+	async def interaction_check(self, interaction: discord.Interaction) -> bool:
+		"""
+		Rozpoczyna sesję profilowania wywołania polecenia, jeśli profilowanie na żądanie obejmuje jeszcze polecenia.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+
+		Returns:
+			bool: Zawsze True (sprawdzenie nie blokuje poleceń).
+		"""
+
+		if profilerNaŻądanie.pozostałePolecenia and interaction.type is discord.InteractionType.application_command:
+			sesja = profilerNaŻądanie.rozpocznij("polecenie", interaction.command.name if interaction.command else "nieznane")
+
+			if sesja is not None:
+				interaction.extras["profil"] = sesja
+
+		return True
+
+	async def on_error(
+		self,
+		interaction: discord.Interaction,
+		error: discord.app_commands.AppCommandError
+	) -> None:
+		"""
+		Kończy sesję profilowania polecenia zakończonego nieobsłużonym błędem i przekazuje błąd dalej.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			error (discord.app_commands.AppCommandError): Nieobsłużony błąd polecenia.
+		"""
+
+		await profilerNaŻądanie.zakończ(interaction.extras.pop("profil", None))
+		await super().on_error(interaction, error)
+
 
 class Zastępstwa(discord.Client):
 	"""
@@ -58,11 +119,11 @@ class Zastępstwa(discord.Client):
 		"""
 
 		super().__init__(intents=intents)
-		self.tree = discord.app_commands.CommandTree(self)
+		self.tree = DrzewoPoleceń(self)
 
 	async def setup_hook(self) -> None:
 		"""
-		Tworzy i konfiguruje sesję HTTP wywoływaną przy starcie bota.
+		Tworzy i konfiguruje sesję HTTP, wczytuje dane serwerów do pamięci podręcznej uruchamia punkt końcowy metryk i rejestruje sygnał profilowania przy starcie bota.
 		"""
 
 		try:
@@ -77,12 +138,31 @@ class Zastępstwa(discord.Client):
 			)
 			raise
 
+		try:
+			await pamięćDanych.wczytaj()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Nie udało się wczytać danych serwerów do pamięci podręcznej. Dane będą odczytywane bezpośrednio z dysku. Więcej informacji: {e}"
+			)
+
+		try:
+			await dziennikZastępstw.wczytajFakty()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Nie udało się wczytać magazynu faktów zastępstw. Statystyki szczegółowe będą obejmować wyłącznie nowe zastępstwa. Więcej informacji: {e}"
+			)
+
+		self.serwerMetryk = await uruchomSerwerMetryk(self)
+		zarejestrujSygnałProfilowania()
+
+		oznaczFazę("setup_hook")
+
 	async def close(self) -> None:
 		"""
-		Bezpiecznie wyłącza bota, anuluje wszystkie zadania i zamyka sesję HTTP.
+		Bezpiecznie wyłącza bota, anuluje wszystkie zadania, zatrzymuje punkt końcowy metryk, zamyka sesję HTTP, zapisuje zmienione dane serwerów i zamyka magazyn danych.
 		"""
 
-		for atrybut in ("aktualizacje", "koniecRoku"):
+		for atrybut in ("aktualizacje", "koniecRoku", "zapisDanych", "przeładowanie", "numerkiDzienne", "monitorPętli"):
 			zadanie = getattr(self, atrybut, None)
 
 			if zadanie and not zadanie.done():
@@ -96,6 +176,16 @@ class Zastępstwa(discord.Client):
 				with contextlib.suppress(asyncio.CancelledError, Exception):
 					await zadanie
 
+		if getattr(self, "serwerMetryk", None):
+			try:
+				await self.serwerMetryk.cleanup()
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas zatrzymywania punktu końcowego metryk. Więcej informacji: {e}"
+				)
+			finally:
+				self.serwerMetryk = None
+
 		if getattr(self, "połączenieHTTP", None):
 			try:
 				await self.połączenieHTTP.close()
@@ -106,14 +196,46 @@ class Zastępstwa(discord.Client):
 			finally:
 				self.połączenieHTTP = None
 
+		try:
+			await zapisywaczKonfiguracji.zapiszTeraz()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zapisywania pliku konfiguracyjnego przy wyłączaniu bota. Więcej informacji: {e}"
+			)
+
+		try:
+			await pamięćDanych.zapiszZmiany()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zapisywania danych serwerów przy wyłączaniu bota. Więcej informacji: {e}"
+			)
+
+		await zamknijMagazynDanych()
 		await super().close()
 
+	async def on_app_command_completion(
+		self,
+		interaction: discord.Interaction,
+		command: discord.app_commands.Command
+	) -> None:
+		"""
+		Kończy sesję profilowania wywołania polecenia, jeśli została rozpoczęta.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			command (discord.app_commands.Command): Wykonane polecenie.
+		"""
+
+		if "profil" in interaction.extras:
+			await profilerNaŻądanie.zakończ(interaction.extras.pop("profil"))
+
 	async def on_ready(self) -> None:
 		"""
 		Ustawia status, synchronizuje polecenia i uruchamia zadania okresowe wywoływane po zalogowaniu bota.
 		"""
 
 		try:
+			oznaczFazę("on_ready")
 			self.czas = datetime.now(ZoneInfo("Europe/Warsaw"))
 			logiKonsoli.info(ascii)
 			logiKonsoli.info(
@@ -126,19 +248,47 @@ class Zastępstwa(discord.Client):
 			)
 
 			if not getattr(self, "aktualizacje", None) or self.aktualizacje.done():
-				self.aktualizacje = asyncio.create_task(sprawdźAktualizacje(self))
+				self.aktualizacje = asyncio.create_task(nadzorujZadanie(self, "aktualizacje", sprawdźAktualizacje), name="aktualizacje")
 			else:
 				logiKonsoli.warning(
 					"Zadanie sprawdzające aktualizacje zastępstw jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
 				)
 
 			if not getattr(self, "koniecRoku", None) or self.koniecRoku.done():
-				self.koniecRoku = asyncio.create_task(sprawdźKoniecRoku(self))
+				self.koniecRoku = asyncio.create_task(nadzorujZadanie(self, "koniecRoku", sprawdźKoniecRoku), name="koniecRoku")
 			else:
 				logiKonsoli.warning(
 					"Zadanie sprawdzające zakończenie roku szkolnego jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
 				)
 
+			if not getattr(self, "zapisDanych", None) or self.zapisDanych.done():
+				self.zapisDanych = asyncio.create_task(nadzorujZadanie(self, "zapisDanych", zapisujDaneOkresowo), name="zapisDanych")
+			else:
+				logiKonsoli.warning(
+					"Zadanie zapisujące dane serwerów jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "przeładowanie", None) or self.przeładowanie.done():
+				self.przeładowanie = asyncio.create_task(nadzorujZadanie(self, "przeładowanie", obserwujKonfiguracje), name="przeładowanie")
+			else:
+				logiKonsoli.warning(
+					"Zadanie przeładowujące plik konfiguracyjny jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "numerkiDzienne", None) or self.numerkiDzienne.done():
+				self.numerkiDzienne = asyncio.create_task(nadzorujZadanie(self, "numerkiDzienne", wysyłajNumerkiCodziennie), name="numerkiDzienne")
+			else:
+				logiKonsoli.warning(
+					"Zadanie wysyłające szczęśliwe numerki jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "monitorPętli", None) or self.monitorPętli.done():
+				self.monitorPętli = asyncio.create_task(nadzorujZadanie(self, "monitorPętli", monitorujPętlę), name="monitorPętli")
+			else:
+				logiKonsoli.warning(
+					"Zadanie monitorujące opóźnienie pętli zdarzeń jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
 			logiKonsoli.info(
 				"Wszystkie zadania zostały poprawnie uruchomione. Enjoy!"
 			)
@@ -156,5 +306,6 @@ informacje.ustaw(bot)
 skonfiguruj.ustaw(bot)
 statystyki.ustaw(bot)
 numerki.ustaw(bot)
+profiluj.ustaw(bot)
 join.ustaw(bot)
 remove.ustaw(bot)
\ No newline at end of file
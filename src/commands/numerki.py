@@ -20,7 +20,7 @@ import discord
 # Wewnętrzne importy
 from src.classes.commands import WidokGłówny
 from src.classes.constants import Constants
-from src.handlers.configuration import konfiguracja, blokadaKonfiguracji
+from src.handlers.configuration import pobierzMigawkę
 from src.helpers.helpers import pobierzSzczęśliweNumerkiNaDzień
 from src.handlers.logging import (
 	logiKonsoli,
@@ -54,8 +54,7 @@ def ustaw(bot: discord.Client) -> None:
 				color=Constants.KOLOR
 			)
 			identyfikatorSerwera = str(interaction.guild.id) if interaction.guild else "01"
-			async with blokadaKonfiguracji:
-				szkola = konfiguracja.get("serwery", {}).get(identyfikatorSerwera, {}).get("szkoła", "01")
+			szkola = pobierzMigawkę().pobierzSerwer(identyfikatorSerwera).szkoła or "01"
 			szczesliweNumerki = pobierzSzczęśliweNumerkiNaDzień(szkola, datetime.today().strftime('%d.%m'))
 			if szczesliweNumerki:
 				embed.add_field(
@@ -0,0 +1,122 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import contextlib
+from typing import Optional
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.classes.constants import Constants
+from src.handlers.logging import (
+	logiKonsoli,
+	logujPolecenia
+)
+from src.handlers.profiling import (
+	folderProfili,
+	profilerNaŻądanie
+)
+
+async def czyWłaściciel(
+	bot: discord.Client,
+	użytkownik: discord.abc.User
+) -> bool:
+	"""
+	Sprawdza, czy użytkownik jest właścicielem aplikacji bota lub członkiem jej zespołu.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		użytkownik (discord.abc.User): Sprawdzany użytkownik.
+
+	Returns:
+		bool: True, jeśli użytkownik jest właścicielem bota.
+	"""
+
+	aplikacja = bot.application or await bot.application_info()
+
+	if aplikacja.team:
+		return any(członek.id == użytkownik.id for członek in aplikacja.team.members)
+
+	return aplikacja.owner.id == użytkownik.id
+
+
+def ustaw(bot: discord.Client) -> None:
+	"""
+	Rejestruje polecenie `/profiluj` w drzewie bota.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord, do której dodawane jest polecenie.
+	"""
+
+	@bot.tree.command(
+		name="profiluj",
+		description="Sprofiluj kolejne cykle aktualizacji i wywołania poleceń (tylko dla właściciela bota)"
+	)
+	@discord.app_commands.describe(
+		cykle="Liczba kolejnych cykli aktualizacji do sprofilowania (0 wyłącza profilowanie cykli).",
+		polecenia="Liczba kolejnych wywołań poleceń do sprofilowania (0 wyłącza profilowanie poleceń)."
+	)
+	@discord.app_commands.default_permissions(administrator=True)
+	async def profiluj(
+		interaction: discord.Interaction,
+		cykle: Optional[discord.app_commands.Range[int, 0, 50]]=None,
+		polecenia: Optional[discord.app_commands.Range[int, 0, 100]]=None
+	) -> None:
+		"""
+		Włącza profilowanie na żądanie kolejnych cykli aktualizacji i wywołań poleceń.
+		Wyniki zapisywane są w folderze `logs/profiles`.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			cykle (Optional[int]): Liczba cykli aktualizacji do sprofilowania.
+			polecenia (Optional[int]): Liczba wywołań poleceń do sprofilowania.
+		"""
+
+		try:
+			if not await czyWłaściciel(bot, interaction.user):
+				embed = discord.Embed(
+					title="**Polecenie nie zostało wykonane!**",
+					description="Nie masz uprawnień do użycia tego polecenia. Może ono zostać użyte wyłącznie przez właściciela bota.",
+					color=Constants.KOLOR
+				)
+				embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+				await interaction.response.send_message(embed=embed, ephemeral=True)
+				logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Brak uprawnień.")
+				return
+
+			liczbaCykli, liczbaPoleceń = profilerNaŻądanie.włącz(cykle, polecenia)
+			embed = discord.Embed(
+				title="**Włączono profilowanie!**",
+				description=f"Sprofilowanych zostanie **{liczbaCykli}** kolejnych cykli aktualizacji i **{liczbaPoleceń}** kolejnych wywołań poleceń. Wyniki zostaną zapisane w folderze `{folderProfili.as_posix()}`.",
+				color=Constants.KOLOR
+			)
+			embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+			await interaction.response.send_message(embed=embed, ephemeral=True)
+			logujPolecenia(interaction, sukces=True)
+		except Exception as e:
+			logujPolecenia(interaction, sukces=False, wiadomośćBłędu=str(e))
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas wywołania polecenia „/profiluj”. Więcej informacji: {e}"
+			)
+			with contextlib.suppress(Exception):
+				if not interaction.response.is_done():
+					await interaction.response.send_message(
+						"Wystąpił błąd. Spróbuj ponownie lub skontaktuj się z administratorem bota.",
+						ephemeral=True
+					)
+				else:
+					await interaction.followup.send(
+						"Wystąpił błąd. Spróbuj ponownie lub skontaktuj się z administratorem bota.",
+						ephemeral=True
+					)
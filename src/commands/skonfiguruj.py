@@ -12,18 +12,64 @@
 
 # Standardowe biblioteki
 import contextlib
+from typing import Optional
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
-from src.classes.commands import WidokGłówny
+from src.classes.commands import (
+	WidokGłówny,
+	WidokPodsumowania
+)
 from src.classes.constants import Constants
-from src.handlers.configuration import konfiguracja
+from src.classes.model import Szkoła
+from src.core.matching import IndeksPrefiksów
+from src.handlers.configuration import pobierzMigawkę
 from src.handlers.logging import (
 	logiKonsoli,
 	logujPolecenia
 )
+from src.helpers.helpers import zapiszKluczeSerwera
+
+def szkołaPodpowiedzi(interaction: discord.Interaction) -> Optional[Szkoła]:
+	"""
+	Ustala szkołę, dla której podpowiadane są klasy i nauczyciele: wybraną już w bieżącym poleceniu,
+	a jeśli nie została jeszcze wybrana, skonfigurowaną wcześniej dla serwera.
+
+	Args:
+		interaction (discord.Interaction): Obiekt interakcji wywołujący podpowiedzi.
+
+	Returns:
+		Optional[Szkoła]: Model szkoły lub None, jeśli nie da się jej ustalić.
+	"""
+
+	migawka = pobierzMigawkę()
+	identyfikatorSzkoły = getattr(interaction.namespace, "szkoła", None)
+
+	if not identyfikatorSzkoły and interaction.guild_id:
+		identyfikatorSzkoły = migawka.pobierzSerwer(interaction.guild_id).szkoła
+
+	return migawka.pobierzSzkołę(str(identyfikatorSzkoły or ""))
+
+
+def podpowiedzi(
+	indeks: IndeksPrefiksów,
+	wpisanyTekst: str
+) -> list[discord.app_commands.Choice[str]]:
+	"""
+	Zamienia wyniki wyszukiwania w indeksie prefiksów na podpowiedzi Discorda.
+
+	Args:
+		indeks (IndeksPrefiksów): Przeszukiwany indeks prefiksów.
+		wpisanyTekst (str): Tekst wpisany dotychczas przez użytkownika.
+
+	Returns:
+		list[discord.app_commands.Choice[str]]: Maksymalnie 25 podpowiedzi.
+	"""
+
+	return [discord.app_commands.Choice(name=element[:100], value=element[:100]) for element in indeks.szukaj(wpisanyTekst)]
+
 
 def ustaw(bot: discord.Client) -> None:
 	"""
@@ -39,18 +85,11 @@ def ustaw(bot: discord.Client) -> None:
 	)
 	@discord.app_commands.describe(
 		kanał="Kanał tekstowy, na który będą wysyłane powiadomienia z zastępstwami.",
-		szkoła="Szkoła, z której to strony będą pobierane informacje o zastępstwach."
+		szkoła="Szkoła, z której to strony będą pobierane informacje o zastępstwach.",
+		klasa="Klasa dodawana bezpośrednio do filtrów (z pominięciem formularza).",
+		nauczyciel="Nauczyciel dodawany bezpośrednio do filtrów (z pominięciem formularza)."
 	)
 	@discord.app_commands.guild_only()
-	@discord.app_commands.choices(
-		szkoła=[
-			discord.app_commands.Choice(
-				name=nazwaSzkoły.get("nazwa", identyfikatorSzkoły),
-				value=str(identyfikatorSzkoły)
-			)
-			for identyfikatorSzkoły, nazwaSzkoły in konfiguracja.get("szkoły", {}).items()
-		]
-	)
 	@discord.app_commands.choices(numerki=[
 		discord.app_commands.Choice(
 			name="Tak",
@@ -66,10 +105,13 @@ def ustaw(bot: discord.Client) -> None:
 		interaction: discord.Interaction,
 		szkoła: str,
 		kanał: discord.TextChannel,
-		numerki: int
+		numerki: int,
+		klasa: Optional[str]=None,
+		nauczyciel: Optional[str]=None
 	) -> None:
 		"""
 		Pozwala skonfigurować bota, dzięki opcjom wyboru szkoły, docelowego kanału tekstowego i filtracji zastępstw.
+		Jeśli podano klasę lub nauczyciela (wybranych z podpowiedzi), filtr zapisywany jest od razu, bez formularza.
 
 		Args:
 			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
@@ -86,7 +128,64 @@ def ustaw(bot: discord.Client) -> None:
 				await interaction.response.send_message(embed=embed, ephemeral=True)
 				logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Brak uprawnień.")
 				return
-			view = WidokGłówny(identyfikatorKanału=str(kanał.id), szkoła=szkoła, wysyłajNumerki=numerki == 1 and (konfiguracja.get("szkoły", {}).get(szkoła, {}).get("ma-numerki", {}) == "TAK"))
+			daneSzkoły = pobierzMigawkę().pobierzSzkołę(szkoła)
+
+			if not daneSzkoły:
+				embed = discord.Embed(
+					title="**Polecenie nie zostało wykonane!**",
+					description="Wybrana szkoła nie istnieje. Wybierz szkołę z listy podpowiedzi.",
+					color=Constants.KOLOR
+				)
+				embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+				await interaction.response.send_message(embed=embed, ephemeral=True)
+				logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Nieznana szkoła.")
+				return
+
+			maNumerki = bool(daneSzkoły and daneSzkoły.maNumerki)
+
+			if klasa or nauczyciel:
+				filtry = {}
+				nieZnaleziono = []
+
+				for wpis, kluczFiltru, lista, indeks in (
+					(klasa, "wybrane-klasy", daneSzkoły.klasy, daneSzkoły.indeksKlas),
+					(nauczyciel, "wybrani-nauczyciele", daneSzkoły.nauczyciele, daneSzkoły.indeksNauczycieli)
+				):
+					if not wpis:
+						continue
+
+					if wpis in lista:
+						filtry[kluczFiltru] = [wpis]
+						continue
+
+					idealneDopasowania, _, _ = indeks.dopasuj([wpis])
+
+					if idealneDopasowania:
+						filtry[kluczFiltru] = idealneDopasowania
+					else:
+						nieZnaleziono.append(wpis)
+
+				if nieZnaleziono:
+					embed = discord.Embed(
+						title="**Polecenie nie zostało wykonane!**",
+						description=(
+							"Nie znaleziono odpowiadających wpisów dla następujących danych:\n"
+							+ "\n".join(f"- **{wprowadzoneDane}**" for wprowadzoneDane in nieZnaleziono)
+							+ "\n\nWybierz klasę lub nauczyciela z listy podpowiedzi."
+						),
+						color=Constants.KOLOR
+					)
+					embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+					await interaction.response.send_message(embed=embed, ephemeral=True)
+					logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Nieznana klasa lub nauczyciel.")
+					return
+
+				await zapiszKluczeSerwera(str(interaction.guild.id), {"identyfikator-kanalu": str(kanał.id), "szkoła": szkoła, **filtry, "wysyłaj-numerki": numerki == 1 and maNumerki})
+				await interaction.response.send_message(embed=WidokPodsumowania.utwórz(str(interaction.guild.id)))
+				logujPolecenia(interaction, sukces=True)
+				return
+
+			view = WidokGłówny(identyfikatorKanału=str(kanał.id), szkoła=szkoła, wysyłajNumerki=numerki == 1 and maNumerki)
 			embed = discord.Embed(
 				title="**Skonfiguruj filtrowanie zastępstw**",
 				description=(
@@ -98,7 +197,7 @@ def ustaw(bot: discord.Client) -> None:
 				),
 				color=Constants.KOLOR
 			)
-			if numerki == 1 and konfiguracja.get("szkoły", {}).get(szkoła, {}).get("ma-numerki", {}) == "NIE":
+			if numerki == 1 and not maNumerki:
 				embed.add_field(
 					name="Twoja szkoła nie wspiera szczęśliwych numerków",
 					value="Twoja szkoła niestety nie otrzymuje aktualizacji dotyczących szczęśliwych numerków. Skontaktuj się z administratorem",
@@ -122,4 +221,65 @@ def ustaw(bot: discord.Client) -> None:
 					await interaction.followup.send(
 						"Wystąpił błąd. Spróbuj ponownie lub skontaktuj się z administratorem bota.",
 						ephemeral=True
-					)
\ No newline at end of file
+					)
+
+	@skonfiguruj.autocomplete("szkoła")
+	async def podpowiedzSzkoły(
+		interaction: discord.Interaction,
+		wpisanyTekst: str
+	) -> list[discord.app_commands.Choice[str]]:
+		"""
+		Podpowiada szkoły na podstawie indeksu prefiksów aktualnej migawki konfiguracji, dzięki czemu przeładowane szkoły są dostępne bez synchronizacji poleceń.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący podpowiedzi.
+			wpisanyTekst (str): Tekst wpisany dotychczas przez użytkownika.
+
+		Returns:
+			list[discord.app_commands.Choice[str]]: Maksymalnie 25 pasujących szkół.
+		"""
+
+		migawka = pobierzMigawkę()
+
+		return [
+			discord.app_commands.Choice(name=migawka.szkoły[identyfikatorSzkoły].nazwa[:100], value=identyfikatorSzkoły)
+			for identyfikatorSzkoły in migawka.indeksSzkół.szukaj(wpisanyTekst)
+		]
+
+	@skonfiguruj.autocomplete("klasa")
+	async def podpowiedzKlasy(
+		interaction: discord.Interaction,
+		wpisanyTekst: str
+	) -> list[discord.app_commands.Choice[str]]:
+		"""
+		Podpowiada klasy szkoły wybranej w poleceniu (lub skonfigurowanej dla serwera).
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący podpowiedzi.
+			wpisanyTekst (str): Tekst wpisany dotychczas przez użytkownika.
+
+		Returns:
+			list[discord.app_commands.Choice[str]]: Maksymalnie 25 pasujących klas.
+		"""
+
+		szkoła = szkołaPodpowiedzi(interaction)
+		return podpowiedzi(szkoła.prefiksyKlas, wpisanyTekst) if szkoła else []
+
+	@skonfiguruj.autocomplete("nauczyciel")
+	async def podpowiedzNauczyciela(
+		interaction: discord.Interaction,
+		wpisanyTekst: str
+	) -> list[discord.app_commands.Choice[str]]:
+		"""
+		Podpowiada nauczycieli szkoły wybranej w poleceniu (lub skonfigurowanej dla serwera).
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji wywołujący podpowiedzi.
+			wpisanyTekst (str): Tekst wpisany dotychczas przez użytkownika.
+
+		Returns:
+			list[discord.app_commands.Choice[str]]: Maksymalnie 25 pasujących nauczycieli.
+		"""
+
+		szkoła = szkołaPodpowiedzi(interaction)
+		return podpowiedzi(szkoła.prefiksyNauczycieli, wpisanyTekst) if szkoła else []
@@ -11,26 +11,34 @@
 #
 
 # Standardowe biblioteki
+import asyncio
 import contextlib
+from datetime import (
+	date,
+	datetime
+)
+from typing import (
+	Any,
+	Optional
+)
+from zoneinfo import ZoneInfo
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
 from src.classes.constants import Constants
-from src.handlers.configuration import (
-	blokadaKonfiguracji,
-	konfiguracja
-)
-from src.handlers.data import zarządzajPlikiemDanych
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.data import pobierzStatystykiSerwera
+from src.handlers.history import dziennikZastępstw
 from src.handlers.logging import (
 	logiKonsoli,
 	logujPolecenia
 )
-from src.helpers.helpers import (
-	odmieńZastępstwa,
-	zwróćNazwyKluczy
-)
+from src.helpers.helpers import odmieńZastępstwa
+
+# Nazwy dni tygodnia według numeru zwracanego przez `date.weekday`
+dniTygodnia = ("Poniedziałek", "Wtorek", "Środa", "Czwartek", "Piątek", "Sobota", "Niedziela")
 
 def ustaw(bot: discord.Client) -> None:
 	"""
@@ -44,31 +52,62 @@ def ustaw(bot: discord.Client) -> None:
 		name="statystyki",
 		description="Wyświetl bieżące statystyki dostarczonych zastępstw w aktualnym roku szkolnym."
 	)
+	@discord.app_commands.describe(
+		podział="Podział zastępstw szkoły dostarczonych na serwery w aktualnym roku szkolnym."
+	)
 	@discord.app_commands.guild_only()
-
-	async def statystyki(interaction: discord.Interaction) -> None:
+	@discord.app_commands.choices(podział=[
+		discord.app_commands.Choice(
+			name="Dni tygodnia",
+			value="dzieńTygodnia"
+		),
+		discord.app_commands.Choice(
+			name="Numery lekcji",
+			value="lekcja"
+		),
+		discord.app_commands.Choice(
+			name="Klasy",
+			value="klasa"
+		),
+		]
+	)
+	async def statystyki(
+		interaction: discord.Interaction,
+		podział: Optional[str]=None
+	) -> None:
 		"""
 		Wyświetla bieżące statystyki dostarczonych zastępstw w aktualnym roku szkolnym.
 
 		Args:
 			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			podział (Optional[str]): Wymiar podziału zastępstw szkoły dostarczonych na serwery. Domyślnie statystyki serwera.
 		"""
 
 		try:
 			identyfikatorSerwera = str(interaction.guild.id)
-			dane = await zarządzajPlikiemDanych(identyfikatorSerwera)
+			konfiguracjaSerwera = pobierzMigawkę().pobierzSerwer(identyfikatorSerwera)
 
-			if not isinstance(dane, dict):
-				dane = {}
+			if podział:
+				if not konfiguracjaSerwera.szkoła:
+					embed = discord.Embed(
+						title="**Polecenie nie zostało wykonane!**",
+						description="Aby wyświetlić podział zastępstw szkoły, poproś administratora o wybranie szkoły. Jesteś administratorem? Użyj polecenia `/skonfiguruj` i postępuj zgodnie z instrukcjami.",
+						color=Constants.KOLOR
+					)
+					embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+					await interaction.response.send_message(embed=embed, ephemeral=True)
+					logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Szkoła nie została skonfigurowana.")
+					return
 
-			licznik = int(dane.get("licznik-zastepstw", 0))
-			statystyki = dane.get("statystyki-nauczycieli", {})
+				await interaction.response.defer()
+				await interaction.followup.send(embed=await stwórzPodział(konfiguracjaSerwera.szkoła, podział))
+				logujPolecenia(interaction, sukces=True)
+				return
 
-			async with blokadaKonfiguracji:
-				konfiguracjaSerwera = konfiguracja.get("serwery", {}).get(identyfikatorSerwera, {}).copy()
+			licznik, ranking = await pobierzStatystykiSerwera(identyfikatorSerwera)
 
-			wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
-			wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
+			wybraniNauczyciele = konfiguracjaSerwera.wybraniNauczyciele
+			wybraneKlasy = konfiguracjaSerwera.wybraneKlasy
 
 			if licznik == 0:
 				embed = discord.Embed(
@@ -90,17 +129,12 @@ def ustaw(bot: discord.Client) -> None:
 					color=Constants.KOLOR
 				)
 
-				if isinstance(statystyki, dict) and statystyki:
-					sortowanie = sorted(statystyki.items(), key=lambda x: (-int(x[1]), x[0]))
-					wolneMiejsca = 25 - len(embed.fields)
-
-					if wolneMiejsca > 0:
-						for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-							embed.add_field(
-								name=str(nauczyciel),
-								value=f"Liczba zastępstw: {int(liczba)}",
-								inline=True
-							)
+				for nauczyciel, liczba in ranking.najlepsi(25 - len(embed.fields)):
+					embed.add_field(
+						name=str(nauczyciel),
+						value=f"Liczba zastępstw: {liczba}",
+						inline=True
+					)
 				embed.set_footer(text=Constants.DŁUŻSZA_STOPKA)
 				await interaction.response.send_message(embed=embed)
 
@@ -114,28 +148,15 @@ def ustaw(bot: discord.Client) -> None:
 					color=Constants.KOLOR
 				)
 
-				wykluczeni = set()
-				pozostali = {}
-
-				for nauczyciel in wybraniNauczyciele:
-					wykluczeni |= zwróćNazwyKluczy(nauczyciel)
-
-				if isinstance(statystyki, dict):
-					for nazwa, liczba in statystyki.items():
-						if not (zwróćNazwyKluczy(nazwa) & wykluczeni):
-							pozostali[nazwa] = int(liczba)
+				pozostali = ranking.najlepsi(25 - len(embed.fields), konfiguracjaSerwera.kluczeWykluczeń)
 
 				if pozostali:
-					sortowanie = sorted(pozostali.items(), key=lambda x: (-int(x[1]), x[0]))
-					wolneMiejsca = 25 - len(embed.fields)
-
-					if wolneMiejsca > 0:
-						for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-							embed.add_field(
-								name=str(nauczyciel),
-								value=f"Liczba zastępstw: {int(liczba)}",
-								inline=True
-							)
+					for nauczyciel, liczba in pozostali:
+						embed.add_field(
+							name=str(nauczyciel),
+							value=f"Liczba zastępstw: {liczba}",
+							inline=True
+						)
 				else:
 					embed.add_field(
 						name="Brak danych",
@@ -173,4 +194,78 @@ def ustaw(bot: discord.Client) -> None:
 					await interaction.followup.send(
 						"Wystąpił błąd. Spróbuj ponownie lub skontaktuj się z administratorem bota.",
 						ephemeral=True
-					)
\ No newline at end of file
+					)
+
+
+async def stwórzPodział(
+	szkoła: str,
+	wymiar: str
+) -> discord.Embed:
+	"""
+	Tworzy wiadomość z podziałem zastępstw szkoły w aktualnym roku szkolnym według wybranego wymiaru.
+	Uwzględniane są wyłącznie zastępstwa zapisane w dzienniku, czyli pasujące do filtrów co najmniej jednego serwera
+	korzystającego ze szkoły, a nie wszystkie zastępstwa ogłoszone na stronie szkoły. Agregacje faktów wykonywane są w osobnym wątku, aby nie blokować pętli zdarzeń.
+
+	Args:
+		szkoła (str): ID szkoły.
+		wymiar (str): Wymiar podziału (`dzieńTygodnia`, `lekcja` lub `klasa`).
+
+	Returns:
+		discord.Embed: Wiadomość z podziałem zastępstw.
+	"""
+
+	dzisiaj = datetime.now(ZoneInfo("Europe/Warsaw")).date()
+	początekRoku = date(dzisiaj.year if dzisiaj.month >= 9 else dzisiaj.year - 1, 9, 1)
+	fakty = dziennikZastępstw.fakty
+
+	def zlicz() -> tuple[dict[Any, int], dict[Any, int]]:
+		"""
+		Funkcja pomocnicza zliczająca zapisane zastępstwa i odwołane lekcje szkoły według wybranego wymiaru.
+		"""
+
+		return (
+			fakty.zlicz(wymiar, szkoła=szkoła, od=początekRoku, do=dzisiaj),
+			fakty.zlicz(wymiar, szkoła=szkoła, od=początekRoku, do=dzisiaj, tylkoOdwołane=True)
+		)
+
+	wszystkie, odwołane = await asyncio.to_thread(zlicz)
+	nazwy = {
+		"dzieńTygodnia": "dni tygodnia",
+		"lekcja": "numery lekcji",
+		"klasa": "klasy"
+	}
+
+	embed = discord.Embed(
+		title="**Statystyki zastępstw**",
+		description=f"Podział zastępstw szkoły dostarczonych na serwery od {początekRoku.strftime('%d.%m.%Y')} według: **{nazwy.get(wymiar, wymiar)}**.",
+		color=Constants.KOLOR
+	)
+
+	if wymiar == "klasa":
+		wartości = sorted(wszystkie.items(), key=lambda x: (-x[1], x[0]))
+	else:
+		wartości = list(wszystkie.items())
+
+	for wartość, liczba in wartości[:25]:
+		if wymiar == "dzieńTygodnia":
+			nazwa = dniTygodnia[wartość]
+		elif wymiar == "lekcja":
+			nazwa = f"Lekcja {wartość}" if wartość else "Lekcja nieznana"
+		else:
+			nazwa = str(wartość)
+
+		embed.add_field(
+			name=nazwa,
+			value=f"Liczba zastępstw: {liczba}\nOdwołane lekcje: {odwołane.get(wartość, 0)}",
+			inline=True
+		)
+
+	if not wartości:
+		embed.add_field(
+			name="Brak danych",
+			value="W tym roku szkolnym nie odnotowano jeszcze zastępstw w tej szkole.",
+			inline=False
+		)
+
+	embed.set_footer(text=Constants.DŁUŻSZA_STOPKA)
+	return embed
@@ -0,0 +1,147 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Wsadowe przetwarzanie zapisanych stron z zastępstwami, niezależne od bota i pliku konfiguracyjnego.
+# Uruchomienie: python -m src.core ŚCIEŻKA [ŚCIEŻKA ...] --klasy 1A,2B [--nauczyciele "J. Kowalski"] [--lista-klas 1A,1B,2B] [--procesy 4]
+# Wynik: linie JSON, po jednej na wiersz zastępstwa ({"plik", "tytuł", "wpis"}) oraz na informacje dodatkowe strony ({"plik", "informacje-dodatkowe"}).
+
+# Standardowe biblioteki
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import sys
+from typing import Any
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from src.core.parser import wyodrębnijDane
+
+def podzielListę(tekst: str) -> list[str]:
+	"""
+	Dzieli listę podaną w argumencie wiersza poleceń po przecinkach.
+
+	Args:
+		tekst (str): Elementy oddzielone przecinkami.
+
+	Returns:
+		list[str]: Lista niepustych elementów.
+	"""
+
+	return [element.strip() for element in tekst.split(",") if element.strip()]
+
+
+def zbierzPliki(ścieżki: list[str]) -> list[Path]:
+	"""
+	Zbiera pliki stron do przetworzenia. Foldery przeszukiwane są rekurencyjnie w poszukiwaniu plików `.htm` i `.html`.
+
+	Args:
+		ścieżki (list[str]): Ścieżki do plików lub folderów.
+
+	Returns:
+		list[Path]: Posortowana lista plików.
+	"""
+
+	pliki = []
+
+	for ścieżka in map(Path, ścieżki):
+		if ścieżka.is_dir():
+			pliki.extend(plik for plik in ścieżka.rglob("*") if plik.suffix.lower() in (".htm", ".html"))
+		else:
+			pliki.append(ścieżka)
+
+	return sorted(pliki)
+
+
+def przetwórzPlik(
+	plik: Path,
+	kodowanie: str,
+	wybraneKlasy: list[str],
+	wybraniNauczyciele: list[str],
+	listaKlas: list[str]
+) -> list[dict[str, Any]]:
+	"""
+	Przetwarza jeden zapisany plik strony w procesie roboczym.
+
+	Args:
+		plik (Path): Ścieżka do pliku strony.
+		kodowanie (str): Kodowanie pliku strony.
+		wybraneKlasy (list[str]): Klasy używane do filtrowania zastępstw.
+		wybraniNauczyciele (list[str]): Nauczyciele używani do filtrowania zastępstw.
+		listaKlas (list[str]): Lista wszystkich klas szkoły.
+
+	Returns:
+		list[dict[str, Any]]: Rekordy wynikowe dla pliku.
+	"""
+
+	try:
+		zawartośćStrony = BeautifulSoup(plik.read_bytes().decode(kodowanie, errors="ignore"), "html.parser")
+		informacjeDodatkowe, wpisyZastępstw = wyodrębnijDane(zawartośćStrony, wybraneKlasy, wybraniNauczyciele, listaKlas)
+	except Exception as e:
+		return [{"plik": str(plik), "błąd": str(e)}]
+
+	rekordy = [{"plik": str(plik), "informacje-dodatkowe": informacjeDodatkowe}] if informacjeDodatkowe else []
+	rekordy.extend({"plik": str(plik), "tytuł": tytuł, "wpis": wpis} for tytuł, wpisy in wpisyZastępstw for wpis in wpisy)
+
+	return rekordy
+
+
+def main() -> int:
+	"""
+	Przetwarza podane pliki równolegle w wielu procesach i wypisuje wyniki jako linie JSON w kolejności plików.
+
+	Returns:
+		int: Kod wyjścia procesu.
+	"""
+
+	parser = argparse.ArgumentParser(prog="python -m src.core", description="Wyodrębnia zastępstwa z zapisanych stron i wypisuje je jako linie JSON.")
+	parser.add_argument("ścieżki", nargs="+", help="Pliki stron lub foldery z plikami .htm/.html.")
+	parser.add_argument("--klasy", type=podzielListę, default=[], help="Wybrane klasy oddzielone przecinkami.")
+	parser.add_argument("--nauczyciele", type=podzielListę, default=[], help="Wybrani nauczyciele oddzieleni przecinkami.")
+	parser.add_argument("--lista-klas", type=podzielListę, default=[], help="Wszystkie klasy szkoły oddzielone przecinkami.")
+	parser.add_argument("--kodowanie", default="iso-8859-2", help="Kodowanie plików stron. Domyślnie iso-8859-2.")
+	parser.add_argument("--procesy", type=int, default=None, help="Liczba procesów roboczych. Domyślnie liczba rdzeni.")
+	argumenty = parser.parse_args()
+
+	if not argumenty.klasy and not argumenty.nauczyciele:
+		parser.error("Podaj co najmniej jeden filtr: --klasy lub --nauczyciele.")
+
+	pliki = zbierzPliki(argumenty.ścieżki)
+	przetwórz = functools.partial(
+		przetwórzPlik,
+		kodowanie=argumenty.kodowanie,
+		wybraneKlasy=argumenty.klasy,
+		wybraniNauczyciele=argumenty.nauczyciele,
+		listaKlas=argumenty.lista_klas
+	)
+
+	with multiprocessing.Pool(argumenty.procesy) as pula:
+		try:
+			for rekordy in pula.imap(przetwórz, pliki, chunksize=4):
+				for rekord in rekordy:
+					sys.stdout.write(json.dumps(rekord, ensure_ascii=False) + "\n")
+
+				sys.stdout.flush()
+		except BrokenPipeError:
+			# Odbiorca wyniku (np. `head`) zakończył odczyt wcześniej
+			os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
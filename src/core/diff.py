@@ -0,0 +1,78 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import hashlib
+from typing import Any
+
+def obliczSumęKontrolną(dane: Any) -> str:
+	"""
+	Oblicza sumę kontrolną (SHA-256) dla podanych danych.
+
+	Args:
+		dane (Any): Dane wejściowe.
+
+	Returns:
+		str: Ciąg znaków reprezentujący hash SHA-256 danych.
+	"""
+
+	if isinstance(dane, str):
+		wejście = dane.strip()
+
+	elif isinstance(dane, list):
+		części = []
+
+		for tytuł, wpisy in sorted(dane, key=lambda pozycja: pozycja[0]):
+			części.append(tytuł.strip())
+
+			for wpis in sorted(wpisy):
+				części.append(wpis.strip())
+
+		wejście = "\n".join(części)
+
+	else:
+		wejście = str(dane)
+
+	return hashlib.sha256(wejście.encode("utf-8")).hexdigest()
+
+
+def wykryjZmiany(
+	poprzednieDane: dict[str, Any],
+	informacjeDodatkowe: str,
+	wpisyZastępstw: list[tuple[str, list[str]]]
+) -> tuple[bool, bool, str, str]:
+	"""
+	Porównuje sumy kontrolne aktualnych informacji dodatkowych i wpisów zastępstw z sumami zapisanymi w danych serwera.
+
+	Args:
+		poprzednieDane (dict[str, Any]): Zapisane dane serwera z kluczami `suma-kontrolna-informacji-dodatkowych` i `suma-kontrolna-wpisow-zastepstw`.
+		informacjeDodatkowe (str): Aktualne informacje dodatkowe.
+		wpisyZastępstw (list[tuple[str, list[str]]]): Aktualne wpisy zastępstw.
+
+	Returns:
+		tuple[bool, bool, str, str]:
+			zmienioneInformacje: Czy informacje dodatkowe uległy zmianie.
+			zmienioneWpisy: Czy wpisy zastępstw uległy zmianie.
+			sumaInformacji: Aktualna suma kontrolna informacji dodatkowych.
+			sumaWpisów: Aktualna suma kontrolna wpisów zastępstw.
+	"""
+
+	sumaInformacji = obliczSumęKontrolną(informacjeDodatkowe)
+	sumaWpisów = obliczSumęKontrolną(wpisyZastępstw)
+
+	return (
+		sumaInformacji != poprzednieDane.get("suma-kontrolna-informacji-dodatkowych", ""),
+		sumaWpisów != poprzednieDane.get("suma-kontrolna-wpisow-zastepstw", ""),
+		sumaInformacji,
+		sumaWpisów
+	)
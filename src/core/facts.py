@@ -0,0 +1,448 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+from array import array
+from collections import Counter
+from datetime import date
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import (
+	Any,
+	Iterable,
+	Optional
+)
+
+# Zewnętrzne biblioteki (opcjonalne)
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# Wewnętrzne importy
+from src.core.normalization import normalizujTekst
+
+# Kolumny magazynu faktów i ich typy w module `array`
+kolumnyFaktów = {
+	"skrót": "Q",
+	"dzień": "i",
+	"dzieńTygodnia": "B",
+	"lekcja": "B",
+	"nauczyciel": "I",
+	"klasa": "i",
+	"szkoła": "H",
+	"odwołane": "B"
+}
+
+# Kolumny kodowane słownikowo: w kolumnie zapisywany jest indeks wartości w słowniku
+kolumnySłownikowe = ("nauczyciel", "klasa", "szkoła")
+
+# Wymiary, według których można agregować fakty
+wymiaryFaktów = ("dzieńTygodnia", "lekcja", "klasa", "nauczyciel", "szkoła", "odwołane")
+
+# Frazy (po normalizacji) oznaczające, że lekcja nie odbędzie się zamiast zostać zastąpiona
+frazyOdwołania = ("odwolan", "zwolnieni", "zwolniona", "przychodza pozniej", "okienko", "wolne")
+
+wzórLekcji = re.compile(r"\*\*Lekcja:\*\*\s*(\d{1,2})")
+wzórZastępcy = re.compile(r"\*\*Zastępca:\*\*([^\n]*)")
+
+def wyodrębnijLekcję(wpis: str) -> int:
+	"""
+	Wyodrębnia numer lekcji ze sformatowanego wpisu zastępstwa.
+
+	Args:
+		wpis (str): Sformatowany wpis zastępstwa.
+
+	Returns:
+		int: Numer lekcji lub 0, jeśli nie został podany.
+	"""
+
+	dopasowanie = wzórLekcji.search(wpis or "")
+	return int(dopasowanie.group(1)) if dopasowanie else 0
+
+
+def czyOdwołane(wpis: str) -> bool:
+	"""
+	Sprawdza, czy wpis zastępstwa oznacza odwołanie lekcji (np. zwolnienie uczniów), a nie zastępstwo.
+
+	Args:
+		wpis (str): Sformatowany wpis zastępstwa.
+
+	Returns:
+		bool: True, jeśli lekcja została odwołana, False w przeciwnym razie.
+	"""
+
+	dopasowanie = wzórZastępcy.search(wpis or "")
+	tekst = normalizujTekst(dopasowanie.group(1) if dopasowanie else wpis)
+	return any(fraza in tekst for fraza in frazyOdwołania)
+
+
+class FaktyZastępstw():
+	"""
+	Kolumnowy magazyn faktów zastępstw do szybkich agregacji (dzień, dzień tygodnia, lekcja, nauczyciel, klasa, szkoła, odwołanie).
+
+	Każdy unikalny wiersz zastępstwa to jeden fakt, przypisany do pierwszej rozpoznanej klasy (-1, jeśli żadnej).
+	Fakty pochodzą z dziennika zastępstw, więc obejmują tylko wiersze pasujące do filtrów co najmniej jednego serwera.
+	Kolumny przechowywane są w tablicach modułu `array`, a teksty kodowane słownikowo, więc dopisanie faktu to kilka
+	operacji `append`. Na dysku każda kolumna jest osobnym plikiem binarnym dopisywanym na końcu, co pozwala wczytać
+	cały rok bez parsowania `JSON`. Agregacje korzystają z NumPy (`bincount` na widokach tablic), jeśli jest dostępny,
+	a w przeciwnym razie z `collections.Counter`.
+
+	Attributes:
+		folder (Optional[Path]): Folder z plikami kolumn lub None dla magazynu wyłącznie w pamięci.
+		kolumny (dict[str, array]): Kolumny faktów według nazwy.
+		słowniki (dict[str, list[str]]): Wartości kolumn kodowanych słownikowo według indeksu.
+		indeksy (dict[str, dict[str, int]]): Indeksy wartości kolumn kodowanych słownikowo.
+		skróty (set[int]): Skróty wierszy zastępstw obecnych w magazynie.
+	"""
+
+	def __init__(self, folder: Optional[Path]=None) -> None:
+		self.folder = folder
+		self.kolumny = {nazwa: array(typ) for nazwa, typ in kolumnyFaktów.items()}
+		self.słowniki = {nazwa: [] for nazwa in kolumnySłownikowe}
+		self.indeksy = {nazwa: {} for nazwa in kolumnySłownikowe}
+		self.skróty = set()
+		# Widoki NumPy blokują zmianę rozmiaru tablic, więc agregacje i dopisywanie nie mogą się przeplatać
+		self.blokada = threading.Lock()
+
+	def __len__(self) -> int:
+		return len(self.kolumny["skrót"])
+
+	def wczytaj(self) -> int:
+		"""
+		Wczytuje kolumny i słowniki z folderu magazynu. Kolumny przycinane są do najkrótszej z nich, co odrzuca fakt
+		zapisany tylko częściowo podczas awarii.
+
+		Returns:
+			int: Liczba wczytanych faktów.
+		"""
+
+		if self.folder is None or not (self.folder / "słowniki.json").exists():
+			return 0
+
+		with self.blokada:
+			with open(self.folder / "słowniki.json", "r", encoding="utf-8") as plik:
+				słowniki = json.load(plik)
+
+			self.słowniki = {nazwa: list(słowniki.get(nazwa, [])) for nazwa in kolumnySłownikowe}
+
+			self.indeksy = {nazwa: {wartość: indeks for indeks, wartość in enumerate(wartości)} for nazwa, wartości in self.słowniki.items()}
+
+			for nazwa, typ in kolumnyFaktów.items():
+				kolumna = array(typ)
+				ścieżka = self.folder / f"{nazwa}.bin"
+
+				if ścieżka.exists():
+					with open(ścieżka, "rb") as plik:
+						kolumna.frombytes(plik.read(ścieżka.stat().st_size // kolumna.itemsize * kolumna.itemsize))
+
+				self.kolumny[nazwa] = kolumna
+
+			długość = min(len(kolumna) for kolumna in self.kolumny.values())
+
+			for nazwa, kolumna in self.kolumny.items():
+				del kolumna[długość:]
+				ścieżka = self.folder / f"{nazwa}.bin"
+
+				if ścieżka.exists() and ścieżka.stat().st_size != długość * kolumna.itemsize:
+					os.truncate(ścieżka, długość * kolumna.itemsize)
+
+			self.skróty = set(self.kolumny["skrót"])
+
+		return długość
+
+	def wyczyść(self) -> None:
+		"""
+		Usuwa wszystkie fakty z pamięci i z folderu magazynu, np. przed przebudową magazynu z dziennika zastępstw.
+		"""
+
+		with self.blokada:
+			self.kolumny = {nazwa: array(typ) for nazwa, typ in kolumnyFaktów.items()}
+			self.słowniki = {nazwa: [] for nazwa in kolumnySłownikowe}
+			self.indeksy = {nazwa: {} for nazwa in kolumnySłownikowe}
+			self.skróty = set()
+
+			if self.folder is not None:
+				(self.folder / "słowniki.json").unlink(missing_ok=True)
+
+				for nazwa in kolumnyFaktów:
+					(self.folder / f"{nazwa}.bin").unlink(missing_ok=True)
+
+	def zakoduj(
+		self,
+		nazwa: str,
+		wartość: str
+	) -> int:
+		"""
+		Zwraca indeks wartości w słowniku kolumny, dodając ją, jeśli pojawia się po raz pierwszy.
+
+		Args:
+			nazwa (str): Nazwa kolumny kodowanej słownikowo.
+			wartość (str): Wartość do zakodowania.
+
+		Returns:
+			int: Indeks wartości w słowniku.
+		"""
+
+		indeks = self.indeksy[nazwa].get(wartość)
+
+		if indeks is None:
+			indeks = self.indeksy[nazwa][wartość] = len(self.słowniki[nazwa])
+			self.słowniki[nazwa].append(wartość)
+
+		return indeks
+
+	def dopisz(self, zdarzenia: Iterable[dict[str, Any]]) -> int:
+		"""
+		Dopisuje fakty z rekordów dziennika zastępstw, pomijając wiersze już obecne w magazynie.
+
+		Args:
+			zdarzenia (Iterable[dict[str, Any]]): Rekordy zdarzeń w formacie dziennika zastępstw.
+
+		Returns:
+			int: Liczba dopisanych faktów.
+		"""
+
+		with self.blokada:
+			początek = len(self)
+			rozmiarySłowników = {nazwa: len(wartości) for nazwa, wartości in self.słowniki.items()}
+
+			for zdarzenie in zdarzenia:
+				try:
+					skrót = int(zdarzenie.get("h", ""), 16)
+					dzień = date.fromisoformat(zdarzenie.get("d", ""))
+				except (TypeError, ValueError):
+					continue
+
+				if skrót in self.skróty:
+					continue
+
+				self.skróty.add(skrót)
+				klasy = zdarzenie.get("k") or []
+				self.kolumny["skrót"].append(skrót)
+				self.kolumny["dzień"].append(dzień.toordinal())
+				self.kolumny["dzieńTygodnia"].append(dzień.weekday())
+				self.kolumny["lekcja"].append(min(max(int(zdarzenie.get("l", 0) or 0), 0), 255))
+				self.kolumny["nauczyciel"].append(self.zakoduj("nauczyciel", str(zdarzenie.get("n", ""))))
+				self.kolumny["klasa"].append(self.zakoduj("klasa", str(klasy[0])) if klasy else -1)
+				self.kolumny["szkoła"].append(self.zakoduj("szkoła", str(zdarzenie.get("s", ""))))
+				self.kolumny["odwołane"].append(1 if zdarzenie.get("o") else 0)
+
+			dopisane = len(self) - początek
+
+			if dopisane and self.folder is not None:
+				try:
+					self.zapisz(początek, rozmiarySłowników != {nazwa: len(wartości) for nazwa, wartości in self.słowniki.items()})
+				except Exception:
+					self.wycofaj(początek, rozmiarySłowników)
+					raise
+
+			return dopisane
+
+	def wycofaj(
+		self,
+		początek: int,
+		rozmiarySłowników: dict[str, int]
+	) -> None:
+		"""
+		Usuwa z pamięci fakty od podanej pozycji oraz wartości słowników dodane razem z nimi, np. po nieudanym zapisie
+		na dysk. Dzięki temu kolejny zapis zaczyna się od pozycji zgodnej z zawartością plików kolumn.
+
+		Args:
+			początek (int): Pozycja pierwszego wycofywanego faktu.
+			rozmiarySłowników (dict[str, int]): Rozmiary słowników sprzed dopisania faktów.
+		"""
+
+		self.skróty.difference_update(self.kolumny["skrót"][początek:])
+
+		for kolumna in self.kolumny.values():
+			del kolumna[początek:]
+
+		for nazwa, rozmiar in rozmiarySłowników.items():
+			for wartość in self.słowniki[nazwa][rozmiar:]:
+				del self.indeksy[nazwa][wartość]
+
+			del self.słowniki[nazwa][rozmiar:]
+
+	def zapisz(
+		self,
+		początek: int,
+		zmienioneSłowniki: bool
+	) -> None:
+		"""
+		Dopisuje na dysk fakty od podanej pozycji. Słowniki zapisywane są przed kolumnami, więc zapisany fakt zawsze
+		wskazuje na istniejące wartości. Przed dopisaniem każdy plik kolumny przycinany jest do podanej pozycji, więc
+		pozostałości wcześniejszego, częściowego zapisu nie przesuwają wierszy pomiędzy kolumnami.
+
+		Args:
+			początek (int): Pozycja pierwszego niezapisanego faktu.
+			zmienioneSłowniki (bool): Czy do słowników dodano nowe wartości.
+		"""
+
+		self.folder.mkdir(parents=True, exist_ok=True)
+
+		if zmienioneSłowniki or not (self.folder / "słowniki.json").exists():
+			tymczasowy = self.folder / "słowniki.json.tmp"
+
+			with open(tymczasowy, "w", encoding="utf-8") as plik:
+				json.dump(self.słowniki, plik, ensure_ascii=False)
+				plik.flush()
+				os.fsync(plik.fileno())
+
+			os.replace(tymczasowy, self.folder / "słowniki.json")
+
+		for nazwa, kolumna in self.kolumny.items():
+			with open(self.folder / f"{nazwa}.bin", "ab") as plik:
+				plik.truncate(początek * kolumna.itemsize)
+				kolumna[początek:].tofile(plik)
+
+	def zlicz(
+		self,
+		wymiar: str,
+		szkoła: Optional[str]=None,
+		od: Optional[date]=None,
+		do: Optional[date]=None,
+		tylkoOdwołane: bool=False
+	) -> dict[Any, int]:
+		"""
+		Zlicza fakty według wymiaru z opcjonalnym filtrem szkoły, zakresu dat i odwołań.
+
+		Args:
+			wymiar (str): Jeden z `wymiaryFaktów`.
+			szkoła (Optional[str]): ID szkoły. Domyślnie wszystkie szkoły.
+			od (Optional[date]): Pierwszy uwzględniany dzień.
+			do (Optional[date]): Ostatni uwzględniany dzień.
+			tylkoOdwołane (bool, optional): Czy liczyć wyłącznie odwołane lekcje. Domyślnie False.
+
+		Returns:
+			dict[Any, int]: Liczba faktów według wartości wymiaru (teksty dla kolumn słownikowych, liczby dla pozostałych),
+				w kolejności rosnących wartości kolumny. Fakty bez rozpoznanej klasy są pomijane.
+
+		Raises:
+			ValueError: Jeśli wymiar jest nieznany.
+		"""
+
+		if wymiar not in wymiaryFaktów:
+			raise ValueError(f"Nieznany wymiar agregacji: {wymiar}.")
+
+		with self.blokada:
+			identyfikatorSzkoły = None
+
+			if szkoła is not None:
+				identyfikatorSzkoły = self.indeksy["szkoła"].get(szkoła)
+
+				if identyfikatorSzkoły is None:
+					return {}
+
+			zakres = (od.toordinal() if od else None, do.toordinal() if do else None)
+			liczniki = (self.zliczNumPy if numpy is not None else self.zliczPython)(wymiar, identyfikatorSzkoły, zakres, tylkoOdwołane)
+
+		słownik = self.słowniki.get(wymiar)
+
+		return {
+			(słownik[wartość] if słownik is not None else wartość): liczba
+			for wartość, liczba in sorted(liczniki.items())
+			if liczba and not (wymiar == "klasa" and wartość < 0)
+		}
+
+	def zliczNumPy(
+		self,
+		wymiar: str,
+		identyfikatorSzkoły: Optional[int],
+		zakres: tuple[Optional[int], Optional[int]],
+		tylkoOdwołane: bool
+	) -> dict[int, int]:
+		"""
+		Agregacja wektorowa: maska filtrów i `numpy.bincount` na widokach kolumn bez kopiowania danych.
+
+		Args:
+			wymiar (str): Jeden z `wymiaryFaktów`.
+			identyfikatorSzkoły (Optional[int]): Indeks szkoły w słowniku kolumny lub None dla wszystkich szkół.
+			zakres (tuple[Optional[int], Optional[int]]): Pierwszy i ostatni uwzględniany dzień jako liczby porządkowe.
+			tylkoOdwołane (bool): Czy liczyć wyłącznie odwołane lekcje.
+
+		Returns:
+			dict[int, int]: Liczba faktów według surowej wartości kolumny wymiaru.
+		"""
+
+		def widok(nazwa: str) -> "numpy.ndarray":
+			"""
+			Zwraca widok NumPy na kolumnę bez kopiowania danych.
+
+			Args:
+				nazwa (str): Nazwa kolumny.
+
+			Returns:
+				numpy.ndarray: Widok kolumny (pusta tablica dla pustej kolumny, której bufora nie można odczytać).
+			"""
+
+			kolumna = self.kolumny[nazwa]
+			return numpy.frombuffer(kolumna, dtype=kolumna.typecode) if kolumna else numpy.zeros(0, dtype=kolumna.typecode)
+
+		maska = numpy.ones(len(self), dtype=bool)
+
+		if identyfikatorSzkoły is not None:
+			maska &= widok("szkoła") == identyfikatorSzkoły
+
+		if zakres[0] is not None:
+			maska &= widok("dzień") >= zakres[0]
+
+		if zakres[1] is not None:
+			maska &= widok("dzień") <= zakres[1]
+
+		if tylkoOdwołane:
+			maska &= widok("odwołane") == 1
+
+		# Przesunięcie o 1 mieści brak klasy (-1) w nieujemnym zakresie wymaganym przez bincount
+		wartości = widok(wymiar)[maska].astype(numpy.int64) + 1
+		liczby = numpy.bincount(wartości)
+
+		return {int(indeks) - 1: int(liczby[indeks]) for indeks in numpy.flatnonzero(liczby)}
+
+	def zliczPython(
+		self,
+		wymiar: str,
+		identyfikatorSzkoły: Optional[int],
+		zakres: tuple[Optional[int], Optional[int]],
+		tylkoOdwołane: bool
+	) -> dict[int, int]:
+		"""
+		Agregacja bez NumPy: `Counter` na kolumnie, a przy filtrach jedno przejście po spiętych kolumnach.
+
+		Args:
+			wymiar (str): Jeden z `wymiaryFaktów`.
+			identyfikatorSzkoły (Optional[int]): Indeks szkoły w słowniku kolumny lub None dla wszystkich szkół.
+			zakres (tuple[Optional[int], Optional[int]]): Pierwszy i ostatni uwzględniany dzień jako liczby porządkowe.
+			tylkoOdwołane (bool): Czy liczyć wyłącznie odwołane lekcje.
+
+		Returns:
+			dict[int, int]: Liczba faktów według surowej wartości kolumny wymiaru.
+		"""
+
+		kolumna = self.kolumny[wymiar]
+		od, do = zakres
+
+		if identyfikatorSzkoły is None and od is None and do is None and not tylkoOdwołane:
+			return Counter(kolumna)
+
+		od = od if od is not None else -1
+		do = do if do is not None else 1 << 31
+
+		return Counter(
+			wartość
+			for wartość, szkoła, dzień, odwołane in zip(kolumna, self.kolumny["szkoła"], self.kolumny["dzień"], self.kolumny["odwołane"])
+			if (identyfikatorSzkoły is None or szkoła == identyfikatorSzkoły) and od <= dzień <= do and (odwołane or not tylkoOdwołane)
+		)
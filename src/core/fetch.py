@@ -0,0 +1,114 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+import logging
+import time
+from typing import Optional
+
+# Zewnętrzne biblioteki
+import aiohttp
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from src.core.metrics import (
+	czasParsowania,
+	czasPobierania,
+	odpowiedzi429,
+	pobraneBajty
+)
+from src.core.tracing import śledź
+
+# Logger rdzenia, przekazywany do pliku logów bota przez `skonfigurujLogi`
+logiRdzenia = logging.getLogger("zastepstwa.core")
+
+async def pobierzStronę(
+	sesja: aiohttp.ClientSession,
+	url: str,
+	kodowanie: str,
+	szkoła: str=""
+) -> Optional[BeautifulSoup]:
+	"""
+	Pobiera zawartość strony internetowej przy użyciu podanej sesji HTTP i przetwarza ją w osobnym wątku.
+	Czas i wynik pobierania, liczba pobranych bajtów oraz czas parsowania trafiają do metryk (`src.core.metrics`),
+	a pobieranie, dekodowanie i parsowanie - do śladu cyklu (`src.core.tracing`), jeśli cykl jest śledzony.
+
+	Args:
+		sesja (aiohttp.ClientSession): Sesja HTTP, z której wykorzystywane jest połączenie.
+		url (str): Adres strony internetowej do pobrania.
+		kodowanie (str): Kodowanie użyte do odczytu treści strony internetowej.
+		szkoła (str, optional): ID szkoły, którego używają etykiety metryk.
+
+	Returns:
+		Optional[BeautifulSoup]: Obiekt BeautifulSoup ze strukturą HTML lub None w przypadku błędu.
+	"""
+
+	początek = time.perf_counter()
+	wynik = "blad"
+
+	try:
+		with śledź("pobieranie", szkola=szkoła) as atrybutyPobierania:
+			async with sesja.get(url) as odpowiedź:
+				atrybutyPobierania["status"] = odpowiedź.status
+
+				if odpowiedź.status == 429:
+					odpowiedzi429.zwiększ(zrodlo="strona")
+
+				odpowiedź.raise_for_status()
+
+				surowe = await odpowiedź.read()
+				atrybutyPobierania["bajty"] = len(surowe)
+
+		pobraneBajty.zwiększ(len(surowe), szkola=szkoła)
+
+		with śledź("dekodowanie", bajty=len(surowe), kodowanie=kodowanie):
+			tekst = surowe.decode(kodowanie, errors="ignore")
+
+		wynik = "ok"
+		czasPobierania.obserwuj(time.perf_counter() - początek, szkola=szkoła, wynik=wynik)
+		pętla = asyncio.get_running_loop()
+
+		def parsuj() -> BeautifulSoup:
+			"""
+			Parsuje pobraną stronę, mierząc czas parsowania.
+
+			Returns:
+				BeautifulSoup: Obiekt BeautifulSoup ze strukturą HTML.
+			"""
+
+			with czasParsowania.zmierz(szkola=szkoła):
+				return BeautifulSoup(tekst, "html.parser")
+
+		with śledź("parsowanie", znaki=len(tekst)):
+			return await pętla.run_in_executor(None, parsuj)
+	except asyncio.TimeoutError:
+		wynik = "timeout"
+		logiRdzenia.warning(
+			f"Przekroczono czas oczekiwania na połączenie ({url}).",
+			extra={"event": "przekroczono-czas-pobierania", "url": url}
+		)
+	except aiohttp.ClientError as e:
+		wynik = "blad-http"
+		logiRdzenia.exception(
+			f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}",
+			extra={"event": "blad-pobierania", "url": url}
+		)
+	except Exception as e:
+		logiRdzenia.exception(
+			f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {e}"
+		)
+	finally:
+		if wynik != "ok":
+			czasPobierania.obserwuj(time.perf_counter() - początek, szkola=szkoła, wynik=wynik)
+	return None
@@ -0,0 +1,235 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+import logging
+import time
+from typing import (
+	Any,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.core.metrics import (
+	kolejkaBlokad,
+	oczekiwanieBlokad,
+	przetrzymanieBlokad
+)
+from src.core.tracing import aktywnyŚlad
+
+# Logger modułów rdzenia
+logiRdzenia = logging.getLogger("zastepstwa.core")
+
+# Oczekiwanie na blokadę (w sekundach), od którego zapisywane jest ostrzeżenie z nazwami zadań przetrzymujących blokadę
+prógDługiegoOczekiwania = 1.0
+
+class StatystykiRodziny():
+	"""
+	Statystyki rywalizacji o blokady jednej rodziny (np. wszystkich blokad kanałów) od ostatniego podsumowania.
+
+	Attributes:
+		rodzina (str): Nazwa rodziny blokad.
+		oczekujący (int): Aktualna liczba zadań oczekujących na blokady rodziny.
+		wejścia (int): Liczba wejść do blokad.
+		sumaOczekiwania (float): Łączny czas oczekiwania (w sekundach).
+		maksOczekiwania (float): Najdłuższe oczekiwanie (w sekundach).
+		sumaPrzetrzymania (float): Łączny czas przetrzymania (w sekundach).
+		maksPrzetrzymania (float): Najdłuższe przetrzymanie (w sekundach).
+		posiadaczMaksPrzetrzymania (Optional[str]): Nazwa zadania, które najdłużej przetrzymywało blokadę.
+		maksKolejki (int): Największa liczba jednocześnie oczekujących zadań.
+	"""
+
+	__slots__ = (
+		"rodzina",
+		"oczekujący",
+		"wejścia",
+		"sumaOczekiwania",
+		"maksOczekiwania",
+		"sumaPrzetrzymania",
+		"maksPrzetrzymania",
+		"posiadaczMaksPrzetrzymania",
+		"maksKolejki"
+	)
+
+	def __init__(self, rodzina: str) -> None:
+		self.rodzina = rodzina
+		self.oczekujący = 0
+		self.wyzeruj()
+
+	def wyzeruj(self) -> None:
+		"""
+		Zeruje statystyki okna (bez liczby aktualnie oczekujących zadań).
+		"""
+
+		self.wejścia = 0
+		self.sumaOczekiwania = 0.0
+		self.maksOczekiwania = 0.0
+		self.sumaPrzetrzymania = 0.0
+		self.maksPrzetrzymania = 0.0
+		self.posiadaczMaksPrzetrzymania = None
+		self.maksKolejki = self.oczekujący
+
+
+# Statystyki rodzin blokad według nazw
+statystykiBlokad: dict[str, StatystykiRodziny] = {}
+
+def nazwaZadania() -> str:
+	"""
+	Zwraca nazwę bieżącego zadania asyncio.
+
+	Returns:
+		str: Nazwa zadania lub `brak`, jeśli kod nie działa w zadaniu.
+	"""
+
+	zadanie = asyncio.current_task()
+	return zadanie.get_name() if zadanie is not None else "brak"
+
+
+class BlokadaZPomiarem():
+	"""
+	Zamiennik `asyncio.Lock` i `asyncio.Semaphore` mierzący czas oczekiwania, czas przetrzymania i długość kolejki
+	oraz zapamiętujący nazwy zadań przetrzymujących blokadę. Pomiary sumowane są dla całej rodziny blokad
+	(np. wszystkich blokad kanałów) i eksportowane jako metryki z etykietą `rodzina`.
+
+	Attributes:
+		rodzina (str): Nazwa rodziny blokad.
+		blokada (asyncio.Lock | asyncio.Semaphore): Opakowana blokada.
+		statystyki (StatystykiRodziny): Statystyki rodziny blokad.
+		posiadacze (dict[Optional[asyncio.Task], tuple[str, float]]): Zadania przetrzymujące blokadę z nazwą i czasem wejścia.
+	"""
+
+	__slots__ = ("rodzina", "blokada", "statystyki", "posiadacze")
+
+	def __init__(
+		self,
+		rodzina: str,
+		blokada: Optional[asyncio.Lock | asyncio.Semaphore]=None
+	) -> None:
+		self.rodzina = rodzina
+		self.blokada = blokada if blokada is not None else asyncio.Lock()
+		self.statystyki = statystykiBlokad.setdefault(rodzina, StatystykiRodziny(rodzina))
+		self.posiadacze = {}
+
+	def locked(self) -> bool:
+		"""
+		Sprawdza, czy blokada jest zajęta (dla semafora: czy nie ma wolnych miejsc).
+
+		Returns:
+			bool: True, jeśli wejście do blokady wymagałoby oczekiwania.
+		"""
+
+		return self.blokada.locked()
+
+	async def acquire(self) -> bool:
+		"""
+		Wchodzi do blokady, mierząc czas oczekiwania i długość kolejki.
+
+		Returns:
+			bool: Zawsze True.
+		"""
+
+		statystyki = self.statystyki
+		zajęta = self.blokada.locked()
+		posiadacze = ", ".join(nazwa for nazwa, _ in self.posiadacze.values()) or "brak"
+
+		if zajęta:
+			statystyki.oczekujący += 1
+			statystyki.maksKolejki = max(statystyki.maksKolejki, statystyki.oczekujący)
+			kolejkaBlokad.ustaw(statystyki.oczekujący, rodzina=self.rodzina)
+
+		początek = time.perf_counter()
+
+		try:
+			await self.blokada.acquire()
+		finally:
+			if zajęta:
+				statystyki.oczekujący -= 1
+				kolejkaBlokad.ustaw(statystyki.oczekujący, rodzina=self.rodzina)
+
+		koniec = time.perf_counter()
+		czasOczekiwania = koniec - początek
+		ślad = aktywnyŚlad.get()
+
+		# Oczekiwanie na zajętą blokadę widoczne jest w śladzie cyklu jako osobny przedział
+		if zajęta and ślad is not None:
+			ślad.dodaj(f"blokada:{self.rodzina}", int(początek * 1e9), int(koniec * 1e9), {"posiadacze": posiadacze})
+
+		if czasOczekiwania >= prógDługiegoOczekiwania:
+			logiRdzenia.warning(
+				f"Oczekiwanie zadania {nazwaZadania()} na blokadę z rodziny „{self.rodzina}” trwało {czasOczekiwania * 1000:.0f} ms (blokadę przetrzymywały: {posiadacze}).",
+				extra={"event": "dlugie-oczekiwanie-na-blokade", "duration_ms": round(czasOczekiwania * 1000, 1), "lock": self.rodzina}
+			)
+
+		statystyki.wejścia += 1
+		statystyki.sumaOczekiwania += czasOczekiwania
+		statystyki.maksOczekiwania = max(statystyki.maksOczekiwania, czasOczekiwania)
+		oczekiwanieBlokad.obserwuj(czasOczekiwania, rodzina=self.rodzina)
+		self.posiadacze[asyncio.current_task()] = (nazwaZadania(), time.perf_counter())
+		return True
+
+	def release(self) -> None:
+		"""
+		Zwalnia blokadę, mierząc czas jej przetrzymania.
+		"""
+
+		wpis = self.posiadacze.pop(asyncio.current_task(), None)
+
+		if wpis is None and self.posiadacze:
+			wpis = self.posiadacze.pop(next(iter(self.posiadacze)))
+
+		self.blokada.release()
+
+		if wpis is None:
+			return
+
+		nazwa, wejście = wpis
+		czasPrzetrzymania = time.perf_counter() - wejście
+		statystyki = self.statystyki
+		statystyki.sumaPrzetrzymania += czasPrzetrzymania
+
+		if czasPrzetrzymania > statystyki.maksPrzetrzymania:
+			statystyki.maksPrzetrzymania = czasPrzetrzymania
+			statystyki.posiadaczMaksPrzetrzymania = nazwa
+
+		przetrzymanieBlokad.obserwuj(czasPrzetrzymania, rodzina=self.rodzina)
+
+	async def __aenter__(self) -> None:
+		await self.acquire()
+
+	async def __aexit__(self, *wyjątek: Any) -> None:
+		self.release()
+
+
+def podsumujBlokady() -> list[str]:
+	"""
+	Tworzy podsumowanie rywalizacji o blokady dla każdej rodziny używanej od poprzedniego podsumowania
+	i zeruje statystyki okna.
+
+	Returns:
+		list[str]: Jeden opis dla każdej rodziny blokad.
+	"""
+
+	opisy = []
+
+	for statystyki in statystykiBlokad.values():
+		if statystyki.wejścia:
+			opisy.append(
+				f"{statystyki.rodzina}: {statystyki.wejścia} wejść, oczekiwanie śr. {statystyki.sumaOczekiwania / statystyki.wejścia * 1000:.1f} ms / maks. {statystyki.maksOczekiwania * 1000:.1f} ms, "
+				f"przetrzymanie śr. {statystyki.sumaPrzetrzymania / statystyki.wejścia * 1000:.1f} ms / maks. {statystyki.maksPrzetrzymania * 1000:.1f} ms ({statystyki.posiadaczMaksPrzetrzymania or 'brak'}), "
+				f"maks. kolejka {statystyki.maksKolejki}"
+			)
+
+		statystyki.wyzeruj()
+
+	return opisy
@@ -0,0 +1,303 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import bisect
+from collections import defaultdict
+import difflib
+import re
+from typing import (
+	Any,
+	Iterable,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.core.normalization import (
+	normalizujTekst,
+	normalizujTekstBezPamięci
+)
+
+def usuńDuplikaty(sekwencja: list[Any]) -> list[Any]:
+	"""
+	Usuwa duplikaty z listy, zachowując kolejność elementów.
+
+	Args:
+		sekwencja (list[Any]): Lista, z której mają zostać usunięte duplikaty.
+
+	Returns:
+		list[Any]: Lista bez duplikatów, w tej samej kolejności co oryginał.
+	"""
+
+	widziane = set()
+	wynik = []
+
+	for element in sekwencja:
+		if element not in widziane:
+			wynik.append(element)
+			widziane.add(element)
+
+	return wynik
+
+
+def stwórzKluczeNormalizacyjne(tekst: str) -> list[str]:
+	"""
+	Tworzy dwie wersje kluczy normalizacyjnych dla podanego tekstu.
+
+	Args:
+		tekst (str): Tekst wejściowy do przetworzenia.
+
+	Returns:
+		list[str]: Lista dwóch kluczy normalizacyjnych [tekstNormalizowany, brakSpacji].
+	"""
+
+	tekstNormalizowany = normalizujTekst(tekst)
+	brakSpacji = re.sub(r"\s+", "", tekstNormalizowany)
+
+	return [tekstNormalizowany, brakSpacji]
+
+
+class IndeksDopasowań():
+	"""
+	Trwały indeks listy referencyjnej (klas lub nauczycieli szkoły) do dopasowywania wpisów użytkownika.
+
+	Indeks budowany jest raz, przy wczytywaniu konfiguracji szkoły. Dopasowania przybliżone dają dokładnie te same wyniki co
+	`difflib.get_close_matches(n=1)`: kandydaci pogrupowani są według długości, a całe grupy, dla których górne ograniczenie
+	podobieństwa wynikające z samych długości (`real_quick_ratio`) jest niższe od progu, są pomijane bez porównywania.
+	Ponieważ szukany jest jeden najlepszy wynik, próg podnoszony jest do podobieństwa najlepszego dotychczasowego kandydata.
+
+	Attributes:
+		mapaKluczy (dict[str, list[str]]): Klucze normalizacyjne zmapowane na oryginalne elementy.
+		normalizowaneDoOryginalnych (dict[str, list[str]]): Pełne znormalizowane nazwy zmapowane na oryginalne elementy.
+		długości (dict[int, tuple[str, ...]]): Unikalne znormalizowane nazwy pogrupowane według długości.
+	"""
+
+	__slots__ = ("mapaKluczy", "normalizowaneDoOryginalnych", "długości")
+
+	def __init__(self, listaDoDopasowania: Iterable[str]) -> None:
+		mapaKluczy = defaultdict(list)
+		normalizowaneDoOryginalnych = defaultdict(list)
+		długości = defaultdict(list)
+
+		for element in listaDoDopasowania:
+			pełnaNorma = re.sub(r"\s+", "", normalizujTekst(element))
+
+			if pełnaNorma not in normalizowaneDoOryginalnych:
+				długości[len(pełnaNorma)].append(pełnaNorma)
+
+			normalizowaneDoOryginalnych[pełnaNorma].append(element)
+
+			for klucz in stwórzKluczeNormalizacyjne(element):
+				mapaKluczy[klucz].append(element)
+
+		self.mapaKluczy = dict(mapaKluczy)
+		self.normalizowaneDoOryginalnych = dict(normalizowaneDoOryginalnych)
+		self.długości = {długość: tuple(nazwy) for długość, nazwy in długości.items()}
+
+	def najbliższy(
+		self,
+		normaWpisu: str,
+		cutoff: float=0.6
+	) -> Optional[str]:
+		"""
+		Wyszukuje najbardziej podobną znormalizowaną nazwę, tak samo jak `difflib.get_close_matches(normaWpisu, nazwy, n=1, cutoff=cutoff)`.
+
+		Args:
+			normaWpisu (str): Znormalizowany wpis bez spacji.
+			cutoff (float, optional): Minimalny próg podobieństwa (0-1). Domyślnie 0.6.
+
+		Returns:
+			Optional[str]: Najbardziej podobna znormalizowana nazwa lub None, jeśli żadna nie osiąga progu.
+		"""
+
+		porównanie = difflib.SequenceMatcher()
+		porównanie.set_seq2(normaWpisu)
+		długośćWpisu = len(normaWpisu)
+		najlepszy = None
+		próg = cutoff
+
+		# Grupy o długości najbliższej wpisowi sprawdzane są najpierw, dzięki czemu próg szybko rośnie
+		for długość in sorted(self.długości, key=lambda długość: abs(długość - długośćWpisu)):
+			suma = długość + długośćWpisu
+
+			if suma and 2.0 * min(długość, długośćWpisu) / suma < próg:
+				continue
+
+			for nazwa in self.długości[długość]:
+				porównanie.set_seq1(nazwa)
+
+				if porównanie.quick_ratio() < próg:
+					continue
+
+				wynik = porównanie.ratio()
+
+				if wynik >= próg and (najlepszy is None or (wynik, nazwa) > najlepszy):
+					najlepszy = (wynik, nazwa)
+					próg = wynik
+
+		return najlepszy[1] if najlepszy else None
+
+	def dopasuj(
+		self,
+		wpisy: list[str],
+		cutoff: float=0.6
+	) -> tuple[list[str], dict[str, str], list[str]]:
+		"""
+		Dopasowuje listę wpisów do listy referencyjnej, próbując znaleźć dokładne lub przybliżone dopasowania.
+
+		Args:
+			wpisy (list[str]): Lista wpisów do dopasowania.
+			cutoff (float, optional): Minimalny próg podobieństwa dla dopasowań przybliżonych (0-1). Domyślnie 0.6.
+
+		Returns:
+			tuple[list[str], dict[str, str], list[str]]:
+				idealneDopasowania: Lista idealnie dopasowanych wpisów.
+				sugestie: Słownik sugestii przybliżonych dopasowań.
+				nieZnaleziono: Lista wpisów, dla których nie znaleziono dopasowania.
+		"""
+
+		idealneDopasowania = []
+		sugestie = {}
+		nieZnaleziono = []
+
+		for wpis in wpisy:
+			kluczeWpisu = stwórzKluczeNormalizacyjne(wpis)
+			znalezioneIdealneDopasowania = None
+
+			for klucz in kluczeWpisu:
+				if klucz in self.mapaKluczy:
+					znalezioneIdealneDopasowania = self.mapaKluczy[klucz][0]
+					break
+
+			if znalezioneIdealneDopasowania:
+				if znalezioneIdealneDopasowania not in idealneDopasowania:
+					idealneDopasowania.append(znalezioneIdealneDopasowania)
+
+				continue
+
+			# Dopasowanie przybliżone
+			normaKandydata = self.najbliższy(kluczeWpisu[1], cutoff)
+
+			if normaKandydata is not None:
+				sugestie[wpis] = self.normalizowaneDoOryginalnych[normaKandydata][0]
+			else:
+				nieZnaleziono.append(wpis)
+
+		return idealneDopasowania, sugestie, nieZnaleziono
+
+
+class IndeksPrefiksów():
+	"""
+	Posortowany indeks prefiksów do podpowiedzi (autocomplete) wyszukujący elementy po początku nazwy lub dowolnego jej słowa.
+
+	Dla każdego elementu zapisywany jest znormalizowany tekst od początku każdego słowa (oraz pełny tekst bez spacji),
+	dzięki czemu wpisanie „kowal” odnajduje „A. Kowalski”, a „1 a” odnajduje „1A”. Wszystkie klucze leżą w jednej
+	posortowanej liście, więc zakres pasujących kluczy wyznaczany jest dwoma wyszukiwaniami binarnymi (`bisect`).
+	Opcjonalne `teksty` pozwalają przeszukiwać inny tekst niż zwracany element (np. nazwę i ID szkoły, zwracając samo ID).
+
+	Attributes:
+		elementy (tuple[str, ...]): Indeksowane elementy w oryginalnej kolejności.
+		klucze (list[str]): Posortowane klucze prefiksów.
+		pozycje (list[tuple[int, int]]): Dla każdego klucza para (ranga, indeks elementu); ranga 0 oznacza początek pełnej nazwy, a 1 początek kolejnego słowa.
+	"""
+
+	__slots__ = ("elementy", "klucze", "pozycje")
+
+	def __init__(
+		self,
+		elementy: Iterable[str],
+		teksty: Optional[Iterable[str]]=None
+	) -> None:
+		self.elementy = tuple(elementy)
+		wpisy = set()
+
+		for indeks, tekst in enumerate(self.elementy if teksty is None else teksty):
+			znormalizowany = normalizujTekst(tekst)
+
+			if not znormalizowany:
+				continue
+
+			wpisy.add((znormalizowany, 0, indeks))
+			wpisy.add((znormalizowany.replace(" ", ""), 0, indeks))
+
+			for pozycja, znak in enumerate(znormalizowany):
+				if znak == " " and pozycja + 1 < len(znormalizowany):
+					wpisy.add((znormalizowany[pozycja + 1:], 1, indeks))
+
+		posortowane = sorted(wpisy)
+		self.klucze = [klucz for klucz, _, _ in posortowane]
+		self.pozycje = [(ranga, indeks) for _, ranga, indeks in posortowane]
+
+	def szukaj(
+		self,
+		tekst: str,
+		limit: int=25
+	) -> list[str]:
+		"""
+		Zwraca elementy, których nazwa lub dowolne słowo nazwy zaczyna się od wpisanego tekstu (także po usunięciu z niego spacji).
+
+		Elementy pasujące od początku nazwy zwracane są przed pasującymi od kolejnego słowa, a w obrębie tej samej
+		rangi zachowywana jest oryginalna kolejność. Wpisany tekst normalizowany jest bez pamięci podręcznej,
+		aby kolejne znaki wpisywane przez użytkowników nie wypierały z niej nazw klas i nauczycieli.
+
+		Args:
+			tekst (str): Tekst wpisany dotychczas przez użytkownika.
+			limit (int, optional): Maksymalna liczba wyników. Domyślnie 25 (limit podpowiedzi Discorda).
+
+		Returns:
+			list[str]: Pasujące elementy.
+		"""
+
+		fraza = normalizujTekstBezPamięci(tekst) if isinstance(tekst, str) else ""
+
+		if not fraza:
+			return list(self.elementy[:limit])
+
+		rangi = {}
+
+		# Fraza ze spacjami (np. „1 a”) szukana jest też bez nich, aby trafić w pełny tekst bez spacji („1a”)
+		for wariant in {fraza, fraza.replace(" ", "")}:
+			początek = bisect.bisect_left(self.klucze, wariant)
+			koniec = bisect.bisect_left(self.klucze, wariant[:-1] + chr(ord(wariant[-1]) + 1), początek)
+
+			for ranga, indeks in self.pozycje[początek:koniec]:
+				if rangi.get(indeks, 2) > ranga:
+					rangi[indeks] = ranga
+
+		najlepsze = sorted(rangi, key=lambda indeks: (rangi[indeks], indeks))[:limit]
+
+		return [self.elementy[indeks] for indeks in najlepsze]
+
+
+def dopasujWpisyDoListy(
+	wpisy: list[str],
+	listaDoDopasowania: list[str],
+	cutoff: float=0.6
+) -> tuple[list[str], dict[str, str], list[str]]:
+	"""
+	Dopasowuje listę wpisów do listy referencyjnej, budując jednorazowy indeks. Dla list szkół z konfiguracji
+	należy korzystać z gotowych indeksów `Szkoła.indeksKlas` i `Szkoła.indeksNauczycieli`.
+
+	Args:
+		wpisy (list[str]): Lista wpisów do dopasowania.
+		listaDoDopasowania (list[str]): Lista referencyjna, do której mają być dopasowane wpisy.
+		cutoff (float, optional): Minimalny próg podobieństwa dla dopasowań przybliżonych (0-1). Domyślnie 0.6.
+
+	Returns:
+		tuple[list[str], dict[str, str], list[str]]:
+			idealneDopasowania: Lista idealnie dopasowanych wpisów.
+			sugestie: Słownik sugestii przybliżonych dopasowań.
+			nieZnaleziono: Lista wpisów, dla których nie znaleziono dopasowania.
+	"""
+
+	return IndeksDopasowań(listaDoDopasowania).dopasuj(wpisy, cutoff)
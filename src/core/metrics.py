@@ -0,0 +1,432 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+from abc import (
+	ABC,
+	abstractmethod
+)
+import bisect
+from contextlib import contextmanager
+import math
+import threading
+import time
+from typing import Iterator
+
+# Domyślne granice przedziałów histogramów czasu (w sekundach)
+graniceCzasu = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+def zabezpieczWartość(wartość: str) -> str:
+	"""
+	Zabezpiecza wartość etykiety (ukośniki, cudzysłowy i znaki nowej linii) zgodnie z formatem tekstowym Prometheusa.
+
+	Args:
+		wartość (str): Wartość etykiety.
+
+	Returns:
+		str: Zabezpieczona wartość etykiety.
+	"""
+
+	return str(wartość).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def sformatujEtykiety(
+	nazwyEtykiet: tuple[str, ...],
+	wartościEtykiet: tuple[str, ...],
+	dodatkowe: str=""
+) -> str:
+	"""
+	Formatuje etykiety metryki w formacie tekstowym Prometheusa, np. `{szkola="01",wynik="ok"}`.
+
+	Args:
+		nazwyEtykiet (tuple[str, ...]): Nazwy etykiet.
+		wartościEtykiet (tuple[str, ...]): Wartości etykiet w tej samej kolejności.
+		dodatkowe (str, optional): Dodatkowa, już sformatowana etykieta (np. `le="0.5"`).
+
+	Returns:
+		str: Etykiety w nawiasach klamrowych lub pusty tekst, jeśli metryka nie ma etykiet.
+	"""
+
+	części = [f'{nazwa}="{zabezpieczWartość(wartość)}"' for nazwa, wartość in zip(nazwyEtykiet, wartościEtykiet)]
+
+	if dodatkowe:
+		części.append(dodatkowe)
+
+	return "{" + ",".join(części) + "}" if części else ""
+
+
+def sformatujLiczbę(wartość: float) -> str:
+	"""
+	Formatuje wartość metryki w formacie tekstowym Prometheusa.
+
+	Args:
+		wartość (float): Wartość metryki.
+
+	Returns:
+		str: Wartość jako tekst (`+Inf` i `-Inf` dla nieskończoności, `NaN` dla wartości nieliczbowej).
+	"""
+
+	if math.isnan(wartość):
+		return "NaN"
+
+	if math.isinf(wartość):
+		return "+Inf" if wartość > 0 else "-Inf"
+
+	return repr(float(wartość)) if not float(wartość).is_integer() else str(int(wartość))
+
+
+class Metryka(ABC):
+	"""
+	Wspólna podstawa metryk: nazwa, opis, nazwy etykiet i blokada chroniąca wartości aktualizowane
+	zarówno z pętli zdarzeń, jak i z wątków roboczych (np. parsowania HTML).
+
+	Attributes:
+		nazwa (str): Nazwa metryki.
+		opis (str): Opis metryki (`# HELP`).
+		etykiety (tuple[str, ...]): Nazwy etykiet.
+		blokada (threading.Lock): Blokada wartości metryki.
+	"""
+
+	typ = "untyped"
+
+	__slots__ = ("nazwa", "opis", "etykiety", "blokada")
+
+	def __init__(
+		self,
+		nazwa: str,
+		opis: str,
+		etykiety: tuple[str, ...]=()
+	) -> None:
+		self.nazwa = nazwa
+		self.opis = opis
+		self.etykiety = tuple(etykiety)
+		self.blokada = threading.Lock()
+
+	def klucz(self, etykiety: dict[str, object]) -> tuple[str, ...]:
+		"""
+		Zamienia etykiety przekazane w wywołaniu na krotkę wartości w kolejności nazw etykiet metryki.
+
+		Args:
+			etykiety (dict[str, object]): Wartości etykiet według nazw.
+
+		Returns:
+			tuple[str, ...]: Wartości etykiet.
+		"""
+
+		return tuple(str(etykiety.get(nazwa, "")) for nazwa in self.etykiety)
+
+	def eksportuj(self) -> list[str]:
+		"""
+		Zwraca linie metryki w formacie tekstowym Prometheusa.
+
+		Returns:
+			list[str]: Linie `# HELP`, `# TYPE` i próbki metryki.
+		"""
+
+		return [f"# HELP {self.nazwa} {self.opis}", f"# TYPE {self.nazwa} {self.typ}", *self.próbki()]
+
+	@abstractmethod
+	def próbki(self) -> list[str]:
+		"""
+		Zwraca próbki metryki (bez linii `# HELP` i `# TYPE`).
+
+		Returns:
+			list[str]: Linie próbek w formacie tekstowym Prometheusa.
+		"""
+
+
+class Licznik(Metryka):
+	"""
+	Licznik rosnący monotonicznie, np. liczba pobrań lub wysłanych wiadomości.
+
+	Attributes:
+		wartości (dict[tuple[str, ...], float]): Wartości licznika według etykiet.
+	"""
+
+	typ = "counter"
+
+	__slots__ = ("wartości",)
+
+	def __init__(self, *args, **kwargs) -> None:
+		super().__init__(*args, **kwargs)
+		self.wartości = {}
+
+	def zwiększ(self, wartość: float=1.0, **etykiety: object) -> None:
+		"""
+		Zwiększa licznik o podaną wartość.
+
+		Args:
+			wartość (float, optional): Przyrost licznika. Domyślnie 1.
+			**etykiety (object): Wartości etykiet.
+		"""
+
+		klucz = self.klucz(etykiety)
+
+		with self.blokada:
+			self.wartości[klucz] = self.wartości.get(klucz, 0.0) + wartość
+
+	def próbki(self) -> list[str]:
+		with self.blokada:
+			wartości = list(self.wartości.items())
+
+		return [f"{self.nazwa}{sformatujEtykiety(self.etykiety, klucz)} {sformatujLiczbę(wartość)}" for klucz, wartość in wartości]
+
+
+class Wskaźnik(Metryka):
+	"""
+	Wartość chwilowa, np. zaplanowany interwał cyklu lub czas trwania ostatniego cyklu.
+
+	Attributes:
+		wartości (dict[tuple[str, ...], float]): Wartości wskaźnika według etykiet.
+	"""
+
+	typ = "gauge"
+
+	__slots__ = ("wartości",)
+
+	def __init__(self, *args, **kwargs) -> None:
+		super().__init__(*args, **kwargs)
+		self.wartości = {}
+
+	def ustaw(self, wartość: float, **etykiety: object) -> None:
+		"""
+		Ustawia wartość wskaźnika.
+
+		Args:
+			wartość (float): Nowa wartość.
+			**etykiety (object): Wartości etykiet.
+		"""
+
+		klucz = self.klucz(etykiety)
+
+		with self.blokada:
+			self.wartości[klucz] = float(wartość)
+
+	def próbki(self) -> list[str]:
+		with self.blokada:
+			wartości = list(self.wartości.items())
+
+		return [f"{self.nazwa}{sformatujEtykiety(self.etykiety, klucz)} {sformatujLiczbę(wartość)}" for klucz, wartość in wartości]
+
+
+class Histogram(Metryka):
+	"""
+	Histogram z ustalonymi granicami przedziałów, np. rozkład czasu pobierania strony.
+
+	Attributes:
+		granice (tuple[float, ...]): Rosnące granice przedziałów (bez `+Inf`).
+		przedziały (dict[tuple[str, ...], list[int]]): Liczba obserwacji w każdym przedziale (nieskumulowana, ostatni przedział to `+Inf`).
+		sumy (dict[tuple[str, ...], float]): Suma obserwacji według etykiet.
+	"""
+
+	typ = "histogram"
+
+	__slots__ = ("granice", "przedziały", "sumy")
+
+	def __init__(
+		self,
+		nazwa: str,
+		opis: str,
+		etykiety: tuple[str, ...]=(),
+		granice: tuple[float, ...]=graniceCzasu
+	) -> None:
+		super().__init__(nazwa, opis, etykiety)
+		self.granice = tuple(sorted(granice))
+		self.przedziały = {}
+		self.sumy = {}
+
+	def obserwuj(self, wartość: float, **etykiety: object) -> None:
+		"""
+		Dodaje obserwację do histogramu.
+
+		Args:
+			wartość (float): Obserwowana wartość.
+			**etykiety (object): Wartości etykiet.
+		"""
+
+		klucz = self.klucz(etykiety)
+		indeks = bisect.bisect_left(self.granice, wartość)
+
+		with self.blokada:
+			przedziały = self.przedziały.get(klucz)
+
+			if przedziały is None:
+				przedziały = self.przedziały[klucz] = [0] * (len(self.granice) + 1)
+
+			przedziały[indeks] += 1
+			self.sumy[klucz] = self.sumy.get(klucz, 0.0) + wartość
+
+	@contextmanager
+	def zmierz(self, **etykiety: object) -> Iterator[None]:
+		"""
+		Mierzy czas wykonania bloku `with` (również zawierającego `await`) i dodaje go do histogramu w sekundach.
+
+		Args:
+			**etykiety (object): Wartości etykiet.
+		"""
+
+		początek = time.perf_counter()
+
+		try:
+			yield
+		finally:
+			self.obserwuj(time.perf_counter() - początek, **etykiety)
+
+	def próbki(self) -> list[str]:
+		with self.blokada:
+			wartości = [(klucz, list(przedziały), self.sumy.get(klucz, 0.0)) for klucz, przedziały in self.przedziały.items()]
+
+		linie = []
+
+		for klucz, przedziały, suma in wartości:
+			skumulowane = 0
+
+			for granica, liczba in zip((*self.granice, math.inf), przedziały):
+				skumulowane += liczba
+				etykietaGranicy = 'le="' + sformatujLiczbę(granica) + '"'
+				linie.append(f"{self.nazwa}_bucket{sformatujEtykiety(self.etykiety, klucz, etykietaGranicy)} {skumulowane}")
+
+			linie.append(f"{self.nazwa}_sum{sformatujEtykiety(self.etykiety, klucz)} {sformatujLiczbę(suma)}")
+			linie.append(f"{self.nazwa}_count{sformatujEtykiety(self.etykiety, klucz)} {skumulowane}")
+
+		return linie
+
+
+class RejestrMetryk():
+	"""
+	Rejestr wszystkich metryk procesu eksportowanych przez punkt końcowy `/metrics`.
+
+	Attributes:
+		metryki (dict[str, Metryka]): Zarejestrowane metryki według nazw.
+	"""
+
+	def __init__(self) -> None:
+		self.metryki = {}
+
+	def zarejestruj(self, metryka: Metryka) -> Metryka:
+		"""
+		Rejestruje metrykę; ponowna rejestracja tej samej nazwy zwraca istniejącą metrykę.
+
+		Args:
+			metryka (Metryka): Metryka do zarejestrowania.
+
+		Returns:
+			Metryka: Zarejestrowana metryka.
+		"""
+
+		return self.metryki.setdefault(metryka.nazwa, metryka)
+
+	def licznik(
+		self,
+		nazwa: str,
+		opis: str,
+		etykiety: tuple[str, ...]=()
+	) -> Licznik:
+		"""
+		Tworzy i rejestruje licznik.
+
+		Args:
+			nazwa (str): Nazwa metryki.
+			opis (str): Opis metryki.
+			etykiety (tuple[str, ...], optional): Nazwy etykiet.
+
+		Returns:
+			Licznik: Zarejestrowany licznik.
+		"""
+
+		return self.zarejestruj(Licznik(nazwa, opis, etykiety))
+
+	def wskaźnik(
+		self,
+		nazwa: str,
+		opis: str,
+		etykiety: tuple[str, ...]=()
+	) -> Wskaźnik:
+		"""
+		Tworzy i rejestruje wskaźnik.
+
+		Args:
+			nazwa (str): Nazwa metryki.
+			opis (str): Opis metryki.
+			etykiety (tuple[str, ...], optional): Nazwy etykiet.
+
+		Returns:
+			Wskaźnik: Zarejestrowany wskaźnik.
+		"""
+
+		return self.zarejestruj(Wskaźnik(nazwa, opis, etykiety))
+
+	def histogram(
+		self,
+		nazwa: str,
+		opis: str,
+		etykiety: tuple[str, ...]=(),
+		granice: tuple[float, ...]=graniceCzasu
+	) -> Histogram:
+		"""
+		Tworzy i rejestruje histogram.
+
+		Args:
+			nazwa (str): Nazwa metryki.
+			opis (str): Opis metryki.
+			etykiety (tuple[str, ...], optional): Nazwy etykiet.
+			granice (tuple[float, ...], optional): Granice przedziałów. Domyślnie granice czasu w sekundach.
+
+		Returns:
+			Histogram: Zarejestrowany histogram.
+		"""
+
+		return self.zarejestruj(Histogram(nazwa, opis, etykiety, granice))
+
+	def eksportuj(self) -> str:
+		"""
+		Zwraca wszystkie metryki w formacie tekstowym Prometheusa (wersja 0.0.4).
+
+		Returns:
+			str: Treść odpowiedzi punktu końcowego `/metrics`.
+		"""
+
+		linie = []
+
+		for metryka in list(self.metryki.values()):
+			linie.extend(metryka.eksportuj())
+
+		return "\n".join(linie) + "\n"
+
+
+# Globalny rejestr metryk procesu
+metryki = RejestrMetryk()
+
+# Pobieranie i przetwarzanie stron szkół
+czasPobierania = metryki.histogram("zastepstwa_pobieranie_sekundy", "Czas pobierania strony z zastępstwami według szkoły i wyniku.", ("szkola", "wynik"))
+pobraneBajty = metryki.licznik("zastepstwa_pobrane_bajty_total", "Liczba bajtów pobranych ze stron z zastępstwami.", ("szkola",))
+czasParsowania = metryki.histogram("zastepstwa_parsowanie_sekundy", "Czas parsowania HTML strony z zastępstwami.", ("szkola",))
+czasWyodrębniania = metryki.histogram("zastepstwa_wyodrebnianie_sekundy", "Czas wyodrębniania i filtrowania zastępstw dla jednego serwera (wyodrębnijDane).")
+sumyKontrolne = metryki.licznik("zastepstwa_sumy_kontrolne_total", "Porównania sum kontrolnych: trafienie oznacza brak zmian, chybienie - zmianę do wysłania.", ("rodzaj", "wynik"))
+
+# Discord
+operacjeDiscord = metryki.licznik("zastepstwa_operacje_discord_total", "Udane operacje na wiadomościach Discorda według operacji i rodzaju wiadomości.", ("operacja", "rodzaj"))
+odpowiedzi429 = metryki.licznik("zastepstwa_odpowiedzi_429_total", "Odpowiedzi HTTP 429 według źródła.", ("zrodlo",))
+oczekiwanieLimitów = metryki.licznik("zastepstwa_oczekiwanie_limitow_sekundy_total", "Łączny czas oczekiwania na zniesienie limitów Discorda (retry_after).")
+oczekiwanieBlokad = metryki.histogram("zastepstwa_blokada_oczekiwanie_sekundy", "Czas oczekiwania na wejście do blokady według rodziny blokad.", ("rodzina",))
+przetrzymanieBlokad = metryki.histogram("zastepstwa_blokada_przetrzymanie_sekundy", "Czas przetrzymania blokady według rodziny blokad.", ("rodzina",))
+kolejkaBlokad = metryki.wskaźnik("zastepstwa_blokada_kolejka", "Liczba zadań oczekujących na blokady według rodziny blokad.", ("rodzina",))
+
+# Magazyn danych i cykl aktualizacji
+czasMagazynu = metryki.histogram("zastepstwa_magazyn_sekundy", "Czas operacji na danych serwerów według rodzaju operacji.", ("operacja",))
+czasCyklu = metryki.histogram("zastepstwa_cykl_sekundy", "Czas trwania cyklu sprawdzania aktualizacji.")
+ostatniCykl = metryki.wskaźnik("zastepstwa_cykl_ostatni_sekundy", "Czas trwania ostatniego cyklu sprawdzania aktualizacji.")
+restartyZadań = metryki.licznik("zastepstwa_restarty_zadan_total", "Ponowne uruchomienia zadań działających w tle przez nadzorcę zadań.", ("zadanie",))
+opóźnieniePętli = metryki.histogram("zastepstwa_petla_opoznienie_sekundy", "Opóźnienie wybudzenia pętli zdarzeń względem zaplanowanego czasu.")
+blokadyPętli = metryki.licznik("zastepstwa_petla_blokady_total", "Blokady pętli zdarzeń powyżej progu według miejsca w kodzie bota lub korutyny.", ("miejsce",))
+interwałCyklu = metryki.wskaźnik("zastepstwa_cykl_interwal_sekundy", "Zaplanowany odstęp pomiędzy cyklami sprawdzania aktualizacji.")
@@ -0,0 +1,151 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import functools
+import re
+import unicodedata
+
+# Wyrażenie regularne scalające ciągi białych znaków w pojedynczą spację
+wzorzecBiałychZnaków = re.compile(r"\s+")
+
+# Pierwszy kod znaku spoza tablicy translacji (początek alfabetu greckiego)
+górnaGranicaTablicy = 0x0370
+
+def zbudujTablicęTranslacji() -> dict[int, str]:
+	"""
+	Buduje tablicę translacji dla znaków spoza ASCII z zakresu Latin-1, Latin Extended-A/B (w tym polskich liter)
+	oraz znaków łączących.
+
+	Każdy znak odwzorowywany jest na wynik dekompozycji NFKD pozbawiony znaków łączących, czyli dokładnie na to,
+	co dla pojedynczego znaku zwracała pierwotna ścieżka `unicodedata`.
+
+	Returns:
+		dict[int, str]: Tablica do użycia w `str.translate`.
+	"""
+
+	tablica = {}
+
+	for kod in range(0x80, górnaGranicaTablicy):
+		znak = chr(kod)
+		wynik = "".join(składowa for składowa in unicodedata.normalize("NFKD", znak) if not unicodedata.combining(składowa))
+
+		if wynik != znak:
+			tablica[kod] = wynik
+
+	return tablica
+
+
+# Tablica translacji znaków spoza ASCII oraz pierwszy znak, którego tablica już nie obejmuje
+tablicaTranslacji = zbudujTablicęTranslacji()
+znakGranicyTablicy = chr(górnaGranicaTablicy)
+
+
+def normalizujTekstBezPamięci(tekst: str) -> str:
+	"""
+	Normalizuje tekst bez korzystania z pamięci podręcznej.
+
+	Teksty ASCII pomijają dekompozycję całkowicie, teksty z zakresu tablicy translacji przetwarzane są jednym
+	wywołaniem `str.translate`, a pozostałe przechodzą pełną ścieżkę NFKD.
+
+	Args:
+		tekst (str): Tekst wejściowy do normalizacji.
+
+	Returns:
+		str: Oczyszczony i znormalizowany tekst.
+	"""
+
+	tekst = tekst.strip()
+
+	if not tekst.isascii():
+		if max(tekst) < znakGranicyTablicy:
+			tekst = tekst.translate(tablicaTranslacji)
+		else:
+			tekst = unicodedata.normalize("NFKD", tekst)
+			tekst = "".join(znak for znak in tekst if not unicodedata.combining(znak))
+
+	tekst = tekst.replace(".", " ")
+	tekst = wzorzecBiałychZnaków.sub(" ", tekst)
+
+	return tekst.lower()
+
+
+# Wersja `normalizujTekstBezPamięci` z ograniczoną pamięcią podręczną LRU
+normalizujZPamięcią = functools.lru_cache(maxsize=16384)(normalizujTekstBezPamięci)
+
+
+def normalizujTekst(tekst: str) -> str:
+	"""
+	Normalizuje tekst w celu ujednolicenia go do porównań i filtracji.
+
+	Wyniki zapamiętywane są w ograniczonej pamięci podręcznej LRU, ponieważ te same nazwy klas i nauczycieli
+	normalizowane są wielokrotnie w każdym wierszu zastępstw.
+
+	Args:
+		tekst (str): Tekst wejściowy do normalizacji.
+
+	Returns:
+		str: Oczyszczony i znormalizowany tekst.
+	"""
+
+	if not tekst or not isinstance(tekst, str):
+		return ""
+
+	return normalizujZPamięcią(tekst)
+
+
+@functools.lru_cache(maxsize=8192)
+def zwróćNazwyKluczy(nazwa: str) -> frozenset[str]:
+	"""
+	Tworzy zestaw kluczy dopasowań dla podanej nazwy.
+
+	Wynik jest niezmienny, ponieważ pochodzi z pamięci podręcznej współdzielonej przez wszystkie wywołania.
+
+	Args:
+		nazwa (str): Tekst nazwy do przetworzenia.
+
+	Returns:
+		frozenset[str]: Zestaw ciągów znaków używanych jako klucze dopasowań.
+	"""
+
+	norma = normalizujTekst(nazwa)
+
+	if not norma:
+		return frozenset()
+
+	części = norma.split()
+	klucze = {norma}
+
+	if części:
+		klucze.add(części[-1])
+
+	if len(części) >= 1:
+		klucze.add(f"{części[0][0]} {części[-1]}")
+		klucze.add(f"{części[0][0]}{części[-1]}")
+
+	return frozenset(klucze)
+
+
+@functools.lru_cache(maxsize=4096)
+def wzorzecCałegoSłowa(tekst: str) -> re.Pattern:
+	"""
+	Zwraca skompilowany wzorzec wyszukujący znormalizowany tekst jako całe słowo.
+
+	Args:
+		tekst (str): Tekst (np. nazwa klasy) do wyszukiwania.
+
+	Returns:
+		re.Pattern: Wzorzec `\\b<tekst>\\b` dla znormalizowanej postaci tekstu.
+	"""
+
+	return re.compile(r"\b" + re.escape(normalizujTekst(tekst)) + r"\b")
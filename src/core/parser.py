@@ -12,7 +12,10 @@
 
 # Standardowe biblioteki
 from collections import defaultdict
+import functools
+import logging
 import re
+import time
 from typing import (
 	Iterable,
 	Optional
@@ -26,12 +29,37 @@ from bs4 import (
 )
 
 # Wewnętrzne importy
-from src.handlers.logging import logiKonsoli
-from src.helpers.helpers import (
+from src.core.metrics import czasWyodrębniania
+from src.core.normalization import (
 	normalizujTekst,
+	wzorzecCałegoSłowa,
 	zwróćNazwyKluczy
 )
 
+# Logger rdzenia, przekazywany do pliku logów bota przez `skonfigurujLogi`
+logiRdzenia = logging.getLogger("zastepstwa.core")
+
+# Wyrażenia regularne kompilowane jednorazowo na potrzeby parsowania komórek tabeli zastępstw
+wzorzecNawiasów = re.compile(r"[\(\)]")
+wzorzecBiałychZnaków = re.compile(r"\s+")
+wzorzecCyfry = re.compile(r"\d")
+
+@functools.lru_cache(maxsize=4096)
+def wzorzecKlasy(klasa: str) -> re.Pattern:
+	"""
+	Zwraca skompilowany wzorzec klasy, dopuszczający dowolne odstępy pomiędzy jej częściami (np. „1 a” i „1a”).
+
+	Args:
+		klasa (str): Nazwa klasy.
+
+	Returns:
+		re.Pattern: Wzorzec do wyszukiwania klasy w znormalizowanym tekście wiersza.
+	"""
+
+	części = normalizujTekst(klasa).split()
+
+	return re.compile(r"\b" + r"\s*".join(map(re.escape, części)) + r"\b")
+
 def wyodrębnijDane(
 	zawartośćStrony: Optional[BeautifulSoup],
 	wybraneKlasy: Optional[list[str]],
@@ -76,7 +104,7 @@ def wyodrębnijDane(
 			for tag in tymczasowy.find_all(True):
 				tag.unwrap()
 		except Exception as e:
-			logiKonsoli.exception(
+			logiRdzenia.exception(
 				f"Wystąpił błąd podczas rozpakowywania tagów. Więcej informacji: {e}"
 			)
 
@@ -240,25 +268,19 @@ def wyodrębnijDane(
 
 		tekst = " ".join(komórka or "" for komórka in komórki[:-1])
 		tekst = normalizujTekst(tekst)
-		tekst = re.sub(r"[\(\)]", " ", tekst)
-		tekst = re.sub(r"\s+", " ", tekst)
-
-		for klasa in wybraneKlasy:
-			normaKlasy = normalizujTekst(klasa)
-			części = normaKlasy.split()
-			wzór = r"\b" + r"\s*".join(map(re.escape, części)) + r"\b"
+		tekst = wzorzecNawiasów.sub(" ", tekst)
+		tekst = wzorzecBiałychZnaków.sub(" ", tekst)
 
-			if re.search(wzór, tekst):
-				return True
-
-		return False
+		return any(wzorzecKlasy(klasa).search(tekst) for klasa in wybraneKlasy)
 
 	if not zawartośćStrony:
-		logiKonsoli.warning(
+		logiRdzenia.warning(
 			"Brak treści pobranej ze strony. Zwracanie pustej zawartości."
 		)
 		return "", []
 
+	początek = time.perf_counter()
+
 	try:
 		informacjeDodatkowe = ""
 		wiersze = zawartośćStrony.find_all("tr")
@@ -323,10 +345,11 @@ def wyodrębnijDane(
 					pełnyTekst = " ".join(komórkiWiersza)
 
 					if listaKlas:
-						znalezionoKlasy = any(re.search(r"\b" + re.escape(normalizujTekst(klasa)) + r"\b", normalizujTekst(pełnyTekst)) for klasa in listaKlas)
+						normaPełnegoTekstu = normalizujTekst(pełnyTekst)
+						znalezionoKlasy = any(wzorzecCałegoSłowa(klasa).search(normaPełnegoTekstu) for klasa in listaKlas)
 						zastępstwoBezKlasy = not znalezionoKlasy
 					else:
-						if not re.search(r"\d", pełnyTekst):
+						if not wzorzecCyfry.search(pełnyTekst):
 							zastępstwoBezKlasy = True
 
 				wierszeWpisówZastępstw = []
@@ -383,7 +406,9 @@ def wyodrębnijDane(
 
 		return informacjeDodatkowe, wpisyZastępstw
 	except Exception as e:
-		logiKonsoli.exception(
+		logiRdzenia.exception(
 			f"Wystąpił błąd podczas przetwarzania HTML. Więcej informacji: {e}"
 		)
-		return "", []
\ No newline at end of file
+		return "", []
+	finally:
+		czasWyodrębniania.obserwuj(time.perf_counter() - początek)
\ No newline at end of file
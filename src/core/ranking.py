@@ -0,0 +1,111 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import bisect
+from typing import (
+	Iterable,
+	Mapping,
+	Optional
+)
+
+# Wewnętrzne importy
+from src.core.normalization import zwróćNazwyKluczy
+
+class RankingNauczycieli():
+	"""
+	Statystyki zastępstw nauczycieli z kolejnością aktualizowaną przy każdym zliczeniu.
+
+	Wpisy przechowywane są na liście posortowanej według (-liczba, nazwa), więc zliczenie zastępstwa przesuwa
+	jeden wpis (wyszukiwanie binarne), a odczyt K najlepszych nauczycieli nie wymaga sortowania całych statystyk.
+	Klucze dopasowań każdego nauczyciela wyliczane są raz, przy pierwszym odczycie z filtrem nauczycieli.
+
+	Attributes:
+		liczniki (dict[str, int]): Liczba zastępstw według nauczyciela.
+		kolejność (list[tuple[int, str]]): Wpisy (-liczba, nazwa) posortowane rosnąco.
+		klucze (dict[str, frozenset[str]]): Klucze dopasowań według nauczyciela.
+	"""
+
+	__slots__ = ("liczniki", "kolejność", "klucze")
+
+	def __init__(self, statystyki: Optional[Mapping[str, int]]=None) -> None:
+		self.liczniki = {}
+		self.klucze = {}
+
+		for nauczyciel, liczba in (statystyki or {}).items():
+			try:
+				self.liczniki[str(nauczyciel)] = int(liczba)
+			except (TypeError, ValueError):
+				continue
+
+		self.kolejność = sorted((-liczba, nauczyciel) for nauczyciel, liczba in self.liczniki.items())
+
+	def dodaj(
+		self,
+		nauczyciel: str,
+		przyrost: int=1
+	) -> None:
+		"""
+		Zlicza zastępstwa nauczyciela i przesuwa jego wpis na właściwe miejsce w kolejności.
+
+		Args:
+			nauczyciel (str): Nazwa nauczyciela.
+			przyrost (int, optional): Liczba zliczanych zastępstw. Domyślnie 1.
+		"""
+
+		poprzednia = self.liczniki.get(nauczyciel)
+
+		if poprzednia is not None:
+			del self.kolejność[bisect.bisect_left(self.kolejność, (-poprzednia, nauczyciel))]
+
+		liczba = (poprzednia or 0) + przyrost
+		self.liczniki[nauczyciel] = liczba
+		bisect.insort(self.kolejność, (-liczba, nauczyciel))
+
+	def najlepsi(
+		self,
+		limit: int,
+		wykluczeni: Iterable[str]=frozenset()
+	) -> list[tuple[str, int]]:
+		"""
+		Zwraca nauczycieli z największą liczbą zastępstw, pomijając tych, których klucze dopasowań pokrywają się z wykluczonymi.
+
+		Args:
+			limit (int): Maksymalna liczba zwracanych nauczycieli.
+			wykluczeni (Iterable[str], optional): Klucze dopasowań nauczycieli ustawionych w filtrze serwera.
+
+		Returns:
+			list[tuple[str, int]]: Pary (nauczyciel, liczba zastępstw) w kolejności malejącej.
+		"""
+
+		wynik = []
+
+		if limit <= 0:
+			return wynik
+
+		for ujemnaLiczba, nauczyciel in self.kolejność:
+			if wykluczeni:
+				klucze = self.klucze.get(nauczyciel)
+
+				if klucze is None:
+					klucze = self.klucze[nauczyciel] = zwróćNazwyKluczy(nauczyciel)
+
+				if not klucze.isdisjoint(wykluczeni):
+					continue
+
+			wynik.append((nauczyciel, -ujemnaLiczba))
+
+			if len(wynik) >= limit:
+				break
+
+		return wynik
@@ -0,0 +1,176 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+from pathlib import Path
+import threading
+import time
+from typing import (
+	Any,
+	Iterator,
+	Optional
+)
+
+class Ślad():
+	"""
+	Ślad jednego cyklu aktualizacji: drzewo przedziałów (spanów) zapisywane w formacie Chrome Trace Event,
+	który otwierają m.in. Perfetto (ui.perfetto.dev) i `chrome://tracing`. Każde zadanie asyncio i każdy wątek
+	otrzymuje własny wiersz (`tid`), dzięki czemu przedziały równoległych serwerów się nie nakładają.
+
+	Attributes:
+		nazwa (str): Nazwa przedziału głównego (np. `cykl`).
+		atrybuty (dict[str, Any]): Atrybuty przedziału głównego.
+		początek (int): Czas rozpoczęcia (`time.perf_counter_ns()`).
+		koniec (Optional[int]): Czas zakończenia (`time.perf_counter_ns()`).
+		początekŚcienny (float): Czas rozpoczęcia jako znacznik czasu UNIX.
+		zdarzenia (list[dict[str, Any]]): Zakończone przedziały w formacie Chrome Trace Event.
+		wiersze (dict[object, tuple[int, str]]): Numery i nazwy wierszy według zadań lub wątków.
+	"""
+
+	__slots__ = ("nazwa", "atrybuty", "początek", "koniec", "początekŚcienny", "zdarzenia", "wiersze")
+
+	def __init__(
+		self,
+		nazwa: str,
+		**atrybuty: Any
+	) -> None:
+		self.nazwa = nazwa
+		self.atrybuty = atrybuty
+		self.początek = time.perf_counter_ns()
+		self.koniec = None
+		self.początekŚcienny = time.time()
+		self.zdarzenia = []
+		self.wiersze = {}
+
+	def wiersz(self) -> int:
+		"""
+		Zwraca numer wiersza bieżącego zadania asyncio (lub wątku, jeśli kod nie działa w pętli zdarzeń).
+
+		Returns:
+			int: Numer wiersza (`tid`).
+		"""
+
+		try:
+			zadanie = asyncio.current_task()
+		except RuntimeError:
+			zadanie = None
+
+		klucz = zadanie if zadanie is not None else threading.get_ident()
+		wpis = self.wiersze.get(klucz)
+
+		if wpis is None:
+			wpis = (len(self.wiersze) + 1, zadanie.get_name() if zadanie is not None else threading.current_thread().name)
+			self.wiersze[klucz] = wpis
+
+		return wpis[0]
+
+	def dodaj(
+		self,
+		nazwa: str,
+		początek: int,
+		koniec: int,
+		atrybuty: dict[str, Any]
+	) -> None:
+		"""
+		Dodaje zakończony przedział do śladu.
+
+		Args:
+			nazwa (str): Nazwa przedziału.
+			początek (int): Czas rozpoczęcia (`time.perf_counter_ns()`).
+			koniec (int): Czas zakończenia (`time.perf_counter_ns()`).
+			atrybuty (dict[str, Any]): Atrybuty przedziału (np. ID serwera, liczba wierszy, bajty).
+		"""
+
+		self.zdarzenia.append({
+			"name": nazwa,
+			"ph": "X",
+			"ts": (początek - self.początek) / 1000,
+			"dur": (koniec - początek) / 1000,
+			"pid": 1,
+			"tid": self.wiersz(),
+			"args": atrybuty
+		})
+
+	def zakończ(self) -> float:
+		"""
+		Kończy ślad.
+
+		Returns:
+			float: Czas trwania śladu w sekundach.
+		"""
+
+		self.koniec = time.perf_counter_ns()
+		return (self.koniec - self.początek) / 1e9
+
+	def zapisz(self, ścieżka: Path) -> None:
+		"""
+		Zapisuje ślad w formacie Chrome Trace Event (JSON). Wywoływana poza pętlą zdarzeń.
+
+		Args:
+			ścieżka (Path): Ścieżka pliku docelowego.
+		"""
+
+		koniec = self.koniec if self.koniec is not None else time.perf_counter_ns()
+		zdarzenia = [
+			{"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "zastepstwa"}},
+			{"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": self.nazwa}},
+			*({"name": "thread_name", "ph": "M", "pid": 1, "tid": numer, "args": {"name": nazwa}} for numer, nazwa in self.wiersze.values()),
+			{"name": self.nazwa, "ph": "X", "ts": 0, "dur": (koniec - self.początek) / 1000, "pid": 1, "tid": 0, "args": self.atrybuty},
+			*self.zdarzenia
+		]
+
+		ścieżka.parent.mkdir(parents=True, exist_ok=True)
+		ścieżka.write_text(
+			json.dumps({"traceEvents": zdarzenia, "displayTimeUnit": "ms", "otherData": {"start": self.początekŚcienny}}, ensure_ascii=False, default=str),
+			encoding="utf-8"
+		)
+
+
+# Ślad bieżącego cyklu, dziedziczony przez zadania tworzone w trakcie cyklu (np. przez `asyncio.gather`)
+aktywnyŚlad: ContextVar[Optional[Ślad]] = ContextVar("aktywnyŚlad", default=None)
+
+@contextmanager
+def śledź(
+	nazwa: str,
+	**atrybuty: Any
+) -> Iterator[dict[str, Any]]:
+	"""
+	Mierzy przedział śladu bieżącego cyklu. Jeśli cykl nie jest śledzony, nie robi nic poza zwróceniem atrybutów.
+
+	Args:
+		nazwa (str): Nazwa przedziału.
+		**atrybuty (Any): Początkowe atrybuty przedziału.
+
+	Yields:
+		dict[str, Any]: Atrybuty przedziału, które można uzupełnić w trakcie jego trwania.
+	"""
+
+	ślad = aktywnyŚlad.get()
+
+	if ślad is None:
+		yield atrybuty
+		return
+
+	początek = time.perf_counter_ns()
+
+	try:
+		yield atrybuty
+	except BaseException as e:
+		atrybuty["blad"] = type(e).__name__
+		raise
+	finally:
+		ślad.dodaj(nazwa, początek, time.perf_counter_ns(), atrybuty)
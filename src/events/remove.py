@@ -10,18 +10,18 @@
 #                                                █▄▄
 #
 
-# Standardowe biblioteki
-import asyncio
-import copy
+# Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
 from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja,
-	zapiszKonfiguracje
+	zapisywaczKonfiguracji,
+	zatwierdźSerwer
 )
-from src.handlers.data import folderDanych
+from src.handlers.data import usuńDaneSerwera
+from src.handlers.history import dziennikZastępstw
 from src.handlers.logging import logiKonsoli
 
 def ustaw(bot: discord.Client) -> None:
@@ -45,17 +45,16 @@ def ustaw(bot: discord.Client) -> None:
 
 	async def usuńSerwerZKonfiguracji(identyfikatorSerwera: int) -> None:
 		"""
-		Usuwa konfigurację serwera Discord z pliku konfiguracyjnego oraz jego pliki zasobów.
+		Usuwa konfigurację serwera Discord z pliku konfiguracyjnego, jego pliki zasobów oraz jego wpisy w dzienniku zastępstw.
 
 		Args:
 			identyfikatorSerwera (int): ID serwera Discord, który ma zostać usunięty z konfiguracji.
 		"""
 
 		async with blokadaKonfiguracji:
-			serwery = konfiguracja.setdefault("serwery", {})
-
-			if str(identyfikatorSerwera) in serwery:
-				del serwery[str(identyfikatorSerwera)]
+			if str(identyfikatorSerwera) in konfiguracja.get("serwery", {}):
+				zatwierdźSerwer(str(identyfikatorSerwera), None)
+				zapisywaczKonfiguracji.zaplanuj("serwery")
 				logiKonsoli.info(
 					f"Usunięto serwer o ID {identyfikatorSerwera} z pliku konfiguracyjnego."
 				)
@@ -64,19 +63,5 @@ def ustaw(bot: discord.Client) -> None:
 					f"Nie znaleziono konfiguracji serwera o ID {identyfikatorSerwera}. Dane nie zostały usunięte."
 				)
 
-			snapshot = copy.deepcopy(konfiguracja)
-			await zapiszKonfiguracje(snapshot)
-
-		for rozszerzenie in (".json", ".json.old", ".json.tmp", ".json.bad"):
-			ścieżkaZasobów = folderDanych / f"{identyfikatorSerwera}{rozszerzenie}"
-
-			if ścieżkaZasobów.exists():
-				try:
-					await asyncio.to_thread(ścieżkaZasobów.unlink)
-					logiKonsoli.info(
-						f"Usunięto plik zasobów ({ścieżkaZasobów})."
-					)
-				except Exception as e:
-					logiKonsoli.exception(
-						f"Wystąpił błąd podczas usuwania pliku zasobów ({ścieżkaZasobów}). Więcej informacji: {e}"
-					)
\ No newline at end of file
+		await usuńDaneSerwera(identyfikatorSerwera)
+		await dziennikZastępstw.usuńSerwer(identyfikatorSerwera)
\ No newline at end of file
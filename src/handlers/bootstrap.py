@@ -0,0 +1,87 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import time
+from typing import Any
+
+# Wewnętrzne importy
+from src.handlers.configuration import zainicjujKonfiguracje
+from src.handlers.data import folderDanych
+from src.handlers.logging import (
+	skonfigurujLogi,
+	zastosujUstawieniaLogów
+)
+
+# Moment rozpoczęcia uruchamiania aplikacji, od którego liczone są czasy faz
+początekUruchamiania = time.perf_counter()
+
+# Czasy zakończenia kolejnych faz uruchamiania w sekundach od rozpoczęcia
+czasyFaz = {}
+
+def oznaczFazę(nazwa: str) -> bool:
+	"""
+	Zapisuje czas zakończenia fazy uruchamiania. Każda faza zapisywana jest tylko raz.
+
+	Args:
+		nazwa (str): Nazwa fazy.
+
+	Returns:
+		bool: True, jeśli faza została zapisana po raz pierwszy, False w przeciwnym razie.
+	"""
+
+	if nazwa in czasyFaz:
+		return False
+
+	czasyFaz[nazwa] = time.perf_counter() - początekUruchamiania
+	return True
+
+
+def podsumujFazy() -> str:
+	"""
+	Tworzy czytelne podsumowanie czasów faz uruchamiania wraz z czasem trwania każdej z nich.
+
+	Returns:
+		str: Podsumowanie w postaci `faza: czas od startu (+czas fazy)`.
+	"""
+
+	poprzedni = 0.0
+	części = []
+
+	for nazwa, czas in czasyFaz.items():
+		części.append(f"{nazwa}: {czas * 1000:.0f} ms (+{(czas - poprzedni) * 1000:.0f} ms)")
+		poprzedni = czas
+
+	return ", ".join(części)
+
+
+def przygotujAplikację() -> dict[str, Any]:
+	"""
+	Jednorazowo przygotowuje aplikację do uruchomienia: konfiguruje logi, wczytuje plik konfiguracyjny i tworzy folder danych.
+	Żaden z tych kroków nie jest wykonywany podczas samego importowania modułów.
+
+	Returns:
+		dict[str, Any]: Globalny słownik konfiguracji.
+	"""
+
+	skonfigurujLogi()
+	oznaczFazę("logi")
+
+	konfiguracja = zainicjujKonfiguracje()
+	zastosujUstawieniaLogów(konfiguracja)
+	oznaczFazę("konfiguracja")
+
+	folderDanych.mkdir(exist_ok=True)
+	oznaczFazę("dane")
+
+	return konfiguracja
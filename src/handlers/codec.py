@@ -0,0 +1,135 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+# Zewnętrzne biblioteki (opcjonalne)
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
+
+if orjson is not None:
+	nazwaKodeka = "orjson"
+	BłędyDekodowania = (json.JSONDecodeError, UnicodeDecodeError)
+elif msgspec is not None:
+	nazwaKodeka = "msgspec"
+	koderMsgspec = msgspec.json.Encoder()
+	dekoderMsgspec = msgspec.json.Decoder()
+	BłędyDekodowania = (json.JSONDecodeError, UnicodeDecodeError, msgspec.DecodeError)
+else:
+	nazwaKodeka = "json"
+	BłędyDekodowania = (json.JSONDecodeError, UnicodeDecodeError)
+
+def zakoduj(
+	dane: Any,
+	czytelnie: bool=True
+) -> bytes:
+	"""
+	Koduje dane do formatu `JSON` w kodowaniu UTF-8.
+
+	Zapis czytelny zachowuje dotychczasowy format plików (wcięcia o szerokości 4 spacji), a zapis zwarty
+	korzysta z najszybszej dostępnej biblioteki (orjson, msgspec lub standardowy moduł json).
+
+	Args:
+		dane (Any): Dane do zakodowania.
+		czytelnie (bool, optional): Czy dane mają zostać zapisane z wcięciami. Domyślnie True.
+
+	Returns:
+		bytes: Zakodowane dane.
+	"""
+
+	if czytelnie:
+		return json.dumps(dane, ensure_ascii=False, indent=4).encode("utf-8")
+
+	if orjson is not None:
+		return orjson.dumps(dane, option=orjson.OPT_NON_STR_KEYS)
+
+	if msgspec is not None:
+		return koderMsgspec.encode(dane)
+
+	return json.dumps(dane, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def odkoduj(zawartość: bytes | str) -> Any:
+	"""
+	Dekoduje dane w formacie `JSON`, korzystając z najszybszej dostępnej biblioteki.
+
+	Args:
+		zawartość (bytes | str): Dane do zdekodowania.
+
+	Returns:
+		Any: Zdekodowane dane.
+
+	Raises:
+		json.JSONDecodeError | UnicodeDecodeError: Gdy dane nie są poprawnym dokumentem `JSON` (patrz `BłędyDekodowania`).
+	"""
+
+	if orjson is not None:
+		return orjson.loads(zawartość)
+
+	if msgspec is not None:
+		return dekoderMsgspec.decode(zawartość.encode("utf-8") if isinstance(zawartość, str) else zawartość)
+
+	if isinstance(zawartość, bytes):
+		zawartość = zawartość.decode("utf-8")
+
+	return json.loads(zawartość)
+
+
+def wczytajPlik(ścieżka: Path) -> Any:
+	"""
+	Wczytuje i dekoduje plik w formacie `JSON`.
+
+	Args:
+		ścieżka (Path): Ścieżka do pliku.
+
+	Returns:
+		Any: Zawartość pliku.
+	"""
+
+	return odkoduj(ścieżka.read_bytes())
+
+
+def eksportujCzytelnie(
+	źródło: Path,
+	cel: Path | None=None
+) -> Path:
+	"""
+	Eksportuje plik `JSON` (również zapisany w formie zwartej) do czytelnej postaci z wcięciami.
+
+	Args:
+		źródło (Path): Ścieżka do eksportowanego pliku.
+		cel (Path | None, optional): Ścieżka pliku wynikowego. Domyślnie plik z rozszerzeniem `.readable.json` obok źródła.
+
+	Returns:
+		Path: Ścieżka zapisanego pliku.
+	"""
+
+	cel = cel or źródło.with_name(f"{źródło.stem}.readable.json")
+	cel.write_bytes(zakoduj(wczytajPlik(źródło), czytelnie=True))
+	return cel
+
+
+if __name__ == "__main__":
+	# Eksport na żądanie: python -m src.handlers.codec config.json data/123.json
+	for argument in sys.argv[1:]:
+		print(eksportujCzytelnie(Path(argument)))
@@ -13,23 +13,48 @@
 # Standardowe biblioteki
 import asyncio
 import contextlib
-import json
 import os
 from pathlib import Path
-from typing import Any
+from typing import (
+	Any,
+	Iterable,
+	Optional
+)
 
 # Wewnętrzne importy
+from src.classes.model import (
+	BłądKonfiguracji,
+	KonfiguracjaSerwera,
+	Szkoła
+)
+from src.classes.snapshot import (
+	MigawkaKonfiguracji,
+	odmroź,
+	podmieńSerwer,
+	podmieńSzkoły,
+	zbudujMigawkę
+)
+from src.core.locks import BlokadaZPomiarem
+from src.handlers.codec import (
+	BłędyDekodowania,
+	odkoduj,
+	zakoduj
+)
 from src.handlers.logging import logiKonsoli
 
 # Globalna blokada modyfikacji pliku konfiguracyjnego
-blokadaKonfiguracji = asyncio.Lock()
+blokadaKonfiguracji = BlokadaZPomiarem("konfiguracja")
 
 # Ścieżka pliku konfiguracyjnego
 ścieżkaKonfiguracji = Path("config.json")
 
+# Ścieżka pliku z konfiguracją serwerów, zapisywaną niezależnie od pliku konfiguracyjnego
+ścieżkaSerwerów = Path("servers.json")
+
 def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 	"""
-	Wczytuje plik konfiguracyjny zapisany w formacie `JSON`.
+	Wczytuje plik konfiguracyjny zapisany w formacie `JSON`. Plik jest nadpisywany wyłącznie wtedy, gdy jego zawartość
+	uległa zmianie (uzupełnienie brakujących kluczy, aktualizacja wersji lub przeniesienie serwerów do osobnego pliku).
 
 	Args:
 		path (Path): Ścieżka do pliku konfiguracyjnego. Domyślnie `config.json`.
@@ -69,6 +94,25 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 		"wersja": "2.3.3.0-stable",
 		"token": "",
 		"koniec-roku-szkolnego": "2026-06-26",
+		"rownolegle-raporty-koncowe": 5,
+		"okno-raportow-koncowych": 1800,
+		"magazyn-danych": "json",
+		"interwal-zapisu-danych": 60,
+		"kompaktowy-zapis": False,
+		"interwal-przeladowania-konfiguracji": 5,
+		"godzina-wysylania-numerkow": "07:00",
+		"dni-wysylania-numerkow": [1, 2, 3, 4, 5],
+		"logi-json": False,
+		"okno-powtorzen-logow": 300,
+		"port-metryk": 0,
+		"adres-metryk": "127.0.0.1",
+		"maksymalny-wiek-cyklu": 1200,
+		"profilowane-cykle": 3,
+		"profilowane-polecenia": 10,
+		"prog-opoznienia-petli": 0.25,
+		"probkowanie-stosu-petli": True,
+		"probkowanie-sladow": 0.0,
+		"prog-wolnego-cyklu": 0,
 		"serwery": {},
 		"szkoły": {
 			"01": {
@@ -100,74 +144,346 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 	}
 
 	if not path.exists():
-		path.write_text(json.dumps(domyślne, ensure_ascii=False, indent=4), encoding="utf-8")
+		zapiszPlik(path, bezSerwerów(domyślne))
 		logiKonsoli.warning(
 			"Utworzono plik konfiguracyjny z domyślną zawartością. Uzupełnij brakujące i skoryguj domyślnie uzupełnione dane."
 		)
 		return domyślne
 
 	try:
-		dane = json.loads(path.read_text(encoding="utf-8"))
+		dane = odkoduj(path.read_bytes())
+		zmieniono = any(klucz not in dane for klucz in domyślne if klucz != "serwery")
 
 		for klucz, wartość in domyślne.items():
 			dane.setdefault(klucz, wartość)
 
 		dane = uporządkuj(dane, domyślne)
-		path.write_text(json.dumps(dane, ensure_ascii=False, indent=4), encoding="utf-8")
+		czytelnie = not dane.get("kompaktowy-zapis", False)
 
 		if dane.get("wersja", "") != domyślne["wersja"]:
 			logiKonsoli.warning(
 				f"Aktualizuję wersję oprogramowania z {dane.get('wersja', 'Brak danych')} na {domyślne['wersja']}."
 			)
 			dane["wersja"] = domyślne["wersja"]
-			path.write_text(json.dumps(dane, ensure_ascii=False, indent=4), encoding="utf-8")
+			zmieniono = True
+
+		ścieżkaSerwerówKonfiguracji = path.with_name(ścieżkaSerwerów.name)
+
+		if ścieżkaSerwerówKonfiguracji.exists():
+			dane["serwery"] = odkoduj(ścieżkaSerwerówKonfiguracji.read_bytes())
+		elif dane.get("serwery"):
+			zapiszPlik(ścieżkaSerwerówKonfiguracji, dane["serwery"], czytelnie)
+			zmieniono = True
+			logiKonsoli.info(
+				f"Przeniesiono konfigurację {len(dane['serwery'])} serwerów do pliku {ścieżkaSerwerówKonfiguracji}."
+			)
+
+		if zmieniono:
+			zapiszPlik(path, bezSerwerów(dane), czytelnie)
 
 		return dane
-	except json.JSONDecodeError as e:
+	except BłędyDekodowania as e:
 		logiKonsoli.exception(
 			f"Wystąpił błąd podczas wczytywania pliku konfiguracyjnego. Więcej informacji: {e}"
 		)
 		raise
 
-konfiguracja = wczytajKonfiguracje()
 
-async def zapiszKonfiguracje(konfiguracja: dict[str, Any]) -> None:
+def bezSerwerów(konfiguracja: dict[str, Any]) -> dict[str, Any]:
 	"""
-	Zapisuje słownik konfiguracji do pliku konfiguracyjnego w formacie `JSON`.
+	Zwraca płytką kopię konfiguracji bez sekcji `serwery`, która zapisywana jest w osobnym pliku.
 
 	Args:
-		konfiguracja (dict[str, Any]): Słownik konfiguracji do zapisania.
-	"""
+		konfiguracja (dict[str, Any]): Słownik konfiguracji.
 
-	def zapisz() -> None:
-		"""
-		Zapisuje słownik konfiguracji do tymczasowego pliku konfiguracyjnego w formacie `JSON`,
-		a następnie nadpisuje istniejący plik konfiguracji, dodatkowo tworząc kopię `.old`.
-		"""
+	Returns:
+		dict[str, Any]: Konfiguracja bez sekcji `serwery`.
+	"""
 
-		tymczasowy = ścieżkaKonfiguracji.with_suffix(".json.tmp")
+	return {klucz: wartość for klucz, wartość in konfiguracja.items() if klucz != "serwery"}
 
-		with open(tymczasowy, "w", encoding="utf-8") as plik:
-			json.dump(konfiguracja, plik, ensure_ascii=False, indent=4)
 
-		try:
-			if ścieżkaKonfiguracji.exists():
-				kopia = ścieżkaKonfiguracji.with_suffix(".json.old")
+def zapiszPlik(
+	ścieżka: Path,
+	dane: Any,
+	czytelnie: bool=True
+) -> None:
+	"""
+	Zapisuje dane do tymczasowego pliku w formacie `JSON`, a następnie nadpisuje istniejący plik, dodatkowo tworząc kopię `.old`.
 
-				with contextlib.suppress(Exception):
-					os.remove(str(kopia))
+	Args:
+		ścieżka (Path): Ścieżka do zapisywanego pliku.
+		dane (Any): Dane do zapisania.
+		czytelnie (bool, optional): Czy dane mają zostać zapisane z wcięciami. Domyślnie True.
+	"""
 
-				os.replace(str(ścieżkaKonfiguracji), str(kopia))
-		except Exception as e:
-			logiKonsoli.exception(
-				f"Wystąpił błąd podczas zapisywania kopii pliku konfiguracyjnego z rozszerzeniem .old dla {ścieżkaKonfiguracji}. Więcej informacji: {e}"
-			)
+	tymczasowy = ścieżka.with_suffix(".json.tmp")
 
-		os.replace(str(tymczasowy), str(ścieżkaKonfiguracji))
+	with open(tymczasowy, "wb") as plik:
+		plik.write(zakoduj(dane, czytelnie))
 
 	try:
-		await asyncio.to_thread(zapisz)
+		if ścieżka.exists():
+			kopia = ścieżka.with_suffix(".json.old")
+
+			with contextlib.suppress(Exception):
+				os.remove(str(kopia))
+
+			os.replace(str(ścieżka), str(kopia))
 	except Exception as e:
 		logiKonsoli.exception(
-			f"Wystąpił błąd podczas zapisywania pliku konfiguracyjnego. Więcej informacji: {e}"
-		)
\ No newline at end of file
+			f"Wystąpił błąd podczas zapisywania kopii pliku z rozszerzeniem .old dla {ścieżka}. Więcej informacji: {e}"
+		)
+
+	os.replace(str(tymczasowy), str(ścieżka))
+
+# Globalny słownik konfiguracji, uzupełniany w miejscu przez `zainicjujKonfiguracje`
+konfiguracja = {}
+
+# Aktualna migawka konfiguracji, podmieniana w całości przez zapisujących
+migawka = zbudujMigawkę(konfiguracja)
+
+def zainicjujKonfiguracje(path: Path=ścieżkaKonfiguracji) -> dict[str, Any]:
+	"""
+	Jednorazowo wczytuje plik konfiguracyjny, uzupełnia w miejscu globalny słownik `konfiguracja` i publikuje pierwszą migawkę.
+	Kolejne wywołania zwracają już wczytaną konfigurację.
+
+	Args:
+		path (Path): Ścieżka do pliku konfiguracyjnego. Domyślnie `config.json`.
+
+	Returns:
+		dict[str, Any]: Globalny słownik konfiguracji.
+
+	Raises:
+		BłądKonfiguracji: Jeśli którykolwiek wpis szkoły albo sekcja `szkoły` lub `serwery` jest niepoprawna.
+	"""
+
+	global migawka
+
+	if konfiguracja:
+		return konfiguracja
+
+	dane = wczytajKonfiguracje(path)
+
+	try:
+		nowaMigawka = zbudujMigawkę(dane)
+	except BłądKonfiguracji as e:
+		logiKonsoli.exception(
+			f"Wystąpił błąd podczas weryfikacji pliku konfiguracyjnego. Popraw wskazany wpis i uruchom bota ponownie. Więcej informacji: {e}"
+		)
+		raise
+
+	konfiguracja.update(dane)
+	migawka = nowaMigawka
+	return konfiguracja
+
+
+def pobierzMigawkę() -> MigawkaKonfiguracji:
+	"""
+	Zwraca aktualną, niemodyfikowalną migawkę konfiguracji. Nie wymaga blokady konfiguracji.
+
+	Returns:
+		MigawkaKonfiguracji: Aktualna migawka konfiguracji.
+	"""
+
+	return migawka
+
+
+def opublikujMigawkę(serwery: Optional[Iterable[str]]=None) -> MigawkaKonfiguracji:
+	"""
+	Buduje i atomowo podmienia migawkę konfiguracji. Wywoływana pod blokadą konfiguracji, po zmianie słownika `konfiguracja`.
+
+	Args:
+		serwery (Optional[Iterable[str]]): ID zmienionych serwerów. Domyślnie przebudowywana jest cała migawka.
+
+	Returns:
+		MigawkaKonfiguracji: Nowo opublikowana migawka.
+	"""
+
+	global migawka
+
+	migawka = zbudujMigawkę(konfiguracja, migawka, serwery)
+	return migawka
+
+
+def zatwierdźSerwer(
+	identyfikatorSerwera: str,
+	daneSerwera: Optional[dict[str, Any]]
+) -> MigawkaKonfiguracji:
+	"""
+	Weryfikuje nowy wpis serwera, a dopiero po pomyślnej weryfikacji zapisuje go w słowniku `konfiguracja` i publikuje migawkę.
+	Niepoprawny wpis nie zmienia ani słownika, ani migawki. Wywoływana pod blokadą konfiguracji.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		daneSerwera (Optional[dict[str, Any]]): Nowy wpis serwera lub None, jeśli serwer ma zostać usunięty.
+
+	Returns:
+		MigawkaKonfiguracji: Nowo opublikowana migawka.
+
+	Raises:
+		BłądKonfiguracji: Jeśli nowy wpis serwera jest niepoprawny.
+	"""
+
+	global migawka
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	konfiguracjaSerwera = KonfiguracjaSerwera.zDanych(identyfikatorSerwera, daneSerwera) if daneSerwera is not None else None
+	serwery = konfiguracja.setdefault("serwery", {})
+
+	if daneSerwera is None:
+		serwery.pop(identyfikatorSerwera, None)
+	else:
+		serwery[identyfikatorSerwera] = daneSerwera
+
+	migawka = podmieńSerwer(migawka, identyfikatorSerwera, konfiguracjaSerwera)
+	return migawka
+
+
+async def przeładujSzkoły(ścieżka: Path=ścieżkaKonfiguracji) -> set[str]:
+	"""
+	Wczytuje ponownie sekcję `szkoły` z pliku konfiguracyjnego i podmienia ją w działającym bocie.
+	Modele budowane są wyłącznie dla szkół, których wpis uległ zmianie; pozostałe są współdzielone z aktualną migawką.
+	Zmiany są stosowane dopiero po pomyślnej weryfikacji wszystkich zmienionych wpisów.
+
+	Args:
+		ścieżka (Path): Ścieżka do pliku konfiguracyjnego. Domyślnie `config.json`.
+
+	Returns:
+		set[str]: ID szkół dodanych, zmienionych lub usuniętych.
+
+	Raises:
+		BłądKonfiguracji: Jeśli którykolwiek zmieniony wpis szkoły jest niepoprawny.
+	"""
+
+	global migawka
+
+	dane = odkoduj(await asyncio.to_thread(ścieżka.read_bytes))
+	noweSzkoły = dane.get("szkoły", {}) if isinstance(dane, dict) else None
+
+	if not isinstance(noweSzkoły, dict):
+		raise BłądKonfiguracji("Sekcja „szkoły” musi być słownikiem.")
+
+	async with blokadaKonfiguracji:
+		aktualneSzkoły = konfiguracja.get("szkoły", {})
+		zmienione = {
+			identyfikatorSzkoły for identyfikatorSzkoły in aktualneSzkoły.keys() | noweSzkoły.keys()
+			if aktualneSzkoły.get(identyfikatorSzkoły) != noweSzkoły.get(identyfikatorSzkoły)
+		}
+
+		if not zmienione:
+			return set()
+
+		modele = {
+			identyfikatorSzkoły: Szkoła.zDanych(identyfikatorSzkoły, daneSzkoły) if identyfikatorSzkoły in zmienione else migawka.szkoły[identyfikatorSzkoły]
+			for identyfikatorSzkoły, daneSzkoły in noweSzkoły.items()
+		}
+
+		konfiguracja["szkoły"] = noweSzkoły
+		migawka = podmieńSzkoły(migawka, modele, noweSzkoły)
+
+	return zmienione
+
+
+def znacznikPliku(ścieżka: Path) -> Optional[tuple[int, int]]:
+	"""
+	Zwraca znacznik modyfikacji pliku (czas modyfikacji w nanosekundach i rozmiar) lub None, jeśli plik nie istnieje.
+
+	Args:
+		ścieżka (Path): Ścieżka do pliku.
+
+	Returns:
+		Optional[tuple[int, int]]: Znacznik modyfikacji pliku.
+	"""
+
+	try:
+		stan = os.stat(ścieżka)
+	except OSError:
+		return None
+
+	return stan.st_mtime_ns, stan.st_size
+
+
+
+class ZapisywaczKonfiguracji():
+	"""
+	Zapisuje konfigurację z opóźnieniem, łącząc zmiany wprowadzone w krótkim oknie czasowym w jeden zapis.
+
+	Konfiguracja podzielona jest na dwie sekcje zapisywane niezależnie: `konfiguracja` (plik `config.json` bez serwerów)
+	oraz `serwery` (plik `servers.json`), dzięki czemu zmiana ustawień jednego serwera nie przepisuje list klas i nauczycieli szkół.
+	Dane zapisywane są z niemodyfikowalnej migawki konfiguracji, więc zapis nie wymaga blokady konfiguracji,
+	a serializacja i zapis odbywają się w osobnym wątku. Nieudany zapis jest ponawiany po upływie kolejnego okna czasowego.
+
+	Attributes:
+		okno (float): Czas w sekundach, przez który zbierane są zmiany przed zapisem.
+		sekcje (set[str]): Sekcje oczekujące na zapis.
+		znacznikiZapisu (dict[Path, tuple[int, int]]): Znaczniki modyfikacji plików zapisanych przez bota, pomijane przy przeładowaniu.
+	"""
+
+	def __init__(self, okno: float=0.5) -> None:
+		self.okno = okno
+		self.sekcje = set()
+		self.znacznikiZapisu = {}
+		self.zadanie = None
+		self.blokadaZapisu = asyncio.Lock()
+
+	def zaplanuj(self, *sekcje: str) -> None:
+		"""
+		Oznacza sekcje do zapisania i planuje zapis po upływie okna czasowego. Nie blokuje wywołującego.
+
+		Args:
+			*sekcje (str): Sekcje do zapisania (`konfiguracja`, `serwery`). Domyślnie obie.
+		"""
+
+		self.sekcje.update(sekcje or ("konfiguracja", "serwery"))
+
+		# Wywołanie z wnętrza trwającego zapisu (ponowienie po błędzie) również planuje kolejny zapis
+		if self.zadanie is None or self.zadanie.done() or self.zadanie is asyncio.current_task():
+			self.zadanie = asyncio.create_task(self.zapiszPoOknie())
+
+	async def zapiszPoOknie(self) -> None:
+		"""
+		Czeka do końca okna czasowego, a następnie zapisuje oczekujące sekcje.
+		"""
+
+		await asyncio.sleep(self.okno)
+		await self.zapiszTeraz()
+
+	async def zapiszTeraz(self) -> None:
+		"""
+		Natychmiast zapisuje wszystkie oczekujące sekcje konfiguracji z aktualnej migawki. W przypadku błędu sekcje
+		pozostają oczekujące, a zapis jest planowany ponownie.
+		"""
+
+		async with self.blokadaZapisu:
+			if not self.sekcje:
+				return
+
+			sekcje = self.sekcje
+			self.sekcje = set()
+			migawka = pobierzMigawkę()
+			czytelnie = not migawka.ustawienia.get("kompaktowy-zapis", False)
+
+			def zapisz() -> None:
+				"""
+				Funkcja pomocnicza serializująca sekcje konfiguracji z migawki i zapisująca je do ich plików.
+				"""
+
+				if "serwery" in sekcje:
+					zapiszPlik(ścieżkaSerwerów, migawka.wpisySerwerów(), czytelnie)
+					self.znacznikiZapisu[ścieżkaSerwerów] = znacznikPliku(ścieżkaSerwerów)
+
+				if "konfiguracja" in sekcje:
+					zapiszPlik(ścieżkaKonfiguracji, {**odmroź(migawka.ustawienia), "szkoły": odmroź(migawka.wpisySzkół)}, czytelnie)
+					self.znacznikiZapisu[ścieżkaKonfiguracji] = znacznikPliku(ścieżkaKonfiguracji)
+
+			try:
+				await asyncio.to_thread(zapisz)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas zapisywania pliku konfiguracyjnego. Zapis zostanie ponowiony. Więcej informacji: {e}"
+				)
+				self.zaplanuj(*sekcje)
+
+# Globalny zapisywacz konfiguracji
+zapisywaczKonfiguracji = ZapisywaczKonfiguracji()
@@ -14,27 +14,365 @@
 import asyncio
 from collections import defaultdict
 import contextlib
-import json
+import copy
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import (
+	Any,
+	Iterable,
+	Optional
+)
 
 # Wewnętrzne importy
+from src.core.locks import BlokadaZPomiarem
+from src.core.metrics import czasMagazynu
+from src.core.ranking import RankingNauczycieli
+from src.handlers.codec import (
+	BłędyDekodowania,
+	wczytajPlik,
+	zakoduj
+)
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.database import MagazynSQLite
 from src.handlers.logging import logiKonsoli
 
 # Ścieżka folderu z plikami danych
 folderDanych = Path("data")
-folderDanych.mkdir(exist_ok=True)
 
 # Globalna blokada modyfikacji pliku danych per serwer
-blokadaPlikuNaSerwer = defaultdict(lambda: asyncio.Lock())
+blokadaPlikuNaSerwer = defaultdict(lambda: BlokadaZPomiarem("plik-serwera"))
+
+# Magazyn SQLite tworzony przy pierwszym użyciu, jeśli został wybrany w pliku konfiguracyjnym
+magazynSQLite = None
+
+def pobierzMagazynSQLite() -> Optional[MagazynSQLite]:
+	"""
+	Zwraca magazyn SQLite, jeśli w pliku konfiguracyjnym ustawiono `"magazyn-danych": "sqlite"`. Przy pierwszym wywołaniu tworzy magazyn i jednorazowo migruje do niego pliki `data/*.json`.
+
+	Returns:
+		Optional[MagazynSQLite]: Magazyn SQLite lub None, jeśli dane przechowywane są w plikach `JSON`.
+	"""
+
+	global magazynSQLite
+
+	if str(pobierzMigawkę().ustawienia.get("magazyn-danych", "json")).strip().lower() != "sqlite":
+		return None
+
+	if magazynSQLite is None:
+		magazynSQLite = MagazynSQLite(folderDanych / "zastepstwa.db", folderDanych)
+
+	return magazynSQLite
+
+
+async def zamknijMagazynDanych() -> None:
+	"""
+	Zamyka magazyn SQLite, jeśli był używany.
+	"""
+
+	global magazynSQLite
+
+	if magazynSQLite is not None:
+		try:
+			await magazynSQLite.zamknij()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zamykania bazy danych. Więcej informacji: {e}"
+			)
+		finally:
+			magazynSQLite = None
+
+
+async def usuńDaneSerwera(identyfikatorSerwera: str) -> None:
+	"""
+	Usuwa wszystkie dane zapisane dla serwera Discord, niezależnie od wybranego magazynu danych.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord, którego dane mają zostać usunięte.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	magazyn = pobierzMagazynSQLite()
+
+	async with blokadaPlikuNaSerwer[identyfikatorSerwera]:
+		pamięćDanych.usuń(identyfikatorSerwera)
+
+		if magazyn:
+			try:
+				await magazyn.usuń(identyfikatorSerwera)
+				logiKonsoli.info(
+					f"Usunięto dane serwera o ID {identyfikatorSerwera} z bazy danych."
+				)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas usuwania danych serwera o ID {identyfikatorSerwera} z bazy danych. Więcej informacji: {e}"
+				)
+
+		for rozszerzenie in (".json", ".json.old", ".json.tmp", ".json.bad"):
+			ścieżkaZasobów = folderDanych / f"{identyfikatorSerwera}{rozszerzenie}"
+
+			if ścieżkaZasobów.exists():
+				try:
+					await asyncio.to_thread(ścieżkaZasobów.unlink)
+					logiKonsoli.info(
+						f"Usunięto plik zasobów ({ścieżkaZasobów})."
+					)
+				except Exception as e:
+					logiKonsoli.exception(
+						f"Wystąpił błąd podczas usuwania pliku zasobów ({ścieżkaZasobów}). Więcej informacji: {e}"
+					)
+
+
+def zapiszPlikDanych(
+	ścieżkaPliku: Path,
+	dane: Any
+) -> None:
+	"""
+	Zapisuje dane serwera Discord do tymczasowego pliku danych w formacie `JSON`,
+	a następnie nadpisuje istniejący plik danych, dodatkowo tworząc kopię `.old`.
+
+	Args:
+		ścieżkaPliku (Path): Ścieżka do pliku danych serwera.
+		dane (Any): Dane do zapisania.
+	"""
+
+	tymczasowy = ścieżkaPliku.with_suffix(".json.tmp")
+	kopia = ścieżkaPliku.with_suffix(".json.old")
+
+	with open(tymczasowy, "wb") as plik:
+		plik.write(zakoduj(dane, czytelnie=not pobierzMigawkę().ustawienia.get("kompaktowy-zapis", False)))
+
+	try:
+		if ścieżkaPliku.exists():
+			with contextlib.suppress(Exception):
+				os.remove(str(kopia))
+
+			os.replace(str(ścieżkaPliku), str(kopia))
+	except Exception as e:
+		logiKonsoli.exception(
+			f"Wystąpił błąd podczas zapisywania kopii pliku danych z rozszerzeniem .old dla {ścieżkaPliku}. Więcej informacji: {e}"
+		)
+
+	os.replace(str(tymczasowy), str(ścieżkaPliku))
+
+
+def wczytajPlikiDanych(folder: Path) -> dict[str, dict[str, Any]]:
+	"""
+	Wczytuje wszystkie pliki danych serwerów (`<ID serwera>.json`) z podanego folderu. Uszkodzone pliki przenoszone są
+	do kopii `.bad`, a pliki, których nie udało się odczytać, są pomijane.
+
+	Args:
+		folder (Path): Folder z plikami danych w formacie `JSON`.
+
+	Returns:
+		dict[str, dict[str, Any]]: Słownik danych serwerów według ich ID.
+	"""
+
+	wynik = {}
+
+	for ścieżkaPliku in folder.glob("*.json"):
+		if not ścieżkaPliku.stem.isdigit():
+			continue
+
+		try:
+			dane = wczytajPlik(ścieżkaPliku)
+		except OSError as e:
+			logiKonsoli.exception(
+				f"Nie udało się odczytać pliku danych ({ścieżkaPliku}). Plik zostanie pominięty. Więcej informacji: {e}"
+			)
+			continue
+		except BłędyDekodowania as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas wczytywania pliku danych ({ścieżkaPliku}). Więcej informacji: {e}"
+			)
+			with contextlib.suppress(Exception):
+				os.replace(str(ścieżkaPliku), str(ścieżkaPliku.with_suffix(".json.bad")))
+			dane = {}
+
+		wynik[ścieżkaPliku.stem] = dane if isinstance(dane, dict) else {}
+
+	return wynik
+
+
+class PamięćDanych():
+	"""
+	Pamięć podręczna danych serwerów Discord z opóźnionym, wsadowym zapisem.
+
+	Dane wszystkich serwerów wczytywane są raz przy starcie bota, odczyty obsługiwane są z pamięci,
+	a zmienione wpisy zapisywane są razem na końcu cyklu aktualizacji, okresowo oraz przy wyłączaniu bota.
+	Zapis wsadowy korzysta z tych samych mechanizmów co pojedynczy zapis: pliku `.tmp` i kopii `.old` lub jednej transakcji SQLite.
+	Dane serwerów, po których wysłano wiadomości, zapisywane są od razu (`zapiszZmiany` z listą serwerów), tak jak przed
+	wprowadzeniem pamięci podręcznej. Słowniki przekazane do `ustaw` przechodzą na własność pamięci i nie są później
+	modyfikowane (tylko podmieniane), dlatego zapis wsadowy nie musi ich kopiować.
+
+	Attributes:
+		dane (dict[str, dict[str, Any]]): Dane serwerów według ich ID.
+		zmienione (set[str]): ID serwerów, których dane nie zostały jeszcze zapisane na dysku.
+		wczytana (bool): Informuje, czy dane zostały wczytane i pamięć obsługuje odczyty.
+		rankingi (dict[str, RankingNauczycieli]): Rankingi nauczycieli serwerów, tworzone przy pierwszym odczycie
+			i aktualizowane przyrostowo razem ze statystykami. Inne zmiany statystyk wymagają `unieważnijRanking`.
+	"""
+
+	def __init__(self) -> None:
+		self.dane = {}
+		self.zmienione = set()
+		self.wczytana = False
+		self.blokadaZapisu = asyncio.Lock()
+		self.rankingi = {}
+
+	async def wczytaj(self) -> None:
+		"""
+		Wczytuje dane wszystkich serwerów z wybranego magazynu danych.
+		"""
+
+		magazyn = pobierzMagazynSQLite()
+
+		if magazyn:
+			self.dane = await magazyn.odczytajWszystkie()
+		else:
+			self.dane = await asyncio.to_thread(wczytajPlikiDanych, folderDanych)
+
+		self.zmienione.clear()
+		self.rankingi.clear()
+		self.wczytana = True
+		logiKonsoli.info(
+			f"Wczytano dane {len(self.dane)} serwerów do pamięci podręcznej."
+		)
+
+	def pobierz(self, identyfikatorSerwera: str) -> dict[str, Any]:
+		"""
+		Zwraca kopię danych serwera Discord z pamięci.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+
+		Returns:
+			dict[str, Any]: Kopia danych serwera lub pusty słownik.
+		"""
+
+		return copy.deepcopy(self.dane.get(str(identyfikatorSerwera), {}))
+
+	def ustaw(
+		self,
+		identyfikatorSerwera: str,
+		dane: dict[str, Any]
+	) -> None:
+		"""
+		Zastępuje dane serwera Discord w pamięci i oznacza je do zapisania. Słownik przechodzi na własność pamięci
+		i nie może być później modyfikowany przez wywołującego.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+			dane (dict[str, Any]): Pełna zawartość danych serwera.
+		"""
+
+		identyfikatorSerwera = str(identyfikatorSerwera)
+		self.dane[identyfikatorSerwera] = dane
+		self.zmienione.add(identyfikatorSerwera)
+
+	def unieważnijRanking(self, identyfikatorSerwera: str) -> None:
+		"""
+		Usuwa ranking nauczycieli serwera Discord z pamięci, aby przy następnym odczycie został zbudowany ponownie ze statystyk.
+		Wywoływana po zmianie statystyk inną drogą niż przyrostowa aktualizacja rankingu (np. po zerowaniu na koniec roku szkolnego).
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+		"""
+
+		self.rankingi.pop(str(identyfikatorSerwera), None)
+
+	def pobierzRanking(self, identyfikatorSerwera: str) -> RankingNauczycieli:
+		"""
+		Zwraca ranking nauczycieli serwera Discord, budując go ze statystyk przy pierwszym odczycie.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+
+		Returns:
+			RankingNauczycieli: Ranking nauczycieli serwera.
+		"""
+
+		identyfikatorSerwera = str(identyfikatorSerwera)
+		ranking = self.rankingi.get(identyfikatorSerwera)
+
+		if ranking is None:
+			statystyki = self.dane.get(identyfikatorSerwera, {}).get("statystyki-nauczycieli", {})
+			ranking = self.rankingi[identyfikatorSerwera] = RankingNauczycieli(statystyki if isinstance(statystyki, dict) else {})
+
+		return ranking
+
+	def usuń(self, identyfikatorSerwera: str) -> None:
+		"""
+		Usuwa dane serwera Discord z pamięci bez zapisywania ich na dysku.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+		"""
+
+		self.dane.pop(str(identyfikatorSerwera), None)
+		self.zmienione.discard(str(identyfikatorSerwera))
+		self.rankingi.pop(str(identyfikatorSerwera), None)
+
+	async def zapiszZmiany(self, serwery: Optional[Iterable[str]]=None) -> int:
+		"""
+		Zapisuje zmienione dane serwerów w jednej operacji wsadowej.
+		W przypadku błędu wpisy pozostają oznaczone do zapisania przy następnej próbie.
+
+		Args:
+			serwery (Optional[Iterable[str]]): ID serwerów do zapisania. Domyślnie zapisywane są wszystkie zmienione serwery.
+
+		Returns:
+			int: Liczba zapisanych serwerów.
+		"""
+
+		async with self.blokadaZapisu:
+			wybrane = self.zmienione if serwery is None else self.zmienione & {str(identyfikatorSerwera) for identyfikatorSerwera in serwery}
+
+			if not wybrane:
+				return 0
+
+			doZapisania = {
+				identyfikatorSerwera: self.dane[identyfikatorSerwera]
+				for identyfikatorSerwera in wybrane
+				if identyfikatorSerwera in self.dane
+			}
+			self.zmienione -= wybrane
+			magazyn = pobierzMagazynSQLite()
+
+			def zapiszPliki() -> None:
+				"""
+				Funkcja pomocnicza zapisująca dane wszystkich zmienionych serwerów do plików danych.
+				"""
+
+				for identyfikatorSerwera, dane in doZapisania.items():
+					zapiszPlikDanych(folderDanych / f"{identyfikatorSerwera}.json", dane)
+
+			try:
+				with czasMagazynu.zmierz(operacja="zapis-wsadowy"):
+					if magazyn:
+						await magazyn.zapiszWiele(doZapisania)
+					else:
+						await asyncio.to_thread(zapiszPliki)
+			except Exception as e:
+				self.zmienione |= doZapisania.keys()
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas zapisywania danych {len(doZapisania)} serwerów. Dane zostaną zapisane przy następnej próbie. Więcej informacji: {e}"
+				)
+				return 0
+
+			return len(doZapisania)
+
+# Globalna pamięć podręczna danych serwerów
+pamięćDanych = PamięćDanych()
 
 async def zarządzajPlikiemDanych(
 	identyfikatorSerwera: str,
 	dane: Any = None
 ) -> dict[str, Any]:
 	"""
-	Zarządza plikiem danych w formacie `JSON` dla konkretnego serwera Discord.
+	Zarządza plikiem danych w formacie `JSON` lub wpisem w bazie SQLite dla konkretnego serwera Discord.
+	Po wczytaniu pamięci podręcznej (`pamięćDanych`) odczyty i zapisy obsługiwane są w pamięci, a zmiany trafiają na dysk przy najbliższym zapisie wsadowym.
+	Czas każdej operacji trafia do metryki `zastepstwa_magazyn_sekundy`.
 
 	Args:
 		identyfikatorSerwera (str): ID serwera Discord, którego dane mają być odczytane lub zapisane.
@@ -44,37 +382,63 @@ async def zarządzajPlikiemDanych(
 		dict[str, Any]: Zawartość pliku danych serwera po operacji odczytu, lub pusty słownik w przypadku błędu.
   """
 
+	początek = time.perf_counter()
+
+	try:
+		return await obsłużDaneSerwera(str(identyfikatorSerwera), dane)
+	finally:
+		czasMagazynu.obserwuj(
+			time.perf_counter() - początek,
+			operacja=("zapis" if dane is not None else "odczyt") + ("-pamiec" if pamięćDanych.wczytana else "-dysk")
+		)
+
+
+async def obsłużDaneSerwera(
+	identyfikatorSerwera: str,
+	dane: Any = None
+) -> dict[str, Any]:
+	"""
+	Wykonuje operację `zarządzajPlikiemDanych` na pamięci podręcznej, bazie SQLite lub pliku danych serwera Discord.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		dane (Any, optional): Jeśli podane, zostaną zapisane w danych serwera. Domyślnie None.
+
+	Returns:
+		dict[str, Any]: Dane serwera po operacji odczytu, lub pusty słownik w przypadku błędu.
+	"""
+
 	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	if pamięćDanych.wczytana:
+		async with blokadaPlikuNaSerwer[identyfikatorSerwera]:
+			if dane is not None:
+				pamięćDanych.ustaw(identyfikatorSerwera, dane)
+
+			return pamięćDanych.pobierz(identyfikatorSerwera)
+
 	ścieżkaPliku = folderDanych / f"{identyfikatorSerwera}.json"
 
 	tymczasowy = ścieżkaPliku.with_suffix(".json.tmp")
-	kopia = ścieżkaPliku.with_suffix(".json.old")
 	uszkodzony = ścieżkaPliku.with_suffix(".json.bad")
+	magazyn = pobierzMagazynSQLite()
 
 	async with blokadaPlikuNaSerwer[identyfikatorSerwera]:
-		try:
-			if dane is not None:
-				def zapisz() -> None:
-					"""
-					Funkcja pomocnicza zapisująca dane serwera Discord do pliku danych w formacie `JSON`.
-					"""
-
-					with open(tymczasowy, "w", encoding="utf-8") as plik:
-						json.dump(dane, plik, ensure_ascii=False, indent=4)
-
-					try:
-						if ścieżkaPliku.exists():
-							with contextlib.suppress(Exception):
-								os.remove(str(kopia))
+		if magazyn:
+			try:
+				if dane is not None:
+					await magazyn.zapisz(identyfikatorSerwera, dane)
 
-							os.replace(str(ścieżkaPliku), str(kopia))
-					except Exception as e:
-						logiKonsoli.exception(
-							f"Wystąpił błąd podczas zapisywania kopii pliku danych z rozszerzeniem .old dla {ścieżkaPliku}. Więcej informacji: {e}"
-						)
+				return await magazyn.odczytaj(identyfikatorSerwera)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas operacji na bazie danych. Więcej informacji: {e}"
+				)
+				return {}
 
-					os.replace(str(tymczasowy), str(ścieżkaPliku))
-				await asyncio.to_thread(zapisz)
+		try:
+			if dane is not None:
+				await asyncio.to_thread(zapiszPlikDanych, ścieżkaPliku, dane)
 
 			def odczytaj() -> bool:
 				"""
@@ -96,10 +460,10 @@ async def zarządzajPlikiemDanych(
 							Any: Zawartość pliku danych w formacie `JSON`.
 						"""
 
-						return json.loads(ścieżkaPliku.read_text(encoding="utf-8"))
+						return wczytajPlik(ścieżkaPliku)
 
 					return await asyncio.to_thread(wczytaj)
-				except (json.JSONDecodeError, UnicodeDecodeError) as e:
+				except BłędyDekodowania as e:
 					logiKonsoli.exception(
 						f"Wystąpił błąd podczas wczytywania pliku danych. Więcej informacji: {e}"
 					)
@@ -130,4 +494,29 @@ async def zarządzajPlikiemDanych(
 					)
 					pass
 
-			return {}
\ No newline at end of file
+			return {}
+
+
+async def pobierzStatystykiSerwera(identyfikatorSerwera: str) -> tuple[int, RankingNauczycieli]:
+	"""
+	Zwraca licznik zastępstw i ranking nauczycieli serwera Discord. Po wczytaniu pamięci podręcznej odczyt nie kopiuje
+	danych serwera i nie sortuje statystyk, a bez niej ranking budowany jest z danych odczytanych z dysku.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+
+	Returns:
+		tuple[int, RankingNauczycieli]: Licznik zastępstw oraz ranking nauczycieli serwera.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	if pamięćDanych.wczytana:
+		async with blokadaPlikuNaSerwer[identyfikatorSerwera]:
+			licznik = pamięćDanych.dane.get(identyfikatorSerwera, {}).get("licznik-zastepstw", 0)
+			return int(licznik or 0), pamięćDanych.pobierzRanking(identyfikatorSerwera)
+
+	dane = await zarządzajPlikiemDanych(identyfikatorSerwera) or {}
+	statystyki = dane.get("statystyki-nauczycieli", {})
+
+	return int(dane.get("licznik-zastepstw", 0) or 0), RankingNauczycieli(statystyki if isinstance(statystyki, dict) else {})
@@ -0,0 +1,410 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+# Wewnętrzne importy
+from src.handlers.codec import (
+	BłędyDekodowania,
+	odkoduj,
+	wczytajPlik,
+	zakoduj
+)
+from src.handlers.logging import logiKonsoli
+
+# Klucze pliku danych przechowywane w dedykowanych kolumnach tabeli `serwery`
+kolumnySerwera = {
+	"suma-kontrolna-informacji-dodatkowych": "suma_kontrolna_informacji",
+	"suma-kontrolna-wpisow-zastepstw": "suma_kontrolna_wpisow",
+	"licznik-zastepstw": "licznik_zastepstw",
+	"ostatni-raport": "ostatni_raport"
+}
+
+schemat = """
+CREATE TABLE IF NOT EXISTS serwery (
+	identyfikator TEXT PRIMARY KEY,
+	suma_kontrolna_informacji TEXT NOT NULL DEFAULT '',
+	suma_kontrolna_wpisow TEXT NOT NULL DEFAULT '',
+	licznik_zastepstw INTEGER NOT NULL DEFAULT 0,
+	ostatni_raport TEXT NOT NULL DEFAULT '',
+	dodatkowe TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS statystyki_nauczycieli (
+	identyfikator TEXT NOT NULL REFERENCES serwery(identyfikator) ON DELETE CASCADE,
+	nauczyciel TEXT NOT NULL,
+	liczba INTEGER NOT NULL,
+	PRIMARY KEY (identyfikator, nauczyciel)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metadane (
+	klucz TEXT PRIMARY KEY,
+	wartosc TEXT NOT NULL
+);
+"""
+
+class MagazynSQLite():
+	"""
+	Magazyn danych serwerów Discord oparty na bazie SQLite w trybie WAL.
+
+	Wszystkie operacje na bazie wykonywane są w jednym, dedykowanym wątku, dzięki czemu połączenie nie jest współdzielone między wątkami, a pętla zdarzeń nie jest blokowana.
+
+	Attributes:
+		ścieżka (Path): Ścieżka do pliku bazy danych.
+		folderPlikówJSON (Path | None): Folder z plikami danych w formacie `JSON`, z którego jednorazowo migrowane są dane.
+	"""
+
+	def __init__(
+		self,
+		ścieżka: Path,
+		folderPlikówJSON: Path | None=None
+	) -> None:
+		self.ścieżka = ścieżka
+		self.folderPlikówJSON = folderPlikówJSON
+		self.połączenie = None
+		self.wykonawca = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+	async def wykonaj(
+		self,
+		funkcja,
+		*args: Any
+	) -> Any:
+		"""
+		Wykonuje funkcję w wątku bazy danych, otwierając połączenie przy pierwszym wywołaniu.
+
+		Args:
+			funkcja (Callable): Funkcja przyjmująca połączenie jako pierwszy argument.
+			*args (Any): Dodatkowe argumenty przekazywane do funkcji.
+
+		Returns:
+			Any: Wynik wywołanej funkcji.
+		"""
+
+		def wywołaj() -> Any:
+			"""
+			Funkcja pomocnicza otwierająca połączenie (jeśli to konieczne) i wywołująca funkcję w wątku bazy danych.
+
+			Returns:
+				Any: Wynik wywołanej funkcji.
+			"""
+
+			if self.połączenie is None:
+				self.połączenie = self.połącz()
+
+			return funkcja(self.połączenie, *args)
+
+		pętla = asyncio.get_running_loop()
+		return await pętla.run_in_executor(self.wykonawca, wywołaj)
+
+	def połącz(self) -> sqlite3.Connection:
+		"""
+		Otwiera połączenie z bazą danych, ustawia tryb WAL, tworzy schemat i w razie potrzeby migruje pliki `JSON`.
+
+		Returns:
+			sqlite3.Connection: Otwarte połączenie z bazą danych.
+		"""
+
+		self.ścieżka.parent.mkdir(parents=True, exist_ok=True)
+		połączenie = sqlite3.connect(str(self.ścieżka), isolation_level=None)
+		połączenie.execute("PRAGMA journal_mode=WAL")
+		połączenie.execute("PRAGMA synchronous=NORMAL")
+		połączenie.execute("PRAGMA foreign_keys=ON")
+		połączenie.executescript(schemat)
+
+		if self.folderPlikówJSON is not None:
+			self.migrujPlikiJSON(połączenie, self.folderPlikówJSON)
+
+		return połączenie
+
+	@staticmethod
+	def migrujPlikiJSON(
+		połączenie: sqlite3.Connection,
+		folder: Path
+	) -> int:
+		"""
+		Jednorazowo przenosi zawartość plików danych `data/*.json` do bazy danych. Pliki pozostają na dysku jako kopia.
+
+		Args:
+			połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+			folder (Path): Folder z plikami danych w formacie `JSON`.
+
+		Returns:
+			int: Liczba przeniesionych plików danych.
+		"""
+
+		if połączenie.execute("SELECT 1 FROM metadane WHERE klucz = 'migracja-json'").fetchone():
+			return 0
+
+		przeniesione = 0
+		połączenie.execute("BEGIN IMMEDIATE")
+
+		try:
+			for ścieżkaPliku in sorted(folder.glob("*.json")):
+				identyfikatorSerwera = ścieżkaPliku.stem
+
+				if not identyfikatorSerwera.isdigit():
+					continue
+
+				dane = None
+
+				for kandydat in (ścieżkaPliku, ścieżkaPliku.with_suffix(".json.old")):
+					try:
+						dane = wczytajPlik(kandydat)
+						break
+					except (OSError, *BłędyDekodowania) as e:
+						logiKonsoli.warning(
+							f"Nie udało się wczytać pliku danych ({kandydat}) podczas migracji do bazy danych. Więcej informacji: {e}"
+						)
+
+				if isinstance(dane, dict):
+					MagazynSQLite.zapiszSerwer(połączenie, identyfikatorSerwera, dane)
+					przeniesione += 1
+
+			połączenie.execute("INSERT INTO metadane (klucz, wartosc) VALUES ('migracja-json', ?)", (str(przeniesione),))
+			połączenie.execute("COMMIT")
+		except Exception:
+			połączenie.execute("ROLLBACK")
+			raise
+
+		if przeniesione:
+			logiKonsoli.info(
+				f"Przeniesiono {przeniesione} plików danych z folderu {folder} do bazy danych. Pliki zostały zachowane jako kopia."
+			)
+
+		return przeniesione
+
+	@staticmethod
+	def zapiszSerwer(
+		połączenie: sqlite3.Connection,
+		identyfikatorSerwera: str,
+		dane: dict[str, Any]
+	) -> None:
+		"""
+		Zastępuje dane serwera Discord w bazie danych. Musi być wywołana wewnątrz transakcji.
+
+		Args:
+			połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+			identyfikatorSerwera (str): ID serwera Discord.
+			dane (dict[str, Any]): Pełna zawartość danych serwera.
+		"""
+
+		statystyki = dane.get("statystyki-nauczycieli", {})
+
+		if not isinstance(statystyki, dict):
+			statystyki = {}
+
+		dodatkowe = {
+			klucz: wartość
+			for klucz, wartość in dane.items()
+			if klucz not in kolumnySerwera and klucz != "statystyki-nauczycieli"
+		}
+
+		połączenie.execute(
+			"INSERT OR REPLACE INTO serwery (identyfikator, suma_kontrolna_informacji, suma_kontrolna_wpisow, licznik_zastepstw, ostatni_raport, dodatkowe) VALUES (?, ?, ?, ?, ?, ?)",
+			(
+				identyfikatorSerwera,
+				str(dane.get("suma-kontrolna-informacji-dodatkowych", "")),
+				str(dane.get("suma-kontrolna-wpisow-zastepstw", "")),
+				int(dane.get("licznik-zastepstw", 0) or 0),
+				str(dane.get("ostatni-raport", "")),
+				zakoduj(dodatkowe, czytelnie=False).decode("utf-8")
+			)
+		)
+		połączenie.execute("DELETE FROM statystyki_nauczycieli WHERE identyfikator = ?", (identyfikatorSerwera,))
+		połączenie.executemany(
+			"INSERT INTO statystyki_nauczycieli (identyfikator, nauczyciel, liczba) VALUES (?, ?, ?)",
+			[(identyfikatorSerwera, str(nauczyciel), int(liczba)) for nauczyciel, liczba in statystyki.items()]
+		)
+
+	@staticmethod
+	def złóżSerwer(
+		wiersz: tuple,
+		statystyki: dict[str, int]
+	) -> dict[str, Any]:
+		"""
+		Składa słownik danych serwera w formacie pliku danych z wiersza tabeli `serwery` i jego statystyk.
+
+		Args:
+			wiersz (tuple): Wiersz tabeli `serwery` bez kolumny identyfikatora.
+			statystyki (dict[str, int]): Statystyki nauczycieli serwera.
+
+		Returns:
+			dict[str, Any]: Dane serwera w formacie zgodnym z plikiem danych.
+		"""
+
+		sumaInformacji, sumaWpisów, licznik, ostatniRaport, dodatkowe = wiersz
+		dane = {
+			"suma-kontrolna-informacji-dodatkowych": sumaInformacji,
+			"suma-kontrolna-wpisow-zastepstw": sumaWpisów,
+			"licznik-zastepstw": licznik,
+			"statystyki-nauczycieli": statystyki,
+			"ostatni-raport": ostatniRaport
+		}
+		dane.update(odkoduj(dodatkowe or "{}"))
+		return dane
+
+	async def odczytaj(self, identyfikatorSerwera: str) -> dict[str, Any]:
+		"""
+		Odczytuje dane serwera Discord z bazy danych.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+
+		Returns:
+			dict[str, Any]: Dane serwera lub pusty słownik, jeśli serwer nie posiada danych.
+		"""
+
+		def odczytajSerwer(połączenie: sqlite3.Connection) -> dict[str, Any]:
+			"""
+			Funkcja pomocnicza odczytująca wiersz serwera i jego statystyki nauczycieli.
+
+			Args:
+				połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+
+			Returns:
+				dict[str, Any]: Dane serwera lub pusty słownik.
+			"""
+
+			wiersz = połączenie.execute(
+				"SELECT suma_kontrolna_informacji, suma_kontrolna_wpisow, licznik_zastepstw, ostatni_raport, dodatkowe FROM serwery WHERE identyfikator = ?",
+				(identyfikatorSerwera,)
+			).fetchone()
+
+			if not wiersz:
+				return {}
+
+			statystyki = dict(połączenie.execute(
+				"SELECT nauczyciel, liczba FROM statystyki_nauczycieli WHERE identyfikator = ?",
+				(identyfikatorSerwera,)
+			).fetchall())
+
+			return self.złóżSerwer(wiersz, statystyki)
+
+		return await self.wykonaj(odczytajSerwer)
+
+	async def odczytajWszystkie(self) -> dict[str, dict[str, Any]]:
+		"""
+		Odczytuje dane wszystkich serwerów Discord z bazy danych.
+
+		Returns:
+			dict[str, dict[str, Any]]: Słownik danych serwerów według ich ID.
+		"""
+
+		def odczytajSerwery(połączenie: sqlite3.Connection) -> dict[str, dict[str, Any]]:
+			"""
+			Funkcja pomocnicza odczytująca wszystkie wiersze serwerów wraz z ich statystykami nauczycieli.
+
+			Args:
+				połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+
+			Returns:
+				dict[str, dict[str, Any]]: Słownik danych serwerów według ich ID.
+			"""
+
+			statystyki = {}
+
+			for identyfikatorSerwera, nauczyciel, liczba in połączenie.execute("SELECT identyfikator, nauczyciel, liczba FROM statystyki_nauczycieli"):
+				statystyki.setdefault(identyfikatorSerwera, {})[nauczyciel] = liczba
+
+			return {
+				wiersz[0]: self.złóżSerwer(wiersz[1:], statystyki.get(wiersz[0], {}))
+				for wiersz in połączenie.execute("SELECT identyfikator, suma_kontrolna_informacji, suma_kontrolna_wpisow, licznik_zastepstw, ostatni_raport, dodatkowe FROM serwery")
+			}
+
+		return await self.wykonaj(odczytajSerwery)
+
+	async def zapisz(
+		self,
+		identyfikatorSerwera: str,
+		dane: dict[str, Any]
+	) -> None:
+		"""
+		Zapisuje dane jednego serwera Discord w pojedynczej transakcji.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+			dane (dict[str, Any]): Pełna zawartość danych serwera.
+		"""
+
+		await self.zapiszWiele({identyfikatorSerwera: dane})
+
+	async def zapiszWiele(self, dane: dict[str, dict[str, Any]]) -> None:
+		"""
+		Zapisuje dane wielu serwerów Discord w jednej transakcji.
+
+		Args:
+			dane (dict[str, dict[str, Any]]): Słownik danych serwerów według ich ID.
+		"""
+
+		def zapiszSerwery(połączenie: sqlite3.Connection) -> None:
+			"""
+			Funkcja pomocnicza zapisująca dane wszystkich serwerów w jednej transakcji.
+
+			Args:
+				połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+			"""
+
+			połączenie.execute("BEGIN IMMEDIATE")
+
+			try:
+				for identyfikatorSerwera, daneSerwera in dane.items():
+					self.zapiszSerwer(połączenie, str(identyfikatorSerwera), daneSerwera)
+
+				połączenie.execute("COMMIT")
+			except Exception:
+				połączenie.execute("ROLLBACK")
+				raise
+
+		if dane:
+			await self.wykonaj(zapiszSerwery)
+
+	async def usuń(self, identyfikatorSerwera: str) -> None:
+		"""
+		Usuwa dane serwera Discord wraz z jego statystykami.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+		"""
+
+		def usuńSerwer(połączenie: sqlite3.Connection) -> None:
+			"""
+			Funkcja pomocnicza usuwająca wiersz serwera (statystyki usuwane są kaskadowo).
+
+			Args:
+				połączenie (sqlite3.Connection): Otwarte połączenie z bazą danych.
+			"""
+
+			połączenie.execute("DELETE FROM serwery WHERE identyfikator = ?", (identyfikatorSerwera,))
+
+		await self.wykonaj(usuńSerwer)
+
+	async def zamknij(self) -> None:
+		"""
+		Zamyka połączenie z bazą danych i wątek, w którym wykonywane są operacje.
+		"""
+
+		def zamknijPołączenie(_) -> None:
+			"""
+			Funkcja pomocnicza zamykająca połączenie w wątku, w którym zostało otwarte.
+			"""
+
+			if self.połączenie is not None:
+				self.połączenie.close()
+				self.połączenie = None
+
+		if self.połączenie is not None:
+			await self.wykonaj(zamknijPołączenie)
+
+		self.wykonawca.shutdown(wait=True)
@@ -0,0 +1,236 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+from dataclasses import dataclass
+from datetime import datetime
+import math
+import time
+from typing import (
+	Any,
+	Optional
+)
+from zoneinfo import ZoneInfo
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.configuration import pobierzMigawkę
+
+@dataclass(slots=True)
+class StanZadania():
+	"""
+	Stan zadania działającego w tle, aktualizowany przez nadzorcę zadań (`nadzorujZadanie`).
+
+	Attributes:
+		nazwa (str): Nazwa zadania (atrybut bota, np. `aktualizacje`).
+		status (str): `nieuruchomione`, `dziala`, `oczekuje-na-restart` lub `zatrzymane`.
+		uruchomiono (Optional[float]): Czas ostatniego uruchomienia (znacznik czasu UNIX).
+		restarty (int): Liczba ponownych uruchomień po zakończeniu lub błędzie.
+		ostatniBłąd (Optional[str]): Opis ostatniego błędu zadania.
+		ostatnieZakończenie (Optional[str]): Sposób ostatniego zakończenia zadania: `blad` lub `bez-bledu`.
+		następnyRestart (Optional[float]): Czas zaplanowanego ponownego uruchomienia (znacznik czasu UNIX).
+	"""
+
+	nazwa: str
+	status: str = "nieuruchomione"
+	uruchomiono: Optional[float] = None
+	restarty: int = 0
+	ostatniBłąd: Optional[str] = None
+	ostatnieZakończenie: Optional[str] = None
+	następnyRestart: Optional[float] = None
+
+
+@dataclass(slots=True)
+class ŚwieżośćSzkoły():
+	"""
+	Świeżość danych szkoły: kiedy ostatnio pobierano jej stronę i kiedy ostatnio wykryto na niej zmianę.
+
+	Attributes:
+		ostatniePobranie (Optional[float]): Czas ostatniej próby pobrania strony (znacznik czasu UNIX).
+		ostatnieUdanePobranie (Optional[float]): Czas ostatniego udanego pobrania strony.
+		ostatniaZmiana (Optional[float]): Czas ostatniej zmiany wysłanej do któregokolwiek serwera szkoły.
+		kolejneBłędy (int): Liczba nieudanych pobrań od ostatniego udanego.
+	"""
+
+	ostatniePobranie: Optional[float] = None
+	ostatnieUdanePobranie: Optional[float] = None
+	ostatniaZmiana: Optional[float] = None
+	kolejneBłędy: int = 0
+
+
+# Stan zadań działających w tle według nazw
+stanZadań: dict[str, StanZadania] = {}
+
+# Świeżość danych szkół według ich ID
+świeżośćSzkół: dict[str, ŚwieżośćSzkoły] = {}
+
+# Czas zakończenia ostatniego pełnego cyklu sprawdzania aktualizacji (znacznik czasu UNIX)
+ostatniCykl: Optional[float] = None
+
+def oznaczPobranie(
+	szkoła: str,
+	sukces: bool
+) -> None:
+	"""
+	Zapisuje wynik próby pobrania strony szkoły.
+
+	Args:
+		szkoła (str): ID szkoły.
+		sukces (bool): Czy stronę udało się pobrać.
+	"""
+
+	stan = świeżośćSzkół.setdefault(szkoła, ŚwieżośćSzkoły())
+	stan.ostatniePobranie = time.time()
+
+	if sukces:
+		stan.ostatnieUdanePobranie = stan.ostatniePobranie
+		stan.kolejneBłędy = 0
+	else:
+		stan.kolejneBłędy += 1
+
+
+def oznaczZmianę(szkoła: str) -> None:
+	"""
+	Zapisuje wykrycie zmiany zastępstw szkoły.
+
+	Args:
+		szkoła (str): ID szkoły.
+	"""
+
+	świeżośćSzkół.setdefault(szkoła, ŚwieżośćSzkoły()).ostatniaZmiana = time.time()
+
+
+def oznaczCykl() -> None:
+	"""
+	Zapisuje zakończenie pełnego cyklu sprawdzania aktualizacji.
+	"""
+
+	global ostatniCykl
+
+	ostatniCykl = time.time()
+
+
+def sformatujCzas(znacznik: Optional[float]) -> Optional[str]:
+	"""
+	Formatuje znacznik czasu UNIX jako datę ISO 8601 w strefie czasowej Europe/Warsaw.
+
+	Args:
+		znacznik (Optional[float]): Znacznik czasu UNIX.
+
+	Returns:
+		Optional[str]: Data w formacie ISO 8601 lub None.
+	"""
+
+	if znacznik is None:
+		return None
+
+	return datetime.fromtimestamp(znacznik, ZoneInfo("Europe/Warsaw")).isoformat(timespec="seconds")
+
+
+def wiek(znacznik: Optional[float], teraz: float) -> Optional[float]:
+	"""
+	Zwraca liczbę sekund, które upłynęły od podanego znacznika czasu.
+
+	Args:
+		znacznik (Optional[float]): Znacznik czasu UNIX.
+		teraz (float): Aktualny znacznik czasu UNIX.
+
+	Returns:
+		Optional[float]: Wiek w sekundach lub None.
+	"""
+
+	return None if znacznik is None else round(teraz - znacznik, 1)
+
+
+def raportZdrowia(bot: discord.Client) -> tuple[bool, bool, dict[str, Any]]:
+	"""
+	Tworzy raport zdrowia bota dla punktów końcowych `/health` (żywotność) i `/ready` (gotowość).
+
+	Bot jest żywy, dopóki nie został zamknięty. Gotowy jest wtedy, gdy połączenie z bramą Discorda jest aktywne,
+	ostatni pełny cykl aktualizacji zakończył się nie dawniej niż `maksymalny-wiek-cyklu` sekund temu,
+	a wszystkie nadzorowane zadania działają.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+
+	Returns:
+		tuple[bool, bool, dict[str, Any]]: Żywotność, gotowość i szczegółowy raport.
+	"""
+
+	teraz = time.time()
+	ustawienia = pobierzMigawkę().ustawienia
+
+	try:
+		maksymalnyWiekCyklu = float(ustawienia.get("maksymalny-wiek-cyklu", 1200))
+	except (TypeError, ValueError):
+		maksymalnyWiekCyklu = 1200.0
+
+	opóźnienie = bot.latency
+	brama = {
+		"polaczono": bot.is_ready() and not bot.is_closed(),
+		"zamknieto": bot.is_closed(),
+		"opoznienie-ms": round(opóźnienie * 1000, 1) if math.isfinite(opóźnienie) else None,
+		"serwery": len(bot.guilds)
+	}
+	wiekCyklu = wiek(ostatniCykl, teraz)
+	zadania = {
+		nazwa: {
+			"status": stan.status,
+			"uruchomiono": sformatujCzas(stan.uruchomiono),
+			"restarty": stan.restarty,
+			"ostatni-blad": stan.ostatniBłąd,
+			"ostatnie-zakonczenie": stan.ostatnieZakończenie,
+			"nastepny-restart": sformatujCzas(stan.następnyRestart)
+		}
+		for nazwa, stan in stanZadań.items()
+	}
+	szkoły = {
+		szkoła: {
+			"ostatnie-pobranie": sformatujCzas(stan.ostatniePobranie),
+			"ostatnie-udane-pobranie": sformatujCzas(stan.ostatnieUdanePobranie),
+			"wiek-danych-s": wiek(stan.ostatnieUdanePobranie, teraz),
+			"ostatnia-zmiana": sformatujCzas(stan.ostatniaZmiana),
+			"kolejne-bledy": stan.kolejneBłędy
+		}
+		for szkoła, stan in świeżośćSzkół.items()
+	}
+
+	przyczyny = []
+
+	if not brama["polaczono"]:
+		przyczyny.append("brak połączenia z bramą Discorda")
+
+	if wiekCyklu is None:
+		przyczyny.append("nie zakończono jeszcze pierwszego cyklu aktualizacji")
+	elif wiekCyklu > maksymalnyWiekCyklu:
+		przyczyny.append(f"ostatni cykl aktualizacji zakończył się {wiekCyklu:.0f} s temu")
+
+	for nazwa, stan in stanZadań.items():
+		if stan.status != "dziala":
+			przyczyny.append(f"zadanie {nazwa} ma status {stan.status}")
+
+	żywy = not bot.is_closed()
+	gotowy = żywy and not przyczyny
+
+	return żywy, gotowy, {
+		"zywy": żywy,
+		"gotowy": gotowy,
+		"przyczyny": przyczyny,
+		"brama": brama,
+		"ostatni-cykl": sformatujCzas(ostatniCykl),
+		"wiek-cyklu-s": wiekCyklu,
+		"zadania": zadania,
+		"szkoly": szkoły
+	}
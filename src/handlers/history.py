@@ -0,0 +1,587 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import asyncio
+from collections import (
+	Counter,
+	OrderedDict
+)
+from datetime import (
+	date,
+	datetime
+)
+import gzip
+import hashlib
+import os
+from pathlib import Path
+import re
+from typing import (
+	Any,
+	Callable,
+	Iterator,
+	Optional
+)
+from zoneinfo import ZoneInfo
+
+# Wewnętrzne importy
+from src.core.facts import (
+	FaktyZastępstw,
+	czyOdwołane,
+	wyodrębnijLekcję
+)
+from src.core.normalization import (
+	normalizujTekst,
+	wzorzecCałegoSłowa
+)
+from src.handlers.codec import (
+	BłędyDekodowania,
+	odkoduj,
+	zakoduj
+)
+from src.handlers.data import folderDanych
+from src.handlers.logging import logiKonsoli
+
+# Wzorzec nazwy segmentu: segment-000001.jsonl, segment-000001.jsonl.gz lub skompaktowany segment-000001-000012.jsonl.gz
+wzórSegmentu = re.compile(r"^segment-(\d{6})(?:-(\d{6}))?\.jsonl(\.gz)?$")
+
+def wyznaczDatę(
+	informacjeDodatkowe: str,
+	dzisiaj: Optional[date]=None
+) -> str:
+	"""
+	Wyznacza datę zastępstw na podstawie informacji dodatkowych (format DD.MM), dobierając rok najbliższy dacie dzisiejszej.
+
+	Args:
+		informacjeDodatkowe (str): Tekst informacji dodatkowych nad zastępstwami.
+		dzisiaj (Optional[date]): Data odniesienia. Domyślnie bieżąca data w strefie Europe/Warsaw.
+
+	Returns:
+		str: Data w formacie ISO (YYYY-MM-DD).
+	"""
+
+	dzisiaj = dzisiaj or datetime.now(ZoneInfo("Europe/Warsaw")).date()
+	dopasowanie = re.search(r"\b(\d{1,2})\.(\d{1,2})\b", informacjeDodatkowe or "")
+
+	if dopasowanie:
+		dzień, miesiąc = int(dopasowanie.group(1)), int(dopasowanie.group(2))
+		kandydaci = []
+
+		for rok in (dzisiaj.year - 1, dzisiaj.year, dzisiaj.year + 1):
+			try:
+				kandydaci.append(date(rok, miesiąc, dzień))
+			except ValueError:
+				continue
+
+		if kandydaci:
+			return min(kandydaci, key=lambda kandydat: abs((kandydat - dzisiaj).days)).isoformat()
+
+	return dzisiaj.isoformat()
+
+
+def utwórzZdarzenie(
+	szkoła: str,
+	data: str,
+	tytuł: str,
+	wpis: str,
+	listaKlas: list[str]
+) -> dict[str, Any]:
+	"""
+	Tworzy zwarty rekord zdarzenia dla pojedynczego wiersza zastępstwa.
+
+	Args:
+		szkoła (str): ID szkoły.
+		data (str): Data zastępstw w formacie ISO.
+		tytuł (str): Tytuł grupy zastępstw (nauczyciel lub grupa nieprzypisanych klas).
+		wpis (str): Sformatowany wpis zastępstwa.
+		listaKlas (list[str]): Lista wszystkich klas szkoły.
+
+	Returns:
+		dict[str, Any]: Rekord zdarzenia bez listy powiadomionych serwerów.
+	"""
+
+	nauczyciel = (tytuł or "").strip()
+
+	if "Zastępstwa z nieprzypisanymi klasami!" in nauczyciel and "**Nauczyciel:**" in wpis:
+		nauczyciel = wpis.split("**Nauczyciel:**", 1)[1].strip().split("\n", 1)[0]
+
+	nauczyciel = nauczyciel.split("/", 1)[0].split(" - ", 1)[0].strip()
+	normaWpisu = normalizujTekst(wpis)
+	klasy = [
+		klasa for klasa in listaKlas
+		if wzorzecCałegoSłowa(klasa).search(normaWpisu)
+	]
+	skrót = hashlib.sha256(f"{szkoła}\n{data}\n{nauczyciel}\n{wpis.strip()}".encode("utf-8")).hexdigest()[:16]
+
+	return {
+		"h": skrót,
+		"c": int(datetime.now(ZoneInfo("Europe/Warsaw")).timestamp()),
+		"s": szkoła,
+		"d": data,
+		"n": nauczyciel,
+		"k": klasy,
+		"l": wyodrębnijLekcję(wpis),
+		"o": czyOdwołane(wpis),
+		"g": []
+	}
+
+
+class DziennikZastępstw():
+	"""
+	Dziennik zdarzeń zastępstw w postaci segmentów dopisywanych wyłącznie na końcu (append-only).
+
+	Każdy wykryty wiersz zastępstwa zapisywany jest jako jeden rekord `JSON` w aktywnym segmencie.
+	Po przekroczeniu rozmiaru segment jest zamykany i kompresowany, a po zebraniu kilku zamkniętych segmentów
+	kompaktowanie strumieniowo scala je, łącząc rekordy tego samego wiersza zastępstwa zapisane w oknie kompaktowania.
+
+	Attributes:
+		folder (Path): Folder z segmentami dziennika.
+		maksymalnyRozmiar (int): Rozmiar w bajtach, po którego przekroczeniu segment jest zamykany.
+		progKompaktowania (int): Liczba zamkniętych, nieskompaktowanych segmentów uruchamiająca kompaktowanie.
+		oknoKompaktowania (int): Czas w sekundach od pierwszego zapisu wiersza, w którym jego kolejne rekordy są z nim scalane.
+		fakty (FaktyZastępstw): Kolumnowy magazyn faktów, uzupełniany razem z dziennikiem.
+	"""
+
+	def __init__(
+		self,
+		folder: Path,
+		maksymalnyRozmiar: int=4 * 1024 * 1024,
+		progKompaktowania: int=8,
+		oknoKompaktowania: int=14 * 24 * 3600,
+		folderFaktów: Optional[Path]=None
+	) -> None:
+		self.folder = folder
+		self.maksymalnyRozmiar = maksymalnyRozmiar
+		self.progKompaktowania = progKompaktowania
+		self.oknoKompaktowania = oknoKompaktowania
+		self.blokada = asyncio.Lock()
+		self.fakty = FaktyZastępstw(folderFaktów)
+
+	def segmenty(self) -> list[tuple[int, int, Path]]:
+		"""
+		Zwraca segmenty dziennika w kolejności zapisu, pomijając segmenty zastąpione już przez segment skompaktowany.
+
+		Returns:
+			list[tuple[int, int, Path]]: Lista krotek (pierwszy numer, ostatni numer, ścieżka).
+		"""
+
+		if not self.folder.exists():
+			return []
+
+		wszystkie = []
+
+		for ścieżka in self.folder.iterdir():
+			dopasowanie = wzórSegmentu.match(ścieżka.name)
+
+			if dopasowanie:
+				początek = int(dopasowanie.group(1))
+				koniec = int(dopasowanie.group(2) or początek)
+				wszystkie.append((początek, koniec, ścieżka))
+
+		skompaktowane = [(początek, koniec) for początek, koniec, _ in wszystkie if koniec != początek]
+		wynik = [
+			segment for segment in wszystkie
+			if not any(
+				początek <= segment[0] and segment[1] <= koniec and (początek, koniec) != (segment[0], segment[1])
+				for początek, koniec in skompaktowane
+			)
+		]
+
+		return sorted(wynik, key=lambda segment: (segment[0], -segment[1]))
+
+	def aktywnySegment(self) -> Path:
+		"""
+		Zwraca ścieżkę aktywnego (nieskompresowanego) segmentu, tworząc nowy numer, jeśli go brakuje.
+
+		Returns:
+			Path: Ścieżka aktywnego segmentu.
+		"""
+
+		segmenty = self.segmenty()
+
+		for _, _, ścieżka in reversed(segmenty):
+			if ścieżka.suffix == ".jsonl":
+				return ścieżka
+
+		numer = max((koniec for _, koniec, _ in segmenty), default=0) + 1
+		return self.folder / f"segment-{numer:06d}.jsonl"
+
+	def dopisz(self, zdarzenia: list[dict[str, Any]]) -> None:
+		"""
+		Dopisuje rekordy do aktywnego segmentu, a w razie potrzeby zamyka segment i uruchamia kompaktowanie.
+
+		Args:
+			zdarzenia (list[dict[str, Any]]): Rekordy zdarzeń do zapisania.
+		"""
+
+		self.folder.mkdir(parents=True, exist_ok=True)
+		ścieżka = self.aktywnySegment()
+
+		with open(ścieżka, "ab") as plik:
+			for zdarzenie in zdarzenia:
+				plik.write(zakoduj(zdarzenie, czytelnie=False) + b"\n")
+
+			plik.flush()
+			os.fsync(plik.fileno())
+
+		if ścieżka.stat().st_size >= self.maksymalnyRozmiar:
+			self.obróć(ścieżka)
+
+			if sum(1 for początek, koniec, nazwa in self.segmenty() if nazwa.suffix == ".gz" and początek == koniec) >= self.progKompaktowania:
+				self.kompaktuj()
+
+	def obróć(self, ścieżka: Path) -> None:
+		"""
+		Zamyka segment, kompresując go do pliku `.jsonl.gz`.
+
+		Args:
+			ścieżka (Path): Ścieżka zamykanego segmentu.
+		"""
+
+		skompresowany = ścieżka.with_suffix(".jsonl.gz")
+		tymczasowy = ścieżka.with_suffix(".jsonl.gz.tmp")
+
+		with open(ścieżka, "rb") as źródło, gzip.open(tymczasowy, "wb") as cel:
+			while blok := źródło.read(1024 * 1024):
+				cel.write(blok)
+
+		os.replace(str(tymczasowy), str(skompresowany))
+		ścieżka.unlink()
+
+	def kompaktuj(self) -> int:
+		"""
+		Strumieniowo scala wszystkie zamknięte segmenty w jeden, łącząc rekordy tego samego wiersza zastępstwa
+		(najnowszy rekord i suma list powiadomionych serwerów). Wiersz zastępstwa jest wykrywany ponownie tylko dopóki
+		widnieje na stronie szkoły, dlatego w pamięci przechowywane są wyłącznie wiersze z okna kompaktowania, a starsze
+		trafiają od razu do nowego segmentu. Rekord powtórzony po upływie okna pozostaje osobnym rekordem, który czytelnicy
+		dziennika i tak pomijają według skrótu. Zastąpione segmenty usuwane są dopiero po zapisaniu nowego segmentu.
+
+		Returns:
+			int: Liczba rekordów w skompaktowanym segmencie.
+		"""
+
+		zamknięte = [segment for segment in self.segmenty() if segment[2].suffix == ".gz"]
+
+		if len(zamknięte) < 2:
+			return 0
+
+		początek = zamknięte[0][0]
+		koniec = zamknięte[-1][1]
+		ścieżka = self.folder / f"segment-{początek:06d}-{koniec:06d}.jsonl.gz"
+		tymczasowy = ścieżka.with_suffix(".gz.tmp")
+		oczekujące = OrderedDict()
+		zapisane = 0
+
+		with gzip.open(tymczasowy, "wb") as plik:
+			for zdarzenie in self.czytajSegmenty(ścieżka for _, _, ścieżka in zamknięte):
+				skrót = zdarzenie.get("h")
+				utworzono = int(zdarzenie.get("c", 0) or 0)
+
+				if skrót in oczekujące:
+					pierwszyZapis, poprzednie = oczekujące[skrót]
+					zdarzenie["g"] = sorted(set(poprzednie.get("g", [])) | set(zdarzenie.get("g", [])))
+					oczekujące[skrót] = (pierwszyZapis, zdarzenie)
+				else:
+					oczekujące[skrót] = (utworzono, zdarzenie)
+
+				while oczekujące and next(iter(oczekujące.values()))[0] < utworzono - self.oknoKompaktowania:
+					plik.write(zakoduj(oczekujące.popitem(last=False)[1][1], czytelnie=False) + b"\n")
+					zapisane += 1
+
+			for _, zdarzenie in oczekujące.values():
+				plik.write(zakoduj(zdarzenie, czytelnie=False) + b"\n")
+				zapisane += 1
+
+		os.replace(str(tymczasowy), str(ścieżka))
+
+		for _, _, stary in zamknięte:
+			if stary != ścieżka:
+				stary.unlink(missing_ok=True)
+
+		logiKonsoli.info(
+			f"Skompaktowano {len(zamknięte)} segmentów dziennika zastępstw do {ścieżka.name} ({zapisane} rekordów)."
+		)
+		return zapisane
+
+	@staticmethod
+	def czytajSegmenty(ścieżki) -> Iterator[dict[str, Any]]:
+		"""
+		Strumieniowo odczytuje rekordy z podanych segmentów, linia po linii.
+
+		Args:
+			ścieżki (Iterable[Path]): Ścieżki segmentów w kolejności zapisu.
+
+		Yields:
+			dict[str, Any]: Kolejne rekordy zdarzeń.
+		"""
+
+		for ścieżka in ścieżki:
+			otwórz = gzip.open if ścieżka.suffix == ".gz" else open
+
+			try:
+				with otwórz(ścieżka, "rb") as plik:
+					for linia in plik:
+						try:
+							yield odkoduj(linia)
+						except BłędyDekodowania:
+							continue
+			except (OSError, EOFError) as e:
+				logiKonsoli.warning(
+					f"Nie udało się odczytać segmentu dziennika zastępstw ({ścieżka}). Więcej informacji: {e}"
+				)
+
+	def czytaj(self) -> Iterator[dict[str, Any]]:
+		"""
+		Strumieniowo odczytuje wszystkie rekordy dziennika, bez wczytywania całości do pamięci.
+
+		Yields:
+			dict[str, Any]: Kolejne rekordy zdarzeń.
+		"""
+
+		yield from self.czytajSegmenty(ścieżka for _, _, ścieżka in self.segmenty())
+
+	def przepisz(self, przekształć: Callable[[dict[str, Any]], Optional[dict[str, Any]]]) -> int:
+		"""
+		Strumieniowo przepisuje wszystkie segmenty dziennika, przekształcając każdy rekord. Segment zastępowany jest
+		nowym plikiem tylko wtedy, gdy którykolwiek z jego rekordów uległ zmianie.
+
+		Args:
+			przekształć (Callable[[dict[str, Any]], Optional[dict[str, Any]]]): Funkcja zwracająca nowy rekord lub None, jeśli rekord ma zostać usunięty.
+
+		Returns:
+			int: Liczba usuniętych rekordów.
+		"""
+
+		usunięte = 0
+
+		for _, _, ścieżka in self.segmenty():
+			tymczasowy = ścieżka.with_name(f"{ścieżka.name}.tmp")
+			otwórz = gzip.open if ścieżka.suffix == ".gz" else open
+			zmieniono = False
+
+			with otwórz(tymczasowy, "wb") as plik:
+				for zdarzenie in self.czytajSegmenty((ścieżka,)):
+					nowe = przekształć(dict(zdarzenie))
+
+					if nowe is None:
+						usunięte += 1
+						zmieniono = True
+						continue
+
+					zmieniono = zmieniono or nowe != zdarzenie
+					plik.write(zakoduj(nowe, czytelnie=False) + b"\n")
+
+			if zmieniono:
+				os.replace(str(tymczasowy), str(ścieżka))
+			else:
+				tymczasowy.unlink()
+
+		return usunięte
+
+	def przebudujFakty(self) -> int:
+		"""
+		Buduje magazyn faktów od nowa z aktualnej zawartości dziennika.
+
+		Returns:
+			int: Liczba faktów w magazynie.
+		"""
+
+		self.fakty.wyczyść()
+		return self.fakty.dopisz(self.czytaj())
+
+	async def usuńRekordy(
+		self,
+		przekształć: Callable[[dict[str, Any]], Optional[dict[str, Any]]],
+		opis: str
+	) -> int:
+		"""
+		Przepisuje dziennik w osobnym wątku, a jeśli usunięto jakiekolwiek rekordy, przebudowuje również magazyn faktów.
+
+		Args:
+			przekształć (Callable[[dict[str, Any]], Optional[dict[str, Any]]]): Funkcja przekazywana do `przepisz`.
+			opis (str): Opis operacji w logach.
+
+		Returns:
+			int: Liczba usuniętych rekordów.
+		"""
+
+		async with self.blokada:
+			try:
+				usunięte = await asyncio.to_thread(self.przepisz, przekształć)
+
+				if usunięte:
+					await asyncio.to_thread(self.przebudujFakty)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas usuwania danych z dziennika zastępstw ({opis}). Więcej informacji: {e}"
+				)
+				return 0
+
+		if usunięte:
+			logiKonsoli.info(
+				f"Usunięto dane z dziennika zastępstw ({opis}). Usunięte rekordy: {usunięte}."
+			)
+
+		return usunięte
+
+	async def usuńSerwer(self, identyfikatorSerwera: str) -> int:
+		"""
+		Usuwa ID serwera Discord z list powiadomionych serwerów. Rekordy, które nie zostały dostarczone do żadnego
+		innego serwera, usuwane są w całości razem z ich faktami.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+
+		Returns:
+			int: Liczba usuniętych rekordów.
+		"""
+
+		identyfikatorSerwera = str(identyfikatorSerwera)
+
+		def przekształć(zdarzenie: dict[str, Any]) -> Optional[dict[str, Any]]:
+			"""
+			Funkcja pomocnicza usuwająca serwer z rekordu.
+			"""
+
+			if identyfikatorSerwera not in zdarzenie.get("g", []):
+				return zdarzenie
+
+			zdarzenie["g"] = [serwer for serwer in zdarzenie["g"] if serwer != identyfikatorSerwera]
+			return zdarzenie if zdarzenie["g"] else None
+
+		return await self.usuńRekordy(przekształć, f"serwer o ID {identyfikatorSerwera}")
+
+	async def usuńStarsze(self, od: str) -> int:
+		"""
+		Usuwa z dziennika i magazynu faktów rekordy zastępstw z datą wcześniejszą niż podana.
+
+		Args:
+			od (str): Data w formacie ISO, od której rekordy są zachowywane.
+
+		Returns:
+			int: Liczba usuniętych rekordów.
+		"""
+
+		return await self.usuńRekordy(lambda zdarzenie: zdarzenie if zdarzenie.get("d", "") >= od else None, f"zastępstwa sprzed {od}")
+
+	def przeliczStatystyki(
+		self,
+		identyfikatorSerwera: str,
+		od: Optional[str]=None
+	) -> tuple[int, dict[str, int]]:
+		"""
+		Przelicza od zera licznik zastępstw i statystyki nauczycieli dla serwera na podstawie dziennika.
+		Powtórnie wykryte wiersze zastępstw liczone są jeden raz.
+
+		Args:
+			identyfikatorSerwera (str): ID serwera Discord.
+			od (Optional[str]): Data w formacie ISO, od której liczone są zastępstwa (np. początek roku szkolnego).
+
+		Returns:
+			tuple[int, dict[str, int]]: Licznik zastępstw i słownik statystyk nauczycieli.
+		"""
+
+		identyfikatorSerwera = str(identyfikatorSerwera)
+		widziane = set()
+		statystyki = Counter()
+
+		for zdarzenie in self.czytaj():
+			if identyfikatorSerwera not in zdarzenie.get("g", []) or (od and zdarzenie.get("d", "") < od):
+				continue
+
+			if zdarzenie.get("h") in widziane:
+				continue
+
+			widziane.add(zdarzenie.get("h"))
+			statystyki[zdarzenie.get("n", "")] += 1
+
+		return sum(statystyki.values()), dict(statystyki)
+
+	def zliczTygodniowo(
+		self,
+		szkoła: Optional[str]=None
+	) -> dict[str, int]:
+		"""
+		Zlicza unikalne zastępstwa w poszczególnych tygodniach (ISO).
+
+		Args:
+			szkoła (Optional[str]): ID szkoły. Domyślnie wszystkie szkoły.
+
+		Returns:
+			dict[str, int]: Liczba zastępstw według tygodnia w formacie YYYY-Www.
+		"""
+
+		widziane = set()
+		tygodnie = Counter()
+
+		for zdarzenie in self.czytaj():
+			if (szkoła and zdarzenie.get("s") != szkoła) or zdarzenie.get("h") in widziane:
+				continue
+
+			widziane.add(zdarzenie.get("h"))
+
+			try:
+				rok, tydzień, _ = date.fromisoformat(zdarzenie.get("d", "")).isocalendar()
+			except ValueError:
+				continue
+
+			tygodnie[f"{rok}-W{tydzień:02d}"] += 1
+
+		return dict(sorted(tygodnie.items()))
+
+	async def dopiszZdarzenia(self, zdarzenia: list[dict[str, Any]]) -> None:
+		"""
+		Asynchronicznie dopisuje rekordy zdarzeń do dziennika, wykonując operacje plikowe w osobnym wątku.
+
+		Args:
+			zdarzenia (list[dict[str, Any]]): Rekordy zdarzeń do zapisania.
+		"""
+
+		if not zdarzenia:
+			return
+
+		async with self.blokada:
+			try:
+				await asyncio.to_thread(self.dopisz, zdarzenia)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas zapisywania zdarzeń do dziennika zastępstw. Więcej informacji: {e}"
+				)
+
+			try:
+				await asyncio.to_thread(self.fakty.dopisz, zdarzenia)
+			except Exception as e:
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas zapisywania faktów zastępstw. Więcej informacji: {e}"
+				)
+
+	async def wczytajFakty(self) -> int:
+		"""
+		Wczytuje kolumnowy magazyn faktów, a jeśli jeszcze nie istnieje, jednorazowo buduje go z segmentów dziennika.
+
+		Returns:
+			int: Liczba faktów w magazynie.
+		"""
+
+		async with self.blokada:
+			wczytane = await asyncio.to_thread(self.fakty.wczytaj)
+
+			if not wczytane and self.segmenty():
+				wczytane = await asyncio.to_thread(self.fakty.dopisz, self.czytaj())
+				logiKonsoli.info(
+					f"Zbudowano magazyn faktów zastępstw z dziennika zastępstw ({wczytane} faktów)."
+				)
+
+		return wczytane
+
+# Globalny dziennik zdarzeń zastępstw
+dziennikZastępstw = DziennikZastępstw(folderDanych / "historia", folderFaktów=folderDanych / "fakty")
@@ -11,32 +11,126 @@
 #
 
 # Standardowe biblioteki
+import atexit
+from datetime import (
+	datetime,
+	timezone
+)
+import gzip
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+	QueueListener,
+	RotatingFileHandler
+)
+import os
 from pathlib import Path
-from typing import Optional
+import queue
+import shutil
+from typing import (
+	TYPE_CHECKING,
+	Any,
+	Optional
+)
 
 # Zewnętrzne biblioteki
-import discord
+if TYPE_CHECKING:
+	import discord
 
 # Wewnętrzne importy
+from src.classes.logs import (
+	FiltrPowtórzeń,
+	FormatJSON,
+	KolejkaLogów,
+	LeniwaWiadomość
+)
 from src.classes.timezone import Timezone
 
+# Globalne loggery konsoli i poleceń, których obsługa plików dodawana jest dopiero przez `skonfigurujLogi`
+logiKonsoli = logging.getLogger("discord")
+logiPoleceń = logging.getLogger("discord.commands")
+
+# Informacja, czy obsługa pliku logów została już dodana
+skonfigurowano = False
+
+# Wątek zapisujący wpisy z kolejki logów do pliku
+słuchaczLogów: Optional[QueueListener] = None
+
+# Filtr zwijający powtarzające się ostrzeżenia i błędy w okresowe podsumowania
+filtrPowtórzeń = FiltrPowtórzeń()
+
+def nazwijArchiwum(nazwa: str) -> str:
+	"""
+	Nadaje archiwalnym (zrotowanym) plikom logów rozszerzenie `.gz`.
+
+	Args:
+		nazwa (str): Domyślna nazwa pliku archiwalnego, np. `console.log.1`.
+
+	Returns:
+		str: Nazwa skompresowanego pliku archiwalnego.
+	"""
+
+	return f"{nazwa}.gz"
+
+
+def skompresujArchiwum(
+	źródło: str,
+	cel: str
+) -> None:
+	"""
+	Kompresuje zrotowany plik logów do archiwum gzip i usuwa oryginał. Wywoływana jest podczas rotacji w wątku
+	`QueueListener`, więc kompresja nie blokuje pętli zdarzeń, a wpisy zgłoszone w tym czasie czekają w kolejce.
+
+	Args:
+		źródło (str): Ścieżka pliku logów przed rotacją.
+		cel (str): Ścieżka docelowego archiwum.
+	"""
+
+	with open(źródło, "rb") as plik, gzip.open(cel, "wb", compresslevel=6) as archiwum:
+		shutil.copyfileobj(plik, archiwum, 1024 * 1024)
+
+	os.remove(źródło)
+
+
+def zatrzymajLogi() -> None:
+	"""
+	Zatrzymuje wątek zapisujący logi, zapisując wcześniej wszystkie wpisy oczekujące w kolejce. Wywoływana automatycznie przy zamykaniu procesu.
+	"""
+
+	global słuchaczLogów
+
+	if słuchaczLogów is None:
+		return
+
+	filtrPowtórzeń.podsumuj()
+	słuchaczLogów.stop()
+
+	for obsługa in słuchaczLogów.handlers:
+		obsługa.close()
+
+	słuchaczLogów = None
+
+
 def skonfigurujLogi() -> tuple[logging.Logger, logging.Logger]:
 	"""
-	Konfiguruje globalne logowanie wydarzeń konsoli (`logiKonsoli`) i poleceń (`logiPoleceń`).
+	Konfiguruje globalne logowanie wydarzeń konsoli (`logiKonsoli`) i poleceń (`logiPoleceń`). Tworzy folder `logs`
+	i dodaje obsługę pliku logów tylko przy pierwszym wywołaniu.
+
+	Loggery przekazują wpisy jedynie do kolejki w pamięci, a formatowanie (wraz ze śladami błędów), zapis do pliku,
+	rotacja i kompresja archiwów odbywają się w osobnym wątku `QueueListener`, poza pętlą zdarzeń.
 
 	Returns:
 		tuple[logging.Logger, logging.Logger]: Logger konsoli `(logiKonsoli)` i logger poleceń `(logiPoleceń)`.
 	"""
 
+	global skonfigurowano, słuchaczLogów
+
+	if skonfigurowano:
+		return logiKonsoli, logiPoleceń
+
 	folderLogów = Path("logs")
 	folderLogów.mkdir(exist_ok=True)
 
-	logiKonsoli = logging.getLogger("discord")
 	logiKonsoli.setLevel(logging.INFO)
-
-	logiPoleceń = logging.getLogger("discord.commands")
 	logiPoleceń.setLevel(logging.INFO)
 
 	ścieżkaLogów = folderLogów / "console.log"
@@ -48,20 +142,117 @@ def skonfigurujLogi() -> tuple[logging.Logger, logging.Logger]:
 		backupCount=31
 	)
 
+	obsługaLogów.namer = nazwijArchiwum
+	obsługaLogów.rotator = skompresujArchiwum
+
 	formatter = Timezone("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 	obsługaLogów.setFormatter(formatter)
 
-	logiKonsoli.addHandler(obsługaLogów)
-	logiPoleceń.addHandler(obsługaLogów)
+	kolejkaLogów = KolejkaLogów(queue.SimpleQueue())
+	filtrPowtórzeń.cel = kolejkaLogów.enqueue
+	kolejkaLogów.addFilter(filtrPowtórzeń)
+	słuchaczLogów = QueueListener(kolejkaLogów.queue, obsługaLogów, respect_handler_level=True)
+	słuchaczLogów.start()
+	atexit.register(zatrzymajLogi)
+
+	logiKonsoli.addHandler(kolejkaLogów)
+	logiPoleceń.addHandler(kolejkaLogów)
 	logiPoleceń.propagate = False
 
+	# Logi rdzenia (`src.core`) niezależnego od biblioteki discord.py
+	logiRdzenia = logging.getLogger("zastepstwa")
+	logiRdzenia.setLevel(logging.INFO)
+	logiRdzenia.addHandler(kolejkaLogów)
+
+	skonfigurowano = True
+
 	return logiKonsoli, logiPoleceń
 
-logiKonsoli, logiPoleceń = skonfigurujLogi()
+
+def zastosujUstawieniaLogów(ustawienia: dict[str, Any]) -> None:
+	"""
+	Stosuje ustawienia logów z pliku konfiguracyjnego, wczytywanego dopiero po skonfigurowaniu logów:
+	format pliku logów (`logi-json`) i długość okna zwijania powtórzeń (`okno-powtorzen-logow`, 0 wyłącza zwijanie).
+
+	Args:
+		ustawienia (dict[str, Any]): Globalny słownik konfiguracji.
+	"""
+
+	try:
+		filtrPowtórzeń.okno = max(0.0, float(ustawienia.get("okno-powtorzen-logow", 300)))
+	except (TypeError, ValueError):
+		logiKonsoli.warning(
+			"Nieprawidłowa wartość „okno-powtorzen-logow” w pliku konfiguracyjnym. Użyto domyślnego okna 300 sekund."
+		)
+		filtrPowtórzeń.okno = 300.0
+
+	if słuchaczLogów is None:
+		return
+
+	for obsługa in słuchaczLogów.handlers:
+		if ustawienia.get("logi-json", False) is True:
+			obsługa.setFormatter(FormatJSON())
+		else:
+			obsługa.setFormatter(Timezone("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+
+def opiszPolecenie(
+	użytkownik: str,
+	identyfikatorUżytkownika: Any,
+	nazwaPolecenia: str,
+	miejsce: Optional[tuple[Any, ...]],
+	opcje: tuple[tuple[Any, Any], ...],
+	sukces: bool,
+	wiadomośćBłędu: Optional[str]
+) -> str:
+	"""
+	Buduje treść wpisu logów polecenia. Wywoływana leniwie, dopiero w wątku zapisującym logi.
+
+	Args:
+		użytkownik (str): Nazwa użytkownika.
+		identyfikatorUżytkownika (Any): ID użytkownika.
+		nazwaPolecenia (str): Nazwa wywołanego polecenia.
+		miejsce (Optional[tuple[Any, ...]]): Nazwa i ID serwera oraz nazwa i ID kanału, pusta krotka dla wiadomości prywatnej lub None, jeśli nie udało się ich odczytać.
+		opcje (tuple[tuple[Any, Any], ...]): Nazwy i wartości użytych argumentów.
+		sukces (bool): Informuje, czy polecenie zostało wykonane pomyślnie.
+		wiadomośćBłędu (Optional[str]): Wiadomość błędu w przypadku niepowodzenia polecenia.
+
+	Returns:
+		str: Treść wpisu logów.
+	"""
+
+	status = "pomyślnie" if sukces else "niepomyślnie"
+	informacjaBłędu = (
+		f" ({wiadomośćBłędu})"
+		if wiadomośćBłędu else ""
+	)
+	użyteArgumenty = (
+		"Użyte argumenty: " + ", ".join(f"{nazwa} ({wartość})" for nazwa, wartość in opcje) + ". "
+		if opcje else ""
+	)
+
+	if miejsce:
+		nazwaSerwera, identyfikatorSerwera, nazwaKanału, identyfikatorKanału = miejsce
+		miejsce = (
+			f"na serwerze „{nazwaSerwera}” (ID: {identyfikatorSerwera}) "
+			f"na kanale tekstowym #{nazwaKanału} (ID: {identyfikatorKanału}). "
+		)
+	elif miejsce is not None:
+		miejsce = "w wiadomości prywatnej. "
+	else:
+		miejsce = ""
+
+	return (
+		f"Użytkownik: {użytkownik} (ID: {identyfikatorUżytkownika}) "
+		f"wywołał polecenie „{nazwaPolecenia}” "
+		f"{miejsce}"
+		f"{użyteArgumenty}"
+		f"Polecenie wykonane {status}.{informacjaBłędu}"
+	)
 
 
 def logujPolecenia(
-	interaction: discord.Interaction,
+	interaction: "discord.Interaction",
 	sukces: bool,
 	wiadomośćBłędu: Optional[str] = None
 ) -> None:
@@ -74,41 +265,47 @@ def logujPolecenia(
 		wiadomośćBłędu (str, optional): Wiadomość błędu w przypadku niepowodzenia polecenia.
 	"""
 
-	status = "pomyślnie" if sukces else "niepomyślnie"
-	informacjaBłędu = (
-		f" ({wiadomośćBłędu})"
-		if wiadomośćBłędu else ""
-	)
 	opcje = (
 		getattr(interaction, "data", {}).get("options", [])
 		if interaction else []
 	)
-	użyteArgumenty = (
-		"Użyte argumenty: " + ", ".join(f"{opcja.get('name', '')} ({opcja.get('value', '')})" for opcja in opcje) + ". "
-		if opcje else ""
-	)
 
 	try:
 		if getattr(interaction, "guild", None):
-			miejsce = (
-				f"na serwerze „{interaction.guild.name}” (ID: {interaction.guild.id}) "
-				f"na kanale tekstowym #{getattr(interaction.channel, 'name', 'N/A')} (ID: {getattr(interaction.channel, 'id', 'N/A')}). "
-			)
+			miejsce = (interaction.guild.name, interaction.guild.id, getattr(interaction.channel, "name", "N/A"), getattr(interaction.channel, "id", "N/A"))
 		else:
-			miejsce = "w wiadomości prywatnej. "
+			miejsce = ()
 	except Exception:
-		miejsce = ""
+		miejsce = None
 
 	nazwaPolecenia = getattr(
 		getattr(interaction, "command", None), "name", getattr(interaction, "command_name", "Brak nazwy")
 	)
 	użytkownik = f"{getattr(interaction, 'user', 'Nieznany użytkownik')}"
 	identyfikatorUżytkownika = getattr(getattr(interaction, "user", None), "id", "Brak ID")
-	wiadomośćLogu = (
-		f"Użytkownik: {użytkownik} (ID: {identyfikatorUżytkownika}) "
-		f"wywołał polecenie „{nazwaPolecenia}” "
-		f"{miejsce}"
-		f"{użyteArgumenty}"
-		f"Polecenie wykonane {status}.{informacjaBłędu}"
-	)
-	logiPoleceń.info(wiadomośćLogu)
\ No newline at end of file
+
+	try:
+		czasTrwania = round((datetime.now(timezone.utc) - interaction.created_at).total_seconds() * 1000, 1)
+	except Exception:
+		czasTrwania = None
+
+	logiPoleceń.info(
+		LeniwaWiadomość(
+			opiszPolecenie,
+			użytkownik,
+			identyfikatorUżytkownika,
+			nazwaPolecenia,
+			miejsce,
+			tuple((opcja.get("name", ""), opcja.get("value", "")) for opcja in opcje),
+			sukces,
+			wiadomośćBłędu
+		),
+		extra={
+			"event": "polecenie",
+			"guild": getattr(getattr(interaction, "guild", None), "id", None),
+			"duration_ms": czasTrwania,
+			"command": nazwaPolecenia,
+			"user": identyfikatorUżytkownika,
+			"success": sukces
+		}
+	)
\ No newline at end of file
@@ -0,0 +1,155 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import json
+import logging
+from typing import (
+	Awaitable,
+	Callable,
+	Optional
+)
+
+# Zewnętrzne biblioteki
+from aiohttp import web
+import discord
+
+# Wewnętrzne importy
+from src.core.metrics import (
+	metryki,
+	oczekiwanieLimitów,
+	odpowiedzi429
+)
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.health import raportZdrowia
+from src.handlers.logging import logiKonsoli
+
+def zliczLimity(record: logging.LogRecord) -> bool:
+	"""
+	Filtr loggera `discord.http` zliczający odpowiedzi 429 i czas oczekiwania na zniesienie limitów.
+	discord.py obsługuje limity samodzielnie, a jedynym śladem każdej odpowiedzi 429 jest ostrzeżenie w tym loggerze.
+
+	Args:
+		record (logging.LogRecord): Wpis logów discord.py.
+
+	Returns:
+		bool: Zawsze True - wpis nie jest odrzucany.
+	"""
+
+	if record.levelno >= logging.WARNING and isinstance(record.msg, str) and "responded with 429" in record.msg:
+		odpowiedzi429.zwiększ(zrodlo="discord")
+
+		if "Retrying in" in record.msg and record.args:
+			try:
+				oczekiwanieLimitów.zwiększ(float(record.args[-1]))
+			except (TypeError, ValueError):
+				pass
+
+	return True
+
+
+async def obsłużMetryki(request: web.Request) -> web.Response:
+	"""
+	Zwraca wszystkie metryki procesu w formacie tekstowym Prometheusa.
+
+	Args:
+		request (web.Request): Żądanie HTTP.
+
+	Returns:
+		web.Response: Odpowiedź z metrykami.
+	"""
+
+	return web.Response(text=metryki.eksportuj(), content_type="text/plain", charset="utf-8", headers={"X-Content-Type-Options": "nosniff"})
+
+
+def obsłużZdrowie(
+	bot: discord.Client,
+	gotowość: bool
+) -> Callable[[web.Request], Awaitable[web.Response]]:
+	"""
+	Tworzy obsługę punktu końcowego `/health` (żywotność) lub `/ready` (gotowość). Oba zwracają pełny raport zdrowia
+	w formacie JSON, a różnią się kodem odpowiedzi: 503 oznacza odpowiednio zamknięty lub niegotowy bot.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		gotowość (bool): Czy kod odpowiedzi ma zależeć od gotowości zamiast od żywotności.
+
+	Returns:
+		Callable[[web.Request], Awaitable[web.Response]]: Funkcja obsługująca żądanie.
+	"""
+
+	async def obsłuż(request: web.Request) -> web.Response:
+		żywy, gotowy, raport = raportZdrowia(bot)
+		return web.Response(
+			text=json.dumps(raport, ensure_ascii=False, indent=4),
+			status=200 if (gotowy if gotowość else żywy) else 503,
+			content_type="application/json",
+			charset="utf-8",
+			headers={"Cache-Control": "no-store"}
+		)
+
+	return obsłuż
+
+
+async def uruchomSerwerMetryk(bot: discord.Client) -> Optional[web.AppRunner]:
+	"""
+	Włącza zliczanie limitów Discorda i - jeśli w pliku konfiguracyjnym ustawiono `port-metryk` - uruchamia lokalny
+	serwer HTTP z punktami końcowymi `/metrics`, `/health` i `/ready` na adresie `adres-metryk` (domyślnie 127.0.0.1).
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord, której stan raportują punkty końcowe zdrowia.
+
+	Returns:
+		Optional[web.AppRunner]: Uruchomiony serwer lub None, jeśli punkt końcowy jest wyłączony albo nie udało się go uruchomić.
+	"""
+
+	loggerHTTP = logging.getLogger("discord.http")
+
+	if zliczLimity not in loggerHTTP.filters:
+		loggerHTTP.addFilter(zliczLimity)
+
+	ustawienia = pobierzMigawkę().ustawienia
+
+	try:
+		port = int(ustawienia.get("port-metryk", 0) or 0)
+	except (TypeError, ValueError):
+		logiKonsoli.warning(
+			"Nieprawidłowa wartość „port-metryk” w pliku konfiguracyjnym. Punkt końcowy metryk nie zostanie uruchomiony."
+		)
+		return None
+
+	if port <= 0:
+		return None
+
+	adres = str(ustawienia.get("adres-metryk", "127.0.0.1") or "127.0.0.1")
+	aplikacja = web.Application()
+	aplikacja.router.add_get("/metrics", obsłużMetryki)
+	aplikacja.router.add_get("/health", obsłużZdrowie(bot, gotowość=False))
+	aplikacja.router.add_get("/ready", obsłużZdrowie(bot, gotowość=True))
+	serwer = web.AppRunner(aplikacja, access_log=None)
+
+	try:
+		await serwer.setup()
+		await web.TCPSite(serwer, adres, port).start()
+	except Exception as e:
+		logiKonsoli.exception(
+			f"Nie udało się uruchomić punktu końcowego metryk na {adres}:{port}. Więcej informacji: {e}"
+		)
+		await serwer.cleanup()
+		return None
+
+	logiKonsoli.info(
+		f"Uruchomiono punkt końcowy metryk pod adresem http://{adres}:{port}/metrics."
+	)
+
+	return serwer
@@ -77,7 +77,8 @@ async def wyślijAktualizacje(
 					pass
 			else:
 				logiKonsoli.warning(
-					f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
+					f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta.",
+					extra={"event": "brak-uprawnien-everyone", "guild": identyfikatorSerwera}
 				)
 
 			embed = discord.Embed(
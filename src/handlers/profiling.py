@@ -0,0 +1,312 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+import contextlib
+import cProfile
+from datetime import datetime
+import io
+from pathlib import Path
+import pstats
+import signal
+import time
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+# Zewnętrzne biblioteki (opcjonalne)
+try:
+	import pyinstrument
+except ImportError:
+	pyinstrument = None
+
+# Wewnętrzne importy
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.logging import logiKonsoli
+
+# Folder, do którego zapisywane są wyniki profilowania
+folderProfili = Path("logs") / "profiles"
+
+# Liczba funkcji wypisywanych w podsumowaniu profilu
+liczbaFunkcji = 30
+
+class SesjaProfilowania():
+	"""
+	Pojedyncza sesja profilowania (jeden cykl aktualizacji lub jedno polecenie). Korzysta z próbkującego profilera
+	`pyinstrument`, jeśli jest zainstalowany, a w przeciwnym razie z wbudowanego `cProfile`.
+
+	Attributes:
+		rodzaj (str): Rodzaj profilowanej operacji (`cykl` lub `polecenie`).
+		nazwa (str): Nazwa profilowanej operacji.
+		początek (datetime): Czas rozpoczęcia sesji.
+		czasTrwania (float): Czas trwania sesji w sekundach (po jej zatrzymaniu).
+		profiler (cProfile.Profile | pyinstrument.Profiler): Profiler sesji.
+		startCzasu (float): Odczyt `time.perf_counter()` w chwili uruchomienia profilera.
+	"""
+
+	__slots__ = ("rodzaj", "nazwa", "początek", "czasTrwania", "profiler", "startCzasu")
+
+	def __init__(
+		self,
+		rodzaj: str,
+		nazwa: str
+	) -> None:
+		self.rodzaj = rodzaj
+		self.nazwa = nazwa
+		self.początek = datetime.now(ZoneInfo("Europe/Warsaw"))
+		self.czasTrwania = 0.0
+		self.profiler = pyinstrument.Profiler(interval=0.001, async_mode="disabled") if pyinstrument is not None else cProfile.Profile()
+		self.startCzasu = 0.0
+
+	def uruchom(self) -> None:
+		"""
+		Rozpoczyna zbieranie danych przez profiler.
+		"""
+
+		self.startCzasu = time.perf_counter()
+
+		if pyinstrument is not None:
+			self.profiler.start()
+		else:
+			self.profiler.enable()
+
+	def zatrzymaj(self) -> None:
+		"""
+		Kończy zbieranie danych przez profiler.
+		"""
+
+		if pyinstrument is not None:
+			self.profiler.stop()
+		else:
+			self.profiler.disable()
+
+		self.czasTrwania = time.perf_counter() - self.startCzasu
+
+	def zapisz(self, folder: Path) -> list[Path]:
+		"""
+		Zapisuje wynik sesji: stosy w formacie collapsed (`pyinstrument`) lub plik pstats (`cProfile`)
+		oraz tekstowe podsumowanie najbardziej kosztownych funkcji. Wywoływana poza pętlą zdarzeń.
+
+		Args:
+			folder (Path): Folder docelowy.
+
+		Returns:
+			list[Path]: Ścieżki zapisanych plików.
+		"""
+
+		folder.mkdir(parents=True, exist_ok=True)
+		nazwaPliku = "".join(znak if znak.isalnum() or znak in "-_" else "_" for znak in self.nazwa)
+		przedrostek = folder / f"{self.początek.strftime('%Y%m%d-%H%M%S')}{self.początek.microsecond // 1000:03d}-{self.rodzaj}-{nazwaPliku}"
+		nagłówek = f"Profil: {self.rodzaj} {self.nazwa}\nRozpoczęto: {self.początek.isoformat(timespec='seconds')}\nCzas trwania: {self.czasTrwania:.3f} s\n\n"
+
+		if pyinstrument is not None:
+			stosy, czasyWłasne = zwińStosy(self.profiler.last_session.root_frame() if self.profiler.last_session else None)
+			plikStosów = przedrostek.with_suffix(".collapsed")
+			plikStosów.write_text("".join(f"{stos} {waga}\n" for stos, waga in stosy.items()), encoding="utf-8")
+
+			najdroższe = sorted(czasyWłasne.items(), key=lambda element: element[1], reverse=True)[:liczbaFunkcji]
+			podsumowanie = nagłówek + "Funkcje o największym czasie własnym (ms):\n" + "".join(
+				f"{czas / 1000:>12.1f}  {funkcja}\n" for funkcja, czas in najdroższe
+			) + "\n" + self.profiler.output_text(unicode=True, color=False)
+		else:
+			plikStosów = przedrostek.with_suffix(".pstats")
+			self.profiler.dump_stats(plikStosów)
+
+			bufor = io.StringIO()
+			statystyki = pstats.Stats(self.profiler, stream=bufor)
+			statystyki.sort_stats(pstats.SortKey.TIME).print_stats(liczbaFunkcji)
+			statystyki.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(liczbaFunkcji)
+			podsumowanie = nagłówek + bufor.getvalue()
+
+		plikPodsumowania = przedrostek.with_suffix(".txt")
+		plikPodsumowania.write_text(podsumowanie, encoding="utf-8")
+		return [plikStosów, plikPodsumowania]
+
+
+class ProfilerNaŻądanie():
+	"""
+	Tryb profilowania włączany na żądanie (sygnałem `SIGUSR1` lub poleceniem `/profiluj`) dla kolejnych cykli
+	aktualizacji i wywołań poleceń. Gdy tryb jest wyłączony, sprawdzenie sprowadza się do porównania liczników z zerem.
+	Jednocześnie aktywna może być tylko jedna sesja, ponieważ profiler obejmuje cały wątek pętli zdarzeń.
+
+	Attributes:
+		pozostałeCykle (int): Liczba cykli aktualizacji, które zostaną jeszcze sprofilowane.
+		pozostałePolecenia (int): Liczba wywołań poleceń, które zostaną jeszcze sprofilowane.
+		aktywnaSesja (Optional[SesjaProfilowania]): Aktualnie trwająca sesja profilowania.
+	"""
+
+	__slots__ = ("pozostałeCykle", "pozostałePolecenia", "aktywnaSesja")
+
+	def __init__(self) -> None:
+		self.pozostałeCykle = 0
+		self.pozostałePolecenia = 0
+		self.aktywnaSesja: Optional[SesjaProfilowania] = None
+
+	def włącz(
+		self,
+		cykle: Optional[int]=None,
+		polecenia: Optional[int]=None
+	) -> tuple[int, int]:
+		"""
+		Włącza profilowanie kolejnych cykli aktualizacji i wywołań poleceń. Pominięte liczby przyjmują wartości
+		`profilowane-cykle` i `profilowane-polecenia` z pliku konfiguracyjnego.
+
+		Args:
+			cykle (Optional[int]): Liczba cykli aktualizacji do sprofilowania.
+			polecenia (Optional[int]): Liczba wywołań poleceń do sprofilowania.
+
+		Returns:
+			tuple[int, int]: Ustawione liczby cykli i poleceń.
+		"""
+
+		ustawienia = pobierzMigawkę().ustawienia
+
+		try:
+			self.pozostałeCykle = max(0, int(cykle if cykle is not None else ustawienia.get("profilowane-cykle", 3)))
+			self.pozostałePolecenia = max(0, int(polecenia if polecenia is not None else ustawienia.get("profilowane-polecenia", 10)))
+		except (TypeError, ValueError):
+			self.pozostałeCykle, self.pozostałePolecenia = 3, 10
+
+		logiKonsoli.info(
+			f"Włączono profilowanie {self.pozostałeCykle} cykli aktualizacji i {self.pozostałePolecenia} wywołań poleceń ({'pyinstrument' if pyinstrument is not None else 'cProfile'}). Wyniki zostaną zapisane w folderze {folderProfili}.",
+			extra={"event": "profilowanie-wlaczone"}
+		)
+		return self.pozostałeCykle, self.pozostałePolecenia
+
+	def rozpocznij(
+		self,
+		rodzaj: str,
+		nazwa: str
+	) -> Optional[SesjaProfilowania]:
+		"""
+		Rozpoczyna sesję profilowania, jeśli tryb profilowania obejmuje jeszcze operację danego rodzaju
+		i żadna inna sesja nie jest aktywna.
+
+		Args:
+			rodzaj (str): `cykl` lub `polecenie`.
+			nazwa (str): Nazwa profilowanej operacji.
+
+		Returns:
+			Optional[SesjaProfilowania]: Rozpoczęta sesja lub None.
+		"""
+
+		if self.aktywnaSesja is not None:
+			return None
+
+		if rodzaj == "cykl":
+			if self.pozostałeCykle <= 0:
+				return None
+			self.pozostałeCykle -= 1
+		else:
+			if self.pozostałePolecenia <= 0:
+				return None
+			self.pozostałePolecenia -= 1
+
+		sesja = SesjaProfilowania(rodzaj, nazwa)
+
+		try:
+			sesja.uruchom()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Nie udało się uruchomić profilera. Więcej informacji: {e}"
+			)
+			return None
+
+		self.aktywnaSesja = sesja
+		return sesja
+
+	async def zakończ(self, sesja: Optional[SesjaProfilowania]) -> None:
+		"""
+		Kończy sesję profilowania i zapisuje jej wynik do folderu `logs/profiles`.
+
+		Args:
+			sesja (Optional[SesjaProfilowania]): Sesja zwrócona przez `rozpocznij` (None jest ignorowane).
+		"""
+
+		if sesja is None or sesja is not self.aktywnaSesja:
+			return
+
+		self.aktywnaSesja = None
+		sesja.zatrzymaj()
+
+		try:
+			ścieżki = await asyncio.to_thread(sesja.zapisz, folderProfili)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zapisywania wyniku profilowania. Więcej informacji: {e}"
+			)
+			return
+
+		logiKonsoli.info(
+			f"Zapisano profil ({sesja.rodzaj} {sesja.nazwa}, {sesja.czasTrwania:.2f} s): {', '.join(str(ścieżka) for ścieżka in ścieżki)}.",
+			extra={"event": "profil-zapisany", "duration_ms": round(sesja.czasTrwania * 1000, 1)}
+		)
+
+		if not self.pozostałeCykle and not self.pozostałePolecenia:
+			logiKonsoli.info(
+				"Zakończono profilowanie na żądanie.",
+				extra={"event": "profilowanie-zakonczone"}
+			)
+
+
+def zwińStosy(ramkaGłówna) -> tuple[dict[str, int], dict[str, int]]:
+	"""
+	Zamienia drzewo ramek `pyinstrument` na stosy w formacie collapsed (przyjmowanym m.in. przez flamegraph.pl
+	i speedscope) oraz sumy czasu własnego funkcji. Wagi podawane są w mikrosekundach.
+
+	Args:
+		ramkaGłówna (pyinstrument.frame.Frame | None): Ramka główna sesji.
+
+	Returns:
+		tuple[dict[str, int], dict[str, int]]: Stosy z wagami i czasy własne funkcji.
+	"""
+
+	stosy: dict[str, int] = {}
+	czasyWłasne: dict[str, int] = {}
+
+	if ramkaGłówna is None:
+		return stosy, czasyWłasne
+
+	doOdwiedzenia = [(ramkaGłówna, "", "")]
+
+	while doOdwiedzenia:
+		ramka, ścieżka, funkcja = doOdwiedzenia.pop()
+
+		# Ramki syntetyczne (np. `[self]`) przypisują czas do funkcji nadrzędnej
+		if not ramka.function.startswith("[") or not ścieżka:
+			funkcja = f"{ramka.function} ({ramka.file_path_short}:{ramka.line_no})".replace(";", ":")
+			ścieżka = f"{ścieżka};{funkcja}" if ścieżka else funkcja
+
+		czasWłasny = int(round((ramka.time - sum(dziecko.time for dziecko in ramka.children)) * 1_000_000))
+
+		if czasWłasny > 0:
+			stosy[ścieżka] = stosy.get(ścieżka, 0) + czasWłasny
+			czasyWłasne[funkcja] = czasyWłasne.get(funkcja, 0) + czasWłasny
+
+		doOdwiedzenia.extend((dziecko, ścieżka, funkcja) for dziecko in ramka.children)
+
+	return stosy, czasyWłasne
+
+
+def zarejestrujSygnałProfilowania() -> None:
+	"""
+	Rejestruje obsługę sygnału `SIGUSR1`, który włącza profilowanie z liczbami z pliku konfiguracyjnego
+	(np. `kill -USR1 <pid>`). Na systemach bez tego sygnału (Windows) pozostaje wyłącznie polecenie `/profiluj`.
+	"""
+
+	with contextlib.suppress(AttributeError, NotImplementedError, RuntimeError):
+		asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, profilerNaŻądanie.włącz)
+
+
+# Globalny profiler na żądanie
+profilerNaŻądanie = ProfilerNaŻądanie()
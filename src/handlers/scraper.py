@@ -10,9 +10,8 @@
 #                                                █▄▄
 #
 
+
 # Standardowe biblioteki
-import aiohttp
-import asyncio
 from typing import Optional
 
 # Zewnętrzne biblioteki
@@ -20,43 +19,25 @@ from bs4 import BeautifulSoup
 import discord
 
 # Wewnętrzne importy
-from src.handlers.logging import logiKonsoli
+from src.core.fetch import pobierzStronę
 
 async def pobierzZawartośćStrony(
 	bot: discord.Client,
 	url: str,
-	kodowanie: str
+	kodowanie: str,
+	szkoła: str=""
 ) -> Optional[BeautifulSoup]:
 	"""
-	Pobiera zawartość strony internetowej.
+	Pobiera zawartość strony internetowej, korzystając z aktywnego połączenia HTTP bota.
 
 	Args:
 		bot (discord.Client): Instancja klienta Discord, z której wykorzystywane jest aktywne połączenie HTTP.
 		url (str): Adres strony internetowej do pobrania.
 		kodowanie (str): Kodowanie użyte do odczytu treści strony internetowej.
+		szkoła (str, optional): ID szkoły, którego używają etykiety metryk.
 
 	Returns:
 		Optional[BeautifulSoup]: Obiekt BeautifulSoup ze strukturą HTML lub None w przypadku błędu.
 	"""
 
-	try:
-		async with bot.połączenieHTTP.get(url) as odpowiedź:
-			odpowiedź.raise_for_status()
-
-			tekst = await odpowiedź.text(encoding=kodowanie, errors="ignore")
-			pętla = asyncio.get_running_loop()
-
-			return await pętla.run_in_executor(None, lambda: BeautifulSoup(tekst, "html.parser"))
-	except asyncio.TimeoutError:
-		logiKonsoli.warning(
-			f"Przekroczono czas oczekiwania na połączenie ({url})."
-		)
-	except aiohttp.ClientError as e:
-		logiKonsoli.exception(
-			f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
-		)
-	except Exception as e:
-		logiKonsoli.exception(
-			f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {e}"
-		)
-	return None
\ No newline at end of file
+	return await pobierzStronę(bot.połączenieHTTP, url, kodowanie, szkoła)
@@ -0,0 +1,123 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import random
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+# Wewnętrzne importy
+from src.core.tracing import Ślad
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.logging import logiKonsoli
+
+# Folder, do którego zapisywane są ślady cykli
+folderŚladów = Path("logs") / "traces"
+
+# Maksymalna liczba przechowywanych plików śladów (najstarsze są usuwane)
+maksymalnaLiczbaŚladów = 100
+
+def ustawieniaŚledzenia() -> tuple[float, float]:
+	"""
+	Odczytuje ustawienia śledzenia cykli z pliku konfiguracyjnego.
+
+	Returns:
+		tuple[float, float]: Odsetek losowo śledzonych cykli (`probkowanie-sladow`, 0-1) i czas trwania cyklu
+		w sekundach, od którego ślad zapisywany jest zawsze (`prog-wolnego-cyklu`, 0 wyłącza).
+	"""
+
+	ustawienia = pobierzMigawkę().ustawienia
+
+	try:
+		próbkowanie = min(max(float(ustawienia.get("probkowanie-sladow", 0) or 0), 0.0), 1.0)
+		próg = max(float(ustawienia.get("prog-wolnego-cyklu", 0) or 0), 0.0)
+	except (TypeError, ValueError):
+		return 0.0, 0.0
+
+	return próbkowanie, próg
+
+
+def rozpocznijŚlad() -> Optional[Ślad]:
+	"""
+	Rozpoczyna ślad cyklu aktualizacji, jeśli śledzenie jest włączone. Przy ustawionym `prog-wolnego-cyklu`
+	śledzony jest każdy cykl, ale zapisywane są tylko cykle wylosowane lub wolniejsze niż próg.
+
+	Returns:
+		Optional[Ślad]: Rozpoczęty ślad lub None, jeśli śledzenie jest wyłączone.
+	"""
+
+	próbkowanie, próg = ustawieniaŚledzenia()
+
+	if próbkowanie <= 0 and próg <= 0:
+		return None
+
+	return Ślad("cykl", wylosowany=random.random() < próbkowanie)
+
+
+def zapiszŚlad(
+	ślad: Ślad,
+	ścieżka: Path
+) -> None:
+	"""
+	Zapisuje ślad i usuwa najstarsze pliki śladów ponad `maksymalnaLiczbaŚladów`. Wywoływana poza pętlą zdarzeń.
+
+	Args:
+		ślad (Ślad): Zakończony ślad cyklu.
+		ścieżka (Path): Ścieżka pliku docelowego.
+	"""
+
+	ślad.zapisz(ścieżka)
+
+	for stary in sorted(ścieżka.parent.glob("*.json"))[:-maksymalnaLiczbaŚladów]:
+		stary.unlink(missing_ok=True)
+
+
+async def zakończŚlad(ślad: Optional[Ślad]) -> None:
+	"""
+	Kończy ślad cyklu i zapisuje go do folderu `logs/traces`, jeśli cykl został wylosowany
+	lub trwał co najmniej `prog-wolnego-cyklu` sekund.
+
+	Args:
+		ślad (Optional[Ślad]): Ślad zwrócony przez `rozpocznijŚlad` (None jest ignorowane).
+	"""
+
+	if ślad is None:
+		return
+
+	czasTrwania = ślad.zakończ()
+	_, próg = ustawieniaŚledzenia()
+	wolny = próg > 0 and czasTrwania >= próg
+
+	if not ślad.atrybuty.get("wylosowany") and not wolny:
+		return
+
+	ślad.atrybuty["wolny"] = wolny
+	ślad.atrybuty["czas-trwania-s"] = round(czasTrwania, 3)
+	początek = datetime.fromtimestamp(ślad.początekŚcienny, ZoneInfo("Europe/Warsaw"))
+	ścieżka = folderŚladów / f"{początek.strftime('%Y%m%d-%H%M%S')}{początek.microsecond // 1000:03d}-{ślad.nazwa}.json"
+
+	try:
+		await asyncio.to_thread(zapiszŚlad, ślad, ścieżka)
+	except Exception as e:
+		logiKonsoli.exception(
+			f"Wystąpił błąd podczas zapisywania śladu cyklu. Więcej informacji: {e}"
+		)
+		return
+
+	logiKonsoli.info(
+		f"Zapisano ślad cyklu ({czasTrwania:.2f} s{', wolny cykl' if wolny else ''}): {ścieżka}.",
+		extra={"event": "slad-zapisany", "duration_ms": round(czasTrwania * 1000, 1)}
+	)
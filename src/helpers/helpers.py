@@ -13,28 +13,29 @@
 # Standardowe biblioteki
 import asyncio
 from collections import defaultdict
-import copy
-import difflib
-import hashlib
-import re
 from typing import Any
-import unicodedata
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
+from src.core.locks import BlokadaZPomiarem
+from src.core.matching import usuńDuplikaty
+from src.core.metrics import operacjeDiscord
+from src.core.tracing import śledź
 from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja,
-	zapiszKonfiguracje
+	pobierzMigawkę,
+	zapisywaczKonfiguracji,
+	zatwierdźSerwer
 )
 
 # Ograniczenie wykonywania jednoczesnych operacji dla serwera do trzech wątków
-blokadaNaSerwer = asyncio.Semaphore(3)
+blokadaNaSerwer = BlokadaZPomiarem("serwer", asyncio.Semaphore(3))
 
 # Zapewnienie, że wysyłanie, usuwanie i reagowanie wiadomości na danym kanale jest sekwencyjne
-blokadaNaKanał = defaultdict(lambda: asyncio.Lock())
+blokadaNaKanał = defaultdict(lambda: BlokadaZPomiarem("kanal"))
 
 async def ograniczWysyłanie(
 	kanał: discord.TextChannel,
@@ -53,8 +54,12 @@ async def ograniczWysyłanie(
 		discord.Message: Obiekt wiadomości wysłanej na kanał.
 	"""
 
-	async with blokadaNaKanał[kanał.id]:
-		wiadomość = await kanał.send(*args, **kwargs)
+	rodzaj = "embed" if kwargs.get("embed") or kwargs.get("embeds") else "tekst"
+
+	with śledź("discord:wyslanie", kanal=kanał.id, rodzaj=rodzaj):
+		async with blokadaNaKanał[kanał.id]:
+			wiadomość = await kanał.send(*args, **kwargs)
+			operacjeDiscord.zwiększ(operacja="wyslanie", rodzaj=rodzaj)
 
 		return wiadomość
 
@@ -67,8 +72,10 @@ async def ograniczUsuwanie(wiadomość: discord.Message) -> None:
 		wiadomość (discord.Message): Wiadomość do usunięcia.
 	"""
 
-	async with blokadaNaKanał[wiadomość.channel.id]:
-		await wiadomość.delete()
+	with śledź("discord:usuniecie", kanal=wiadomość.channel.id):
+		async with blokadaNaKanał[wiadomość.channel.id]:
+			await wiadomość.delete()
+			operacjeDiscord.zwiększ(operacja="usuniecie", rodzaj="wiadomosc")
 
 
 async def ograniczReagowanie(
@@ -83,39 +90,10 @@ async def ograniczReagowanie(
 		emoji (str): Emoji, które ma zostać dodane jako reakcja.
 	"""
 
-	async with blokadaNaKanał[wiadomość.channel.id]:
-		await wiadomość.add_reaction(emoji)
-
-
-def obliczSumęKontrolną(dane: Any) -> str:
-	"""
-	Oblicza sumę kontrolną (SHA-256) dla podanych danych.
-
-	Args:
-		dane (Any): Dane wejściowe.
-
-	Returns:
-		str: Ciąg znaków reprezentujący hash SHA-256 danych.
-	"""
-
-	if isinstance(dane, str):
-		wejście = dane.strip()
-
-	elif isinstance(dane, list):
-		części = []
-
-		for tytuł, wpisy in sorted(dane, key=lambda pozycja: pozycja[0]):
-			części.append(tytuł.strip())
-
-			for wpis in sorted(wpisy):
-				części.append(wpis.strip())
-
-		wejście = "\n".join(części)
-
-	else:
-		wejście = str(dane)
-
-	return hashlib.sha256(wejście.encode("utf-8")).hexdigest()
+	with śledź("discord:reakcja", kanal=wiadomość.channel.id):
+		async with blokadaNaKanał[wiadomość.channel.id]:
+			await wiadomość.add_reaction(emoji)
+			operacjeDiscord.zwiększ(operacja="reakcja", rodzaj="emoji")
 
 
 def odmieńZastępstwa(licznik: int) -> str:
@@ -141,61 +119,10 @@ def odmieńZastępstwa(licznik: int) -> str:
 	return "zastępstw"
 
 
-def normalizujTekst(tekst: str) -> str:
-	"""
-	Normalizuje tekst w celu ujednolicenia go do porównań i filtracji.
-
-	Args:
-		tekst (str): Tekst wejściowy do normalizacji.
-
-	Returns:
-		str: Oczyszczony i znormalizowany tekst.
-	"""
-
-	if not tekst or not isinstance(tekst, str):
-		return ""
-
-	tekst = tekst.strip()
-	tekst = unicodedata.normalize("NFKD", tekst)
-	tekst = "".join(znak for znak in tekst if not unicodedata.combining(znak))
-	tekst = tekst.replace(".", " ")
-	tekst = re.sub(r"\s+", " ", tekst)
-
-	return tekst.lower()
-
-
-def zwróćNazwyKluczy(nazwa: str) -> set[str]:
-	"""
-	Tworzy zestaw kluczy dopasowań dla podanej nazwy.
-
-	Args:
-		nazwa (str): Tekst nazwy do przetworzenia.
-
-	Returns:
-		set[str]: Zestaw ciągów znaków używanych jako klucze dopasowań.
-	"""
-
-	norma = normalizujTekst(nazwa)
-
-	if not norma:
-		return set()
-
-	części = norma.split()
-	klucze = {norma}
-
-	if części:
-		klucze.add(części[-1])
-
-	if len(części) >= 1:
-		klucze.add(f"{części[0][0]} {części[-1]}")
-		klucze.add(f"{części[0][0]}{części[-1]}")
-
-	return klucze
-
-
 def pobierzSłownikSerwera(identyfikatorSerwera: str) -> dict[str, Any]:
 	"""
-	Pobiera słownik konfiguracji dla podanego serwera. Jeśli serwer nie istnieje w konfiguracji, tworzy domyślną strukturę.
+	Zwraca kopię słownika konfiguracji dla podanego serwera, uzupełnioną o domyślną strukturę. Zmiany w kopii
+	trafiają do konfiguracji dopiero po jej zatwierdzeniu przez `zatwierdźSerwer`.
 
 	Args:
 		identyfikatorSerwera (str): ID serwera Discord.
@@ -204,9 +131,11 @@ def pobierzSłownikSerwera(identyfikatorSerwera: str) -> dict[str, Any]:
 		dict[str, Any]: Słownik z konfiguracją serwera.
 	"""
 
-	identyfikatorSerwera = str(identyfikatorSerwera)
-	serwery = konfiguracja.setdefault("serwery", {})
-	dane = serwery.setdefault(identyfikatorSerwera, {})
+	dane = konfiguracja.get("serwery", {}).get(str(identyfikatorSerwera))
+	dane = {
+		klucz: list(wartość) if isinstance(wartość, list) else wartość
+		for klucz, wartość in dane.items()
+	} if isinstance(dane, dict) else {}
 
 	if "identyfikator-kanalu" not in dane:
 		dane["identyfikator-kanalu"] = ""
@@ -223,49 +152,28 @@ def pobierzSłownikSerwera(identyfikatorSerwera: str) -> dict[str, Any]:
 	if "wysyłaj-numerki" not in dane:
 		dane["wysyłaj-numerki"] = False
 
-	serwery[identyfikatorSerwera] = dane
 	return dane
 
 
-def usuńDuplikaty(sekwencja: list[Any]) -> list[Any]:
-	"""
-	Usuwa duplikaty z listy, zachowując kolejność elementów.
-
-	Args:
-		sekwencja (list[Any]): Lista, z której mają zostać usunięte duplikaty.
-
-	Returns:
-		list[Any]: Lista bez duplikatów, w tej samej kolejności co oryginał.
-	"""
-
-	widziane = set()
-	wynik = []
-
-	for element in sekwencja:
-		if element not in widziane:
-			wynik.append(element)
-			widziane.add(element)
-
-	return wynik
-
-
 async def zapiszKluczeSerwera(
 	identyfikatorSerwera: str,
 	dane: dict
 ) -> None:
 	"""
-	Zapisuje klucze i konfigurację wybranego serwera.
+	Zapisuje klucze i konfigurację wybranego serwera. Nowy wpis jest weryfikowany przed zapisaniem w konfiguracji.
 
 	Args:
 		identyfikatorSerwera (str): ID serwera Discord.
 		dane (dict): Słownik z danymi do zapisania.
+
+	Raises:
+		BłądKonfiguracji: Jeśli nowy wpis serwera jest niepoprawny. Konfiguracja pozostaje wtedy bez zmian.
 	"""
 
 	identyfikatorSerwera = str(identyfikatorSerwera)
 	lokalneDane = dict(dane or {})
 
 	async with blokadaKonfiguracji:
-		serwery = konfiguracja.setdefault("serwery", {})
 		daneSerwera = pobierzSłownikSerwera(identyfikatorSerwera)
 		poprzedniaSzkoła = daneSerwera.get("szkoła", "")
 		aktualnaSzkoła = lokalneDane.get("szkoła", "")
@@ -311,11 +219,8 @@ async def zapiszKluczeSerwera(
 			if wartość:
 				daneSerwera[klucz] = wartość
 
-		serwery[identyfikatorSerwera] = daneSerwera
-		konfiguracja["serwery"] = serwery
-		snapshot = copy.deepcopy(konfiguracja)
-
-		await zapiszKonfiguracje(snapshot)
+		zatwierdźSerwer(identyfikatorSerwera, daneSerwera)
+		zapisywaczKonfiguracji.zaplanuj("serwery")
 
 
 async def wyczyśćFiltry(identyfikatorSerwera: str) -> None:
@@ -334,162 +239,38 @@ async def wyczyśćFiltry(identyfikatorSerwera: str) -> None:
 		daneSerwera["szkoła"] = ""
 		daneSerwera["wybrane-klasy"] = []
 		daneSerwera["wybrani-nauczyciele"] = []
-		snapshot = copy.deepcopy(konfiguracja)
-
-		await zapiszKonfiguracje(snapshot)
+		zatwierdźSerwer(identyfikatorSerwera, daneSerwera)
+		zapisywaczKonfiguracji.zaplanuj("serwery")
 
 
-def dopasujWpisyDoListy(
-	wpisy: list[str],
-	listaDoDopasowania: list[str],
-	cutoff: float=0.6
-) -> tuple[list[str], dict[str, str], list[str]]:
+def pobierzListęKlas(szkoła: str | None=None) -> list[str]:
 	"""
-	Dopasowuje listę wpisów do listy referencyjnej, próbując znaleźć dokładne lub przybliżone dopasowania.
+	Pobiera listę klas dla wybranej szkoły z migawki konfiguracji, w której jest ona już spłaszczona.
 
 	Args:
-		wpisy (list[str]): Lista wpisów do dopasowania.
-		listaDoDopasowania (list[str]): Lista referencyjna, do której mają być dopasowane wpisy.
-		cutoff (float, optional): Minimalny próg podobieństwa dla dopasowań przybliżonych (0-1). Domyślnie 0.6.
+		szkoła (str | None, optional): Szkoła, dla której mają zostać pobrane klasy.
 
 	Returns:
-		tuple[list[str], dict[str, str], list[str]]:
-			idealneDopasowania: Lista idealnie dopasowanych wpisów.
-			sugestie: Słownik sugestii przybliżonych dopasowań.
-			nieZnaleziono: Lista wpisów, dla których nie znaleziono dopasowania.
+		list[str]: Lista klas przypisanych do danej szkoły.
 	"""
 
-	def stwórzKluczeNormalizacyjne(tekst: str) -> list[str]:
-		"""
-		Tworzy dwie wersje kluczy normalizacyjnych dla podanego tekstu.
-
-		Args:
-			tekst (str): Tekst wejściowy do przetworzenia.
-
-		Returns:
-			list[str]: Lista dwóch kluczy normalizacyjnych [tekstNormalizowany, brakSpacji].
-		"""
-
-		tekstNormalizowany = normalizujTekst(tekst)
-		brakSpacji = re.sub(r"\s+", "", tekstNormalizowany)
-
-		return [tekstNormalizowany, brakSpacji]
-
-	def zbudujIndeks(listaDoDopasowania: list[str]) -> tuple[dict[str, list[str]], dict[str, list[str]], list[str]]:
-		"""
-		Buduje indeksy wyszukiwania dla listy referencyjnej, tworząc mapowanie kluczy normalizacyjnych do oryginalnych elementów.
-
-		Args:
-			listaDoDopasowania (list[str]): Lista elementów do przetworzenia.
-
-		Returns:
-			tuple[dict[str, list[str]], dict[str, list[str]], list[str]]:
-				mapaKluczy: Słownik, w którym każdy klucz normalizacyjny mapuje do listy odpowiadających mu oryginalnych elementów.
-				normalizowaneDoOryginalnych: Słownik odwzorowujący pełną znormalizowaną nazwę na listę oryginalnych elementów.
-				listaNormalizowanych: Lista wszystkich pełnych znormalizowanych nazw występujących w liście elementów do przetworzenia.
-		"""
-
-		mapaKluczy = defaultdict(list)
-		normalizowaneDoOryginalnych = defaultdict(list)
-		listaNormalizowanych = []
-
-		for element in listaDoDopasowania:
-			pełnaNorma = re.sub(r"\s+", "", normalizujTekst(element))
-			normalizowaneDoOryginalnych[pełnaNorma].append(element)
-			listaNormalizowanych.append(pełnaNorma)
-
-			for klucz in stwórzKluczeNormalizacyjne(element):
-				mapaKluczy[klucz].append(element)
-
-		return mapaKluczy, normalizowaneDoOryginalnych, listaNormalizowanych
+	return list(pobierzMigawkę().pobierzKlasy(szkoła))
 
-	mapaKluczy, normalizowaneDoOryginalnych, listaNormalizowanych = zbudujIndeks(listaDoDopasowania)
-
-	idealneDopasowania = []
-	sugestie = {}
-	nieZnaleziono = []
-
-	for wpis in wpisy:
-		kluczeWpisu = stwórzKluczeNormalizacyjne(wpis)
-		znalezioneIdealneDopasowania = None
-
-		for klucz in kluczeWpisu:
-			if klucz in mapaKluczy:
-				znalezioneIdealneDopasowania = mapaKluczy[klucz][0]
-				break
-
-		if znalezioneIdealneDopasowania:
-			if znalezioneIdealneDopasowania not in idealneDopasowania:
-				idealneDopasowania.append(znalezioneIdealneDopasowania)
-
-			continue
-
-		# Dopasowanie przybliżone
-		normaWpisu = re.sub(r"\s+", "", normalizujTekst(wpis))
-		normaKandydatów = difflib.get_close_matches(normaWpisu, listaNormalizowanych, n=1, cutoff=cutoff)
-
-		if normaKandydatów:
-			normaKandydata = normaKandydatów[0]
-			kandydat = normalizowaneDoOryginalnych[normaKandydata][0]
-			sugestie[wpis] = kandydat
-		else:
-			nieZnaleziono.append(wpis)
-
-	return idealneDopasowania, sugestie, nieZnaleziono
-
-
-def pobierzListęKlas(szkoła: str | None=None) -> list[str]:
+def pobierzSzczęśliweNumerkiNaDzień(szkoła: str, dzień: str) -> list[int | str]:
 	"""
-	Pobiera listę klas dla wybranej szkoły z konfiguracji.
+	Pobiera szczęśliwe numerki dla danej szkoły w danym dniu z indeksu przygotowanego podczas wczytywania konfiguracji.
 
 	Args:
-		szkoła (str | None, optional): Szkoła, dla której mają zostać pobrane klasy.
+		szkoła (str): Szkoła, dla której pobieramy szczęśliwe numerki.
+		dzień (str): Dzień w formacie DD.MM.
 
 	Returns:
-		list[str]: Lista klas przypisanych do danej szkoły.
+		list[int | str]: Lista szczęśliwych numerków.
 	"""
 
-	suroweDane = (konfiguracja.get("szkoły", {})).get(szkoła, {}).get("lista-klas", {})
-
-	if isinstance(suroweDane, dict):
-		return [klasa for grupy in suroweDane.values() for klasa in grupy]
-
-	if isinstance(suroweDane, list):
-		return suroweDane
-
-	return []
-
-def pobierzSzczęśliweNumerkiNaDzień(szkoła: str, dzień: str) -> list[int]:
-	"""
-	Pobiera szczęśliwe numerki dla danej szkoły w danym dniu
+	daneSzkoły = pobierzMigawkę().pobierzSzkołę(szkoła)
 
-	Args:
-		szkoła (str): Szkołą, dla której pobieramy szczęśliwy numerek
-		dzień (str): dzień w formacie DD.MM
-	
-	Returns:
-		list[int]: lista szczęśliwych numerków
-	"""	
-	suroweDane = (konfiguracja.get("szkoły", {})).get(szkoła, {}).get("szczęśliwe-numerki", {})
-	if not dzień:
-		return []
-	if (dzień not in suroweDane):
+	if not daneSzkoły or not dzień:
 		return []
-	
-	items = suroweDane.get(dzień, [])
-	if not items:
-		return []
-	
-	wynik: list[int] = []
-	for v in items:
-		# spróbuj skonwertować na int, w przeciwnym razie zachowaj jako string (ale preferencyjnie numeric)
-		try:
-			wynik.append(int(v))
-		except Exception:
-			try:
-				# usuń białe znaki i spróbuj jeszcze raz
-				wynik.append(int(str(v).strip()))
-			except Exception:
-				# w ostateczności dodaj jako string (zachowanie kompatybilności)
-				wynik.append(str(v))
-	return wynik
\ No newline at end of file
+
+	return list(daneSzkoły.numerkiNaDzień(dzień))
@@ -0,0 +1,193 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+from datetime import (
+	date,
+	datetime,
+	time,
+	timedelta
+)
+from typing import Any
+from zoneinfo import ZoneInfo
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.data import (
+	pamięćDanych,
+	zarządzajPlikiemDanych
+)
+from src.handlers.logging import logiKonsoli
+from src.handlers.numerki import (
+	stwórzEmbedNumerków,
+	wyślijNumerki
+)
+from src.helpers.helpers import blokadaNaSerwer
+
+def odczytajHarmonogram(ustawienia: dict[str, Any]) -> tuple[time, frozenset[int]]:
+	"""
+	Odczytuje z ustawień godzinę i dni tygodnia, w których wysyłane są szczęśliwe numerki.
+
+	Args:
+		ustawienia (dict[str, Any]): Ustawienia globalne z migawki konfiguracji.
+
+	Returns:
+		tuple[time, frozenset[int]]: Godzina wysyłania oraz dni tygodnia (1 – poniedziałek, 7 – niedziela).
+
+	Raises:
+		ValueError: Jeśli godzina lub dni tygodnia mają niepoprawny format.
+	"""
+
+	godzina = datetime.strptime(str(ustawienia.get("godzina-wysylania-numerkow", "07:00")).strip(), "%H:%M").time()
+	dni = frozenset(int(dzień) for dzień in ustawienia.get("dni-wysylania-numerkow", [1, 2, 3, 4, 5]))
+
+	if not dni or not dni <= set(range(1, 8)):
+		raise ValueError(f"dni tygodnia muszą być liczbami od 1 do 7, otrzymano: {sorted(dni)}")
+
+	return godzina, dni
+
+
+async def wysyłajNumerkiCodziennie(bot: discord.Client) -> None:
+	"""
+	Raz dziennie, o godzinie ustawionej w pliku konfiguracyjnym, rozsyła szczęśliwe numerki na serwery, które je włączyły.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	ostatniDzień = None
+
+	while not bot.is_closed():
+		uśpienie = 60
+
+		try:
+			godzina, dni = odczytajHarmonogram(pobierzMigawkę().ustawienia)
+			teraz = datetime.now(ZoneInfo("Europe/Warsaw"))
+			termin = datetime.combine(teraz.date(), godzina, teraz.tzinfo)
+
+			if teraz >= termin and teraz.date() != ostatniDzień:
+				if teraz.isoweekday() in dni:
+					await roześlijNumerki(bot, teraz.date())
+
+				ostatniDzień = teraz.date()
+
+			if teraz >= termin:
+				termin += timedelta(days=1)
+
+			uśpienie = min(max((termin - teraz).total_seconds(), 1), 60)
+		except (TypeError, ValueError) as e:
+			logiKonsoli.error(
+				f"Niepoprawny harmonogram wysyłania szczęśliwych numerków w pliku konfiguracyjnym. Oczekiwane wartości: godzina w formacie HH:MM oraz lista dni tygodnia od 1 do 7. Więcej informacji: {e}"
+			)
+			uśpienie = 3600
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas wysyłania szczęśliwych numerków. Więcej informacji: {e}"
+			)
+
+		await asyncio.sleep(uśpienie)
+
+
+async def roześlijNumerki(
+	bot: discord.Client,
+	dzień: date
+) -> int:
+	"""
+	Rozsyła szczęśliwe numerki na dany dzień. Wiadomość tworzona jest raz na szkołę, a każdy serwer otrzymuje ją co najwyżej raz dziennie.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		dzień (date): Dzień, dla którego rozsyłane są numerki.
+
+	Returns:
+		int: Liczba serwerów, na które wysłano numerki.
+	"""
+
+	migawka = pobierzMigawkę()
+	wysłane = 0
+
+	for identyfikatorSzkoły, szkoła in migawka.szkoły.items():
+		if not szkoła.maNumerki:
+			continue
+
+		serwery = [
+			identyfikatorSerwera for identyfikatorSerwera in migawka.subskrybenciSzkół.get(identyfikatorSzkoły, ())
+			if migawka.pobierzSerwer(identyfikatorSerwera).wysyłajNumerki
+		]
+
+		if not serwery:
+			continue
+
+		embed = stwórzEmbedNumerków(szkoła, dzień)
+
+		if not embed:
+			logiKonsoli.info(
+				f"Brak szczęśliwych numerków na dzień {dzień.strftime('%d.%m')} dla szkoły o ID {identyfikatorSzkoły}. Numerki nie zostaną wysłane."
+			)
+			continue
+
+		wyniki = await asyncio.gather(*(wyślijNumerkiNaSerwer(bot, int(identyfikatorSerwera), embed, dzień) for identyfikatorSerwera in serwery), return_exceptions=True)
+		wysłane += sum(1 for wynik in wyniki if wynik is True)
+
+	if wysłane:
+		await pamięćDanych.zapiszZmiany()
+		logiKonsoli.info(
+			f"Wysłano szczęśliwe numerki na dzień {dzień.strftime('%d.%m')} do {wysłane} serwerów."
+		)
+
+	return wysłane
+
+
+async def wyślijNumerkiNaSerwer(
+	bot: discord.Client,
+	identyfikatorSerwera: int,
+	embed: discord.Embed,
+	dzień: date
+) -> bool:
+	"""
+	Wysyła szczęśliwe numerki na serwer, jeśli nie zostały na niego jeszcze wysłane tego dnia, i zapisuje dzień wysyłki w danych serwera.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		identyfikatorSerwera (int): ID serwera Discord.
+		embed (discord.Embed): Wiadomość z szczęśliwymi numerkami szkoły.
+		dzień (date): Dzień, dla którego wysyłane są numerki.
+
+	Returns:
+		bool: True, jeśli numerki zostały wysłane, False w przeciwnym razie.
+	"""
+
+	async with blokadaNaSerwer:
+		konfiguracjaSerwera = pobierzMigawkę().pobierzSerwer(identyfikatorSerwera)
+		identyfikatorKanału = konfiguracjaSerwera.identyfikatorKanału
+		kanał = bot.get_channel(identyfikatorKanału) if identyfikatorKanału else None
+
+		if not kanał or not konfiguracjaSerwera.wysyłajNumerki:
+			return False
+
+		dane = await zarządzajPlikiemDanych(identyfikatorSerwera) or {}
+
+		if dane.get("ostatnie-numerki", "") == dzień.isoformat():
+			return False
+
+		if not await wyślijNumerki(kanał, identyfikatorSerwera, embed):
+			return False
+
+		await zarządzajPlikiemDanych(identyfikatorSerwera, {**dane, "ostatnie-numerki": dzień.isoformat()})
+		await pamięćDanych.zapiszZmiany((str(identyfikatorSerwera),))
+		return True
@@ -0,0 +1,51 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import asyncio
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.data import pamięćDanych
+from src.handlers.logging import logiKonsoli
+
+async def zapisujDaneOkresowo(bot: discord.Client) -> None:
+	"""
+	Okresowo zapisuje zmienione dane serwerów z pamięci podręcznej, niezależnie od cyklu aktualizacji zastępstw.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	while not bot.is_closed():
+		try:
+			interwał = max(int(pobierzMigawkę().ustawienia.get("interwal-zapisu-danych", 60)), 1)
+		except (TypeError, ValueError):
+			interwał = 60
+
+		await asyncio.sleep(interwał)
+
+		try:
+			zapisane = await pamięćDanych.zapiszZmiany()
+
+			if zapisane:
+				logiKonsoli.debug(
+					f"Zapisano dane {zapisane} serwerów z pamięci podręcznej."
+				)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas okresowego zapisywania danych serwerów. Więcej informacji: {e}"
+			)
@@ -0,0 +1,75 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+
+# Standardowe biblioteki
+import asyncio
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.classes.model import BłądKonfiguracji
+from src.handlers.codec import BłędyDekodowania
+from src.handlers.configuration import (
+	pobierzMigawkę,
+	przeładujSzkoły,
+	zapisywaczKonfiguracji,
+	znacznikPliku,
+	ścieżkaKonfiguracji
+)
+from src.handlers.logging import logiKonsoli
+
+async def obserwujKonfiguracje(bot: discord.Client) -> None:
+	"""
+	Sprawdza czas modyfikacji pliku konfiguracyjnego i po jego zmianie przeładowuje sekcję `szkoły` bez ponownego uruchamiania bota.
+	Zmiany zapisane przez samego bota są pomijane, a niepoprawna konfiguracja pozostawia w użyciu poprzednie dane.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	ostatniZnacznik = znacznikPliku(ścieżkaKonfiguracji)
+
+	while not bot.is_closed():
+		try:
+			interwał = max(float(pobierzMigawkę().ustawienia.get("interwal-przeladowania-konfiguracji", 5)), 1)
+		except (TypeError, ValueError):
+			interwał = 5
+
+		await asyncio.sleep(interwał)
+		znacznik = await asyncio.to_thread(znacznikPliku, ścieżkaKonfiguracji)
+
+		if znacznik is None or znacznik == ostatniZnacznik:
+			continue
+
+		ostatniZnacznik = znacznik
+
+		if znacznik == zapisywaczKonfiguracji.znacznikiZapisu.get(ścieżkaKonfiguracji):
+			continue
+
+		try:
+			zmienione = await przeładujSzkoły()
+
+			if zmienione:
+				logiKonsoli.info(
+					f"Przeładowano konfigurację szkół o ID: {', '.join(sorted(zmienione))}."
+				)
+		except (BłądKonfiguracji, *BłędyDekodowania) as e:
+			logiKonsoli.error(
+				f"Zmieniony plik konfiguracyjny jest niepoprawny, dalej używana jest poprzednia konfiguracja szkół. Więcej informacji: {e}"
+			)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas przeładowywania pliku konfiguracyjnego. Więcej informacji: {e}"
+			)
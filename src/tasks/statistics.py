@@ -12,7 +12,13 @@
 
 # Standardowe biblioteki
 import asyncio
-from datetime import datetime
+import contextlib
+from datetime import (
+	datetime,
+	timedelta
+)
+import time
+from typing import Any
 from zoneinfo import ZoneInfo
 
 # Zewnętrzne biblioteki
@@ -20,18 +26,21 @@ import discord
 
 # Wewnętrzne importy
 from src.classes.constants import Constants
-from src.handlers.configuration import (
-	blokadaKonfiguracji,
-	konfiguracja
+from src.classes.model import KonfiguracjaSerwera
+from src.core.ranking import RankingNauczycieli
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.data import (
+	pamięćDanych,
+	pobierzStatystykiSerwera,
+	zarządzajPlikiemDanych
 )
-from src.handlers.data import zarządzajPlikiemDanych
+from src.handlers.history import dziennikZastępstw
 from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
 	blokadaNaSerwer,
 	odmieńZastępstwa,
 	ograniczUsuwanie,
-	ograniczWysyłanie,
-	zwróćNazwyKluczy
+	ograniczWysyłanie
 )
 
 async def sprawdźKoniecRoku(bot: discord.Client) -> None:
@@ -45,9 +54,8 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 	await bot.wait_until_ready()
 	while not bot.is_closed():
 		try:
-			async with blokadaKonfiguracji:
-				dataZakończeniaRoku = konfiguracja.get("koniec-roku-szkolnego", "").strip()
-				serwery = list(konfiguracja.get("serwery", {}).keys())
+			migawka = pobierzMigawkę()
+			dataZakończeniaRoku = migawka.ustawienia.get("koniec-roku-szkolnego", "").strip()
 
 			if not dataZakończeniaRoku:
 				logiKonsoli.warning(
@@ -79,135 +87,269 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 			aktualnyCzas = datetime.now(ZoneInfo("Europe/Warsaw"))
 
 			if aktualnyCzas >= koniecRoku:
-				for identyfikatorSerwera in serwery:
-					identyfikatorSerwera = int(identyfikatorSerwera)
-
-					try:
-						async with blokadaKonfiguracji:
-							konfiguracjaSerwera = konfiguracja.get("serwery", {}).get(str(identyfikatorSerwera), {}).copy()
-
-						identyfikatorKanału = konfiguracjaSerwera.get("identyfikator-kanalu", "")
-						kanał = bot.get_channel(int(identyfikatorKanału))
-
-						if not identyfikatorKanału or not kanał:
-							continue
-
-						dane = await zarządzajPlikiemDanych(identyfikatorSerwera) or {}
-						licznik = int(dane.get("licznik-zastepstw", 0))
-
-						if licznik == 0:
-							dane["ostatni-raport"] = dataZakończeniaRoku
-							dane["licznik-zastepstw"] = 0
-							dane["statystyki-nauczycieli"] = {}
-
-							for klucz in ("suma-kontrolna-informacji-dodatkowych", "suma-kontrolna-wpisow-zastepstw"):
-								if klucz not in dane:
-									dane[klucz] = ""
-
-							await zarządzajPlikiemDanych(identyfikatorSerwera, dane)
-							continue
-
-						ostatniRaport = dane.get("ostatni-raport", "").strip()
-
-						if ostatniRaport == dataZakończeniaRoku:
-							continue
-
-						if kanał.permissions_for(kanał.guild.me).mention_everyone:
-							async with blokadaNaSerwer:
-								wzmianka = await ograniczWysyłanie(kanał, "@everyone Podsumowanie roku szkolnego!", allowed_mentions=discord.AllowedMentions(everyone=True))
-							await asyncio.sleep(5)
-
-							try:
-								await ograniczUsuwanie(wzmianka)
-							except Exception:
-								pass
-						else:
-							logiKonsoli.warning(
-								f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
-							)
-
-						tytuł = "**Podsumowanie roku szkolnego!**"
-						opis = f"Dla tego serwera w tym roku szkolnym dostarczono **{licznik}** {odmieńZastępstwa(licznik)}! Poniżej znajduje się lista nauczycieli z największą liczbą zarejestrowanych zastępstw."
-						stopka = f"Udanych i przede wszystkim bezpiecznych wakacji!\n{Constants.KRÓTSZA_STOPKA}"
-
-						wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
-						wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
-						statystyki = dane.get("statystyki-nauczycieli", {})
-
-						if wybraneKlasy and not wybraniNauczyciele:
-							embed = discord.Embed(
-								title=tytuł,
-								description=opis,
-								color=Constants.KOLOR
-							)
-
-							if isinstance(statystyki, dict) and statystyki:
-								sortowanie = sorted(statystyki.items(), key=lambda x: (-int(x[1]), x[0]))
-								wolneMiejsca = 25 - len(embed.fields)
-
-								if wolneMiejsca > 0:
-									for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-										embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {int(liczba)}", inline=True)
-
-							embed.set_footer(text=stopka)
-							async with blokadaNaSerwer:
-								await ograniczWysyłanie(kanał, embed=embed)
-							logiKonsoli.info(
-								f"Roczne podsumowanie statystyk zastępstw zostało pomyślnie dostarczone do serwera o ID {identyfikatorSerwera}."
-							)
-
-						elif (wybraneKlasy and wybraniNauczyciele) or (wybraniNauczyciele and not wybraneKlasy):
-							embed = discord.Embed(
-								title=tytuł,
-								description=(f"{opis} (Pominięto nauczycieli ustawionych w filtrze)."),
-								color=Constants.KOLOR
-							)
-
-							wykluczeni = set()
-							pozostali = {}
-
-							for nauczyciel in wybraniNauczyciele:
-								wykluczeni |= zwróćNazwyKluczy(nauczyciel)
-
-							if isinstance(statystyki, dict):
-								for nazwa, liczba in statystyki.items():
-									if not (zwróćNazwyKluczy(nazwa) & wykluczeni):
-										pozostali[nazwa] = int(liczba)
-
-							if pozostali:
-								sortowanie = sorted(pozostali.items(), key=lambda x: (-int(x[1]), x[0]))
-								wolneMiejsca = 25 - len(embed.fields)
-
-								if wolneMiejsca > 0:
-									for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-										embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {int(liczba)}", inline=True)
-							else:
-								embed.add_field(name="Brak danych", value="Nie znaleziono odpowiednich statystyk dla tego serwera.", inline=False)
-
-							embed.set_footer(text=stopka)
-							async with blokadaNaSerwer:
-								await ograniczWysyłanie(kanał, embed=embed)
-							logiKonsoli.info(
-								f"Roczne podsumowanie statystyk zastępstw zostało pomyślnie dostarczone do serwera o ID {identyfikatorSerwera}."
-							)
-
-						dane["ostatni-raport"] = dataZakończeniaRoku
-						dane["licznik-zastepstw"] = 0
-						dane["statystyki-nauczycieli"] = {}
-
-						for klucz in ("suma-kontrolna-informacji-dodatkowych", "suma-kontrolna-wpisow-zastepstw"):
-							if klucz not in dane:
-								dane[klucz] = ""
-
-						await zarządzajPlikiemDanych(identyfikatorSerwera, dane)
-
-					except Exception as e:
-						logiKonsoli.exception(
-							f"Wystąpił błąd podczas raportowania statystyk zastępstw na koniec roku dla serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
-						)
+				nieudane = await roześlijRaporty(bot, dataZakończeniaRoku)
+
+				# Serwery, do których nie udało się dostarczyć raportu, są ponawiane po godzinie
+				if nieudane:
+					await asyncio.sleep(3600)
+					continue
+
+				# Po dostarczeniu wszystkich podsumowań zastępstwa zakończonego roku szkolnego nie są już potrzebne
+				await dziennikZastępstw.usuńStarsze((koniecRoku.date() + timedelta(days=1)).isoformat())
+
 			await asyncio.sleep(24 * 3600)
 		except Exception as e:
 			logiKonsoli.exception(
 				f"Wystąpił nieoczekiwany błąd podczas sprawdzania, czy nastąpiło zakończenie roku szkolnego. Więcej informacji: {e}"
 			)
-			await asyncio.sleep(3600)
\ No newline at end of file
+			await asyncio.sleep(3600)
+
+
+def odczytajLiczbę(
+	ustawienia: dict[str, Any],
+	klucz: str,
+	domyślna: float,
+	minimum: float
+) -> float:
+	"""
+	Odczytuje liczbę z ustawień, zwracając wartość domyślną, jeśli wpis jest niepoprawny.
+
+	Args:
+		ustawienia (dict[str, Any]): Ustawienia globalne z migawki konfiguracji.
+		klucz (str): Klucz ustawienia.
+		domyślna (float): Wartość domyślna.
+		minimum (float): Najmniejsza dopuszczalna wartość.
+
+	Returns:
+		float: Odczytana wartość, nie mniejsza niż minimum.
+	"""
+
+	try:
+		return max(float(ustawienia.get(klucz, domyślna)), minimum)
+	except (TypeError, ValueError):
+		return domyślna
+
+
+async def roześlijRaporty(
+	bot: discord.Client,
+	dataZakończeniaRoku: str
+) -> int:
+	"""
+	Rozsyła roczne podsumowania na wszystkie serwery, które jeszcze go nie otrzymały.
+
+	Raporty wysyłane są równolegle (z ograniczeniem ustawionym w pliku konfiguracyjnym) i rozłożone w czasie na całe okno
+	wysyłki. Każdy dostarczony raport jest od razu zapisywany na dysku (`ostatni-raport`), więc po ponownym uruchomieniu
+	bota wysyłka jest wznawiana od pozostałych serwerów.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		dataZakończeniaRoku (str): Data zakończenia roku szkolnego z pliku konfiguracyjnego.
+
+	Returns:
+		int: Liczba serwerów, do których nie udało się dostarczyć raportu.
+	"""
+
+	migawka = pobierzMigawkę()
+	równoległość = int(odczytajLiczbę(migawka.ustawienia, "rownolegle-raporty-koncowe", 5, 1))
+	okno = odczytajLiczbę(migawka.ustawienia, "okno-raportow-koncowych", 1800, 0)
+	oczekujące = []
+
+	for identyfikatorSerwera in migawka.serwery:
+		identyfikatorSerwera = int(identyfikatorSerwera)
+		konfiguracjaSerwera = migawka.pobierzSerwer(identyfikatorSerwera)
+		kanał = bot.get_channel(konfiguracjaSerwera.identyfikatorKanału) if konfiguracjaSerwera.identyfikatorKanału else None
+
+		if not kanał:
+			continue
+
+		try:
+			dane = await zarządzajPlikiemDanych(identyfikatorSerwera) or {}
+
+			if dane.get("ostatni-raport", "").strip() == dataZakończeniaRoku:
+				continue
+
+			if int(dane.get("licznik-zastepstw", 0)) == 0:
+				await zapiszPunktKontrolny(identyfikatorSerwera, dataZakończeniaRoku, zapiszNaDysku=False)
+				continue
+
+			oczekujące.append((identyfikatorSerwera, konfiguracjaSerwera, kanał))
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas przygotowywania podsumowania roku dla serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
+			)
+
+	await pamięćDanych.zapiszZmiany()
+
+	if not oczekujące:
+		return 0
+
+	logiKonsoli.info(
+		f"Rozpoczęto wysyłanie podsumowań roku szkolnego do {len(oczekujące)} serwerów (równolegle: {równoległość}, okno wysyłki: {int(okno)} s)."
+	)
+
+	semafor = asyncio.Semaphore(równoległość)
+	początek = time.monotonic()
+	odstęp = okno / len(oczekujące)
+	postęp = {"dostarczone": 0, "nieudane": 0, "ostatniLog": początek}
+
+	async def wyślij(numer: int, identyfikatorSerwera: int, konfiguracjaSerwera: KonfiguracjaSerwera, kanał: discord.TextChannel) -> None:
+		"""
+		Funkcja pomocnicza wysyłająca raport po upływie przydzielonego opóźnienia i raportująca postęp wysyłki.
+		"""
+
+		await asyncio.sleep(max(początek + numer * odstęp - time.monotonic(), 0))
+
+		async with semafor:
+			try:
+				await wyślijRaport(identyfikatorSerwera, konfiguracjaSerwera, kanał, dataZakończeniaRoku)
+				postęp["dostarczone"] += 1
+			except Exception as e:
+				postęp["nieudane"] += 1
+				logiKonsoli.exception(
+					f"Wystąpił błąd podczas raportowania statystyk zastępstw na koniec roku dla serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
+				)
+
+		zakończone = postęp["dostarczone"] + postęp["nieudane"]
+		teraz = time.monotonic()
+
+		if zakończone == len(oczekujące) or teraz - postęp["ostatniLog"] >= 30:
+			postęp["ostatniLog"] = teraz
+			pozostało = timedelta(seconds=round((teraz - początek) / zakończone * (len(oczekujące) - zakończone)))
+			logiKonsoli.info(
+				f"Postęp wysyłania podsumowań roku szkolnego: {zakończone}/{len(oczekujące)} ({zakończone * 100 // len(oczekujące)}%), nieudane: {postęp['nieudane']}, pozostało ok. {pozostało}."
+			)
+
+	await asyncio.gather(*(wyślij(numer, *serwer) for numer, serwer in enumerate(oczekujące)))
+	logiKonsoli.info(
+		f"Zakończono wysyłanie podsumowań roku szkolnego. Dostarczone: {postęp['dostarczone']}, nieudane: {postęp['nieudane']}, czas: {timedelta(seconds=round(time.monotonic() - początek))}."
+	)
+
+	return postęp["nieudane"]
+
+
+def stwórzRaport(
+	konfiguracjaSerwera: KonfiguracjaSerwera,
+	licznik: int,
+	ranking: RankingNauczycieli
+) -> discord.Embed | None:
+	"""
+	Tworzy wiadomość z rocznym podsumowaniem statystyk zastępstw serwera.
+
+	Args:
+		konfiguracjaSerwera (KonfiguracjaSerwera): Konfiguracja serwera Discord.
+		licznik (int): Liczba zastępstw dostarczonych w tym roku szkolnym.
+		ranking (RankingNauczycieli): Ranking nauczycieli serwera.
+
+	Returns:
+		discord.Embed | None: Wiadomość z podsumowaniem lub None, jeśli serwer nie ma ustawionych filtrów.
+	"""
+
+	tytuł = "**Podsumowanie roku szkolnego!**"
+	opis = f"Dla tego serwera w tym roku szkolnym dostarczono **{licznik}** {odmieńZastępstwa(licznik)}! Poniżej znajduje się lista nauczycieli z największą liczbą zarejestrowanych zastępstw."
+	stopka = f"Udanych i przede wszystkim bezpiecznych wakacji!\n{Constants.KRÓTSZA_STOPKA}"
+
+	wybraniNauczyciele = konfiguracjaSerwera.wybraniNauczyciele
+	wybraneKlasy = konfiguracjaSerwera.wybraneKlasy
+
+	if wybraneKlasy and not wybraniNauczyciele:
+		embed = discord.Embed(
+			title=tytuł,
+			description=opis,
+			color=Constants.KOLOR
+		)
+
+		for nauczyciel, liczba in ranking.najlepsi(25 - len(embed.fields)):
+			embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {liczba}", inline=True)
+
+	elif wybraniNauczyciele:
+		embed = discord.Embed(
+			title=tytuł,
+			description=(f"{opis} (Pominięto nauczycieli ustawionych w filtrze)."),
+			color=Constants.KOLOR
+		)
+
+		pozostali = ranking.najlepsi(25 - len(embed.fields), konfiguracjaSerwera.kluczeWykluczeń)
+
+		if pozostali:
+			for nauczyciel, liczba in pozostali:
+				embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {liczba}", inline=True)
+		else:
+			embed.add_field(name="Brak danych", value="Nie znaleziono odpowiednich statystyk dla tego serwera.", inline=False)
+
+	else:
+		return None
+
+	embed.set_footer(text=stopka)
+	return embed
+
+
+async def wyślijRaport(
+	identyfikatorSerwera: int,
+	konfiguracjaSerwera: KonfiguracjaSerwera,
+	kanał: discord.TextChannel,
+	dataZakończeniaRoku: str
+) -> None:
+	"""
+	Wysyła roczne podsumowanie na serwer, a następnie zeruje jego statystyki i zapisuje punkt kontrolny wysyłki.
+
+	Args:
+		identyfikatorSerwera (int): ID serwera Discord.
+		konfiguracjaSerwera (KonfiguracjaSerwera): Konfiguracja serwera Discord.
+		kanał (discord.TextChannel): Kanał tekstowy, na który wysyłany jest raport.
+		dataZakończeniaRoku (str): Data zakończenia roku szkolnego z pliku konfiguracyjnego.
+	"""
+
+	licznik, ranking = await pobierzStatystykiSerwera(identyfikatorSerwera)
+	embed = stwórzRaport(konfiguracjaSerwera, licznik, ranking)
+
+	if embed:
+		if kanał.permissions_for(kanał.guild.me).mention_everyone:
+			async with blokadaNaSerwer:
+				wzmianka = await ograniczWysyłanie(kanał, "@everyone Podsumowanie roku szkolnego!", allowed_mentions=discord.AllowedMentions(everyone=True))
+			await asyncio.sleep(5)
+
+			with contextlib.suppress(Exception):
+				await ograniczUsuwanie(wzmianka)
+		else:
+			logiKonsoli.warning(
+				f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
+			)
+
+		async with blokadaNaSerwer:
+			await ograniczWysyłanie(kanał, embed=embed)
+
+		logiKonsoli.info(
+			f"Roczne podsumowanie statystyk zastępstw zostało pomyślnie dostarczone do serwera o ID {identyfikatorSerwera}."
+		)
+
+	await zapiszPunktKontrolny(identyfikatorSerwera, dataZakończeniaRoku)
+
+
+async def zapiszPunktKontrolny(
+	identyfikatorSerwera: int,
+	dataZakończeniaRoku: str,
+	zapiszNaDysku: bool=True
+) -> None:
+	"""
+	Zeruje statystyki serwera, oznacza raport jako dostarczony i od razu zapisuje zmiany na dysku.
+
+	Args:
+		identyfikatorSerwera (int): ID serwera Discord.
+		dataZakończeniaRoku (str): Data zakończenia roku szkolnego z pliku konfiguracyjnego.
+		zapiszNaDysku (bool, optional): Czy zapisać zmiany na dysku od razu, zamiast przy najbliższym zapisie wsadowym. Domyślnie True.
+	"""
+
+	dane = await zarządzajPlikiemDanych(identyfikatorSerwera) or {}
+	dane["ostatni-raport"] = dataZakończeniaRoku
+	dane["licznik-zastepstw"] = 0
+	dane["statystyki-nauczycieli"] = {}
+
+	for klucz in ("suma-kontrolna-informacji-dodatkowych", "suma-kontrolna-wpisow-zastepstw"):
+		if klucz not in dane:
+			dane[klucz] = ""
+
+	await zarządzajPlikiemDanych(identyfikatorSerwera, dane)
+	pamięćDanych.unieważnijRanking(identyfikatorSerwera)
+
+	if zapiszNaDysku:
+		await pamięćDanych.zapiszZmiany()
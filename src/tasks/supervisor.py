@@ -0,0 +1,94 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import asyncio
+import time
+from typing import (
+	Awaitable,
+	Callable
+)
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.core.metrics import restartyZadań
+from src.handlers.health import (
+	StanZadania,
+	stanZadań
+)
+from src.handlers.logging import logiKonsoli
+
+# Opóźnienie pierwszego ponownego uruchomienia zadania; każde kolejne jest dwukrotnie dłuższe, aż do limitu
+początkoweOpóźnienie = 5.0
+maksymalneOpóźnienie = 300.0
+
+# Zadanie działające co najmniej tyle sekund uznawane jest za stabilne, a opóźnienie wraca do wartości początkowej
+czasStabilnejPracy = 600.0
+
+async def nadzorujZadanie(
+	bot: discord.Client,
+	nazwa: str,
+	funkcja: Callable[[discord.Client], Awaitable[None]]
+) -> None:
+	"""
+	Uruchamia zadanie działające w tle i uruchamia je ponownie, jeśli zakończy się błędem lub niespodziewanie
+	(przed zamknięciem bota). Kolejne restarty następujących po sobie awarii są coraz rzadsze (wykładnicze opóźnienie
+	od `początkoweOpóźnienie` do `maksymalneOpóźnienie`), dzięki czemu zapętlone awarie nie zalewają logów i usług.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		nazwa (str): Nazwa zadania widoczna w raporcie zdrowia i logach.
+		funkcja (Callable[[discord.Client], Awaitable[None]]): Funkcja zadania, np. `sprawdźAktualizacje`.
+	"""
+
+	stan = stanZadań.setdefault(nazwa, StanZadania(nazwa))
+	opóźnienie = początkoweOpóźnienie
+
+	try:
+		while not bot.is_closed():
+			stan.status = "dziala"
+			stan.uruchomiono = time.time()
+			stan.następnyRestart = None
+			początek = time.monotonic()
+
+			try:
+				await funkcja(bot)
+				stan.ostatnieZakończenie = "bez-bledu"
+			except Exception as e:
+				stan.ostatnieZakończenie = "blad"
+				stan.ostatniBłąd = f"{type(e).__name__}: {e}"
+				logiKonsoli.exception(
+					f"Zadanie {nazwa} zakończyło się błędem. Więcej informacji: {e}"
+				)
+
+			if bot.is_closed():
+				break
+
+			if time.monotonic() - początek >= czasStabilnejPracy:
+				opóźnienie = początkoweOpóźnienie
+
+			stan.restarty += 1
+			stan.status = "oczekuje-na-restart"
+			stan.następnyRestart = time.time() + opóźnienie
+			restartyZadań.zwiększ(zadanie=nazwa)
+			logiKonsoli.warning(
+				f"Zadanie {nazwa} zostanie uruchomione ponownie za {opóźnienie:.0f} s (restart nr {stan.restarty}).",
+				extra={"event": "restart-zadania", "task": nazwa}
+			)
+
+			await asyncio.sleep(opóźnienie)
+			opóźnienie = min(opóźnienie * 2, maksymalneOpóźnienie)
+	finally:
+		stan.status = "zatrzymane"
+		stan.następnyRestart = None
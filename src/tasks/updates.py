@@ -12,26 +12,57 @@
 
 # Standardowe biblioteki
 import asyncio
+from collections import Counter
+import time
+from typing import (
+	Any,
+	Optional
+)
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
-from src.handlers.numerki import wyślijNumerki
-from src.handlers.configuration import (
-	blokadaKonfiguracji,
-	konfiguracja
+from src.core.diff import wykryjZmiany
+from src.core.metrics import (
+	czasCyklu,
+	interwałCyklu,
+	ostatniCykl,
+	sumyKontrolne
+)
+from src.core.parser import wyodrębnijDane
+from src.core.tracing import (
+	aktywnyŚlad,
+	śledź
+)
+from src.handlers.bootstrap import (
+	oznaczFazę,
+	podsumujFazy
+)
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.data import (
+	pamięćDanych,
+	zarządzajPlikiemDanych
+)
+from src.handlers.health import (
+	oznaczCykl,
+	oznaczPobranie,
+	oznaczZmianę
+)
+from src.handlers.history import (
+	dziennikZastępstw,
+	utwórzZdarzenie,
+	wyznaczDatę
 )
-from src.handlers.data import zarządzajPlikiemDanych
 from src.handlers.logging import logiKonsoli
 from src.handlers.notifications import wyślijAktualizacje
-from src.handlers.parser import wyodrębnijDane
+from src.handlers.profiling import profilerNaŻądanie
 from src.handlers.scraper import pobierzZawartośćStrony
-from src.helpers.helpers import (
-	blokadaNaSerwer,
-	obliczSumęKontrolną,
-	pobierzListęKlas
+from src.handlers.traces import (
+	rozpocznijŚlad,
+	zakończŚlad
 )
+from src.helpers.helpers import blokadaNaSerwer
 
 async def sprawdźAktualizacje(bot: discord.Client) -> None:
 	"""
@@ -42,48 +73,80 @@ async def sprawdźAktualizacje(bot: discord.Client) -> None:
 	"""
 
 	await bot.wait_until_ready()
+	interwałCyklu.ustaw(300)
+
 	while not bot.is_closed():
-		async with blokadaKonfiguracji:
-			szkoły = dict(konfiguracja.get("szkoły", {}).copy())
-			serwery = dict(konfiguracja.get("serwery", {}).copy())
-
-		if not szkoły:
-			logiKonsoli.warning(
-				"Brak zdefiniowanych szkół w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie."
-			)
-		else:
-			for identyfikatorSzkoły, daneSzkoły in szkoły.items():
-				url = (daneSzkoły or {}).get("url", "")
-
-				if not url:
-					logiKonsoli.warning(
-						f"Nie ustawiono URL dla szkoły o ID {identyfikatorSzkoły} w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie."
-					)
-					continue
-
-				zawartośćStrony = await pobierzZawartośćStrony(bot, url, kodowanie=(daneSzkoły or {}).get("kodowanie", "iso-8859-2"))
-				serweryDoSprawdzenia = []
-				for identyfikatorSerwera, konfiguracjaSerwera in serwery.items():
-					if not isinstance(konfiguracjaSerwera, dict):
+		sesjaProfilowania = profilerNaŻądanie.rozpocznij("cykl", "aktualizacje") if profilerNaŻądanie.pozostałeCykle else None
+		ślad = rozpocznijŚlad()
+		tokenŚladu = aktywnyŚlad.set(ślad)
+
+		try:
+			początekCyklu = time.perf_counter()
+			migawka = pobierzMigawkę()
+			szkoły = migawka.szkoły
+
+			if not szkoły:
+				logiKonsoli.warning(
+					"Brak zdefiniowanych szkół w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie.",
+					extra={"event": "brak-szkol"}
+				)
+			else:
+				for identyfikatorSzkoły, daneSzkoły in szkoły.items():
+					url = daneSzkoły.url
+
+					if not url:
+						logiKonsoli.warning(
+							f"Nie ustawiono URL dla szkoły o ID {identyfikatorSzkoły} w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie.",
+							extra={"event": "brak-url-szkoly", "school": identyfikatorSzkoły}
+						)
+						continue
+
+					serweryDoSprawdzenia = migawka.subskrybenciSzkół.get(identyfikatorSzkoły, ())
+
+					if not serweryDoSprawdzenia:
 						continue
-					if konfiguracjaSerwera.get("szkoła", "") == identyfikatorSzkoły:
-						try:
-							serweryDoSprawdzenia.append(int(identyfikatorSerwera))
-						except Exception:
+
+					with śledź("szkola", szkola=identyfikatorSzkoły, serwery=len(serweryDoSprawdzenia)) as atrybutySzkoły:
+						zawartośćStrony = await pobierzZawartośćStrony(bot, url, kodowanie=daneSzkoły.kodowanie, szkoła=identyfikatorSzkoły)
+						oznaczPobranie(identyfikatorSzkoły, bool(zawartośćStrony))
+
+						if not zawartośćStrony:
+							atrybutySzkoły["pobrano"] = False
 							continue
 
-				if not zawartośćStrony or not serweryDoSprawdzenia:
-					continue
+						zdarzenia = {}
+						zadania = [sprawdźSerwer(int(identyfikatorSerwera), zawartośćStrony, bot, zdarzenia) for identyfikatorSerwera in serweryDoSprawdzenia]
+						await asyncio.gather(*zadania, return_exceptions=True)
+						atrybutySzkoły["zdarzenia"] = len(zdarzenia)
+
+						with śledź("dziennik", zdarzenia=len(zdarzenia)):
+							await dziennikZastępstw.dopiszZdarzenia(list(zdarzenia.values()))
+
+			with śledź("zapis-danych"):
+				await pamięćDanych.zapiszZmiany()
+
+			czasTrwania = time.perf_counter() - początekCyklu
+			czasCyklu.obserwuj(czasTrwania)
+			ostatniCykl.ustaw(czasTrwania)
+			oznaczCykl()
+
+			if oznaczFazę("pierwszy-cykl"):
+				logiKonsoli.info(
+					f"Czasy uruchamiania bota: {podsumujFazy()}."
+				)
+		finally:
+			aktywnyŚlad.reset(tokenŚladu)
+			await profilerNaŻądanie.zakończ(sesjaProfilowania)
+			await zakończŚlad(ślad)
 
-				zadania = [sprawdźSerwer(int(identyfikatorSerwera), zawartośćStrony, bot) for identyfikatorSerwera in serweryDoSprawdzenia]
-				await asyncio.gather(*zadania, return_exceptions=True)
 		await asyncio.sleep(300)
 
 
 async def sprawdźSerwer(
 	identyfikatorSerwera: int,
 	zawartośćStrony: str,
-	bot: discord.Client
+	bot: discord.Client,
+	zdarzenia: Optional[dict[tuple[str, str], dict[str, Any]]]=None
 ) -> None:
 	"""
 	Sprawdza aktualizacje per serwer, używając semafora ograniczającego jednoczesne sprawdzanie serwerów do trzech wątków.
@@ -92,16 +155,19 @@ async def sprawdźSerwer(
 		identyfikatorSerwera (int): ID serwera Discord.
 		zawartośćStrony (str): Zawartość strony z zastępstwami.
 		bot (discord.Client): Instancja klienta Discord.
+		zdarzenia (Optional[dict[tuple[str, str], dict[str, Any]]]): Zbiór zdarzeń cyklu, do którego dopisywane są wysłane wiersze zastępstw.
 	"""
 
-	async with blokadaNaSerwer:
-		await sprawdźSerwery(identyfikatorSerwera, zawartośćStrony, bot)
+	with śledź("serwer", serwer=identyfikatorSerwera):
+		async with blokadaNaSerwer:
+			await sprawdźSerwery(identyfikatorSerwera, zawartośćStrony, bot, zdarzenia)
 
 
 async def sprawdźSerwery(
 	identyfikatorSerwera: int,
 	zawartośćStrony: str,
-	bot: discord.Client
+	bot: discord.Client,
+	zdarzenia: Optional[dict[tuple[str, str], dict[str, Any]]]=None
 ) -> None:
 	"""
 	Pobiera konfigurację serwera, sprawdza aktualizacje danych, wysyła aktualizacje i aktualizuje statystyki.
@@ -110,36 +176,46 @@ async def sprawdźSerwery(
 		identyfikatorSerwera (int): ID serwera Discord.
 		zawartośćStrony (str): Zawartość strony z zastępstwami.
 		bot (discord.Client): Instancja klienta Discord.
+		zdarzenia (Optional[dict[tuple[str, str], dict[str, Any]]]): Zbiór zdarzeń cyklu, do którego dopisywane są wysłane wiersze zastępstw.
 	"""
 
-	async with blokadaKonfiguracji:
-		konfiguracjaSerwera = konfiguracja.get("serwery", {}).get(str(identyfikatorSerwera), {}).copy()
+	migawka = pobierzMigawkę()
+	konfiguracjaSerwera = migawka.pobierzSerwer(identyfikatorSerwera)
 
-	identyfikatorKanału = konfiguracjaSerwera.get("identyfikator-kanalu", "")
-	kanał = bot.get_channel(int(identyfikatorKanału))
+	identyfikatorKanału = konfiguracjaSerwera.identyfikatorKanału
+	kanał = bot.get_channel(identyfikatorKanału) if identyfikatorKanału else None
 
-	if not identyfikatorKanału or not kanał:
+	if not kanał:
 		return
 
 	try:
-		poprzednieDane = await zarządzajPlikiemDanych(identyfikatorSerwera)
+		with śledź("odczyt-stanu"):
+			poprzednieDane = await zarządzajPlikiemDanych(identyfikatorSerwera)
 
 		if not isinstance(poprzednieDane, dict):
 			poprzednieDane = {}
 
-		sumaKontrolnaPoprzednichInformacjiDodatkowych = poprzednieDane.get("suma-kontrolna-informacji-dodatkowych", "")
-		sumaKontrolnaPoprzednichWpisówZastępstw = poprzednieDane.get("suma-kontrolna-wpisow-zastepstw", "")
+		wybraneKlasy = konfiguracjaSerwera.wybraneKlasy
+		wybraniNauczyciele = konfiguracjaSerwera.wybraniNauczyciele
+
+		listaKlas = migawka.pobierzKlasy(konfiguracjaSerwera.szkoła)
 
-		wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
-		wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
+		with śledź("wyodrebnianie", klasy=len(wybraneKlasy or ()), nauczyciele=len(wybraniNauczyciele or ())) as atrybutyWyodrębniania:
+			informacjeDodatkowe, aktualneWpisyZastępstw = wyodrębnijDane(zawartośćStrony, wybraneKlasy, wybraniNauczyciele, listaKlas)
+			atrybutyWyodrębniania["grupy"] = len(aktualneWpisyZastępstw or [])
+			atrybutyWyodrębniania["wiersze"] = sum(len(wpisy) for _, wpisy in (aktualneWpisyZastępstw or []))
 
-		listaKlas = pobierzListęKlas(konfiguracjaSerwera.get("szkoła", ""))
-		informacjeDodatkowe, aktualneWpisyZastępstw = wyodrębnijDane(zawartośćStrony, wybraneKlasy, wybraniNauczyciele, listaKlas)
-		sumaKontrolnaAktualnychInformacjiDodatkowych = obliczSumęKontrolną(informacjeDodatkowe)
-		sumaKontrolnaAktualnychWpisówZastępstw = obliczSumęKontrolną(aktualneWpisyZastępstw)
+		with śledź("sumy-kontrolne") as atrybutySum:
+			zmienioneInformacje, zmienioneWpisy, sumaKontrolnaAktualnychInformacjiDodatkowych, sumaKontrolnaAktualnychWpisówZastępstw = wykryjZmiany(poprzednieDane, informacjeDodatkowe, aktualneWpisyZastępstw)
+			atrybutySum["zmienione-informacje"] = zmienioneInformacje
+			atrybutySum["zmienione-wpisy"] = zmienioneWpisy
+		sumyKontrolne.zwiększ(rodzaj="informacje", wynik="chybienie" if zmienioneInformacje else "trafienie")
+		sumyKontrolne.zwiększ(rodzaj="wpisy", wynik="chybienie" if zmienioneWpisy else "trafienie")
 
-		if sumaKontrolnaAktualnychInformacjiDodatkowych != sumaKontrolnaPoprzednichInformacjiDodatkowych or sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
-			if sumaKontrolnaAktualnychWpisówZastępstw == sumaKontrolnaPoprzednichWpisówZastępstw:
+		if zmienioneInformacje or zmienioneWpisy:
+			oznaczZmianę(konfiguracjaSerwera.szkoła)
+
+			if not zmienioneWpisy:
 				logiKonsoli.debug(
 					f"Treść informacji dodatkowych uległa zmianie dla serwera o ID {identyfikatorSerwera}. Zostaną wysłane zaktualizowane informacje."
 				)
@@ -149,21 +225,19 @@ async def sprawdźSerwery(
 				)
 
 			try:
-				if sumaKontrolnaAktualnychInformacjiDodatkowych != sumaKontrolnaPoprzednichInformacjiDodatkowych and sumaKontrolnaAktualnychWpisówZastępstw == sumaKontrolnaPoprzednichWpisówZastępstw:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, None)
+				with śledź("wysylanie", kanal=kanał.id):
+					if zmienioneInformacje and not zmienioneWpisy:
+						await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, None)
 
-				elif sumaKontrolnaAktualnychInformacjiDodatkowych == sumaKontrolnaPoprzednichInformacjiDodatkowych and sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
+					elif not zmienioneInformacje and zmienioneWpisy:
+						await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
 
-				else:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
-				
-				if konfiguracjaSerwera.get("wysyłaj-numerki"):
-					await wyślijNumerki(kanał, identyfikatorSerwera, informacjeDodatkowe, konfiguracjaSerwera.get("szkoła", ""))
+					else:
+						await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
 
 				poprzedniLicznik = int(poprzednieDane.get("licznik-zastepstw", 0))
 
-				if sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
+				if zmienioneWpisy:
 					przyrost = sum(len(wpisy) for _, wpisy in aktualneWpisyZastępstw) if aktualneWpisyZastępstw else 0
 					nowyLicznik = poprzedniLicznik + przyrost
 					statystykiNauczycieli = poprzednieDane.get("statystyki-nauczycieli", {})
@@ -171,6 +245,8 @@ async def sprawdźSerwery(
 					if not isinstance(statystykiNauczycieli, dict):
 						statystykiNauczycieli = {}
 
+					przyrostyNauczycieli = Counter()
+
 					for tytuł, wpisy in (aktualneWpisyZastępstw or []):
 						nazwa = (tytuł or "").strip()
 
@@ -179,12 +255,32 @@ async def sprawdźSerwery(
 								if "**Nauczyciel:**" in wpis:
 									nauczyciel = wpis.split("**Nauczyciel:**", 1)[1].strip()
 									nauczyciel = nauczyciel.split("\n", 1)[0].strip().split("/", 1)[0].split(" - ", 1)[0].strip()
-									statystykiNauczycieli[nauczyciel] = int(statystykiNauczycieli.get(nauczyciel, 0)) + 1
+									przyrostyNauczycieli[nauczyciel] += 1
 
 							continue
 
 						klucz = nazwa.split("/", 1)[0].split(" - ", 1)[0].strip()
-						statystykiNauczycieli[klucz] = int(statystykiNauczycieli.get(klucz, 0)) + len(wpisy)
+						przyrostyNauczycieli[klucz] += len(wpisy)
+
+					# Ranking w pamięci podręcznej aktualizowany jest razem ze statystykami, więc `/statystyki` nie musi ich sortować
+					ranking = pamięćDanych.pobierzRanking(identyfikatorSerwera) if pamięćDanych.wczytana else None
+
+					for nauczyciel, przyrostNauczyciela in przyrostyNauczycieli.items():
+						statystykiNauczycieli[nauczyciel] = int(statystykiNauczycieli.get(nauczyciel, 0)) + przyrostNauczyciela
+
+						if ranking is not None:
+							ranking.dodaj(nauczyciel, przyrostNauczyciela)
+
+					if zdarzenia is not None:
+						szkoła = konfiguracjaSerwera.szkoła
+						dataZastępstw = wyznaczDatę(informacjeDodatkowe)
+
+						for tytuł, wpisy in (aktualneWpisyZastępstw or []):
+							for wpis in wpisy:
+								if (tytuł, wpis) not in zdarzenia:
+									zdarzenia[(tytuł, wpis)] = utwórzZdarzenie(szkoła, dataZastępstw, tytuł, wpis, listaKlas)
+
+								zdarzenia[(tytuł, wpis)]["g"].append(str(identyfikatorSerwera))
 				else:
 					nowyLicznik = poprzedniLicznik
 					statystykiNauczycieli = poprzednieDane.get("statystyki-nauczycieli", {})
@@ -193,6 +289,7 @@ async def sprawdźSerwery(
 						statystykiNauczycieli = {}
 
 				noweDane = {
+					**poprzednieDane,
 					"suma-kontrolna-informacji-dodatkowych": sumaKontrolnaAktualnychInformacjiDodatkowych,
 					"suma-kontrolna-wpisow-zastepstw": sumaKontrolnaAktualnychWpisówZastępstw,
 					"licznik-zastepstw": nowyLicznik,
@@ -200,7 +297,11 @@ async def sprawdźSerwery(
 					"ostatni-raport": poprzednieDane.get("ostatni-raport", "")
 				}
 
-				await zarządzajPlikiemDanych(identyfikatorSerwera, noweDane)
+				with śledź("zapis-stanu"):
+					await zarządzajPlikiemDanych(identyfikatorSerwera, noweDane)
+
+					# Sumy kontrolne po wysłaniu wiadomości trafiają na dysk od razu, aby awaria przed zapisem wsadowym nie powtórzyła wysyłki
+					await pamięćDanych.zapiszZmiany((str(identyfikatorSerwera),))
 			except discord.DiscordException as e:
 				logiKonsoli.exception(
 					f"Nie udało się wysłać wszystkich wiadomości do serwera o ID {identyfikatorSerwera}, suma kontrolna nie zostanie zaktualizowana. Więcej informacji: {e}"
@@ -0,0 +1,219 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+import asyncio
+from pathlib import Path
+import sys
+import threading
+import time
+import traceback
+from typing import (
+	Any,
+	Optional
+)
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.core.locks import podsumujBlokady
+from src.core.metrics import (
+	blokadyPętli,
+	opóźnieniePętli
+)
+from src.handlers.configuration import pobierzMigawkę
+from src.handlers.logging import logiKonsoli
+
+# Odstęp pomiędzy kolejnymi pomiarami opóźnienia pętli zdarzeń (w sekundach)
+interwałPomiaru = 0.5
+
+# Co ile sekund raportowane są percentyle opóźnienia w logach
+oknoRaportu = 300.0
+
+# Maksymalna liczba ramek stosu zapisywanych przy blokadzie pętli
+głębokośćStosu = 20
+
+# Folder kodu bota - pierwsza ramka z tego folderu wskazuje miejsce blokady
+folderŹródeł = str(Path(__file__).resolve().parents[1])
+
+class StrażnikPętli(threading.Thread):
+	"""
+	Wątek nadzorujący pętlę zdarzeń. Jeśli pętla nie wykona zaplanowanego pomiaru w terminie wydłużonym o próg,
+	strażnik zapisuje aktualnie wykonywane zadanie i (opcjonalnie) stos wątku pętli, zanim blokada się zakończy.
+
+	Attributes:
+		pętla (asyncio.AbstractEventLoop): Nadzorowana pętla zdarzeń.
+		identyfikatorWątku (int): Identyfikator wątku pętli zdarzeń.
+		próg (float): Opóźnienie (w sekundach), od którego pętla uznawana jest za zablokowaną.
+		próbkowanieStosu (bool): Czy przy blokadzie zapisywany jest stos wątku pętli.
+		oczekiwanyTakt (float): Czas (`time.monotonic()`), w którym pętla powinna wykonać kolejny pomiar.
+		blokady (dict[float, dict[str, Any]]): Informacje o wykrytych blokadach według oczekiwanego taktu.
+		zatrzymany (threading.Event): Sygnał zatrzymania wątku.
+	"""
+
+	def __init__(
+		self,
+		pętla: asyncio.AbstractEventLoop,
+		próg: float,
+		próbkowanieStosu: bool
+	) -> None:
+		super().__init__(name="StrażnikPętli", daemon=True)
+		self.pętla = pętla
+		self.identyfikatorWątku = threading.get_ident()
+		self.próg = próg
+		self.próbkowanieStosu = próbkowanieStosu
+		self.oczekiwanyTakt = time.monotonic() + interwałPomiaru
+		self.blokady = {}
+		self.zatrzymany = threading.Event()
+
+	def run(self) -> None:
+		"""
+		Sprawdza co połowę progu, czy pętla zdarzeń nie przekroczyła terminu kolejnego pomiaru.
+		"""
+
+		while not self.zatrzymany.wait(self.próg / 2):
+			takt = self.oczekiwanyTakt
+
+			if takt in self.blokady or time.monotonic() - takt < self.próg:
+				continue
+
+			try:
+				self.blokady[takt] = self.opiszBlokadę()
+			except Exception as e:
+				self.blokady[takt] = {"zadanie": "nieznane", "korutyna": "nieznana", "miejsce": "nieznane", "stos": f"Nie udało się odczytać stosu: {e}"}
+
+	def opiszBlokadę(self) -> dict[str, Any]:
+		"""
+		Odczytuje zadanie wykonywane przez pętlę zdarzeń i (opcjonalnie) stos jej wątku.
+
+		Returns:
+			dict[str, Any]: Nazwa zadania, korutyna, miejsce w kodzie bota i stos.
+		"""
+
+		zadanie = asyncio.current_task(self.pętla)
+		korutyna = zadanie.get_coro() if zadanie is not None else None
+		opis = {
+			"zadanie": zadanie.get_name() if zadanie is not None else "wywołanie zwrotne",
+			"korutyna": getattr(korutyna, "__qualname__", "brak"),
+			"miejsce": None,
+			"stos": None
+		}
+
+		if not self.próbkowanieStosu:
+			return opis
+
+		ramka = sys._current_frames().get(self.identyfikatorWątku)
+
+		if ramka is None:
+			return opis
+
+		stos = traceback.extract_stack(ramka)
+
+		for wpis in reversed(stos):
+			if wpis.filename.startswith(folderŹródeł):
+				opis["miejsce"] = f"{wpis.name} ({Path(wpis.filename).name}:{wpis.lineno})"
+				break
+
+		opis["stos"] = "".join(traceback.format_list(stos[-głębokośćStosu:]))
+		return opis
+
+	def zatrzymaj(self) -> None:
+		"""
+		Zatrzymuje wątek strażnika.
+		"""
+
+		self.zatrzymany.set()
+
+
+def percentyl(
+	posortowane: list[float],
+	procent: float
+) -> float:
+	"""
+	Zwraca percentyl z posortowanej listy wartości (metoda najbliższego rzędu).
+
+	Args:
+		posortowane (list[float]): Posortowane rosnąco wartości.
+		procent (float): Percentyl z zakresu 0-100.
+
+	Returns:
+		float: Wartość percentyla (0 dla pustej listy).
+	"""
+
+	if not posortowane:
+		return 0.0
+
+	return posortowane[min(len(posortowane) - 1, max(0, round(procent / 100 * len(posortowane)) - 1))]
+
+
+async def monitorujPętlę(bot: discord.Client) -> None:
+	"""
+	Mierzy w sposób ciągły opóźnienie pętli zdarzeń (różnicę pomiędzy zaplanowanym a faktycznym wybudzeniem)
+	i zapisuje je w histogramie metryk. Co `oknoRaportu` sekund raportuje w logach percentyle opóźnienia wraz
+	z podsumowaniem rywalizacji o blokady, a każdą blokadę powyżej `prog-opoznienia-petli` sekund opisuje zadaniem
+	i miejscem, które ją spowodowało.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	ustawienia = pobierzMigawkę().ustawienia
+
+	try:
+		próg = max(float(ustawienia.get("prog-opoznienia-petli", 0.25)), 0.01)
+	except (TypeError, ValueError):
+		próg = 0.25
+
+	strażnik = StrażnikPętli(asyncio.get_running_loop(), próg, bool(ustawienia.get("probkowanie-stosu-petli", True)))
+	strażnik.start()
+	pomiary: list[float] = []
+	początekOkna = time.monotonic()
+
+	try:
+		while not bot.is_closed():
+			strażnik.oczekiwanyTakt = time.monotonic() + interwałPomiaru
+			await asyncio.sleep(interwałPomiaru)
+			teraz = time.monotonic()
+			takt = strażnik.oczekiwanyTakt
+			opóźnienie = max(0.0, teraz - takt)
+			opóźnieniePętli.obserwuj(opóźnienie)
+			pomiary.append(opóźnienie)
+			blokada: Optional[dict[str, Any]] = strażnik.blokady.pop(takt, None)
+
+			if opóźnienie >= próg:
+				blokada = blokada or {"zadanie": "nieznane", "korutyna": "nieznana", "miejsce": None, "stos": None}
+				blokadyPętli.zwiększ(miejsce=blokada["miejsce"] or blokada["korutyna"])
+				logiKonsoli.warning(
+					f"Pętla zdarzeń była zablokowana przez {opóźnienie * 1000:.0f} ms (zadanie: {blokada['zadanie']}, korutyna: {blokada['korutyna']}, miejsce: {blokada['miejsce'] or 'nieznane'})."
+					+ (f"\nStos w trakcie blokady:\n{blokada['stos']}" if blokada["stos"] else ""),
+					extra={"event": "blokada-petli", "duration_ms": round(opóźnienie * 1000, 1), "task": blokada["zadanie"]}
+				)
+
+			if teraz - początekOkna >= oknoRaportu:
+				posortowane = sorted(pomiary)
+				logiKonsoli.info(
+					f"Opóźnienie pętli zdarzeń z ostatnich {teraz - początekOkna:.0f} s ({len(posortowane)} pomiarów): p50 {percentyl(posortowane, 50) * 1000:.1f} ms, p95 {percentyl(posortowane, 95) * 1000:.1f} ms, p99 {percentyl(posortowane, 99) * 1000:.1f} ms, maks. {posortowane[-1] * 1000:.1f} ms.",
+					extra={"event": "opoznienie-petli"}
+				)
+				opisyBlokad = podsumujBlokady()
+
+				if opisyBlokad:
+					logiKonsoli.info(
+						"Rywalizacja o blokady z tego samego okresu:\n" + "\n".join(opisyBlokad),
+						extra={"event": "rywalizacja-o-blokady"}
+					)
+
+				pomiary.clear()
+				początekOkna = teraz
+	finally:
+		strażnik.zatrzymaj()